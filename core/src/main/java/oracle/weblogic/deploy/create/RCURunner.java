@@ -80,6 +80,9 @@ public class RCURunner {
     private String atpDefaultTablespace = null;
     private String atpTemporaryTablespace = null;
     private String rcuVariables = null;
+    private boolean logRcuOutput = false;
+    private Thread rcuThread;
+    private volatile CreateException rcuFailure;
 
     /**
      * The constructor.
@@ -171,17 +174,13 @@ public class RCURunner {
     public void runRcu(String rcuSysPass, String rcuSchemaPass) throws CreateException {
         final String METHOD = "runRcu";
 
-        File rcuBinDir = new File(new File(oracleHome, "oracle_common"), "bin");
-        File rcuScript = FileUtils.getCanonicalFile(new File(rcuBinDir, RCU_SCRIPT_NAME));
-
-        validateExistingExecutableFile(rcuScript, RCU_SCRIPT_NAME);
-        validateNonEmptyString(rcuSysPass, "rcu_sys_password", true);
-        validateNonEmptyString(rcuSchemaPass, "rcu_schema_password", true);
+        File rcuScript = validateRcuArguments(rcuSysPass, rcuSchemaPass);
 
         Map<String, String> dropEnv = getRcuDropEnv();
         String[] scriptArgs = getRcuDropArgs();
         List<String> scriptStdinLines = getRcuDropStdinLines(rcuSysPass, rcuSchemaPass);
         ScriptRunner runner = new ScriptRunner(dropEnv, RCU_DROP_LOG_BASENAME);
+        runner.setLogStdout(logRcuOutput);
         int exitCode;
         try {
             exitCode = runner.executeScript(rcuScript, scriptStdinLines, scriptArgs);
@@ -202,6 +201,7 @@ public class RCURunner {
         scriptArgs = getRcuCreateArgs();
         scriptStdinLines = getRcuCreateStdinLines(rcuSysPass, rcuSchemaPass);
         runner = new ScriptRunner(createEnv, RCU_CREATE_LOG_BASENAME);
+        runner.setLogStdout(logRcuOutput);
         try {
             exitCode = runner.executeScript(rcuScript, scriptStdinLines, scriptArgs);
             if (ATP_DB && exitCode != 0 && isSchemaNotExistError(runner)) {
@@ -219,10 +219,103 @@ public class RCURunner {
         }
     }
 
+    /**
+     * Start RCU on a background thread to drop and recreate the RCU schemas, and return without waiting for it
+     * to complete.  The RCU output is written to the log as it is produced.  The waitForRcu() method must be
+     * called to wait for RCU to complete and to get the result.
+     *
+     * @param rcuSysPass    the RCU database SYS password
+     * @param rcuSchemaPass the RCU database schema password to use for all RCU schemas
+     * @throws CreateException if an error occurs with parameter validation
+     */
+    public synchronized void startRcu(final String rcuSysPass, final String rcuSchemaPass) throws CreateException {
+        final String METHOD = "startRcu";
+
+        LOGGER.entering(CLASS, METHOD);
+        validateRcuArguments(rcuSysPass, rcuSchemaPass);
+        if (rcuThread != null) {
+            waitForRcu();
+        }
+
+        logRcuOutput = true;
+        rcuFailure = null;
+        rcuThread = new Thread(new Runnable() {
+            @Override
+            public void run() {
+                try {
+                    runRcu(rcuSysPass, rcuSchemaPass);
+                } catch (CreateException ce) {
+                    rcuFailure = ce;
+                } catch (RuntimeException re) {
+                    rcuFailure = new CreateException("WLSDPLY-12010", re, CLASS, re.getLocalizedMessage());
+                }
+            }
+        }, "rcu");
+        rcuThread.setDaemon(true);
+        rcuThread.start();
+        LOGGER.info("WLSDPLY-12011", CLASS);
+        LOGGER.exiting(CLASS, METHOD);
+    }
+
+    /**
+     * Wait for RCU that was started by startRcu() to complete.  This method returns immediately if RCU
+     * was not started, or if its result was already returned.
+     *
+     * @throws CreateException if RCU failed, or if the wait was interrupted
+     */
+    public synchronized void waitForRcu() throws CreateException {
+        final String METHOD = "waitForRcu";
+
+        LOGGER.entering(CLASS, METHOD);
+        if (rcuThread == null) {
+            LOGGER.exiting(CLASS, METHOD);
+            return;
+        }
+
+        long beginTime = System.currentTimeMillis();
+        try {
+            rcuThread.join();
+        } catch (InterruptedException ie) {
+            Thread.currentThread().interrupt();
+            CreateException ce = new CreateException("WLSDPLY-12012", ie, CLASS, ie.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, ce);
+            throw ce;
+        }
+        LOGGER.info("WLSDPLY-12013", CLASS, System.currentTimeMillis() - beginTime);
+        rcuThread = null;
+
+        CreateException ce = rcuFailure;
+        rcuFailure = null;
+        if (ce != null) {
+            LOGGER.throwing(CLASS, METHOD, ce);
+            throw ce;
+        }
+        LOGGER.exiting(CLASS, METHOD);
+    }
+
+    /**
+     * Determine if RCU that was started by startRcu() is still running.
+     *
+     * @return true if RCU is running; false otherwise
+     */
+    public synchronized boolean isRcuRunning() {
+        return rcuThread != null && rcuThread.isAlive();
+    }
+
     ///////////////////////////////////////////////////////////////////////////
     // Private helper methods                                                //
     ///////////////////////////////////////////////////////////////////////////
 
+    private File validateRcuArguments(String rcuSysPass, String rcuSchemaPass) throws CreateException {
+        File rcuBinDir = new File(new File(oracleHome, "oracle_common"), "bin");
+        File rcuScript = FileUtils.getCanonicalFile(new File(rcuBinDir, RCU_SCRIPT_NAME));
+
+        validateExistingExecutableFile(rcuScript, RCU_SCRIPT_NAME);
+        validateNonEmptyString(rcuSysPass, "rcu_sys_password", true);
+        validateNonEmptyString(rcuSchemaPass, "rcu_schema_password", true);
+        return rcuScript;
+    }
+
     private void addATPEnv(Map<String, String> env) {
         if (ATP_DB) {
             env.put("RCU_SSL_MODE", "true");
@@ -0,0 +1,424 @@
+/*
+ * Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.daemon;
+
+import java.io.BufferedInputStream;
+import java.io.BufferedOutputStream;
+import java.io.DataInputStream;
+import java.io.DataOutputStream;
+import java.io.File;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.io.OutputStream;
+import java.io.PrintStream;
+import java.math.BigInteger;
+import java.net.InetAddress;
+import java.net.ServerSocket;
+import java.net.Socket;
+import java.net.SocketTimeoutException;
+import java.security.SecureRandom;
+import java.util.Arrays;
+import java.util.Enumeration;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.Properties;
+import java.util.TreeMap;
+import java.util.logging.Handler;
+import java.util.logging.LogManager;
+import java.util.logging.Logger;
+
+import oracle.weblogic.deploy.logging.PlatformLogger;
+import oracle.weblogic.deploy.logging.WLSDeployLogFactory;
+import oracle.weblogic.deploy.logging.WLSDeployLoggingConfig;
+import oracle.weblogic.deploy.util.StringUtils;
+import oracle.weblogic.deploy.util.WLSDeployExit;
+import oracle.weblogic.deploy.util.WLSDeployExitException;
+
+/**
+ * A long-lived daemon that runs tools for the tool scripts, so that starting the JVM, importing the
+ * Jython modules and loading the aliases are done once for many tool runs.
+ *
+ * <p>The daemon listens on a loopback port, and writes the port and a random token to the daemon file,
+ * which only the user that started the daemon can read.  Requests are run one at a time, because the
+ * output of each tool is redirected to its client through System.out and System.err.
+ *
+ * <p>The daemon closes a connection that does not send its request in time, and does not start a request
+ * that waited too long for the previous request to complete.  The client falls back to running the tool in
+ * its own JVM if the daemon does not start the tool in time.
+ *
+ * <p>The daemon does not run a request if the client Oracle home, working directory, or WLSDEPLOY_*
+ * environment variables are not the same as the daemon's, or if the tool runner can't run the tool.
+ * The client then returns NOT_RUN_EXIT_CODE, and the tool script runs the tool in its own JVM.
+ */
+public class ToolDaemon {
+    private static final String CLASS = ToolDaemon.class.getName();
+    private static final PlatformLogger LOGGER = WLSDeployLogFactory.getLogger("wlsdeploy.util");
+
+    /**
+     * The exit code returned to the client when the daemon did not run the tool.
+     */
+    public static final int NOT_RUN_EXIT_CODE = 97;
+
+    /**
+     * The environment variable that specifies the daemon file.
+     */
+    public static final String DAEMON_FILE_ENV_VARIABLE = "WLSDEPLOY_DAEMON_FILE";
+
+    /**
+     * The program name sent by the client to stop the daemon.
+     */
+    public static final String STOP_PROGRAM_NAME = "stop";
+
+    static final String PORT_PROPERTY = "port";
+    static final String TOKEN_PROPERTY = "token";
+
+    static final int EXIT_FRAME = 0;
+    static final int STDOUT_FRAME = 1;
+    static final int STDERR_FRAME = 2;
+    static final int STARTED_FRAME = 3;
+
+    /**
+     * The time the client waits for the daemon to start the tool, before it runs the tool in its own JVM.
+     */
+    static final int START_TIMEOUT_MILLIS = 10000;
+
+    /**
+     * The age of a request after which the daemon does not start the tool, since the client may have
+     * stopped waiting for it.
+     */
+    static final int REQUEST_AGE_LIMIT_MILLIS = START_TIMEOUT_MILLIS / 2;
+
+    /**
+     * The time the daemon waits for a client to send its request.
+     */
+    static final int REQUEST_READ_TIMEOUT_MILLIS = 2000;
+
+    private static final int ERROR_EXIT_CODE = 2;
+    private static final int BACKLOG = 50;
+    private static final String ENV_VARIABLE_PREFIX = "WLSDEPLOY_";
+    private static final String JAVA_HOME_ENV_VARIABLE = "JAVA_HOME";
+    private static final List<String> IGNORED_ENV_VARIABLES = Arrays.asList(
+        WLSDeployLoggingConfig.WLSDEPLOY_PROGRAM_NAME_ENV_VARIABLE,
+        DAEMON_FILE_ENV_VARIABLE
+    );
+    private static final String LOG_CONFIG_CLASS_PROPERTY = "java.util.logging.config.class";
+    private static final String HANDLERS_PROPERTY_SUFFIX = ".handlers";
+
+    private final File daemonFile;
+    private final File oracleHome;
+    private final String programName;
+    private final ToolRunner runner;
+    private final String token;
+
+    /**
+     * Constructor.
+     *
+     * @param daemonFile the file where the daemon port and token are written
+     * @param oracleHome the Oracle home used by the daemon JVM
+     * @param programName the program name of the daemon, used for its own log file
+     * @param runner the runner for the tools
+     */
+    public ToolDaemon(File daemonFile, String oracleHome, String programName, ToolRunner runner) {
+        this.daemonFile = daemonFile;
+        this.oracleHome = new File(oracleHome);
+        this.programName = programName;
+        this.runner = runner;
+        this.token = new BigInteger(130, new SecureRandom()).toString(32);
+    }
+
+    /**
+     * Run requests until a stop request is received.
+     *
+     * @throws IOException if the daemon could not listen or write the daemon file
+     */
+    public void serve() throws IOException {
+        final String METHOD = "serve";
+        LOGGER.entering(CLASS, METHOD);
+
+        WLSDeployExit.setExitDisabled(true);
+        ServerSocket serverSocket = new ServerSocket(0, BACKLOG, InetAddress.getLoopbackAddress());
+        try {
+            writeDaemonFile(serverSocket.getLocalPort());
+            LOGGER.info("WLSDPLY-01820", serverSocket.getLocalPort(), daemonFile.getAbsolutePath());
+
+            boolean running = true;
+            while (running) {
+                Socket socket = serverSocket.accept();
+                try {
+                    running = handleRequest(socket);
+                } catch (SocketTimeoutException ste) {
+                    LOGGER.warning("WLSDPLY-01829", ste, REQUEST_READ_TIMEOUT_MILLIS);
+                } catch (IOException ioe) {
+                    LOGGER.warning("WLSDPLY-01825", ioe, ioe.getLocalizedMessage());
+                } finally {
+                    closeQuietly(socket);
+                }
+            }
+        } finally {
+            serverSocket.close();
+            if (!daemonFile.delete()) {
+                daemonFile.deleteOnExit();
+            }
+            WLSDeployExit.setExitDisabled(false);
+        }
+        LOGGER.info("WLSDPLY-01828");
+        LOGGER.exiting(CLASS, METHOD);
+    }
+
+    /**
+     * Get the environment variables that must be the same in the client and the daemon.
+     *
+     * @return a map of the environment variable names and values
+     */
+    static Map<String, String> getToolEnvironment() {
+        Map<String, String> result = new TreeMap<>();
+        for (Map.Entry<String, String> entry : System.getenv().entrySet()) {
+            String name = entry.getKey();
+            boolean toolVariable = name.startsWith(ENV_VARIABLE_PREFIX) && !IGNORED_ENV_VARIABLES.contains(name);
+            if (toolVariable || JAVA_HOME_ENV_VARIABLE.equals(name)) {
+                result.put(name, entry.getValue());
+            }
+        }
+        return result;
+    }
+
+    ///////////////////////////////////////////////////////////////////////////
+    // Private helper methods                                                //
+    ///////////////////////////////////////////////////////////////////////////
+
+    private boolean handleRequest(Socket socket) throws IOException {
+        DataInputStream input = new DataInputStream(new BufferedInputStream(socket.getInputStream()));
+        DataOutputStream output = new DataOutputStream(new BufferedOutputStream(socket.getOutputStream()));
+
+        // a client that connects and does not send its request must not block the daemon
+        socket.setSoTimeout(REQUEST_READ_TIMEOUT_MILLIS);
+        if (!token.equals(input.readUTF())) {
+            LOGGER.warning("WLSDPLY-01827");
+            return true;
+        }
+        long requestTime = input.readLong();
+        String clientOracleHome = input.readUTF();
+        String clientDirectory = input.readUTF();
+        Map<String, String> clientEnvironment = new TreeMap<>();
+        int count = input.readInt();
+        for (int i = 0; i < count; i++) {
+            String name = input.readUTF();
+            clientEnvironment.put(name, input.readUTF());
+        }
+        String toolName = input.readUTF();
+        String[] args = new String[input.readInt()];
+        for (int i = 0; i < args.length; i++) {
+            args[i] = input.readUTF();
+        }
+        socket.setSoTimeout(0);
+
+        if (STOP_PROGRAM_NAME.equals(toolName)) {
+            writeExit(output, 0);
+            return false;
+        }
+
+        int exitCode;
+        long requestAge = System.currentTimeMillis() - requestTime;
+        if (requestAge > REQUEST_AGE_LIMIT_MILLIS) {
+            LOGGER.fine("WLSDPLY-01830", toolName, requestAge);
+            exitCode = NOT_RUN_EXIT_CODE;
+        } else if (canRun(toolName, clientOracleHome, clientDirectory, clientEnvironment)) {
+            writeFrame(output, STARTED_FRAME);
+            exitCode = runTool(toolName, args, output);
+        } else {
+            exitCode = NOT_RUN_EXIT_CODE;
+        }
+        writeExit(output, exitCode);
+        return true;
+    }
+
+    private boolean canRun(String toolName, String clientOracleHome, String clientDirectory,
+        Map<String, String> clientEnvironment) throws IOException {
+        String directory = System.getProperty("user.dir");
+
+        if (!runner.canRun(toolName)) {
+            LOGGER.fine("WLSDPLY-01824", toolName);
+            return false;
+        }
+        if (!oracleHome.getCanonicalFile().equals(new File(clientOracleHome).getCanonicalFile())) {
+            LOGGER.fine("WLSDPLY-01821", toolName, clientOracleHome, oracleHome);
+            return false;
+        }
+        if (!new File(directory).getCanonicalFile().equals(new File(clientDirectory).getCanonicalFile())) {
+            LOGGER.fine("WLSDPLY-01822", toolName, clientDirectory, directory);
+            return false;
+        }
+        if (!getToolEnvironment().equals(clientEnvironment)) {
+            LOGGER.fine("WLSDPLY-01823", toolName);
+            return false;
+        }
+        return true;
+    }
+
+    private int runTool(String toolName, String[] args, DataOutputStream output) {
+        PrintStream savedOut = System.out;
+        PrintStream savedErr = System.err;
+        PrintStream clientOut = new PrintStream(new FrameOutputStream(output, STDOUT_FRAME), true);
+        PrintStream clientErr = new PrintStream(new FrameOutputStream(output, STDERR_FRAME), true);
+
+        int exitCode;
+        System.setOut(clientOut);
+        System.setErr(clientErr);
+        try {
+            // the console log handlers use the current System.out and System.err when they are created
+            configureLogging(toolName);
+            exitCode = runner.runTool(toolName, args);
+        } catch (WLSDeployExitException ex) {
+            exitCode = ex.getExitCode();
+        } catch (RuntimeException ex) {
+            ex.printStackTrace(clientErr);
+            exitCode = ERROR_EXIT_CODE;
+        } finally {
+            clientOut.flush();
+            clientErr.flush();
+            System.setOut(savedOut);
+            System.setErr(savedErr);
+            configureLogging(programName);
+        }
+        return exitCode;
+    }
+
+    private void writeDaemonFile(int port) throws IOException {
+        Properties properties = new Properties();
+        properties.setProperty(PORT_PROPERTY, Integer.toString(port));
+        properties.setProperty(TOKEN_PROPERTY, token);
+
+        File tempFile = new File(daemonFile.getAbsolutePath() + ".tmp");
+        if (tempFile.exists() && !tempFile.delete()) {
+            throw new IOException("Unable to delete " + tempFile.getAbsolutePath());
+        }
+        if (!tempFile.createNewFile()) {
+            throw new IOException("Unable to create " + tempFile.getAbsolutePath());
+        }
+
+        // only the owner can read the token
+        tempFile.setReadable(false, false);
+        tempFile.setWritable(false, false);
+        tempFile.setReadable(true, true);
+        tempFile.setWritable(true, true);
+
+        try (FileOutputStream fos = new FileOutputStream(tempFile)) {
+            properties.store(fos, null);
+        }
+        if (daemonFile.exists() && !daemonFile.delete()) {
+            throw new IOException("Unable to delete " + daemonFile.getAbsolutePath());
+        }
+        if (!tempFile.renameTo(daemonFile)) {
+            throw new IOException("Unable to rename " + tempFile.getAbsolutePath());
+        }
+    }
+
+    private static void writeFrame(DataOutputStream output, int frameType) throws IOException {
+        synchronized (output) {
+            output.writeByte(frameType);
+            output.flush();
+        }
+    }
+
+    private static void writeExit(DataOutputStream output, int exitCode) throws IOException {
+        synchronized (output) {
+            output.writeByte(EXIT_FRAME);
+            output.writeInt(exitCode);
+            output.flush();
+        }
+    }
+
+    /*
+     * Configure logging for the program with the logging configuration class of the JVM,
+     * so each tool writes the same log file that it writes when it is run in its own JVM.
+     */
+    private static void configureLogging(String logProgramName) {
+        String configClassName = System.getProperty(LOG_CONFIG_CLASS_PROPERTY);
+        if (StringUtils.isEmpty(configClassName)) {
+            return;
+        }
+
+        try {
+            Class<?> configClass = Class.forName(configClassName);
+            configClass.getConstructor(String.class).newInstance(logProgramName);
+        } catch (ReflectiveOperationException ex) {
+            LOGGER.warning("WLSDPLY-01826", ex, configClassName, ex.getLocalizedMessage());
+            return;
+        }
+        addLoggerHandlers();
+    }
+
+    /*
+     * LogManager.readConfiguration() does not add the handlers that are configured for loggers that
+     * already exist, such as the summary handler of the wlsdeploy logger, so add any that are missing.
+     */
+    private static void addLoggerHandlers() {
+        LogManager manager = LogManager.getLogManager();
+        Enumeration<String> loggerNames = manager.getLoggerNames();
+        while (loggerNames.hasMoreElements()) {
+            String loggerName = loggerNames.nextElement();
+            Logger logger = manager.getLogger(loggerName);
+            String handlerNames = manager.getProperty(loggerName + HANDLERS_PROPERTY_SUFFIX);
+            if (logger == null || loggerName.isEmpty() || handlerNames == null) {
+                continue;
+            }
+
+            Map<String, Handler> existingHandlers = new HashMap<>();
+            for (Handler handler : logger.getHandlers()) {
+                existingHandlers.put(handler.getClass().getName(), handler);
+            }
+            for (String handlerName : StringUtils.splitCommaSeparatedList(handlerNames)) {
+                if (existingHandlers.containsKey(handlerName)) {
+                    continue;
+                }
+                try {
+                    logger.addHandler((Handler) Class.forName(handlerName).newInstance());
+                } catch (ReflectiveOperationException ex) {
+                    LOGGER.warning("WLSDPLY-01826", ex, handlerName, ex.getLocalizedMessage());
+                }
+            }
+        }
+    }
+
+    private static void closeQuietly(Socket socket) {
+        try {
+            socket.close();
+        } catch (IOException ignore) {
+            // nothing to do...
+        }
+    }
+
+    /*
+     * Writes the tool output to the client, in frames of the output type, length and bytes.
+     */
+    private static class FrameOutputStream extends OutputStream {
+        private final DataOutputStream output;
+        private final int frameType;
+
+        FrameOutputStream(DataOutputStream output, int frameType) {
+            this.output = output;
+            this.frameType = frameType;
+        }
+
+        @Override
+        public void write(int b) throws IOException {
+            write(new byte[] { (byte) b }, 0, 1);
+        }
+
+        @Override
+        public void write(byte[] bytes, int offset, int length) throws IOException {
+            if (length == 0) {
+                return;
+            }
+            synchronized (output) {
+                output.writeByte(frameType);
+                output.writeInt(length);
+                output.write(bytes, offset, length);
+                output.flush();
+            }
+        }
+    }
+}
@@ -0,0 +1,141 @@
+/*
+ * Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.daemon;
+
+import java.io.BufferedInputStream;
+import java.io.BufferedOutputStream;
+import java.io.DataInputStream;
+import java.io.DataOutputStream;
+import java.io.File;
+import java.io.FileInputStream;
+import java.io.IOException;
+import java.io.PrintStream;
+import java.net.InetAddress;
+import java.net.InetSocketAddress;
+import java.net.Socket;
+import java.util.Arrays;
+import java.util.Map;
+import java.util.Properties;
+
+/**
+ * The client used by the tool scripts to run a tool in the tool daemon.  The tool output is written
+ * to System.out and System.err, and the client exits with the exit code of the tool.
+ *
+ * <p>If there is no daemon, or the daemon did not start the tool in time or did not run it, the client exits with
+ * ToolDaemon.NOT_RUN_EXIT_CODE without writing any output, and the script runs the tool in its own JVM.
+ *
+ * <p>Usage: ToolDaemonClient daemon_file oracle_home program_name [tool arguments]
+ */
+public class ToolDaemonClient {
+    private static final int CONNECT_TIMEOUT_MILLIS = 2000;
+    private static final int ERROR_EXIT_CODE = 2;
+    private static final int MIN_ARGS = 3;
+
+    private ToolDaemonClient() {
+        // hide the constructor
+    }
+
+    /**
+     * The entry point for the tool scripts.
+     *
+     * @param args the daemon file, the Oracle home, the program name, and the tool arguments
+     */
+    public static void main(String[] args) {
+        if (args.length < MIN_ARGS) {
+            System.err.println("Usage: " + ToolDaemonClient.class.getName() +
+                " <daemon_file> <oracle_home> <program_name> [<tool arguments>]");
+            System.exit(ToolDaemon.NOT_RUN_EXIT_CODE);
+        }
+        String[] toolArgs = Arrays.copyOfRange(args, MIN_ARGS, args.length);
+        System.exit(run(new File(args[0]), args[1], args[2], toolArgs));
+    }
+
+    /**
+     * Run the tool in the daemon identified by the daemon file.
+     *
+     * @param daemonFile the daemon file with the daemon port and token
+     * @param oracleHome the Oracle home for the tool
+     * @param programName the program name of the tool, or ToolDaemon.STOP_PROGRAM_NAME to stop the daemon
+     * @param toolArgs the tool arguments
+     * @return the exit code of the tool, or ToolDaemon.NOT_RUN_EXIT_CODE if the daemon did not run the tool
+     */
+    public static int run(File daemonFile, String oracleHome, String programName, String[] toolArgs) {
+        Properties daemonProperties = readDaemonFile(daemonFile);
+        if (daemonProperties == null) {
+            return ToolDaemon.NOT_RUN_EXIT_CODE;
+        }
+
+        boolean outputReceived = false;
+        Socket socket = new Socket();
+        try {
+            int port = Integer.parseInt(daemonProperties.getProperty(ToolDaemon.PORT_PROPERTY));
+            socket.connect(new InetSocketAddress(InetAddress.getLoopbackAddress(), port), CONNECT_TIMEOUT_MILLIS);
+
+            // if the daemon is busy or stalled, run the tool in its own JVM instead of waiting
+            socket.setSoTimeout(ToolDaemon.START_TIMEOUT_MILLIS);
+            DataOutputStream output = new DataOutputStream(new BufferedOutputStream(socket.getOutputStream()));
+            output.writeUTF(daemonProperties.getProperty(ToolDaemon.TOKEN_PROPERTY, ""));
+            output.writeLong(System.currentTimeMillis());
+            output.writeUTF(oracleHome);
+            output.writeUTF(System.getProperty("user.dir"));
+            Map<String, String> environment = ToolDaemon.getToolEnvironment();
+            output.writeInt(environment.size());
+            for (Map.Entry<String, String> entry : environment.entrySet()) {
+                output.writeUTF(entry.getKey());
+                output.writeUTF(entry.getValue());
+            }
+            output.writeUTF(programName);
+            output.writeInt(toolArgs.length);
+            for (String toolArg : toolArgs) {
+                output.writeUTF(toolArg);
+            }
+            output.flush();
+
+            DataInputStream input = new DataInputStream(new BufferedInputStream(socket.getInputStream()));
+            while (true) {
+                int frameType = input.readByte();
+                if (frameType == ToolDaemon.EXIT_FRAME) {
+                    return input.readInt();
+                }
+                if (frameType == ToolDaemon.STARTED_FRAME) {
+                    // the tool may run for a long time without writing any output
+                    socket.setSoTimeout(0);
+                    continue;
+                }
+                byte[] bytes = new byte[input.readInt()];
+                input.readFully(bytes);
+                PrintStream target = (frameType == ToolDaemon.STDERR_FRAME) ? System.err : System.out;
+                target.write(bytes, 0, bytes.length);
+                target.flush();
+                outputReceived = true;
+            }
+        } catch (IOException | NumberFormatException ex) {
+            if (outputReceived) {
+                System.err.println("The connection to the tool daemon failed: " + ex.getLocalizedMessage());
+                return ERROR_EXIT_CODE;
+            }
+            return ToolDaemon.NOT_RUN_EXIT_CODE;
+        } finally {
+            try {
+                socket.close();
+            } catch (IOException ignore) {
+                // nothing to do...
+            }
+        }
+    }
+
+    private static Properties readDaemonFile(File daemonFile) {
+        if (!daemonFile.isFile()) {
+            return null;
+        }
+        Properties properties = new Properties();
+        try (FileInputStream fis = new FileInputStream(daemonFile)) {
+            properties.load(fis);
+        } catch (IOException ignore) {
+            return null;
+        }
+        return properties;
+    }
+}
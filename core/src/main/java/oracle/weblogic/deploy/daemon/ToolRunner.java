@@ -0,0 +1,29 @@
+/*
+ * Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.daemon;
+
+/**
+ * Runs the tools for the tool daemon.
+ */
+public interface ToolRunner {
+
+    /**
+     * Determine if the tool can be run by the daemon.
+     *
+     * @param programName the program name of the tool, such as validateModel
+     * @return true if the tool can be run by the daemon
+     */
+    boolean canRun(String programName);
+
+    /**
+     * Run the tool with the specified arguments, and return its exit code.
+     * The tool output is written to System.out and System.err.
+     *
+     * @param programName the program name of the tool, such as validateModel
+     * @param args the command-line arguments for the tool
+     * @return the exit code of the tool
+     */
+    int runTool(String programName, String[] args);
+}
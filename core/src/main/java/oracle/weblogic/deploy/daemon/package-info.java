@@ -0,0 +1,8 @@
+/*
+ * Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+/**
+ * The tool daemon, which runs tools in a long-lived JVM, and the client used by the tool scripts.
+ */
+package oracle.weblogic.deploy.daemon;
@@ -1,17 +1,30 @@
 /*
- * Copyright (c) 2017, 2019, Oracle Corporation and/or its affiliates.  All rights reserved.
+ * Copyright (c) 2017, 2020, Oracle Corporation and/or its affiliates.  All rights reserved.
  * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
  */
 package oracle.weblogic.deploy.encrypt;
 
+import java.nio.ByteBuffer;
+import java.nio.CharBuffer;
 import java.security.InvalidAlgorithmParameterException;
 import java.security.InvalidKeyException;
+import java.security.MessageDigest;
 import java.security.NoSuchAlgorithmException;
 import java.security.SecureRandom;
 import java.security.spec.InvalidKeySpecException;
 import java.security.spec.KeySpec;
 import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.Collections;
+import java.util.HashMap;
+import java.util.LinkedHashMap;
 import java.util.List;
+import java.util.Map;
+import java.util.concurrent.Callable;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
 
 import javax.crypto.BadPaddingException;
 import javax.crypto.Cipher;
@@ -55,8 +68,23 @@ public final class EncryptionUtils {
     private static final int NONCE_POS = 1;
     private static final int SALT_POS = 2;
 
+    private static final String KEY_CACHE_DIGEST_ALGORITHM = "SHA-256";
+    private static final int KEY_CACHE_SIZE = 256;
+
     private static final SecureRandom RANDOM = new SecureRandom();
 
+    // the keys derived from each passphrase and salt, since each derivation takes a noticeable time.
+    // the cache key is a digest of the passphrase and the salt, so the passphrase is not kept.
+    private static final Map<String, SecretKey> KEY_CACHE =
+        Collections.synchronizedMap(new LinkedHashMap<String, SecretKey>(16, 0.75f, true) {
+            private static final long serialVersionUID = 1L;
+
+            @Override
+            protected boolean removeEldestEntry(Map.Entry<String, SecretKey> eldest) {
+                return size() > KEY_CACHE_SIZE;
+            }
+        });
+
     private EncryptionUtils() {
         // hide the constructor for this utility class
     }
@@ -83,34 +111,61 @@ public final class EncryptionUtils {
     public static char[] decryptString(String cipherText, final char[] userPassphrase) throws EncryptionException {
         final String METHOD = "decryptString";
 
-        if (userPassphrase == null || userPassphrase.length == 0) {
-            EncryptionException ee = new EncryptionException("WLSDPLY-04000");
-            LOGGER.throwing(CLASS, METHOD, ee);
-            throw ee;
-        }
+        checkPassphrase(userPassphrase, METHOD);
 
         char[] result = null;
         if (!StringUtils.isEmpty(cipherText)) {
             List<byte[]> parts = getCipherComponents(cipherText);
             if (parts.size() == CIPHER_SECTIONS) {
-                byte[] cipherFodder = parts.remove(0);
-                byte[] nonce = parts.remove(0);
-                byte[] salt = parts.remove(0);
-
-                SecretKey key = getKey(userPassphrase, salt);
-                Cipher cipher = getCipher();
-                try {
-                    cipher.init(Cipher.DECRYPT_MODE, key, new GCMParameterSpec(GCM_TAG_LENGTH * BITS_PER_BYTE, nonce));
-                    result = new String(cipher.doFinal(cipherFodder), UTF_8).toCharArray();
-                } catch (InvalidAlgorithmParameterException | InvalidKeyException |
-                    IllegalBlockSizeException | BadPaddingException ex) {
-
-                    EncryptionException ee = new EncryptionException("WLSDPLY-04001", ex, ex.getLocalizedMessage());
-                    LOGGER.throwing(CLASS, METHOD, ee);
-                    throw ee;
-                }
+                SecretKey key = getKey(userPassphrase, parts.get(SALT_POS));
+                result = decrypt(parts, key);
+            }
+        }
+        return result;
+    }
+
+    /**
+     * Get the unencrypted characters from each of the encrypted strings.  A key is derived for each
+     * distinct salt, and the keys that are not cached are derived concurrently.
+     *
+     * @param cipherTexts the encrypted strings
+     * @param userPassphrase the passphrase used to encrypt the strings
+     * @return the unencrypted characters for each string, in the same order,
+     *         or null for each string that is empty or not encrypted
+     * @throws EncryptionException if an error occurs while decrypting any of the strings
+     */
+    public static List<char[]> decryptStrings(List<String> cipherTexts, final char[] userPassphrase)
+        throws EncryptionException {
+        final String METHOD = "decryptStrings";
+
+        LOGGER.entering(CLASS, METHOD, cipherTexts.size());
+        checkPassphrase(userPassphrase, METHOD);
+
+        List<List<byte[]>> allParts = new ArrayList<>();
+        Map<String, byte[]> salts = new LinkedHashMap<>();
+        for (String cipherText : cipherTexts) {
+            List<byte[]> parts = Collections.emptyList();
+            if (!StringUtils.isEmpty(cipherText)) {
+                parts = getCipherComponents(cipherText);
+            }
+            if (parts.size() == CIPHER_SECTIONS) {
+                byte[] salt = parts.get(SALT_POS);
+                salts.put(DatatypeConverter.printBase64Binary(salt), salt);
+            }
+            allParts.add(parts);
+        }
+        Map<String, SecretKey> keys = deriveKeys(userPassphrase, salts);
+
+        List<char[]> result = new ArrayList<>();
+        for (List<byte[]> parts : allParts) {
+            char[] clearText = null;
+            if (parts.size() == CIPHER_SECTIONS) {
+                SecretKey key = keys.get(DatatypeConverter.printBase64Binary(parts.get(SALT_POS)));
+                clearText = decrypt(parts, key);
             }
+            result.add(clearText);
         }
+        LOGGER.exiting(CLASS, METHOD, salts.size());
         return result;
     }
 
@@ -125,39 +180,174 @@ public final class EncryptionUtils {
     public static String encryptString(String clearText, final char[] userPassphrase) throws EncryptionException {
         final String METHOD = "encryptString";
 
-        if (userPassphrase == null || userPassphrase.length == 0) {
-            EncryptionException ee = new EncryptionException("WLSDPLY-04000");
-            LOGGER.throwing(CLASS, METHOD, ee);
-            throw ee;
-        }
+        checkPassphrase(userPassphrase, METHOD);
 
         String result = clearText;
         if (!StringUtils.isEmpty(clearText)) {
             final byte[] salt = new byte[SALT_SIZE];
             RANDOM.nextBytes(salt);
             SecretKey key = getKey(userPassphrase, salt);
-            Cipher cipher = getCipher();
-            try {
-                final byte[] nonce = new byte[GCM_NONCE_LENGTH];
-                RANDOM.nextBytes(nonce);
-                GCMParameterSpec spec = new GCMParameterSpec(GCM_TAG_LENGTH * BITS_PER_BYTE, nonce);
-                cipher.init(Cipher.ENCRYPT_MODE, key, spec);
-                byte[] encrypted = cipher.doFinal(clearText.getBytes(UTF_8));
-                result = getEncryptedString(encrypted, nonce, salt);
-            } catch (InvalidKeyException | InvalidAlgorithmParameterException |
-                     IllegalBlockSizeException | BadPaddingException ex) {
-
-                EncryptionException ee = new EncryptionException("WLSDPLY-04002", ex, ex.getLocalizedMessage());
-                LOGGER.throwing(CLASS, METHOD, ee);
-                throw ee;
-            }
+            result = encrypt(clearText, key, salt);
         }
         return  result;
     }
 
+    /**
+     * Get the encrypted string for each of the specified strings.  The strings share a single salt,
+     * so only one key is derived for all of them.  Each string has its own nonce.
+     *
+     * @param clearTexts the strings to encrypt
+     * @param userPassphrase the passphrase to use for encryption/decryption
+     * @return the encrypted strings, in the same order.  Empty strings are returned unchanged.
+     * @throws EncryptionException if an error occurs while encrypting any of the strings
+     */
+    public static List<String> encryptStrings(List<String> clearTexts, final char[] userPassphrase)
+        throws EncryptionException {
+        final String METHOD = "encryptStrings";
+
+        LOGGER.entering(CLASS, METHOD, clearTexts.size());
+        checkPassphrase(userPassphrase, METHOD);
+
+        final byte[] salt = new byte[SALT_SIZE];
+        RANDOM.nextBytes(salt);
+        SecretKey key = null;
+
+        List<String> result = new ArrayList<>();
+        for (String clearText : clearTexts) {
+            String encrypted = clearText;
+            if (!StringUtils.isEmpty(clearText)) {
+                if (key == null) {
+                    key = getKey(userPassphrase, salt);
+                }
+                encrypted = encrypt(clearText, key, salt);
+            }
+            result.add(encrypted);
+        }
+        LOGGER.exiting(CLASS, METHOD);
+        return result;
+    }
+
+    private static void checkPassphrase(final char[] userPassphrase, String method) throws EncryptionException {
+        if (userPassphrase == null || userPassphrase.length == 0) {
+            EncryptionException ee = new EncryptionException("WLSDPLY-04000");
+            LOGGER.throwing(CLASS, method, ee);
+            throw ee;
+        }
+    }
+
+    private static String encrypt(String clearText, SecretKey key, byte[] salt) throws EncryptionException {
+        final String METHOD = "encrypt";
+
+        Cipher cipher = getCipher();
+        try {
+            final byte[] nonce = new byte[GCM_NONCE_LENGTH];
+            RANDOM.nextBytes(nonce);
+            GCMParameterSpec spec = new GCMParameterSpec(GCM_TAG_LENGTH * BITS_PER_BYTE, nonce);
+            cipher.init(Cipher.ENCRYPT_MODE, key, spec);
+            byte[] encrypted = cipher.doFinal(clearText.getBytes(UTF_8));
+            return getEncryptedString(encrypted, nonce, salt);
+        } catch (InvalidKeyException | InvalidAlgorithmParameterException |
+                 IllegalBlockSizeException | BadPaddingException ex) {
+
+            EncryptionException ee = new EncryptionException("WLSDPLY-04002", ex, ex.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, ee);
+            throw ee;
+        }
+    }
+
+    private static char[] decrypt(List<byte[]> parts, SecretKey key) throws EncryptionException {
+        final String METHOD = "decrypt";
+
+        byte[] cipherFodder = parts.get(PWD_POS);
+        byte[] nonce = parts.get(NONCE_POS);
+        Cipher cipher = getCipher();
+        try {
+            cipher.init(Cipher.DECRYPT_MODE, key, new GCMParameterSpec(GCM_TAG_LENGTH * BITS_PER_BYTE, nonce));
+            return new String(cipher.doFinal(cipherFodder), UTF_8).toCharArray();
+        } catch (InvalidAlgorithmParameterException | InvalidKeyException |
+            IllegalBlockSizeException | BadPaddingException ex) {
+
+            EncryptionException ee = new EncryptionException("WLSDPLY-04001", ex, ex.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, ee);
+            throw ee;
+        }
+    }
+
+    /**
+     * Get the key for each salt.  The keys that are not in the key cache are derived on one thread
+     * for each available processor.
+     *
+     * @param userPassphrase the passphrase
+     * @param salts the salts, keyed by their Base64 encoding
+     * @return the keys, keyed by the Base64 encoding of their salts
+     */
+    private static Map<String, SecretKey> deriveKeys(final char[] userPassphrase, Map<String, byte[]> salts)
+        throws EncryptionException {
+        final String METHOD = "deriveKeys";
+
+        Map<String, SecretKey> keys = new HashMap<>();
+        Map<String, byte[]> newSalts = new LinkedHashMap<>();
+        for (Map.Entry<String, byte[]> entry : salts.entrySet()) {
+            SecretKey key = KEY_CACHE.get(getCacheKey(userPassphrase, entry.getValue()));
+            if (key != null) {
+                keys.put(entry.getKey(), key);
+            } else {
+                newSalts.put(entry.getKey(), entry.getValue());
+            }
+        }
+
+        int threadCount = Math.min(Runtime.getRuntime().availableProcessors(), newSalts.size());
+        if (threadCount < 2) {
+            for (Map.Entry<String, byte[]> entry : newSalts.entrySet()) {
+                keys.put(entry.getKey(), getKey(userPassphrase, entry.getValue()));
+            }
+            return keys;
+        }
+
+        LOGGER.finer("WLSDPLY-04008", newSalts.size(), threadCount);
+        ExecutorService executor = Executors.newFixedThreadPool(threadCount);
+        try {
+            Map<String, Future<SecretKey>> futures = new LinkedHashMap<>();
+            for (Map.Entry<String, byte[]> entry : newSalts.entrySet()) {
+                final byte[] salt = entry.getValue();
+                futures.put(entry.getKey(), executor.submit(new Callable<SecretKey>() {
+                    @Override
+                    public SecretKey call() throws EncryptionException {
+                        return getKey(userPassphrase, salt);
+                    }
+                }));
+            }
+            for (Map.Entry<String, Future<SecretKey>> entry : futures.entrySet()) {
+                keys.put(entry.getKey(), entry.getValue().get());
+            }
+        } catch (ExecutionException ex) {
+            if (ex.getCause() instanceof EncryptionException) {
+                throw (EncryptionException) ex.getCause();
+            }
+            EncryptionException ee = new EncryptionException("WLSDPLY-04004", ex.getCause(),
+                ex.getCause().getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, ee);
+            throw ee;
+        } catch (InterruptedException ie) {
+            Thread.currentThread().interrupt();
+            EncryptionException ee = new EncryptionException("WLSDPLY-04009", ie);
+            LOGGER.throwing(CLASS, METHOD, ee);
+            throw ee;
+        } finally {
+            executor.shutdownNow();
+        }
+        return keys;
+    }
+
     private static SecretKey getKey(final char[] userPassphrase, byte[] saltBytes) throws EncryptionException {
         final String METHOD = "getKey";
 
+        String cacheKey = getCacheKey(userPassphrase, saltBytes);
+        SecretKey cachedKey = KEY_CACHE.get(cacheKey);
+        if (cachedKey != null) {
+            return cachedKey;
+        }
+
         SecretKeyFactory factory;
         try {
             factory = SecretKeyFactory.getInstance(SECRET_KEY_FACTORY_ALGORITHM);
@@ -177,9 +367,35 @@ public final class EncryptionUtils {
             LOGGER.throwing(CLASS, METHOD, ee);
             throw ee;
         }
+        KEY_CACHE.put(cacheKey, result);
         return result;
     }
 
+    private static String getCacheKey(final char[] userPassphrase, byte[] saltBytes) throws EncryptionException {
+        final String METHOD = "getCacheKey";
+
+        MessageDigest digest;
+        try {
+            digest = MessageDigest.getInstance(KEY_CACHE_DIGEST_ALGORITHM);
+        } catch (NoSuchAlgorithmException nsae) {
+            EncryptionException ee = new EncryptionException("WLSDPLY-04007", nsae, nsae.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, ee);
+            throw ee;
+        }
+
+        ByteBuffer passphraseBuffer = UTF_8.encode(CharBuffer.wrap(userPassphrase));
+        byte[] passphraseBytes = new byte[passphraseBuffer.remaining()];
+        passphraseBuffer.get(passphraseBytes);
+        digest.update(passphraseBytes);
+        Arrays.fill(passphraseBytes, (byte) 0);
+        if (passphraseBuffer.hasArray()) {
+            Arrays.fill(passphraseBuffer.array(), (byte) 0);
+        }
+
+        digest.update(saltBytes);
+        return DatatypeConverter.printBase64Binary(digest.digest());
+    }
+
     private static Cipher getCipher() throws EncryptionException {
         final String METHOD = "getCipher";
 
@@ -14,13 +14,15 @@ import oracle.weblogic.deploy.logging.PlatformLogger;
 import oracle.weblogic.deploy.util.PyOrderedDict;
 import oracle.weblogic.deploy.util.StringUtils;
 
+import org.antlr.v4.runtime.BailErrorStrategy;
 import org.antlr.v4.runtime.CharStream;
 import org.antlr.v4.runtime.CharStreams;
 import org.antlr.v4.runtime.CommonTokenStream;
+import org.antlr.v4.runtime.DefaultErrorStrategy;
+import org.antlr.v4.runtime.ParserRuleContext;
+import org.antlr.v4.runtime.RecognitionException;
 import org.antlr.v4.runtime.atn.PredictionMode;
 import org.antlr.v4.runtime.misc.ParseCancellationException;
-import org.antlr.v4.runtime.tree.ParseTree;
-import org.antlr.v4.runtime.tree.ParseTreeWalker;
 import org.python.core.Py;
 import org.python.core.PyDictionary;
 import org.python.core.PyFloat;
@@ -30,14 +32,15 @@ import org.python.core.PyObject;
 import org.python.core.PyString;
 
 /**
- * This class does the heavy-lifting of walking the parse tree and performing the conversion into a Python dictionary.
+ * This class does the heavy-lifting of listening to the parser and performing the conversion into a Python dictionary.
+ * The dictionary is built from the parse events as the input is parsed, and each completed pair or array element is
+ * pruned from the parse tree, so the parse tree never holds more than the values that enclose the current position.
  */
 public abstract class AbstractJsonTranslator extends JSONBaseListener {
 
     private PyDictionary fileDict;
     private Deque<PyDictionary> currentDict;
     private Deque<PyList> currentArray;
-    private Deque<String> currentPairName;
     private Deque<ValueType> currentValueType;
     private PyObject currentScalarValue;
     @SuppressWarnings("WeakerAccess")
@@ -63,26 +66,16 @@ public abstract class AbstractJsonTranslator extends JSONBaseListener {
         }
         currentDict = new ArrayDeque<>();
         currentArray = new ArrayDeque<>();
-        currentPairName = new ArrayDeque<>();
         currentValueType = new ArrayDeque<>();
         currentScalarValue = Py.None;
     }
 
-    /**
-     * {@inheritDoc}
-     */
-    @Override
-    public void enterPair(JSONParser.PairContext ctx) {
-        String name = resolveEscapeSequences(StringUtils.stripQuotes(ctx.STRING().getText()));
-        currentPairName.push(name);
-    }
-
     /**
      * {@inheritDoc}
      */
     @Override
     public void exitPair(JSONParser.PairContext ctx) {
-        String name = currentPairName.pop();
+        String name = getPairName(ctx);
         ValueType valueType = currentValueType.pop();
         PyDictionary container;
         PyObject value;
@@ -115,9 +108,13 @@ public abstract class AbstractJsonTranslator extends JSONBaseListener {
      * {@inheritDoc}
      */
     @Override
-    public void enterJsonObject(JSONParser.JsonObjectContext ctx) {
-        String METHOD = "enterJsonObject";
-        if (currentPairName.isEmpty()) {
+    public void enterObj(JSONParser.ObjContext ctx) {
+        String METHOD = "enterObj";
+
+        // The labeled value context is the parent of the object, and the pair name
+        // has been matched by the time the parser enters the object.
+        ParserRuleContext valueOwner = ctx.getParent().getParent();
+        if (valueOwner instanceof JSONParser.JsonContext) {
             // This should only happen for the outermost object that the file defines.
             //
             currentDict.push(fileDict);
@@ -132,13 +129,15 @@ public abstract class AbstractJsonTranslator extends JSONBaseListener {
             newObjectDict = new PyDictionary();
         }
 
-        String name = currentPairName.peek();
-        if (currentDict.peek().has_key(new PyString(name))) {
-            String message = ExceptionHelper.getMessage("WLSDPLY-18028", name);
-            ParseCancellationException ex =
-                new ParseCancellationException(message);
-            getLogger().throwing(getClassName(), METHOD, ex);
-            throw ex;
+        if (valueOwner instanceof JSONParser.PairContext) {
+            String name = getPairName((JSONParser.PairContext) valueOwner);
+            if (currentDict.peek().has_key(new PyString(name))) {
+                String message = ExceptionHelper.getMessage("WLSDPLY-18028", name);
+                ParseCancellationException ex =
+                    new ParseCancellationException(message);
+                getLogger().throwing(getClassName(), METHOD, ex);
+                throw ex;
+            }
         }
         currentDict.push(newObjectDict);
         currentValueType.push(ValueType.OBJECT);
@@ -152,7 +151,7 @@ public abstract class AbstractJsonTranslator extends JSONBaseListener {
         // This method also gets called at the very end of the file so we need to
         // guard against this condition and do nothing...
         //
-        if (currentPairName.isEmpty()) {
+        if (ctx.getParent() instanceof JSONParser.JsonContext) {
             return;
         }
         addToArrayIfNeeded();
@@ -162,7 +161,7 @@ public abstract class AbstractJsonTranslator extends JSONBaseListener {
      * {@inheritDoc}
      */
     @Override
-    public void enterJsonArray(JSONParser.JsonArrayContext ctx) {
+    public void enterArray(JSONParser.ArrayContext ctx) {
         PyList list = new PyList();
         currentArray.push(list);
         currentValueType.push(ValueType.ARRAY);
@@ -180,17 +179,10 @@ public abstract class AbstractJsonTranslator extends JSONBaseListener {
      * {@inheritDoc}
      */
     @Override
-    public void enterJsonString(JSONParser.JsonStringContext ctx) {
+    public void exitJsonString(JSONParser.JsonStringContext ctx) {
         String cleanString = resolveEscapeSequences(StringUtils.stripQuotes(ctx.STRING().getText()));
         currentScalarValue = new PyString(cleanString);
         currentValueType.push(ValueType.SCALAR);
-    }
-
-    /**
-     * {@inheritDoc}
-     */
-    @Override
-    public void exitJsonString(JSONParser.JsonStringContext ctx) {
         addToArrayIfNeeded();
     }
 
@@ -198,7 +190,7 @@ public abstract class AbstractJsonTranslator extends JSONBaseListener {
      * {@inheritDoc}
      */
     @Override
-    public void enterJsonNumber(JSONParser.JsonNumberContext ctx) {
+    public void exitJsonNumber(JSONParser.JsonNumberContext ctx) {
         String numberText = ctx.NUMBER().getText();
         PyObject value;
         if (!StringUtils.isEmpty(numberText)) {
@@ -225,13 +217,6 @@ public abstract class AbstractJsonTranslator extends JSONBaseListener {
         }
         currentScalarValue = value;
         currentValueType.push(ValueType.SCALAR);
-    }
-
-    /**
-     * {@inheritDoc}
-     */
-    @Override
-    public void exitJsonNumber(JSONParser.JsonNumberContext ctx) {
         addToArrayIfNeeded();
     }
 
@@ -239,16 +224,9 @@ public abstract class AbstractJsonTranslator extends JSONBaseListener {
      * {@inheritDoc}
      */
     @Override
-    public void enterJsonTrue(JSONParser.JsonTrueContext ctx) {
+    public void exitJsonTrue(JSONParser.JsonTrueContext ctx) {
         currentScalarValue = new PyString("True");
         currentValueType.push(ValueType.SCALAR);
-    }
-
-    /**
-     * {@inheritDoc}
-     */
-    @Override
-    public void exitJsonTrue(JSONParser.JsonTrueContext ctx) {
         addToArrayIfNeeded();
     }
 
@@ -256,16 +234,9 @@ public abstract class AbstractJsonTranslator extends JSONBaseListener {
      * {@inheritDoc}
      */
     @Override
-    public void enterJsonFalse(JSONParser.JsonFalseContext ctx) {
+    public void exitJsonFalse(JSONParser.JsonFalseContext ctx) {
         currentScalarValue = new PyString("False");
         currentValueType.push(ValueType.SCALAR);
-    }
-
-    /**
-     * {@inheritDoc}
-     */
-    @Override
-    public void exitJsonFalse(JSONParser.JsonFalseContext ctx) {
         addToArrayIfNeeded();
     }
 
@@ -273,17 +244,24 @@ public abstract class AbstractJsonTranslator extends JSONBaseListener {
      * {@inheritDoc}
      */
     @Override
-    public void enterJsonNull(JSONParser.JsonNullContext ctx) {
+    public void exitJsonNull(JSONParser.JsonNullContext ctx) {
         currentScalarValue = Py.None;
         currentValueType.push(ValueType.SCALAR);
+        addToArrayIfNeeded();
     }
 
     /**
      * {@inheritDoc}
      */
     @Override
-    public void exitJsonNull(JSONParser.JsonNullContext ctx) {
-        addToArrayIfNeeded();
+    public void exitEveryRule(ParserRuleContext ctx) {
+        // A completed pair or array element has been added to its container, so drop it and its
+        // preceding siblings from the parse tree to keep the tree proportional to the nesting depth.
+        ParserRuleContext parent = ctx.getParent();
+        if ((ctx instanceof JSONParser.PairContext || parent instanceof JSONParser.ArrayContext)
+            && parent.children != null) {
+            parent.children.clear();
+        }
     }
 
     protected abstract String getClassName();
@@ -304,14 +282,26 @@ public abstract class AbstractJsonTranslator extends JSONBaseListener {
 
                 CommonTokenStream tokens = new CommonTokenStream(lexer);
                 JSONParser parser = new JSONParser(tokens);
+                parser.addParseListener(this);
 
+                // Try the faster SLL prediction first, failing at the first syntax error.
+                // Only if that fails, parse again with full LL prediction to report the errors.
                 parser.removeErrorListeners();
-                parser.addErrorListener(errorListener);
-                parser.getInterpreter().setPredictionMode(PredictionMode.LL_EXACT_AMBIG_DETECTION);
-
-                ParseTree tree = parser.json();
-                ParseTreeWalker walker = new ParseTreeWalker();
-                walker.walk(this, tree);
+                parser.setErrorHandler(new BailErrorStrategy());
+                parser.getInterpreter().setPredictionMode(PredictionMode.SLL);
+                try {
+                    parser.json();
+                } catch (ParseCancellationException pce) {
+                    if (!(pce.getCause() instanceof RecognitionException)) {
+                        throw pce;
+                    }
+                    getLogger().finer("WLSDPLY-18029", "JSON", jsonFileName);
+                    parser.reset();
+                    parser.addErrorListener(errorListener);
+                    parser.setErrorHandler(new DefaultErrorStrategy());
+                    parser.getInterpreter().setPredictionMode(PredictionMode.LL_EXACT_AMBIG_DETECTION);
+                    parser.json();
+                }
             } catch (IOException ioe) {
                 JsonException ex =
                     new JsonException("WLSDPLY-18007", ioe, "JSON", jsonFileName, ioe.getLocalizedMessage());
@@ -360,6 +350,10 @@ public abstract class AbstractJsonTranslator extends JSONBaseListener {
         }
     }
 
+    private static String getPairName(JSONParser.PairContext ctx) {
+        return resolveEscapeSequences(StringUtils.stripQuotes(ctx.STRING().getText()));
+    }
+
     private static String resolveEscapeSequences(String text) {
         String result = text;
         if (!StringUtils.isEmpty(text)) {
@@ -41,6 +41,22 @@ public class WLSDeployCustomizeLoggingConfig extends WLSDeployLoggingConfig {
     private static final String WLSDEPLOY_HANDLER_PROP = WLSDEPLOY_LOGGER_NAME + ".handlers";
     private static final String WLSDEPLOY_HANDLER_METHOD = "getHandlerProperties";
 
+    /**
+     * The constructor.
+     */
+    public WLSDeployCustomizeLoggingConfig() {
+        super();
+    }
+
+    /**
+     * The constructor that configures the logging for the specified program.
+     *
+     * @param programName the name of the program
+     */
+    public WLSDeployCustomizeLoggingConfig(String programName) {
+        super(programName);
+    }
+
     /**
      * Check the logging.properties file for a "WLSDEPLOY".handlers property. If the property does not exist,
      * check to see if the WLSDEPLOY_LOG_HANDLERS_ENV_VARIABLE environment variable has been set.
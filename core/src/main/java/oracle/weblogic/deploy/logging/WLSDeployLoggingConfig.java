@@ -120,7 +120,16 @@ public class WLSDeployLoggingConfig {
      * The constructor.
      */
     public WLSDeployLoggingConfig() {
-        String programName = System.getenv(WLSDEPLOY_PROGRAM_NAME_ENV_VARIABLE);
+        this(System.getenv(WLSDEPLOY_PROGRAM_NAME_ENV_VARIABLE));
+    }
+
+    /**
+     * The constructor that configures the logging for the specified program, instead of the program
+     * named by the environment.  This is used by the tool daemon to log each tool it runs to the tool's log file.
+     *
+     * @param programName the name of the program
+     */
+    public WLSDeployLoggingConfig(String programName) {
         if (StringUtils.isEmpty(programName)) {
             programName = DEFAULT_PROGRAM_NAME;
         }
@@ -165,6 +174,10 @@ public class WLSDeployLoggingConfig {
     }
 
     public static synchronized File getLoggingDirectory() {
+        if (loggingDirectory == null) {
+            // logging was not configured by a tool, so use the temporary directory
+            return new File(System.getProperty("java.io.tmpdir"));
+        }
         return new File(loggingDirectory.getAbsolutePath());
     }
 
@@ -0,0 +1,191 @@
+/*
+ * Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.util;
+
+import java.io.File;
+import java.io.FileInputStream;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.io.InputStream;
+import java.io.OutputStream;
+import java.security.NoSuchAlgorithmException;
+import java.util.Map;
+import java.util.Properties;
+import java.util.concurrent.ConcurrentHashMap;
+
+import oracle.weblogic.deploy.logging.PlatformLogger;
+import oracle.weblogic.deploy.logging.WLSDeployLogFactory;
+
+/**
+ * A cache of the Base64-encoded hashes of files and archive entries, so that binaries that have not changed
+ * are not read again to compute their hashes.
+ * <p>
+ * The hash of a file is reused while the canonical path, the size, and the modification time of the file are
+ * the same.  The hash of an archive entry is reused while the path, the CRC-32 checksum, and the size of the
+ * entry are the same.  The cache can be saved to a properties file and loaded by later runs.  It can be used
+ * by concurrent threads, although two threads may compute the hash of the same file at the same time.
+ */
+public class FileDigestCache {
+    private static final String CLASS = FileDigestCache.class.getName();
+    private static final PlatformLogger LOGGER = WLSDeployLogFactory.getLogger("wlsdeploy.util");
+
+    private static final String FILE_KEY_PREFIX = "file:";
+    private static final String ENTRY_KEY_PREFIX = "entry:";
+    private static final char VALUE_SEPARATOR = ' ';
+
+    private final File cacheFile;
+    private final Map<String, String> hashes = new ConcurrentHashMap<>();
+    private boolean loaded;
+    private volatile boolean modified;
+
+    /**
+     * Create a cache that is saved to the specified file.
+     *
+     * @param cacheFile the properties file that holds the cache, or null if the cache should not be saved
+     */
+    public FileDigestCache(File cacheFile) {
+        this.cacheFile = cacheFile;
+    }
+
+    /**
+     * Get the Base64-encoded hash of the file, computing it only if the file has changed since it was cached.
+     *
+     * @param fileName the file name
+     * @return the Base64-encoded hash
+     * @throws IOException if an error occurs reading the file
+     * @throws NoSuchAlgorithmException if an error occurs obtaining the hashing algorithm
+     * @throws IllegalArgumentException if the file is not a valid, existing file
+     */
+    public String getFileHash(String fileName) throws IOException, NoSuchAlgorithmException {
+        final String METHOD = "getFileHash";
+
+        LOGGER.entering(CLASS, METHOD, fileName);
+        File file = FileUtils.getCanonicalFile(FileUtils.validateExistingFile(fileName));
+        String key = FILE_KEY_PREFIX + file.getPath();
+        String validator = file.length() + ":" + file.lastModified();
+
+        String result = getCachedHash(key, validator);
+        if (result == null) {
+            result = FileUtils.computeHash(file);
+            putCachedHash(key, validator, result);
+        } else {
+            LOGGER.finer("WLSDPLY-01150", file);
+        }
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
+
+    /**
+     * Get the Base64-encoded hash of the archive entry, computing it only if the entry has changed since it was
+     * cached.  The hash of an entry with no checksum, such as an entry that has not been saved, is not cached.
+     *
+     * @param archive the archive
+     * @param path the path of the entry in the archive
+     * @return the Base64-encoded hash
+     * @throws WLSDeployArchiveIOException if an error occurs reading the entry
+     */
+    public String getArchiveEntryHash(WLSDeployArchive archive, String path) throws WLSDeployArchiveIOException {
+        final String METHOD = "getArchiveEntryHash";
+
+        LOGGER.entering(CLASS, METHOD, archive.getArchiveFileName(), path);
+        String validator = archive.getFileChecksum(path);
+        if (validator == null) {
+            String result = archive.getFileHash(path);
+            LOGGER.exiting(CLASS, METHOD, result);
+            return result;
+        }
+
+        String key = ENTRY_KEY_PREFIX + path;
+        String result = getCachedHash(key, validator);
+        if (result == null) {
+            result = archive.getFileHash(path);
+            putCachedHash(key, validator, result);
+        } else {
+            LOGGER.finer("WLSDPLY-01151", path, archive.getArchiveFileName());
+        }
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
+
+    /**
+     * Save the cache to its file, if the cache has a file and any hash has been added.  Errors are logged
+     * and otherwise ignored, since the hashes can be computed again.
+     */
+    public void save() {
+        final String METHOD = "save";
+
+        LOGGER.entering(CLASS, METHOD);
+        if (cacheFile == null || !modified) {
+            LOGGER.exiting(CLASS, METHOD);
+            return;
+        }
+
+        Properties properties = new Properties();
+        properties.putAll(hashes);
+
+        File directory = cacheFile.getParentFile();
+        if (directory != null && !directory.isDirectory() && !directory.mkdirs()) {
+            LOGGER.fine("WLSDPLY-01152", cacheFile, directory);
+            LOGGER.exiting(CLASS, METHOD);
+            return;
+        }
+
+        try (OutputStream outputStream = new FileOutputStream(cacheFile)) {
+            properties.store(outputStream, null);
+            modified = false;
+            LOGGER.fine("WLSDPLY-01153", hashes.size(), cacheFile);
+        } catch (IOException ioe) {
+            LOGGER.warning("WLSDPLY-01154", ioe, cacheFile, ioe.getLocalizedMessage());
+        }
+        LOGGER.exiting(CLASS, METHOD);
+    }
+
+    private String getCachedHash(String key, String validator) {
+        load();
+        String value = hashes.get(key);
+        if (value != null) {
+            int separatorIndex = value.indexOf(VALUE_SEPARATOR);
+            if (separatorIndex > 0 && validator.equals(value.substring(0, separatorIndex))) {
+                return value.substring(separatorIndex + 1);
+            }
+        }
+        return null;
+    }
+
+    private void putCachedHash(String key, String validator, String hash) {
+        hashes.put(key, validator + VALUE_SEPARATOR + hash);
+        modified = true;
+    }
+
+    /**
+     * Read the cache file the first time the cache is used.  A file that cannot be read is ignored.
+     */
+    private synchronized void load() {
+        if (loaded) {
+            return;
+        }
+        loaded = true;
+
+        if (cacheFile == null || !cacheFile.isFile()) {
+            return;
+        }
+
+        Properties properties = new Properties();
+        try (InputStream inputStream = new FileInputStream(cacheFile)) {
+            properties.load(inputStream);
+        } catch (IOException | IllegalArgumentException ex) {
+            LOGGER.warning("WLSDPLY-01155", ex, cacheFile, ex.getLocalizedMessage());
+            return;
+        }
+
+        for (String key : properties.stringPropertyNames()) {
+            // hashes computed by this run are newer than the saved hashes
+            if (!hashes.containsKey(key)) {
+                hashes.put(key, properties.getProperty(key));
+            }
+        }
+        LOGGER.finer("WLSDPLY-01156", hashes.size(), cacheFile);
+    }
+}
@@ -11,8 +11,14 @@ import java.io.FileOutputStream;
 import java.io.FilenameFilter;
 import java.io.IOException;
 import java.io.InputStream;
+import java.nio.file.FileVisitResult;
 import java.nio.file.Files;
+import java.nio.file.LinkOption;
+import java.nio.file.Path;
 import java.nio.file.Paths;
+import java.nio.file.SimpleFileVisitor;
+import java.nio.file.StandardCopyOption;
+import java.nio.file.attribute.BasicFileAttributes;
 import java.security.MessageDigest;
 import java.security.NoSuchAlgorithmException;
 import java.util.ArrayList;
@@ -40,6 +46,7 @@ public final class FileUtils {
     private static final int FILE_NAME_POS = 0;
     private static final int FILE_EXT_POS = 1;
     private static final int READ_BUFFER_SIZE = 4096;
+    private static final int HASH_BUFFER_SIZE = 65536;
 
     private FileUtils() {
         // hide the constructor for this utility class
@@ -523,6 +530,40 @@ public final class FileUtils {
         LOGGER.exiting(directory);
     }
 
+    /**
+     * Copy a directory and all of its contents, recursively.  The file attributes, such as the permissions
+     * and last modified times, are copied, and symbolic links are copied as links.
+     *
+     * @param sourceDirectory the directory to copy
+     * @param targetDirectory the directory to create, which must not exist or must be empty
+     * @throws IOException if an error occurs copying the directory
+     */
+    public static void copyDirectory(File sourceDirectory, File targetDirectory) throws IOException {
+        final String METHOD = "copyDirectory";
+
+        LOGGER.entering(CLASS, METHOD, sourceDirectory, targetDirectory);
+        final Path sourcePath = sourceDirectory.toPath();
+        final Path targetPath = targetDirectory.toPath();
+        Files.walkFileTree(sourcePath, new SimpleFileVisitor<Path>() {
+            @Override
+            public FileVisitResult preVisitDirectory(Path dir, BasicFileAttributes attrs) throws IOException {
+                Path targetDir = targetPath.resolve(sourcePath.relativize(dir));
+                if (!Files.isDirectory(targetDir, LinkOption.NOFOLLOW_LINKS)) {
+                    Files.copy(dir, targetDir, StandardCopyOption.COPY_ATTRIBUTES, LinkOption.NOFOLLOW_LINKS);
+                }
+                return FileVisitResult.CONTINUE;
+            }
+
+            @Override
+            public FileVisitResult visitFile(Path file, BasicFileAttributes attrs) throws IOException {
+                Files.copy(file, targetPath.resolve(sourcePath.relativize(file)), StandardCopyOption.COPY_ATTRIBUTES,
+                    LinkOption.NOFOLLOW_LINKS);
+                return FileVisitResult.CONTINUE;
+            }
+        });
+        LOGGER.exiting(CLASS, METHOD);
+    }
+
     /**
      * Compute the Base64-encoded hash for the specified file.
      *
@@ -558,12 +599,38 @@ public final class FileUtils {
         LOGGER.entering(CLASS, METHOD, file);
         validateExistingFile(file);
 
-        byte[] fileBytes = readFileToByteArray(file);
-        String result = computeHash(fileBytes);
+        String result;
+        try (FileInputStream fis = new FileInputStream(file)) {
+            result = computeHash(fis);
+        }
         LOGGER.exiting(CLASS, METHOD, result);
         return result;
     }
 
+    /**
+     * Compute the Base64-encoded hash for the contents of the specified input stream, reading it in blocks
+     * so that the contents are never held in memory.  The caller is responsible for closing the stream.
+     *
+     * @param input the input stream to read
+     * @return the Base64-encoded hash
+     * @throws IOException if an error occurs reading the input stream
+     * @throws NoSuchAlgorithmException if an error occurs obtaining the hashing algorithm
+     */
+    public static String computeHash(InputStream input) throws IOException, NoSuchAlgorithmException {
+        MessageDigest messageDigest = MessageDigest.getInstance("MD5");
+        byte[] readBuffer = new byte[HASH_BUFFER_SIZE];
+
+        int bytesRead;
+        while (true) {
+            bytesRead = input.read(readBuffer);
+            if (bytesRead < 0) {
+                break;
+            }
+            messageDigest.update(readBuffer, 0, bytesRead);
+        }
+        return DatatypeConverter.printBase64Binary(messageDigest.digest());
+    }
+
     /**
      * Compute the Base64-encoded hash for the specified bytes.
      *
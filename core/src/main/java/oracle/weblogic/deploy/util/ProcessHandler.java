@@ -29,6 +29,7 @@ public class ProcessHandler {
     private static final PlatformLogger LOGGER = WLSDeployLogFactory.getLogger("wlsdeploy.util");
 
     private static final long POLL_INTERVAL = 1000L;
+    private static final long DRAINER_JOIN_TIMEOUT = 5000L;
     private static final int MILLIS_PER_SECOND = 1000;
     private static final Charset DEFAULT_CHARSET = Charset.defaultCharset();
 
@@ -40,6 +41,7 @@ public class ProcessHandler {
     private int timeout = -1;
     private WaitHandler waitHandler;
     private List<String> stdoutBuffer;
+    private String stdoutLogName;
 
     /**
      * The constructor.
@@ -99,6 +101,15 @@ public class ProcessHandler {
         stdoutWriter = System.out;
     }
 
+    /**
+     * Set the writing of each line of the standard output of the process to the log as it is read.
+     *
+     * @param name the name used to identify the process output in the log
+     */
+    public void setLogStdout(String name) {
+        stdoutLogName = name;
+    }
+
     /**
      * Set the time to wait for the process to complete.  The default is -1, which means no timeout.
      *
@@ -248,6 +259,8 @@ public class ProcessHandler {
                 }
                 if (!isRunning()) {
                     waitHandler.processExit(process);
+                    // let the drainer read the last of the output, so the log and buffer are complete
+                    drainerThread.join(DRAINER_JOIN_TIMEOUT);
                     return;
                 }
                 Thread.sleep(POLL_INTERVAL);
@@ -326,7 +339,9 @@ public class ProcessHandler {
                     if (stdoutBuffer != null) {
                         stdoutBuffer.add(msg);
                     }
-                    if (logToLog) {
+                    if (stdoutLogName != null) {
+                        LOGGER.info("WLSDPLY-01209", stdoutLogName, msg);
+                    } else if (logToLog) {
                         LOGGER.fine("WLSDPLY-01207", this.toString(), msg);
                     }
                 }
@@ -4,13 +4,11 @@
  */
 package oracle.weblogic.deploy.util;
 
-import java.io.IOException;
-import java.io.ObjectInputStream;
-import java.util.Collection;
+import java.util.ArrayList;
+import java.util.Collections;
+import java.util.HashSet;
 import java.util.Iterator;
-import java.util.LinkedHashMap;
-import java.util.LinkedHashSet;
-import java.util.Map;
+import java.util.List;
 import java.util.Set;
 
 import oracle.weblogic.deploy.exception.ExceptionHelper;
@@ -29,20 +27,30 @@ import org.python.core.ThreadState;
 
 /**
  * A basic implementation of a Python dictionary that preserves order.
+ * <p>
+ * The entries are stored only in the PyDictionary superclass.  The insertion order is kept in a list of keys,
+ * where a deleted key leaves a stale slot that is dropped when the list is next compacted.  This makes delete and
+ * reinsert constant time, and the list is compacted before the keys are listed or when half of it is stale.
+ * <p>
+ * The sharedCopy() method returns a copy that shares its nested containers with this dictionary until they are
+ * accessed.  The first access of the values of either dictionary gives it its own copies of the nested containers,
+ * so subtrees that are never accessed are never copied.
  */
 public final class PyOrderedDict extends PyDictionary implements Iterable<PyObject> {
-    private static final long serialVersionUID = 1L;
+    private static final long serialVersionUID = 2L;
 
     private static final PlatformLogger LOGGER = WLSDeployLogFactory.getLogger("wlsdeploy.util");
 
-    private final LinkedHashMap<PyObject, PyObject> linkedHashMap;
+    private final List<PyObject> keyOrder;
+    private int staleKeyCount;
+    private volatile boolean shared;
 
     /**
      * The no-args constructor.
      */
     public PyOrderedDict() {
         super(PyType.fromClass(PyOrderedDict.class));
-        this.linkedHashMap = new LinkedHashMap<>();
+        this.keyOrder = new ArrayList<>();
     }
 
     /**
@@ -52,7 +60,6 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     public PyOrderedDict(PyOrderedDict other) {
         this();
-        super.update(other);
         update(other);
     }
 
@@ -101,8 +108,8 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
             result = -2;
         } else {
             other = (PyOrderedDict) ob_other;
-            int an = this.linkedHashMap.size();
-            int bn = other.linkedHashMap.size();
+            int an = __len__();
+            int bn = other.__len__();
             if (an < bn) {
                 result = -1;
             } else if (an > bn) {
@@ -119,7 +126,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
         akeys.sort();
         bkeys.sort();
 
-        for (int i = 0; i < other.linkedHashMap.size(); i++) {
+        for (int i = 0; i < bkeys.size(); i++) {
             PyObject akey = akeys.pyget(i);
             PyObject bkey = bkeys.pyget(i);
             int c = akey._cmp(bkey);
@@ -185,26 +192,54 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
         // referenced from one of it's attributes.
         memoDict.__setitem__(new PyString(Py.idstr(this)), newPyOrderedDict);
 
-        for (Map.Entry<PyObject, PyObject> entry : linkedHashMap.entrySet()) {
-            PyObject newKey = doDeepCopy(entry.getKey(), memo);
-            PyObject newValue = doDeepCopy(entry.getValue(), memo);
+        for (PyObject key : getOrderedKeys()) {
+            PyObject newKey = doDeepCopy(key, memo);
+            PyObject newValue = doDeepCopy(super.__finditem__(key), memo);
             newPyOrderedDict.__setitem__(newKey, newValue);
         }
         return newPyOrderedDict;
     }
 
+    /**
+     * Create a copy of this dictionary that shares its nested dictionaries and lists with this dictionary,
+     * instead of copying them.  Each dictionary gets its own copies of the nested values the first time that
+     * its values are accessed, so the two dictionaries can be changed independently.  Nested dictionaries are
+     * copied the same way, so only the accessed parts of the tree are copied.
+     * <p>
+     * References to nested values obtained before this method is called are not protected,
+     * changes made through them are seen by both dictionaries.
+     *
+     * @return a copy of this dictionary
+     */
+    public PyOrderedDict sharedCopy() {
+        PyOrderedDict newPyOrderedDict = new PyOrderedDict();
+        synchronized (this.keyOrder) {
+            for (PyObject key : getOrderedKeys()) {
+                newPyOrderedDict.__setitem__(key, super.__finditem__(key));
+            }
+            this.shared = true;
+        }
+        newPyOrderedDict.shared = true;
+        return newPyOrderedDict;
+    }
+
     /**
      * {@inheritDoc}
      */
     @Override
     public void __delitem__(PyObject key) {
-        synchronized (this.linkedHashMap){
-            PyObject ret = this.linkedHashMap.remove(key);
-            if (ret == null) {
+        synchronized (this.keyOrder) {
+            if (!super.has_key(key)) {
                 throw Py.KeyError(key.toString());
             }
+            super.__delitem__(key);
+
+            // leave the key in the order list, it is removed when the list is compacted
+            this.staleKeyCount++;
+            if (this.staleKeyCount > this.keyOrder.size() / 2) {
+                compactKeyOrder();
+            }
         }
-        super.__delitem__(key);
     }
 
     /**
@@ -218,8 +253,8 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
 
         PyObject result = Py.One;
         PyOrderedDict other = (PyOrderedDict)ob_other;
-        int an = this.linkedHashMap.size();
-        int bn = other.linkedHashMap.size();
+        int an = __len__();
+        int bn = other.__len__();
         if (an != bn) {
             result = Py.Zero;
         } else {
@@ -255,7 +290,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public PyObject __iter__(){
-        return new PyOrderedDictIter(this, this.linkedHashMap.keySet(), PyOrderedDictIter.KEYS);
+        return new PyOrderedDictIter(this, getOrderedKeys(), PyOrderedDictIter.KEYS);
     }
 
     /**
@@ -263,7 +298,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public int __len__() {
-        return this.linkedHashMap.size();
+        return super.__len__();
     }
 
     /**
@@ -271,7 +306,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public boolean __nonzero__() {
-        return this.linkedHashMap.size() != 0;
+        return super.__len__() != 0;
     }
 
     /**
@@ -279,13 +314,15 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public void __setitem__(PyObject key, PyObject value) {
-        synchronized (this.linkedHashMap) {
-            this.linkedHashMap.put(key, value);
-        }
         // do not access protected field directly.
         // 2.7 version does not have table variable.
         // Neither version has synchronization on the table.
-        super.__setitem__(key, value);
+        synchronized (this.keyOrder) {
+            if (!super.has_key(key)) {
+                this.keyOrder.add(key);
+            }
+            super.__setitem__(key, value);
+        }
     }
 
     /**
@@ -293,8 +330,11 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public void clear() {
-        this.linkedHashMap.clear();
-        super.clear();
+        synchronized (this.keyOrder) {
+            this.keyOrder.clear();
+            this.staleKeyCount = 0;
+            super.clear();
+        }
     }
 
     /**
@@ -302,6 +342,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public PyOrderedDict copy() {
+        unshare();
         PyOrderedDict newPyOrderedDict = new PyOrderedDict();
         newPyOrderedDict.doUpdate(this);
         return newPyOrderedDict;
@@ -320,11 +361,10 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public PyObject get(PyObject key, PyObject default_object) {
-        // Cannot use getOrDefault() as this is a Java 8 method and
-        // the project is attempting to be compatible with Java 7...
-        PyObject result = default_object;
-        if (linkedHashMap.containsKey(key)) {
-            result = linkedHashMap.get(key);
+        unshare();
+        PyObject result = super.__finditem__(key);
+        if (result == null) {
+            result = default_object;
         }
         return result;
     }
@@ -334,7 +374,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public boolean has_key(PyObject key) {
-        return this.linkedHashMap.containsKey(key);
+        return super.has_key(key);
     }
 
     /**
@@ -342,12 +382,13 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public PyList items() {
-        Set<Map.Entry<PyObject, PyObject>> entries = this.linkedHashMap.entrySet();
-        java.util.Vector<PyObject> l = new java.util.Vector<>(entries.size());
-        for (Map.Entry<PyObject, PyObject> entry: entries) {
-            l.add(new PyTuple(new PyObject[] { entry.getKey(), entry.getValue() }));
+        unshare();
+        PyObject[] keys = getOrderedKeys();
+        PyObject[] items = new PyObject[keys.length];
+        for (int i = 0; i < keys.length; i++) {
+            items[i] = new PyTuple(new PyObject[] { keys[i], super.__finditem__(keys[i]) });
         }
-        return new PyList(l.toArray(new PyObject[0]));
+        return new PyList(items);
     }
 
     /**
@@ -355,7 +396,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public Iterator<PyObject> iterator(){
-        return new PyOrderedDictIter(this, this.linkedHashMap.keySet(), PyOrderedDictIter.ITEMS);
+        return new PyOrderedDictIter(this, getOrderedKeys(), PyOrderedDictIter.ITEMS);
     }
 
     /**
@@ -363,7 +404,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public PyObject iterkeys() {
-        return new PyOrderedDictIter(this, this.linkedHashMap.keySet(), PyOrderedDictIter.KEYS);
+        return new PyOrderedDictIter(this, getOrderedKeys(), PyOrderedDictIter.KEYS);
     }
 
     /**
@@ -371,7 +412,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public PyObject itervalues() {
-        return new PyOrderedDictIter(this, this.linkedHashMap.keySet(), PyOrderedDictIter.VALUES);
+        return new PyOrderedDictIter(this, getOrderedKeys(), PyOrderedDictIter.VALUES);
     }
 
     /**
@@ -379,7 +420,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public PyObject iteritems() {
-        return new PyOrderedDictIter(this, this.linkedHashMap.keySet(), PyOrderedDictIter.ITEMS);
+        return new PyOrderedDictIter(this, getOrderedKeys(), PyOrderedDictIter.ITEMS);
     }
 
     /**
@@ -387,10 +428,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public PyList keys() {
-        Set<PyObject> keys = this.linkedHashMap.keySet();
-        java.util.Vector<PyObject> v = new java.util.Vector<>(keys.size());
-        v.addAll(keys);
-        return new PyList(v.toArray(new PyObject[0]));
+        return new PyList(getOrderedKeys());
     }
 
     /**
@@ -414,6 +452,40 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
         return val;
     }
 
+    /**
+     * {@inheritDoc}
+     */
+    @Override
+    public PyObject popitem() {
+        PyObject[] keys = getOrderedKeys();
+        if (keys.length == 0) {
+            throw Py.KeyError("popitem(): dictionary is empty");
+        }
+        PyObject key = keys[keys.length - 1];
+        return new PyTuple(new PyObject[] { key, this.pop(key) });
+    }
+
+    /**
+     * {@inheritDoc}
+     */
+    @Override
+    public PyObject setdefault(PyObject key) {
+        return this.setdefault(key, Py.None);
+    }
+
+    /**
+     * {@inheritDoc}
+     */
+    @Override
+    public PyObject setdefault(PyObject key, PyObject failobj) {
+        synchronized (this.keyOrder) {
+            if (!this.has_key(key)) {
+                this.__setitem__(key, failobj);
+            }
+            return this.get(key);
+        }
+    }
+
     /**
      * {@inheritDoc}
      */
@@ -424,12 +496,11 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
             return "{...}";
         }
 
-        Set<Map.Entry<PyObject, PyObject>> entries = this.linkedHashMap.entrySet();
         StringBuilder buf = new StringBuilder("{");
-        for (Map.Entry<PyObject, PyObject> entry: entries) {
-            buf.append((entry.getKey()).__repr__());
+        for (PyObject key: getOrderedKeys()) {
+            buf.append(key.__repr__());
             buf.append(": ");
-            buf.append((entry.getValue()).__repr__());
+            buf.append(super.__finditem__(key).__repr__());
             buf.append(", ");
         }
         if(buf.length() > 1){
@@ -471,14 +542,78 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      * @return an ordered list of values
      */
     public PyList getValues() {
-        Collection<PyObject> values = this.linkedHashMap.values();
-        java.util.Vector<PyObject> v = new java.util.Vector<>(values.size());
-        v.addAll(values);
-        return new PyList(v.toArray(new PyObject[0]));
+        unshare();
+        PyObject[] keys = getOrderedKeys();
+        PyObject[] values = new PyObject[keys.length];
+        for (int i = 0; i < keys.length; i++) {
+            values[i] = super.__finditem__(keys[i]);
+        }
+        return new PyList(values);
     }
 
     // private methods
 
+    private PyObject[] getOrderedKeys() {
+        synchronized (this.keyOrder) {
+            if (this.staleKeyCount > 0) {
+                compactKeyOrder();
+            }
+            return this.keyOrder.toArray(new PyObject[this.keyOrder.size()]);
+        }
+    }
+
+    /*
+     * Remove the stale slots from the key order list.  A key that was deleted and added again
+     * has more than one slot, the last slot holds its position.  Must be called holding the keyOrder lock.
+     */
+    private void compactKeyOrder() {
+        List<PyObject> keys = new ArrayList<>(super.__len__());
+        Set<PyObject> found = new HashSet<>();
+        for (int i = this.keyOrder.size() - 1; i >= 0; i--) {
+            PyObject key = this.keyOrder.get(i);
+            if (super.has_key(key) && found.add(key)) {
+                keys.add(key);
+            }
+        }
+        Collections.reverse(keys);
+        this.keyOrder.clear();
+        this.keyOrder.addAll(keys);
+        this.staleKeyCount = 0;
+    }
+
+    /*
+     * If this dictionary shares its nested values with a copy, replace them with copies of its own.
+     */
+    private void unshare() {
+        if (this.shared) {
+            synchronized (this.keyOrder) {
+                if (this.shared) {
+                    for (PyObject key : getOrderedKeys()) {
+                        PyObject value = super.__finditem__(key);
+                        PyObject newValue = copySharedValue(value);
+                        if (newValue != value) {
+                            super.__setitem__(key, newValue);
+                        }
+                    }
+                    this.shared = false;
+                }
+            }
+        }
+    }
+
+    private static PyObject copySharedValue(PyObject value) {
+        PyObject result = value;
+        if (value instanceof PyOrderedDict) {
+            result = ((PyOrderedDict) value).sharedCopy();
+        } else {
+            String typeName = value.getType().fastGetName();
+            if ("list".equals(typeName) || "dict".equals(typeName)) {
+                result = doDeepCopy(value, new PyDictionary());
+            }
+        }
+        return result;
+    }
+
     private static PyObject dictFromKeys(PyType type, PyObject keys, PyObject value) {
         if (value == null) {
             value = Py.None;
@@ -497,7 +632,6 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
         for (int i = 0; i < pylist.size(); i++) {
             PyTuple tuple = (PyTuple) pylist.get(i);
             this.__setitem__(Py.java2py(tuple.get(0)), Py.java2py(tuple.get(1)));
-            super.__setitem__(Py.java2py(tuple.get(0)), Py.java2py(tuple.get(1)));
         }
     }
 
@@ -579,22 +713,22 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      * Iterator class for PyOrderedDict class.
      */
     static final class PyOrderedDictIter extends PyIterator implements Iterator<PyObject> {
-        private static final long serialVersionUID = 1L;
+        private static final long serialVersionUID = 2L;
 
         private static final int KEYS = 0;
         private static final int VALUES = 1;
         private static final int ITEMS = 2;
 
         private PyObject orderedDict;
-        private Set<PyObject> dictKeys;
+        private PyObject[] dictKeys;
         private int type;
-        private transient Iterator iter;
+        private int index;
 
-        private PyOrderedDictIter(PyObject orderedDict, Set<PyObject> dictKeys, int type) {
+        private PyOrderedDictIter(PyObject orderedDict, PyObject[] dictKeys, int type) {
             this.orderedDict = orderedDict;
-            this.dictKeys = new LinkedHashSet<>(dictKeys);
+            this.dictKeys = dictKeys;
             this.type = type;
-            this.iter = dictKeys.iterator();
+            this.index = 0;
         }
 
         /**
@@ -610,7 +744,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
          */
         @Override
         public boolean hasNext(){
-            return this.iter.hasNext();
+            return this.index < this.dictKeys.length;
         }
 
         /**
@@ -620,7 +754,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
         public PyObject next() {
             PyObject result = null;
             if (hasNext()) {
-                PyObject key = (PyObject) this.iter.next();
+                PyObject key = this.dictKeys[this.index++];
                 switch (type) {
                     case VALUES:
                         result = orderedDict.__finditem__(key);
@@ -638,12 +772,6 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
             return result;
         }
 
-        @SuppressWarnings("unused")
-        private void readObject(ObjectInputStream in) throws IOException, ClassNotFoundException {
-            in.defaultReadObject();
-            iter = dictKeys.iterator();
-        }
-
         /**
          * {@inheritDoc}
          */
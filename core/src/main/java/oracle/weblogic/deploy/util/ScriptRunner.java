@@ -29,6 +29,7 @@ public class ScriptRunner {
     private List<String> stdoutBuffer;
     private File stdoutFile;
     private String stdoutLogBaseName;
+    private boolean logStdout = false;
 
     /**
      * The constructor.
@@ -41,6 +42,15 @@ public class ScriptRunner {
         this.env = new HashMap<>(env);
     }
 
+    /**
+     * Set whether each line of the external program's standard output is also written to the log.
+     *
+     * @param logStdout true to write the output to the log as it is produced
+     */
+    public void setLogStdout(boolean logStdout) {
+        this.logStdout = logStdout;
+    }
+
     /**
      * Run the external program.
      *
@@ -77,6 +87,9 @@ public class ScriptRunner {
         ProcessHandler processHandler = new ProcessHandler(command, cwd);
         processHandler.setStdoutLog(stdoutFile, appendFlag);
         processHandler.setBufferStdout();
+        if (logStdout) {
+            processHandler.setLogStdout(stdoutLogBaseName);
+        }
 
         for (Map.Entry<String, String> envEntry : env.entrySet()) {
             String var = envEntry.getKey();
@@ -318,8 +318,7 @@ public class WLSDeployArchive {
         boolean result = false;
         // Verify that the path is into the binary root directory so that we do not allow random content.
         if (isPathIntoArchive(path)) {
-            List<String> entries = getZipFile().listZipEntries();
-            result = entries.contains(path);
+            result = getZipFile().containsZipEntry(path);
         }
         LOGGER.exiting(CLASS, METHOD, result);
         return result;
@@ -342,8 +341,7 @@ public class WLSDeployArchive {
         boolean result = false;
         // Verify that the path is into the binary root directory so that we do not allow random content.
         if (isPathIntoArchive(path)) {
-            List<String> entries = getZipFile().listZipEntries();
-            result = !entries.contains(path) && zipListContainsPath(entries, path);
+            result = !getZipFile().containsZipEntry(path) && getZipFile().containsZipEntryWithPrefix(path);
         }
         LOGGER.exiting(CLASS, METHOD, result);
         return result;
@@ -367,8 +365,8 @@ public class WLSDeployArchive {
         boolean result = false;
         // Verify that the path is into the binary root directory so that we do not allow random content.
         if (isPathIntoArchive(path)) {
-            List<String> entries = getZipFile().listZipEntries();
-            result = entries.contains(path) || zipListContainsPath(entries, path);
+            // an entry that matches the path also starts with it
+            result = getZipFile().containsZipEntryWithPrefix(path);
         }
         LOGGER.exiting(CLASS, METHOD, result);
         return result;
@@ -488,44 +486,53 @@ public class WLSDeployArchive {
             throw aioe;
         }
 
-        Map<String, InputStream> zipEntries = getZipFile().getZipEntries(path);
-        if (zipEntries.isEmpty() || !zipEntries.containsKey(path)) {
+        InputStream zipEntry = getZipFile().getZipEntry(path);
+        if (zipEntry == null) {
             WLSDeployArchiveIOException aioe =
                 new WLSDeployArchiveIOException("WLSDPLY-01406", getArchiveFileName(), path);
             LOGGER.throwing(CLASS, METHOD, aioe);
-            closeMapInputStreams(zipEntries);
-            getZipFile().close();
             throw aioe;
         }
 
-        byte[] fileBytes;
-        try {
-            fileBytes = FileUtils.readInputStreamToByteArray(zipEntries.get(path));
-        } catch (IOException ioe) {
-            WLSDeployArchiveIOException aioe =
-                new WLSDeployArchiveIOException("WLSDPLY-01407", ioe, getArchiveFileName(), path,
-                    ioe.getLocalizedMessage());
-            LOGGER.throwing(CLASS, METHOD, aioe);
-            throw aioe;
-        } finally {
-            closeMapInputStreams(zipEntries);
-            getZipFile().close();
-        }
-
         String result;
         try {
-            result = FileUtils.computeHash(fileBytes);
-        } catch (NoSuchAlgorithmException e) {
+            result = FileUtils.computeHash(zipEntry);
+        } catch (IOException | NoSuchAlgorithmException e) {
             WLSDeployArchiveIOException aioe =
                 new WLSDeployArchiveIOException("WLSDPLY-01407", e, getArchiveFileName(), path,
                     e.getLocalizedMessage());
             LOGGER.throwing(CLASS, METHOD, aioe);
             throw aioe;
+        } finally {
+            try {
+                zipEntry.close();
+            } catch (IOException ignore) {
+                LOGGER.warning("WLSDPLY-01417", ignore, path, ignore.getLocalizedMessage());
+            }
         }
         LOGGER.exiting(CLASS, METHOD, result);
         return result;
     }
 
+    /**
+     * Get a value that changes when the content of the specified archive file entry changes,
+     * made from the CRC-32 checksum and the size of the entry.
+     *
+     * @param path the path into the archive file
+     * @return the checksum value, or null if the entry does not exist or has no checksum
+     * @throws WLSDeployArchiveIOException if an error occurs while reading the archive
+     */
+    public String getFileChecksum(String path) throws WLSDeployArchiveIOException {
+        final String METHOD = "getFileChecksum";
+
+        LOGGER.entering(CLASS, METHOD, path);
+        validateNonEmptyString(path, "path", METHOD);
+
+        String result = getZipFile().getZipEntryChecksum(path);
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
+
     /**
      * This method adds an application to the archive.  If an application with the same name already exists, this
      * method assumes that the new one also needs to be added so it changes the name to prevent conflicts by adding
@@ -1094,6 +1101,59 @@ public class WLSDeployArchive {
         getZipFile().removeZipEntries(WLSDPLY_ARCHIVE_BINARY_DIR + ZIP_SEP);
     }
 
+    /**
+     * Begin a batch of changes to the archive.  Until the batch is committed, the files that are added
+     * and removed are staged, and the archive file is written once, when the batch is committed.
+     * The archive behaves as if the staged changes had been saved, so added entries are renamed to avoid
+     * conflicts with the staged entries, and the staged entries are listed and extracted like saved entries.
+     * The files of a directory that is added are read when the batch is committed, so they must not be
+     * removed before then.
+     *
+     * @throws WLSDeployArchiveIOException if the archive cannot be read or the staging directory cannot be created
+     * @throws IllegalStateException if a batch is already open
+     */
+    public void beginBatch() throws WLSDeployArchiveIOException {
+        final String METHOD = "beginBatch";
+
+        LOGGER.entering(CLASS, METHOD);
+        getZipFile().beginBatch();
+        LOGGER.exiting(CLASS, METHOD);
+    }
+
+    /**
+     * Determine whether a batch of changes to the archive is open.
+     *
+     * @return true if changes are being staged, false otherwise
+     */
+    public boolean isBatchOpen() {
+        return getZipFile().isBatchOpen();
+    }
+
+    /**
+     * Write the staged changes of the open batch to the archive file, in a single pass.
+     *
+     * @throws WLSDeployArchiveIOException if an error occurs while writing the archive file
+     * @throws IllegalStateException if no batch is open
+     */
+    public void commitBatch() throws WLSDeployArchiveIOException {
+        final String METHOD = "commitBatch";
+
+        LOGGER.entering(CLASS, METHOD);
+        getZipFile().commitBatch();
+        LOGGER.exiting(CLASS, METHOD);
+    }
+
+    /**
+     * Discard the staged changes of the open batch, if any, leaving the archive file unchanged.
+     */
+    public void rollbackBatch() {
+        final String METHOD = "rollbackBatch";
+
+        LOGGER.entering(CLASS, METHOD);
+        getZipFile().rollbackBatch();
+        LOGGER.exiting(CLASS, METHOD);
+    }
+
     /**
      * Closes the underlying zip file and any open streams.
      */
@@ -1303,7 +1363,6 @@ public class WLSDeployArchive {
             throw wdaioe;
         } finally {
             closeMapInputStreams(zipEntries);
-            getZipFile().close();
         }
         LOGGER.exiting(CLASS, METHOD);
     }
@@ -1349,7 +1408,6 @@ public class WLSDeployArchive {
             } catch (IOException ignore) {
                 LOGGER.warning("WLSDPLY-01417", ignore, itemToExtract, ignore.getLocalizedMessage());
             }
-            getZipFile().close();
         }
         LOGGER.exiting(CLASS, METHOD);
     }
@@ -1358,19 +1416,6 @@ public class WLSDeployArchive {
     // Private Helper methods used by the protected methods above...         //
     ///////////////////////////////////////////////////////////////////////////
 
-    private static boolean zipListContainsPath(List<String> entries, String path) {
-        boolean foundInList = false;
-        if (path != null && entries != null) {
-            for (String entry : entries) {
-                if (entry.startsWith(path)) {
-                    foundInList = true;
-                    break;
-                }
-            }
-        }
-        return foundInList;
-    }
-
     private static void copyFile(InputStream input, FileOutputStream output) throws IOException {
         byte[] readBuffer = new byte[READ_BUFFER_SIZE];
 
@@ -25,6 +25,8 @@ public class WLSDeployExit {
     private static final String CLASS = WLSDeployExit.class.getName();
     private static final PlatformLogger LOGGER = WLSDeployLogFactory.getLogger("wlsdeploy.util");
 
+    private static volatile boolean exitDisabled = false;
+
     /**
      * Perform any last methods for the tools and exit the JVM.
      *
@@ -46,9 +48,22 @@ public class WLSDeployExit {
      */
     public static void exit(int error_code) {
         // might want to validate the exit code first
+        if (exitDisabled) {
+            throw new WLSDeployExitException(error_code);
+        }
         System.exit(error_code);
     }
 
+    /**
+     * Disable or enable exiting the JVM.  A tool that is run by the tool daemon must not exit the JVM,
+     * so the exit methods throw a WLSDeployExitException with the exit code when exiting is disabled.
+     *
+     * @param disabled true if exiting the JVM should be disabled
+     */
+    public static void setExitDisabled(boolean disabled) {
+        exitDisabled = disabled;
+    }
+
     /**
      * Returns the first handler that is assignment-compatible with the specified class.
      * @param handlerClass the class to check for compatibility
@@ -0,0 +1,33 @@
+/*
+ * Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.util;
+
+/**
+ * The exception thrown by WLSDeployExit in place of exiting the JVM, when exiting is disabled.
+ */
+public class WLSDeployExitException extends RuntimeException {
+    private static final long serialVersionUID = 1L;
+
+    private final int exitCode;
+
+    /**
+     * Constructor that takes the tool exit code.
+     *
+     * @param exitCode the exit code of the tool
+     */
+    public WLSDeployExitException(int exitCode) {
+        super("exit code " + exitCode);
+        this.exitCode = exitCode;
+    }
+
+    /**
+     * Get the exit code of the tool.
+     *
+     * @return the exit code
+     */
+    public int getExitCode() {
+        return exitCode;
+    }
+}
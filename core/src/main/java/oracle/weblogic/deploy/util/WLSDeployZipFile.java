@@ -4,11 +4,13 @@
  */
 package oracle.weblogic.deploy.util;
 
+import java.io.ByteArrayInputStream;
 import java.io.File;
 import java.io.FileInputStream;
 import java.io.FileOutputStream;
 import java.io.IOException;
 import java.io.InputStream;
+import java.io.OutputStream;
 import java.nio.file.Files;
 import java.nio.file.Path;
 import java.util.ArrayList;
@@ -17,7 +19,9 @@ import java.util.Iterator;
 import java.util.LinkedHashMap;
 import java.util.List;
 import java.util.Map;
+import java.util.TreeSet;
 import java.util.regex.Pattern;
+import java.util.zip.CRC32;
 import java.util.zip.ZipEntry;
 import java.util.zip.ZipFile;
 import java.util.zip.ZipOutputStream;
@@ -28,6 +32,15 @@ import oracle.weblogic.deploy.logging.WLSDeployLogFactory;
 
 /**
  * The internal class that does the heavy-lifting with zip files for the WLSDeployArchive class.
+ * <p>
+ * The entry names are read from the zip file once and kept in an index, along with the zip file handle
+ * used to read the entries, until the zip file is modified.  The index is also rebuilt if the size or
+ * the modification time of the file changes, in case the file was changed by another process.
+ * <p>
+ * Each change is normally saved by writing a new zip file.  Between beginBatch() and commitBatch(), changes
+ * are staged instead, and the zip file is written once, when the batch is committed.  New entries whose content
+ * is already compressed, such as application archives, are stored without compression when a batch is committed,
+ * so they are copied as-is whenever the zip file is written again.
  */
 public class WLSDeployZipFile {
     private static final String CLASS = WLSDeployZipFile.class.getName();
@@ -40,6 +53,9 @@ public class WLSDeployZipFile {
     private static final char ZIP_SEP_CHAR = '/';
     private static final String ZIP_SEP = "/";
     private static final int READ_BUFFER_SIZE = 4096;
+    private static final String[] COMPRESSED_CONTENT_EXTENSIONS = {
+        ".ear", ".war", ".jar", ".rar", ".gar", ".zip", ".gz", ".tgz"
+    };
 
     private static final int MAX_DIGITS = Integer.toString(Integer.MAX_VALUE).length() - 1;
     private static final String ARCHIVE_RENAME_PATTERN_REGEX = ".+\\([0-9]{1," + MAX_DIGITS + "}\\)/?$";
@@ -52,6 +68,15 @@ public class WLSDeployZipFile {
     private ZipFile openZipFile;
     private boolean newFile;
 
+    private LinkedHashMap<String, ZipEntry> entryIndex;
+    private TreeSet<String> sortedEntryNames;
+    private long indexedFileLength;
+    private long indexedFileLastModified;
+
+    private File batchDirectory;
+    private LinkedHashMap<String, StagedEntry> stagedEntries;
+    private boolean batchModified;
+
     //////////////////////////////////////////////////////////////////////////////////////////////////
     // Public APIs                                                                                  //
     //////////////////////////////////////////////////////////////////////////////////////////////////
@@ -101,20 +126,20 @@ public class WLSDeployZipFile {
         final String METHOD = "getZipEntry";
 
         LOGGER.entering(CLASS, METHOD, key);
-        closeOpenZipFile();
 
-        LinkedHashMap<String, ZipEntry> map = getZipFileEntries(getFile());
+        Map<String, ZipEntry> map = getEntryIndex();
         InputStream stream = null;
-        boolean leaveOpen = false;
         try {
             if (map.containsKey(key)) {
                 LOGGER.finer("WLSDPLY-01500", getFileName(), key);
-                openZipFile = new ZipFile(getFile(), ZIP_FILE_OPEN_MODE);
-                ZipEntry ze = new ZipEntry(key);
-                sanitizeZipEntry(ze);
-                stream = openZipFile.getInputStream(ze);
-                leaveOpen = true;
-                LOGGER.finer("WLSDPLY-01501", getFileName(), ze.getName(), stream.toString());
+                if (isStagedEntry(key)) {
+                    stream = getStagedEntryStream(key);
+                } else {
+                    ZipEntry ze = new ZipEntry(key);
+                    sanitizeZipEntry(ze);
+                    stream = getReadZipFile().getInputStream(ze);
+                }
+                LOGGER.finer("WLSDPLY-01501", getFileName(), key, stream.toString());
             } else {
                 LOGGER.finer("WLSDPLY-01502", getFileName(), key);
             }
@@ -123,15 +148,32 @@ public class WLSDeployZipFile {
                 getFileName(), ioe.getLocalizedMessage());
             LOGGER.throwing(CLASS, METHOD, wdaioe);
             throw wdaioe;
-        } finally {
-            if (!leaveOpen && openZipFile != null) {
-                closeOpenZipFile();
-            }
         }
         LOGGER.exiting(CLASS, METHOD, stream);
         return stream;
     }
 
+    /**
+     * Get a value that changes when the content of an entry changes, made from the CRC-32 checksum
+     * and the size recorded for the entry in the zip file.
+     *
+     * @param key entry name
+     * @return the checksum value, or null if the entry does not exist or has no recorded checksum
+     * @throws WLSDeployArchiveIOException if an error occurs while reading the zip file
+     */
+    public String getZipEntryChecksum(String key) throws WLSDeployArchiveIOException {
+        final String METHOD = "getZipEntryChecksum";
+
+        LOGGER.entering(CLASS, METHOD, key);
+        String result = null;
+        ZipEntry entry = getEntryIndex().get(key);
+        if (entry != null && !isStagedEntry(key) && entry.getCrc() != -1 && entry.getSize() != -1) {
+            result = Long.toHexString(entry.getCrc()) + ":" + entry.getSize();
+        }
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
+
     /**
      * Get the list of entries in the zip file.
      *
@@ -142,9 +184,8 @@ public class WLSDeployZipFile {
         final String METHOD = "listZipEntries";
 
         LOGGER.entering(CLASS, METHOD);
-        closeOpenZipFile();
 
-        Map<String, ZipEntry> zipEntries = getZipFileEntries(file);
+        Map<String, ZipEntry> zipEntries = getEntryIndex();
         List<String> result = new ArrayList<>(zipEntries.keySet());
         LOGGER.exiting(CLASS, METHOD, result);
         return result;
@@ -161,9 +202,8 @@ public class WLSDeployZipFile {
         final String METHOD = "listZipEntries";
 
         LOGGER.entering(CLASS, METHOD, prefix);
-        closeOpenZipFile();
 
-        Map<String, ZipEntry> zipEntries = getZipFileEntries(file);
+        Map<String, ZipEntry> zipEntries = getEntryIndex();
         List<String> result = new ArrayList<>();
         for (String name : zipEntries.keySet()) {
             if (name.startsWith(prefix)) {
@@ -174,6 +214,41 @@ public class WLSDeployZipFile {
         return result;
     }
 
+    /**
+     * Determine whether the zip file has an entry with the specified name.
+     *
+     * @param key the entry name
+     * @return true if the entry exists, false otherwise
+     * @throws WLSDeployArchiveIOException if an error occurs while reading the zip file
+     */
+    public boolean containsZipEntry(String key) throws WLSDeployArchiveIOException {
+        final String METHOD = "containsZipEntry";
+
+        LOGGER.entering(CLASS, METHOD, key);
+        boolean result = getEntryIndex().containsKey(key);
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
+
+    /**
+     * Determine whether the zip file has any entry whose name starts with the specified prefix.
+     *
+     * @param prefix the beginning part of the entry name
+     * @return true if a matching entry exists, false otherwise
+     * @throws WLSDeployArchiveIOException if an error occurs while reading the zip file
+     */
+    public boolean containsZipEntryWithPrefix(String prefix) throws WLSDeployArchiveIOException {
+        final String METHOD = "containsZipEntryWithPrefix";
+
+        LOGGER.entering(CLASS, METHOD, prefix);
+        getEntryIndex();
+        // any name that starts with the prefix sorts before any greater name that does not
+        String firstMatch = sortedEntryNames.ceiling(prefix);
+        boolean result = firstMatch != null && firstMatch.startsWith(prefix);
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
+
     /**
      * Get the entries in the zip file.  Because this code returns input streams from the ZipFile,
      * the caller must call close() when they are finished with the input streams.
@@ -185,29 +260,21 @@ public class WLSDeployZipFile {
         final String METHOD = "getZipEntries";
 
         LOGGER.entering(CLASS, METHOD);
-        closeOpenZipFile();
 
-        LinkedHashMap<String, ZipEntry> map = getZipFileEntries(getFile());
+        Map<String, ZipEntry> map = getEntryIndex();
         LinkedHashMap<String, InputStream> zipEntries = new LinkedHashMap<>();
-        boolean leaveOpen = false;
         try {
             if (!map.isEmpty()) {
                 LOGGER.finer("WLSDPLY-01504", getFileName(), map.size());
-                openZipFile = new ZipFile(getFile(), ZIP_FILE_OPEN_MODE);
                 for (String key : map.keySet()) {
                     addEntryToMap(map, zipEntries, key);
                 }
-                leaveOpen = true;
             }
         } catch (IOException ioe) {
             WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01503", ioe,
                 getFileName(), ioe.getLocalizedMessage());
             LOGGER.throwing(CLASS, METHOD, wdaioe);
             throw wdaioe;
-        } finally {
-            if (!leaveOpen && openZipFile != null) {
-                closeOpenZipFile();
-            }
         }
         LOGGER.exiting(CLASS, METHOD, zipEntries);
         return zipEntries;
@@ -226,15 +293,12 @@ public class WLSDeployZipFile {
         final String METHOD = "getZipEntries";
 
         LOGGER.entering(CLASS, METHOD, key);
-        closeOpenZipFile();
 
-        LinkedHashMap<String, ZipEntry> map = getZipFileEntries(getFile());
+        Map<String, ZipEntry> map = getEntryIndex();
         LinkedHashMap<String, InputStream> zipEntries = new LinkedHashMap<>();
-        boolean leaveOpen = false;
         try {
             if (!map.isEmpty()) {
                 LOGGER.finer("WLSDPLY-01504", getFileName(), map.size());
-                openZipFile = new ZipFile(getFile(), ZIP_FILE_OPEN_MODE);
                 Iterator<String> savedKeys = map.keySet().iterator();
                 while (savedKeys.hasNext()) {
                     String savedKey = savedKeys.next();
@@ -242,17 +306,12 @@ public class WLSDeployZipFile {
                         addEntryToMap(map, zipEntries, savedKey);
                     }
                 }
-                leaveOpen = true;
             }
         } catch (IOException ioe) {
             WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01503", ioe,
                 getFileName(), ioe.getLocalizedMessage());
             LOGGER.throwing(CLASS, METHOD, wdaioe);
             throw wdaioe;
-        } finally {
-            if (!leaveOpen && openZipFile != null) {
-                closeOpenZipFile();
-            }
         }
         LOGGER.exiting(CLASS, METHOD, zipEntries);
         return zipEntries;
@@ -272,11 +331,15 @@ public class WLSDeployZipFile {
         closeOpenZipFile();
 
         boolean removedEntry = false;
-        LinkedHashMap<String, ZipEntry> map = getZipFileEntries(getFile());
-        if (map.containsKey(key)) {
+        if (getEntryIndex().containsKey(key)) {
             LOGGER.finer("WLSDPLY-01500", getFileName(), key);
-            map.remove(key);
-            saveChangesToZip(map, null);
+            if (isBatchOpen()) {
+                unstageEntry(key);
+            } else {
+                LinkedHashMap<String, ZipEntry> map = getZipFileEntries();
+                map.remove(key);
+                saveChangesToZip(map, null);
+            }
             removedEntry = true;
         } else {
             LOGGER.finer("WLSDPLY-01502", getFileName(), key);
@@ -301,16 +364,23 @@ public class WLSDeployZipFile {
         closeOpenZipFile();
 
         boolean removedEntry = false;
-        LinkedHashMap<String, ZipEntry> entriesMap = getZipFileEntries(getFile());
-        if (!entriesMap.isEmpty()) {
-            ArrayList<String> matchingKeys = getMatchingKeysFromMap(entriesMap, key);
+        Map<String, ZipEntry> index = getEntryIndex();
+        if (!index.isEmpty()) {
+            ArrayList<String> matchingKeys = getMatchingKeysFromMap(index, key);
             if (!matchingKeys.isEmpty()) {
                 LOGGER.finer("WLSDPLY-01505", getFileName(), key, matchingKeys.size());
 
-                for (String matchingKey : matchingKeys) {
-                    entriesMap.remove(matchingKey);
+                if (isBatchOpen()) {
+                    for (String matchingKey : matchingKeys) {
+                        unstageEntry(matchingKey);
+                    }
+                } else {
+                    LinkedHashMap<String, ZipEntry> entriesMap = getZipFileEntries();
+                    for (String matchingKey : matchingKeys) {
+                        entriesMap.remove(matchingKey);
+                    }
+                    saveChangesToZip(entriesMap, null);
                 }
-                saveChangesToZip(entriesMap, null);
                 removedEntry = true;
             } else {
                 LOGGER.finer("WLSDPLY-01506", getFileName(), key);
@@ -366,17 +436,20 @@ public class WLSDeployZipFile {
         closeOpenZipFile();
 
         boolean addedEntry = true;
-        LinkedHashMap<String, ZipEntry> zipEntriesMap = getZipFileEntries(getFile());
-        if (zipEntriesMap.containsKey(key)) {
+        if (getEntryIndex().containsKey(key)) {
             LOGGER.finer("WLSDPLY-01509", getFileName(), key);
             addedEntry = false;
         }
         // still true so ok to proceed
         if (addedEntry) {
             LOGGER.finer("WLSDPLY-01510", getFileName(), key);
-            LinkedHashMap<String, InputStream> newEntries = new LinkedHashMap<>();
-            newEntries.put(key, inputStream);
-            saveChangesToZip(zipEntriesMap, newEntries);
+            if (isBatchOpen()) {
+                stageEntry(key, spoolEntry(key, inputStream));
+            } else {
+                LinkedHashMap<String, InputStream> newEntries = new LinkedHashMap<>();
+                newEntries.put(key, inputStream);
+                saveChangesToZip(getZipFileEntries(), newEntries);
+            }
             LOGGER.finer("WLSDPLY-01511", getFileName(), key);
         }
         LOGGER.exiting(CLASS, METHOD, addedEntry);
@@ -433,17 +506,20 @@ public class WLSDeployZipFile {
         closeOpenZipFile();
 
         boolean addedEntry = true;
-        LinkedHashMap<String, ZipEntry> zipEntriesMap = getZipFileEntries(getFile());
-        if (zipEntriesMap.containsKey(key)) {
+        if (getEntryIndex().containsKey(key)) {
             LOGGER.finer("WLSDPLY-01509", getFileName(), key);
             addedEntry = false;
         }
         // still true so ok to proceed
         if (addedEntry) {
             LOGGER.finer("WLSDPLY-01510", getFileName(), key);
-            LinkedHashMap<String, InputStream> newEntries = new LinkedHashMap<>();
-            newEntries.put(key, null);
-            saveChangesToZip(zipEntriesMap, newEntries);
+            if (isBatchOpen()) {
+                stageEntry(key, null);
+            } else {
+                LinkedHashMap<String, InputStream> newEntries = new LinkedHashMap<>();
+                newEntries.put(key, null);
+                saveChangesToZip(getZipFileEntries(), newEntries);
+            }
             LOGGER.finer("WLSDPLY-01511", getFileName(), key);
         }
         LOGGER.exiting(CLASS, METHOD, addedEntry);
@@ -495,13 +571,17 @@ public class WLSDeployZipFile {
         if (!rootEntryName.endsWith(ZIP_SEP)) {
             rootEntryName += ZIP_SEP;
         }
-        LinkedHashMap<String, ZipEntry> existingEntries = getZipFileEntries(getFile());
-        LinkedHashMap<String, InputStream> newEntries = new LinkedHashMap<>();
-        try {
-            addDirectoryToUnsavedMap(newEntries, directory, rootEntryName);
-            saveChangesToZip(existingEntries, newEntries);
-        } finally {
-            cleanupUnsavedEntries(newEntries);
+        if (isBatchOpen()) {
+            stageDirectory(directory, rootEntryName);
+        } else {
+            LinkedHashMap<String, ZipEntry> existingEntries = getZipFileEntries();
+            LinkedHashMap<String, InputStream> newEntries = new LinkedHashMap<>();
+            try {
+                addDirectoryToUnsavedMap(newEntries, directory, rootEntryName);
+                saveChangesToZip(existingEntries, newEntries);
+            } finally {
+                cleanupUnsavedEntries(newEntries);
+            }
         }
         LOGGER.exiting(CLASS, METHOD, newEntryName);
         return newEntryName;
@@ -520,25 +600,120 @@ public class WLSDeployZipFile {
         LOGGER.entering(CLASS, METHOD, key, inputStream);
         closeOpenZipFile();
 
-        LinkedHashMap<String, ZipEntry> zipEntriesMap = getZipFileEntries(getFile());
-        if (zipEntriesMap.containsKey(key)) {
-            zipEntriesMap.remove(key);
+        if (isBatchOpen()) {
+            LOGGER.finer("WLSDPLY-01510", getFileName(), key);
+            stageEntry(key, spoolEntry(key, inputStream));
+            LOGGER.finer("WLSDPLY-01511", getFileName(), key);
+        } else {
+            LinkedHashMap<String, ZipEntry> zipEntriesMap = getZipFileEntries();
+            if (zipEntriesMap.containsKey(key)) {
+                zipEntriesMap.remove(key);
+            }
+
+            LinkedHashMap<String, InputStream> entryToPut = new LinkedHashMap<>();
+            entryToPut.put(key, inputStream);
+            try {
+                LOGGER.finer("WLSDPLY-01510", getFileName(), key);
+                saveChangesToZip(zipEntriesMap, entryToPut);
+                LOGGER.finer("WLSDPLY-01511", getFileName(), key);
+            } finally {
+                cleanupUnsavedEntries(entryToPut);
+            }
         }
+        LOGGER.exiting(CLASS, METHOD);
+    }
 
-        LinkedHashMap<String, InputStream> entryToPut = new LinkedHashMap<>();
-        entryToPut.put(key, inputStream);
+    /**
+     * Begin a batch of changes.  Until the batch is committed or rolled back, entries that are added or removed
+     * are staged instead of saved, and the entries are listed and read as if the staged changes had been saved.
+     * The content of each added entry is copied to a staging directory beside the zip file, except for the files
+     * added by addDirectoryZipEntries(), which are read from the directory when the batch is committed.
+     *
+     * @throws WLSDeployArchiveIOException if the zip file cannot be read or the staging directory cannot be created
+     * @throws IllegalStateException if a batch is already open
+     */
+    public void beginBatch() throws WLSDeployArchiveIOException {
+        final String METHOD = "beginBatch";
+
+        LOGGER.entering(CLASS, METHOD);
+        if (isBatchOpen()) {
+            String message = ExceptionHelper.getMessage("WLSDPLY-01543", getFileName());
+            IllegalStateException ise = new IllegalStateException(message);
+            LOGGER.throwing(CLASS, METHOD, ise);
+            throw ise;
+        }
+
+        // while the batch is open, the index includes the staged changes
+        getEntryIndex();
         try {
-            LOGGER.finer("WLSDPLY-01510", getFileName(), key);
-            saveChangesToZip(zipEntriesMap, entryToPut);
-            LOGGER.finer("WLSDPLY-01511", getFileName(), key);
+            batchDirectory = FileUtils.createTempDirectory(getFile().getParentFile(), "wdt_batch");
+        } catch (IOException ioe) {
+            WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01544", ioe,
+                getFileName(), ioe.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, wdaioe);
+            throw wdaioe;
+        }
+        stagedEntries = new LinkedHashMap<>();
+        batchModified = false;
+        LOGGER.fine("WLSDPLY-01545", getFileName(), batchDirectory.getAbsolutePath());
+        LOGGER.exiting(CLASS, METHOD);
+    }
+
+    /**
+     * Determine whether a batch of changes is open.
+     *
+     * @return true if changes are being staged, false otherwise
+     */
+    public boolean isBatchOpen() {
+        return stagedEntries != null;
+    }
+
+    /**
+     * Save the staged changes of the open batch, writing the zip file once.  The batch is closed,
+     * and the staging directory is removed, whether or not the changes are saved successfully.
+     *
+     * @throws WLSDeployArchiveIOException if an error occurs while reading or writing the zip file
+     * @throws IllegalStateException if no batch is open
+     */
+    public void commitBatch() throws WLSDeployArchiveIOException {
+        final String METHOD = "commitBatch";
+
+        LOGGER.entering(CLASS, METHOD);
+        if (!isBatchOpen()) {
+            String message = ExceptionHelper.getMessage("WLSDPLY-01546", getFileName());
+            IllegalStateException ise = new IllegalStateException(message);
+            LOGGER.throwing(CLASS, METHOD, ise);
+            throw ise;
+        }
+
+        try {
+            if (batchModified) {
+                LOGGER.fine("WLSDPLY-01547", getFileName(), stagedEntries.size());
+                saveBatchToZip();
+            }
         } finally {
-            cleanupUnsavedEntries(entryToPut);
+            endBatch();
         }
         LOGGER.exiting(CLASS, METHOD);
     }
 
     /**
-     * Closes the open zip file from the last call, if any, which in turn closes all open input streams into the zip.
+     * Discard the staged changes of the open batch, if any, leaving the zip file unchanged.
+     */
+    public void rollbackBatch() {
+        final String METHOD = "rollbackBatch";
+
+        LOGGER.entering(CLASS, METHOD);
+        if (isBatchOpen()) {
+            LOGGER.fine("WLSDPLY-01548", getFileName(), stagedEntries.size());
+            endBatch();
+        }
+        LOGGER.exiting(CLASS, METHOD);
+    }
+
+    /**
+     * Closes the open zip file, if any, which in turn closes all open input streams into the zip.
+     * The entry index is kept, and the zip file is opened again when an entry is next read.
      */
     public void close() {
         final String METHOD = "close";
@@ -631,18 +806,46 @@ public class WLSDeployZipFile {
         return value;
     }
 
-    private LinkedHashMap<String, ZipEntry> getZipFileEntries(File zipFile) throws WLSDeployArchiveIOException {
-        final String METHOD = "getZipEntries";
+    /**
+     * Get a copy of the zip file entries, which the caller may modify.
+     *
+     * @return the entries, keyed by name, in the order they appear in the zip file
+     * @throws WLSDeployArchiveIOException if an error occurs while reading the zip file
+     */
+    private LinkedHashMap<String, ZipEntry> getZipFileEntries() throws WLSDeployArchiveIOException {
+        return new LinkedHashMap<>(getEntryIndex());
+    }
+
+    /**
+     * Get the index of the zip file entries, reading the entries from the zip file if the index
+     * has not been built, or if the zip file has changed since it was built.  The caller must not
+     * modify the returned map.
+     *
+     * @return the entries, keyed by name, in the order they appear in the zip file
+     * @throws WLSDeployArchiveIOException if an error occurs while reading the zip file
+     */
+    private Map<String, ZipEntry> getEntryIndex() throws WLSDeployArchiveIOException {
+        final String METHOD = "getEntryIndex";
+
+        if (entryIndex != null) {
+            if (isBatchOpen() ||
+                (getFile().length() == indexedFileLength && getFile().lastModified() == indexedFileLastModified)) {
+                return entryIndex;
+            }
+            // changed by another process, so the open zip file is stale too
+            closeOpenZipFile();
+        }
 
         LinkedHashMap<String, ZipEntry> savedZipEntries = new LinkedHashMap<>();
+        TreeSet<String> savedNames = new TreeSet<>();
         if (zipFileIsNotEmpty()) {
-            savedZipEntries = new LinkedHashMap<>();
-            try (ZipFile zipper = new ZipFile(zipFile, ZIP_FILE_OPEN_MODE)) {
-                Enumeration<?> entries = zipper.entries();
+            try {
+                Enumeration<?> entries = getReadZipFile().entries();
                 while (entries.hasMoreElements()) {
                     ZipEntry entry = (ZipEntry) entries.nextElement();
                     String key = entry.getName();
                     savedZipEntries.put(key, entry);
+                    savedNames.add(key);
                 }
             } catch (IOException ioe) {
                 WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01503",
@@ -650,8 +853,34 @@ public class WLSDeployZipFile {
                 LOGGER.throwing(CLASS, METHOD, wdaioe);
                 throw wdaioe;
             }
+            LOGGER.finer("WLSDPLY-01542", getFileName(), savedZipEntries.size());
         }
-        return savedZipEntries;
+        entryIndex = savedZipEntries;
+        sortedEntryNames = savedNames;
+        indexedFileLength = getFile().length();
+        indexedFileLastModified = getFile().lastModified();
+        return entryIndex;
+    }
+
+    /**
+     * Discard the index of the zip file entries, after the zip file has been modified.
+     */
+    private void invalidateEntryIndex() {
+        entryIndex = null;
+        sortedEntryNames = null;
+    }
+
+    /**
+     * Get the zip file handle used to read entries, opening the zip file if it is not open.
+     *
+     * @return the open zip file
+     * @throws IOException if the zip file cannot be opened
+     */
+    private ZipFile getReadZipFile() throws IOException {
+        if (getOpenZipFile() == null) {
+            setOpenZipFile(new ZipFile(getFile(), ZIP_FILE_OPEN_MODE));
+        }
+        return getOpenZipFile();
     }
 
     private void saveChangesToZip(Map<String, ZipEntry> updatedZipEntries, Map<String, InputStream> newEntries)
@@ -660,6 +889,10 @@ public class WLSDeployZipFile {
 
         LOGGER.entering(CLASS, METHOD, updatedZipEntries, newEntries);
 
+        // the zip file is rewritten, so the entries must be read again
+        invalidateEntryIndex();
+        closeOpenZipFile();
+
         File newOutputFile = getNewOutputFile();
         if ((updatedZipEntries != null && !updatedZipEntries.isEmpty()) ||
             (newEntries != null && !newEntries.isEmpty())) {
@@ -690,7 +923,7 @@ public class WLSDeployZipFile {
             InputStream inputStream = null;
             try (ZipOutputStream zos = new ZipOutputStream(new FileOutputStream(newOutputFile, false))) {
                 if (updatedZipEntries != null && !updatedZipEntries.isEmpty()) {
-                    openZipFile = new ZipFile(getFile(), ZIP_FILE_OPEN_MODE);
+                    getReadZipFile();
 
                     ZipEntry ze;
                     for (Map.Entry<String, ZipEntry> updatedEntry : updatedZipEntries.entrySet()) {
@@ -772,6 +1005,250 @@ public class WLSDeployZipFile {
         LOGGER.exiting(CLASS, METHOD);
     }
 
+    /**
+     * Write the zip file with the staged changes of the open batch, in a single pass.  The saved entries that
+     * are not removed or replaced are copied from the zip file, and the staged entries are written from their
+     * content files, in the order they appear in the index.
+     *
+     * @throws WLSDeployArchiveIOException if an error occurs while reading or writing the zip file
+     */
+    private void saveBatchToZip() throws WLSDeployArchiveIOException {
+        final String METHOD = "saveBatchToZip";
+
+        LOGGER.entering(CLASS, METHOD);
+        logZipEntries(stagedEntries, "WLSDPLY-01516");
+        closeOpenZipFile();
+
+        File newOutputFile = getNewOutputFile();
+        try (ZipOutputStream zos = new ZipOutputStream(new FileOutputStream(newOutputFile, false))) {
+            for (Map.Entry<String, ZipEntry> indexEntry : entryIndex.entrySet()) {
+                String key = indexEntry.getKey();
+                if (stagedEntries.containsKey(key)) {
+                    writeStagedEntry(zos, key, stagedEntries.get(key));
+                    LOGGER.finer("WLSDPLY-01520", key, getFileName(), newOutputFile.getAbsolutePath());
+                } else {
+                    copySavedEntry(zos, indexEntry.getValue());
+                    LOGGER.finer("WLSDPLY-01519", key, getFileName(), newOutputFile.getAbsolutePath());
+                }
+            }
+            zos.finish();
+            LOGGER.fine("WLSDPLY-01521", newOutputFile.getAbsolutePath(), getFileName());
+        } catch (IOException ioe) {
+            WLSDeployArchiveIOException wdaioee = new WLSDeployArchiveIOException("WLSDPLY-01522",
+                ioe, getFileName(), ioe.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, wdaioee);
+            throw wdaioee;
+        } finally {
+            closeOpenZipFile();
+        }
+
+        if (isNewFile()) {
+            setNewFile(false);
+        } else {
+            swapFiles(getFile(), newOutputFile);
+        }
+        LOGGER.exiting(CLASS, METHOD);
+    }
+
+    private void copySavedEntry(ZipOutputStream zos, ZipEntry savedEntry)
+        throws IOException, WLSDeployArchiveIOException {
+
+        // entries that were stored keep their size and checksum, so they are copied without compression
+        ZipEntry ze = new ZipEntry(savedEntry);
+        sanitizeZipEntry(ze);
+        zos.putNextEntry(ze);
+        if (!savedEntry.isDirectory()) {
+            try (InputStream inputStream = getReadZipFile().getInputStream(savedEntry)) {
+                readWriteBytes(savedEntry.getName(), inputStream, zos);
+            }
+        }
+        zos.closeEntry();
+    }
+
+    private static void writeStagedEntry(ZipOutputStream zos, String key, StagedEntry staged)
+        throws IOException, WLSDeployArchiveIOException {
+
+        ZipEntry ze = new ZipEntry(key);
+        if (staged == null) {
+            zos.putNextEntry(ze);
+            zos.closeEntry();
+            return;
+        }
+
+        if (isCompressedContent(key)) {
+            if (!staged.hasChecksum()) {
+                try (InputStream inputStream = new FileInputStream(staged.getSource())) {
+                    copyChecked(key, inputStream, null, staged);
+                }
+            }
+            ze.setMethod(ZipEntry.STORED);
+            ze.setSize(staged.getSize());
+            ze.setCompressedSize(staged.getSize());
+            ze.setCrc(staged.getCrc());
+        }
+        zos.putNextEntry(ze);
+        try (InputStream inputStream = new FileInputStream(staged.getSource())) {
+            readWriteBytes(key, inputStream, zos);
+        }
+        zos.closeEntry();
+    }
+
+    private static boolean isCompressedContent(String key) {
+        String name = key.toLowerCase();
+        for (String extension : COMPRESSED_CONTENT_EXTENSIONS) {
+            if (name.endsWith(extension)) {
+                return true;
+            }
+        }
+        return false;
+    }
+
+    /**
+     * Copy the input to the output, if any, computing the size and checksum of the content.
+     *
+     * @param key the entry name, for error messages
+     * @param inputStream the content
+     * @param outputStream the stream to which the content is copied, or null to only compute the checksum
+     * @param staged the staged entry that receives the size and checksum
+     * @throws IOException if an error occurs while writing the content
+     * @throws WLSDeployArchiveIOException if an error occurs while reading the content
+     */
+    private static void copyChecked(String key, InputStream inputStream, OutputStream outputStream,
+        StagedEntry staged) throws IOException, WLSDeployArchiveIOException {
+
+        CRC32 crc = new CRC32();
+        long size = 0;
+        int bytesRead;
+        byte[] readBuffer = new byte[READ_BUFFER_SIZE];
+
+        while (true) {
+            try {
+                bytesRead = inputStream.read(readBuffer);
+                if (bytesRead < 0) {
+                    break;
+                }
+            } catch (IOException ioe) {
+                WLSDeployArchiveIOException wdaioe =  new WLSDeployArchiveIOException(
+                    "WLSDPLY-01527", ioe, key, ioe.getLocalizedMessage());
+                LOGGER.throwing(wdaioe);
+                throw wdaioe;
+            }
+            crc.update(readBuffer, 0, bytesRead);
+            size += bytesRead;
+            if (outputStream != null) {
+                outputStream.write(readBuffer, 0, bytesRead);
+            }
+        }
+        staged.setChecksum(size, crc.getValue());
+    }
+
+    /**
+     * Copy the content of a new entry to a file in the staging directory, and close the input stream.
+     *
+     * @param key the entry name
+     * @param inputStream the content of the entry
+     * @return the staged entry
+     * @throws WLSDeployArchiveIOException if the content cannot be copied
+     */
+    private StagedEntry spoolEntry(String key, InputStream inputStream) throws WLSDeployArchiveIOException {
+        final String METHOD = "spoolEntry";
+
+        File spoolFile = null;
+        try {
+            spoolFile = File.createTempFile("wdt_entry", ".tmp", batchDirectory);
+            StagedEntry staged = new StagedEntry(spoolFile, true);
+            try (FileOutputStream outputStream = new FileOutputStream(spoolFile)) {
+                copyChecked(key, inputStream, outputStream, staged);
+            }
+            return staged;
+        } catch (IOException ioe) {
+            if (spoolFile != null && !spoolFile.delete()) {
+                spoolFile.deleteOnExit();
+            }
+            WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01549", ioe,
+                getFileName(), key, ioe.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, wdaioe);
+            throw wdaioe;
+        } finally {
+            if (inputStream != null) {
+                closeFileInputStream(inputStream, key);
+            }
+        }
+    }
+
+    /**
+     * Stage the files in the directory and its subdirectories, to be read when the batch is committed.
+     *
+     * @param directory the directory
+     * @param directoryEntryName the entry name of the directory, ending with a slash
+     */
+    private void stageDirectory(File directory, String directoryEntryName) {
+        File[] dirEntries = directory.listFiles();
+        if (dirEntries != null) {
+            for (File dirEntry : dirEntries) {
+                String newEntryName = directoryEntryName + dirEntry.getName();
+                if (dirEntry.isDirectory()) {
+                    stageDirectory(dirEntry, newEntryName + ZIP_SEP);
+                } else {
+                    stageEntry(newEntryName, new StagedEntry(dirEntry, false));
+                }
+            }
+        }
+    }
+
+    /**
+     * Add a staged entry to the index, replacing any entry with the same name.
+     *
+     * @param key the entry name
+     * @param staged the content of the entry, or null for a directory entry
+     */
+    private void stageEntry(String key, StagedEntry staged) {
+        if (entryIndex.containsKey(key)) {
+            unstageEntry(key);
+        }
+        entryIndex.put(key, new ZipEntry(key));
+        sortedEntryNames.add(key);
+        stagedEntries.put(key, staged);
+        batchModified = true;
+    }
+
+    /**
+     * Remove an entry from the index, and discard its staged content, if any.
+     *
+     * @param key the entry name
+     */
+    private void unstageEntry(String key) {
+        entryIndex.remove(key);
+        sortedEntryNames.remove(key);
+        StagedEntry staged = stagedEntries.remove(key);
+        if (staged != null && staged.isSpooled() && !staged.getSource().delete()) {
+            staged.getSource().deleteOnExit();
+        }
+        batchModified = true;
+    }
+
+    private boolean isStagedEntry(String key) {
+        return isBatchOpen() && stagedEntries.containsKey(key);
+    }
+
+    private InputStream getStagedEntryStream(String key) throws IOException {
+        StagedEntry staged = stagedEntries.get(key);
+        if (staged == null) {
+            return new ByteArrayInputStream(new byte[0]);
+        }
+        return new FileInputStream(staged.getSource());
+    }
+
+    private void endBatch() {
+        FileUtils.deleteDirectory(batchDirectory);
+        batchDirectory = null;
+        stagedEntries = null;
+        batchModified = false;
+
+        // the index includes the staged changes, so the entries must be read again
+        invalidateEntryIndex();
+    }
+
     private File getNewOutputFile() throws WLSDeployArchiveIOException {
         final String METHOD = "getNewOutputFile";
 
@@ -879,8 +1356,7 @@ public class WLSDeployZipFile {
         LOGGER.entering(entryName);
 
         boolean renameNeeded = false;
-        Map<String, ZipEntry> zipEntryMap = getZipFileEntries(getFile());
-        if (zipEntryMap.containsKey(entryName)) {
+        if (getEntryIndex().containsKey(entryName)) {
             LOGGER.finest("WLSDPLY-01534", entryName);
             renameNeeded = true;
         }
@@ -906,7 +1382,7 @@ public class WLSDeployZipFile {
         }
         LOGGER.finer("WLSDPLY-01535", entryName, entryNameBase, entryNameExtension);
         ArrayList<String> matchingSavedEntries = new ArrayList<>();
-        Map<String, ZipEntry> zipEntriesMap = getZipFileEntries(getFile());
+        Map<String, ZipEntry> zipEntriesMap = getEntryIndex();
 
         for (String zipEntryKey : zipEntriesMap.keySet()) {
             if (zipEntryKey.startsWith(entryNameBase) && entryReallyMatches(zipEntryKey, entryNameBase,
@@ -1066,13 +1542,16 @@ public class WLSDeployZipFile {
         }
     }
 
-    private void addEntryToMap(LinkedHashMap<String, ZipEntry> zipMap, LinkedHashMap<String, InputStream> map,
+    private void addEntryToMap(Map<String, ZipEntry> zipMap, LinkedHashMap<String, InputStream> map,
         String key) throws IOException {
 
         LOGGER.finer("WLSDPLY-01500", getFileName(), key);
-        ZipEntry entry = zipMap.get(key);
-        sanitizeZipEntry(entry);
-        InputStream stream = openZipFile.getInputStream(entry);
+        InputStream stream;
+        if (isStagedEntry(key)) {
+            stream = getStagedEntryStream(key);
+        } else {
+            stream = getReadZipFile().getInputStream(zipMap.get(key));
+        }
         LOGGER.finer("WLSDPLY-01501", getFileName(), key, stream);
         map.put(key, stream);
     }
@@ -1096,4 +1575,44 @@ public class WLSDeployZipFile {
         }
         return null;
     }
+
+    /**
+     * The content of an entry added during a batch, and its size and checksum, once they are computed.
+     */
+    private static final class StagedEntry {
+        private final File source;
+        private final boolean spooled;
+        private long size = -1;
+        private long crc = -1;
+
+        StagedEntry(File source, boolean spooled) {
+            this.source = source;
+            this.spooled = spooled;
+        }
+
+        File getSource() {
+            return source;
+        }
+
+        boolean isSpooled() {
+            return spooled;
+        }
+
+        boolean hasChecksum() {
+            return crc != -1;
+        }
+
+        long getSize() {
+            return size;
+        }
+
+        long getCrc() {
+            return crc;
+        }
+
+        void setChecksum(long size, long crc) {
+            this.size = size;
+            this.crc = crc;
+        }
+    }
 }
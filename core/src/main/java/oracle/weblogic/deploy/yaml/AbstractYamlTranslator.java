@@ -15,12 +15,15 @@ import oracle.weblogic.deploy.logging.PlatformLogger;
 import oracle.weblogic.deploy.util.PyOrderedDict;
 import oracle.weblogic.deploy.util.StringUtils;
 
+import org.antlr.v4.runtime.BailErrorStrategy;
 import org.antlr.v4.runtime.CharStream;
 import org.antlr.v4.runtime.CharStreams;
 import org.antlr.v4.runtime.CommonTokenStream;
+import org.antlr.v4.runtime.DefaultErrorStrategy;
+import org.antlr.v4.runtime.ParserRuleContext;
+import org.antlr.v4.runtime.RecognitionException;
 import org.antlr.v4.runtime.atn.PredictionMode;
 import org.antlr.v4.runtime.tree.ParseTree;
-import org.antlr.v4.runtime.tree.ParseTreeWalker;
 import org.antlr.v4.runtime.misc.ParseCancellationException;
 import org.python.core.Py;
 import org.python.core.PyDictionary;
@@ -31,7 +34,9 @@ import org.python.core.PyObject;
 import org.python.core.PyString;
 
 /**
- * This class does the heavy-lifting of walking the parse tree and performing the conversion into a Python dictionary.
+ * This class does the heavy-lifting of listening to the parser and performing the conversion into a Python dictionary.
+ * The dictionary is built from the parse events as the input is parsed, and each completed statement is pruned from
+ * the parse tree, so the parse tree never holds more than the statements that enclose the current position.
  */
 public abstract class AbstractYamlTranslator extends YamlBaseListener {
 
@@ -63,13 +68,17 @@ public abstract class AbstractYamlTranslator extends YamlBaseListener {
         }
         currentDict = new ArrayDeque<>();
         currentDict.push(fileDict);
+
+        // discard any list left open by an SLL parse that was abandoned for the LL parse
+        openObjectList = null;
+        lastObjectName = null;
     }
 
     /**
      * {@inheritDoc}
      */
     @Override
-    public void enterAssign(YamlParser.AssignContext ctx) {
+    public void exitAssign(YamlParser.AssignContext ctx) {
         String name = getQuotedStringText(ctx.name().getText());
         PyObject value = getAssignValue(name, ctx);
 
@@ -85,18 +94,7 @@ public abstract class AbstractYamlTranslator extends YamlBaseListener {
      * {@inheritDoc}
      */
     @Override
-    public void enterYamlListItemAssign(YamlParser.YamlListItemAssignContext ctx) {
-        YamlParser.AssignContext assignCtx = ctx.assign();
-
-        // The only type of list item we treat differently is a list of values.
-        enterAssign(assignCtx);
-    }
-
-    /**
-     * {@inheritDoc}
-     */
-    @Override
-    public void enterYamlListItemValue(YamlParser.YamlListItemValueContext ctx) {
+    public void exitYamlListItemValue(YamlParser.YamlListItemValueContext ctx) {
         YamlParser.ValueContext valueCtx = ctx.value();
 
         PyList myList = getOpenObjectList();
@@ -109,20 +107,12 @@ public abstract class AbstractYamlTranslator extends YamlBaseListener {
      * {@inheritDoc}
      */
     @Override
-    public void enterYamlListItemObject(YamlParser.YamlListItemObjectContext ctx) {
-        YamlParser.ObjectContext objCtx = ctx.object();
-
-        // The only type of list item we treat differently is a list of values.
-        enterObject(objCtx);
-    }
+    public void enterObj_block(YamlParser.Obj_blockContext ctx) {
+        String METHOD = "enterObj_block";
 
-    /**
-     * {@inheritDoc}
-     */
-    @Override
-    public void enterObject(YamlParser.ObjectContext ctx) {
-        String METHOD = "enterObject";
-        String name = getQuotedStringText(ctx.name().getText());
+        // The object name has been matched by the time the parser enters the object block.
+        YamlParser.ObjectContext objCtx = (YamlParser.ObjectContext) ctx.getParent();
+        String name = getQuotedStringText(objCtx.name().getText());
         PyDictionary objDict;
         if (useOrderedDict) {
             objDict = new PyOrderedDict();
@@ -171,6 +161,18 @@ public abstract class AbstractYamlTranslator extends YamlBaseListener {
         currentDict.pop();
     }
 
+    /**
+     * {@inheritDoc}
+     */
+    @Override
+    public void exitEveryRule(ParserRuleContext ctx) {
+        // A completed statement has been added to the dictionary, so drop it and its
+        // preceding siblings from the parse tree to keep the tree proportional to the nesting depth.
+        if (ctx instanceof YamlParser.StatementContext && ctx.getParent().children != null) {
+            ctx.getParent().children.clear();
+        }
+    }
+
     protected abstract String getClassName();
     protected abstract PlatformLogger getLogger();
 
@@ -189,14 +191,26 @@ public abstract class AbstractYamlTranslator extends YamlBaseListener {
 
                 CommonTokenStream tokens = new CommonTokenStream(lexer);
                 YamlParser parser = new YamlParser(tokens);
+                parser.addParseListener(this);
 
+                // Try the faster SLL prediction first, failing at the first syntax error.
+                // Only if that fails, parse again with full LL prediction to report the errors.
                 parser.removeErrorListeners();
-                parser.addErrorListener(errorListener);
-                parser.getInterpreter().setPredictionMode(PredictionMode.LL_EXACT_AMBIG_DETECTION);
-
-                ParseTree tree = parser.file();
-                ParseTreeWalker walker = new ParseTreeWalker();
-                walker.walk(this, tree);
+                parser.setErrorHandler(new BailErrorStrategy());
+                parser.getInterpreter().setPredictionMode(PredictionMode.SLL);
+                try {
+                    parser.file();
+                } catch (ParseCancellationException pce) {
+                    if (!(pce.getCause() instanceof RecognitionException)) {
+                        throw pce;
+                    }
+                    getLogger().finer("WLSDPLY-18029", "YAML", yamlFileName);
+                    parser.reset();
+                    parser.addErrorListener(errorListener);
+                    parser.setErrorHandler(new DefaultErrorStrategy());
+                    parser.getInterpreter().setPredictionMode(PredictionMode.LL_EXACT_AMBIG_DETECTION);
+                    parser.file();
+                }
             } catch (IOException ioe) {
                 YamlException ex =
                     new YamlException("WLSDPLY-18007", ioe, "YAML", yamlFileName, ioe.getLocalizedMessage());
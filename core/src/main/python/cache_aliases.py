@@ -0,0 +1,137 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+The entry point for the cacheAliases tool.
+"""
+import os
+import sys
+from oracle.weblogic.deploy.aliases import AliasException
+from oracle.weblogic.deploy.util import CLAException
+from oracle.weblogic.deploy.util import WebLogicDeployToolingVersion
+
+sys.path.append(os.path.dirname(os.path.realpath(sys.argv[0])))
+
+from wlsdeploy.aliases import alias_cache
+from wlsdeploy.aliases.alias_entries import AliasEntries
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.util import model_context_helper
+from wlsdeploy.util import cla_helper
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+
+_program_name = 'cacheAliases'
+_class_name = 'cache_aliases'
+__logger = PlatformLogger('wlsdeploy.aliases')
+
+__required_arguments = [
+    CommandLineArgUtil.ORACLE_HOME_SWITCH
+]
+
+__optional_arguments = [
+    CommandLineArgUtil.TARGET_VERSION_SWITCH,
+    CommandLineArgUtil.TARGET_MODE_SWITCH,
+    CommandLineArgUtil.CLEAR_CACHE_SWITCH
+]
+
+
+def __process_args(args):
+    """
+    Process the command-line arguments.
+    :param args: the command-line arguments list
+    :raises CLAException: if an error occurs while validating and processing the command-line arguments
+    """
+    cla_util = CommandLineArgUtil(_program_name, __required_arguments, __optional_arguments)
+    argument_map = cla_util.process_args(args)
+    return model_context_helper.create_context(_program_name, argument_map), argument_map
+
+
+def __get_wlst_modes(argument_map, model_context):
+    """
+    Get the WLST modes to be cached. If no target mode was specified, both modes are cached.
+    :param argument_map: the command-line argument map
+    :param model_context: the model context
+    :return: a list of WlstModes values
+    """
+    if CommandLineArgUtil.TARGET_MODE_SWITCH in argument_map:
+        return [model_context.get_target_wlst_mode()]
+    return [WlstModes.OFFLINE, WlstModes.ONLINE]
+
+
+def cache_aliases(model_context, wlst_modes, clear_cache):
+    """
+    Write the resolved alias knowledge base to the cache for each WLST mode.
+    :param model_context: the model context, used to determine the WLS version
+    :param wlst_modes: a list of the WlstModes values to cache
+    :param clear_cache: if True, remove existing cache files before writing
+    :return: an exit code
+    :raises AliasException: if an error occurs while loading the aliases
+    """
+    _method_name = 'cache_aliases'
+
+    __logger.entering(class_name=_class_name, method_name=_method_name)
+
+    cache_dir = alias_cache.get_cache_directory()
+    if cache_dir is None:
+        __logger.severe('WLSDPLY-10200', alias_cache.ALIAS_CACHE_DIR_VARIABLE,
+                        class_name=_class_name, method_name=_method_name)
+        return CommandLineArgUtil.PROG_ERROR_EXIT_CODE
+
+    if clear_cache:
+        count = alias_cache.clear_cache()
+        __logger.info('WLSDPLY-10201', count, cache_dir, class_name=_class_name, method_name=_method_name)
+
+    wls_version = model_context.get_target_wls_version()
+    exit_code = CommandLineArgUtil.PROG_OK_EXIT_CODE
+    for wlst_mode in wlst_modes:
+        # the aliases are written to the cache once, when they are loaded or by save_category_cache()
+        alias_entries = AliasEntries(wlst_mode, wls_version)
+        cache_file = alias_entries.save_category_cache()
+        if cache_file is None:
+            __logger.warning('WLSDPLY-10202', wls_version, WlstModes.from_value(wlst_mode), cache_dir,
+                             class_name=_class_name, method_name=_method_name)
+            exit_code = CommandLineArgUtil.PROG_WARNING_EXIT_CODE
+        else:
+            __logger.info('WLSDPLY-10203', wls_version, WlstModes.from_value(wlst_mode), cache_file,
+                          class_name=_class_name, method_name=_method_name)
+
+    __logger.exiting(class_name=_class_name, method_name=_method_name, result=exit_code)
+    return exit_code
+
+
+def main(args):
+    """
+    The main entry point for the cacheAliases tool.
+    :param args: the command-line arguments
+    """
+    _method_name = 'main'
+
+    __logger.entering(class_name=_class_name, method_name=_method_name)
+    for index, arg in enumerate(args):
+        __logger.finer('sys.argv[{0}] = {1}', str(index), str(arg), class_name=_class_name, method_name=_method_name)
+
+    try:
+        model_context, argument_map = __process_args(args)
+    except CLAException, ex:
+        exit_code = ex.getExitCode()
+        if exit_code != CommandLineArgUtil.HELP_EXIT_CODE:
+            __logger.severe('WLSDPLY-20008', _program_name, ex.getLocalizedMessage(), error=ex,
+                            class_name=_class_name, method_name=_method_name)
+        cla_helper.clean_up_temp_files()
+        sys.exit(exit_code)
+
+    clear_cache = CommandLineArgUtil.CLEAR_CACHE_SWITCH in argument_map
+    try:
+        exit_code = cache_aliases(model_context, __get_wlst_modes(argument_map, model_context), clear_cache)
+    except AliasException, ae:
+        __logger.severe('WLSDPLY-10204', _program_name, ae.getLocalizedMessage(), error=ae,
+                        class_name=_class_name, method_name=_method_name)
+        sys.exit(CommandLineArgUtil.PROG_ERROR_EXIT_CODE)
+
+    __logger.exiting(result=exit_code, class_name=_class_name, method_name=_method_name)
+    sys.exit(exit_code)
+
+
+if __name__ == '__main__' or __name__ == 'main':
+    WebLogicDeployToolingVersion.logVersionInfo(_program_name)
+    main(sys.argv)
@@ -29,6 +29,8 @@ from oracle.weblogic.deploy.compare import CompareException
 from oracle.weblogic.deploy.exception import ExceptionHelper
 from oracle.weblogic.deploy.aliases import AliasException
 from oracle.weblogic.deploy.util import PyWLSTException
+from oracle.weblogic.deploy.json import JsonException
+from oracle.weblogic.deploy.yaml import YamlException
 from wlsdeploy.exception import exception_helper
 
 from wlsdeploy.logging.platform_logger import PlatformLogger
@@ -497,31 +499,17 @@ class ModelFileDiffer:
             return 0
 
         if self.output_dir:
-            fos = None
-            writer = None
             file_name = None
             try:
                 print format_message('WLSDPLY-05711', self.output_dir)
                 print BLANK_LINE
                 file_name = self.output_dir + '/diffed_model.json'
-                fos = JFileOutputStream(file_name, False)
-                writer = JPrintWriter(fos, True)
-                json_object = PythonToJson(net_diff)
-                json_object._write_dictionary_to_json_file(net_diff, writer)
-                writer.close()
+                PythonToJson(net_diff).write_to_json_file(file_name)
                 file_name = self.output_dir + '/diffed_model.yaml'
-                fos = JFileOutputStream(file_name, False)
-                writer = JPrintWriter(fos, True)
-                pty = PythonToYaml(net_diff)
-                pty._write_dictionary_to_yaml_file(net_diff, writer)
-                writer.close()
-            except JIOException, ioe:
-                if fos:
-                    fos.close()
-                if writer:
-                    writer.close()
-                _logger.severe('WLSDPLY-05708', file_name, ioe.getLocalizedMessage(),
-                                error=ioe, class_name=_class_name, method_name=_method_name)
+                PythonToYaml(net_diff).write_to_yaml_file(file_name)
+            except (JsonException, YamlException), ex:
+                _logger.severe('WLSDPLY-05708', file_name, ex.getLocalizedMessage(),
+                                error=ex, class_name=_class_name, method_name=_method_name)
                 return 2
         else:
             print format_message('WLSDPLY-05707')
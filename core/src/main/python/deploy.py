@@ -23,6 +23,7 @@ from wlsdeploy.aliases.aliases import Aliases
 from wlsdeploy.aliases.wlst_modes import WlstModes
 from wlsdeploy.exception.expection_types import ExceptionType
 from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.deploy import deployer
 from wlsdeploy.tool.deploy import deployer_utils
 from wlsdeploy.tool.deploy import model_deployer
 from wlsdeploy.tool.util import model_context_helper
@@ -161,6 +162,7 @@ def __deploy_online(model, model_context, aliases):
         raise ex
 
     model_deployer.deploy_applications(model, model_context, aliases, wlst_mode=__wlst_mode)
+    deployer.log_attribute_counts()
 
     try:
         __wlst_helper.disconnect()
@@ -42,6 +42,8 @@ from wlsdeploy.tool.util import model_context_helper
 from wlsdeploy.tool.util.variable_injector import VariableInjector
 from wlsdeploy.tool.util import wlst_helper
 from wlsdeploy.tool.util.wlst_helper import WlstHelper
+from wlsdeploy.tool.util.wlst_session_pool import SynchronizedProxy
+from wlsdeploy.tool.util.wlst_session_pool import WlstSessionPool
 from wlsdeploy.tool.validate.validator import Validator
 from wlsdeploy.util import cla_helper
 from wlsdeploy.util import model_translator
@@ -59,6 +61,8 @@ _class_name = 'discover'
 __logger = PlatformLogger(discoverer.get_discover_logger_name())
 __wlst_mode = WlstModes.OFFLINE
 
+DISCOVER_CONNECTIONS_VARIABLE = 'WDT_DISCOVER_CONNECTIONS'
+
 __required_arguments = [
     CommandLineArgUtil.ORACLE_HOME_SWITCH,
     CommandLineArgUtil.DOMAIN_HOME_SWITCH,
@@ -178,25 +182,29 @@ def __discover(model_context, aliases, injector, helper):
     model = Model()
     base_location = LocationContext()
     __connect_to_domain(model_context, helper)
+    session_pool = __open_session_pool(model_context)
     try:
-        _add_domain_name(base_location, aliases, helper)
-        DomainInfoDiscoverer(model_context, model.get_model_domain_info(), base_location, wlst_mode=__wlst_mode,
-                             aliases=aliases, variable_injector=injector).discover()
-        TopologyDiscoverer(model_context, model.get_model_topology(), base_location, wlst_mode=__wlst_mode,
-                           aliases=aliases, variable_injector=injector).discover()
-        ResourcesDiscoverer(model_context, model.get_model_resources(), base_location, wlst_mode=__wlst_mode,
-                            aliases=aliases, variable_injector=injector).discover()
-        DeploymentsDiscoverer(model_context, model.get_model_app_deployments(), base_location, wlst_mode=__wlst_mode,
-                              aliases=aliases, variable_injector=injector).discover()
-        __discover_multi_tenant(model, model_context, base_location, aliases, injector)
-    except AliasException, ae:
-        wls_version = WebLogicHelper(__logger).get_actual_weblogic_version()
-        wlst_mode = WlstModes.from_value(__wlst_mode)
-        ex = exception_helper.create_discover_exception('WLSDPLY-06000', model_context.get_domain_name(),
-                                                        model_context.get_domain_home(), wls_version, wlst_mode,
-                                                        ae.getLocalizedMessage(), error=ae)
-        __logger.throwing(ex, class_name=_class_name, method_name=_method_name)
-        raise ex
+        try:
+            _add_domain_name(base_location, aliases, helper)
+            DomainInfoDiscoverer(model_context, model.get_model_domain_info(), base_location, wlst_mode=__wlst_mode,
+                                 aliases=aliases, variable_injector=injector).discover()
+            TopologyDiscoverer(model_context, model.get_model_topology(), base_location, wlst_mode=__wlst_mode,
+                               aliases=aliases, variable_injector=injector).discover()
+            ResourcesDiscoverer(model_context, model.get_model_resources(), base_location, wlst_mode=__wlst_mode,
+                                aliases=aliases, variable_injector=injector).discover()
+            DeploymentsDiscoverer(model_context, model.get_model_app_deployments(), base_location,
+                                  wlst_mode=__wlst_mode, aliases=aliases, variable_injector=injector).discover()
+            __discover_multi_tenant(model, model_context, base_location, aliases, injector)
+        except AliasException, ae:
+            wls_version = WebLogicHelper(__logger).get_actual_weblogic_version()
+            wlst_mode = WlstModes.from_value(__wlst_mode)
+            ex = exception_helper.create_discover_exception('WLSDPLY-06000', model_context.get_domain_name(),
+                                                            model_context.get_domain_home(), wls_version, wlst_mode,
+                                                            ae.getLocalizedMessage(), error=ae)
+            __logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+            raise ex
+    finally:
+        __close_session_pool(session_pool, model_context)
 
     __disconnect_domain(helper)
     return model
@@ -266,9 +274,80 @@ def __connect_to_domain(model_context, helper):
     return
 
 
+def __get_session_pool_size():
+    """
+    Get the number of separate WLST sessions to use for online discovery from the environment.
+    :return: the number of sessions, 1 if the variable is not set or is not valid
+    """
+    _method_name = '__get_session_pool_size'
+
+    value = os.environ.get(DISCOVER_CONNECTIONS_VARIABLE, None)
+    if value is None or len(value.strip()) == 0:
+        return 1
+
+    size = 0
+    try:
+        size = int(value.strip())
+    except ValueError:
+        pass
+
+    if size < 1:
+        __logger.warning('WLSDPLY-06028', value, DISCOVER_CONNECTIONS_VARIABLE,
+                         class_name=_class_name, method_name=_method_name)
+        return 1
+    return size
+
+
+def __open_session_pool(model_context):
+    """
+    Open separate WLST sessions for concurrent online discovery, if more than one session was requested.
+    While the sessions are in use, the archive file is shared by the discovery tasks,
+    so it is replaced in the model context with a synchronized wrapper.
+    :param model_context: the model context
+    :return: the open session pool, or None if discovery will use only the main WLST session
+    :raises DiscoverException: if a separate session cannot be opened
+    """
+    _method_name = '__open_session_pool'
+
+    if __wlst_mode != WlstModes.ONLINE:
+        return None
+
+    size = __get_session_pool_size()
+    if size < 2:
+        return None
+
+    __logger.info('WLSDPLY-06029', size, class_name=_class_name, method_name=_method_name)
+    session_pool = WlstSessionPool(size, ExceptionType.DISCOVER)
+    session_pool.open(model_context.get_admin_user(), model_context.get_admin_password(),
+                      model_context.get_admin_url())
+
+    archive_file = model_context.get_archive_file()
+    if archive_file is not None:
+        model_context.set_archive_file(SynchronizedProxy(archive_file))
+    discoverer.set_session_pool(session_pool)
+    return session_pool
+
+
+def __close_session_pool(session_pool, model_context):
+    """
+    Close the separate WLST sessions, if they were opened, and restore the archive file in the model context.
+    :param session_pool: the open session pool, or None
+    :param model_context: the model context
+    """
+    if session_pool is None:
+        return
+
+    discoverer.set_session_pool(None)
+    archive_file = model_context.get_archive_file()
+    if isinstance(archive_file, SynchronizedProxy):
+        model_context.set_archive_file(archive_file.get_target())
+    session_pool.close()
+
+
 def __clear_archive_file(model_context):
     """
-    Remove any binaries already in the archive file.
+    Begin a batch of changes to the archive file, and remove any binaries already in the archive file.
+    The changes made by discovery are staged, and the archive file is written once, when they are saved.
     :param model_context: the model context
     :raises DiscoverException: if an error occurs while removing the binaries
     """
@@ -283,6 +362,7 @@ def __clear_archive_file(model_context):
         raise de
 
     try:
+        archive_file.beginBatch()
         archive_file.removeAllBinaries()
     except WLSDeployArchiveIOException, wioe:
         de = exception_helper.create_discover_exception('WLSDPLY-06005', wioe.getLocalizedMessage())
@@ -292,6 +372,27 @@ def __clear_archive_file(model_context):
     return
 
 
+def __save_archive(model_context):
+    """
+    Write the changes staged by discovery to the archive file.
+    :param model_context: the model context
+    :raises DiscoverException: if an error occurs while writing the archive file
+    """
+    _method_name = '__save_archive'
+    __logger.entering(class_name=_class_name, method_name=_method_name)
+
+    archive_file = model_context.get_archive_file()
+    try:
+        archive_file.commitBatch()
+    except WLSDeployArchiveIOException, wioe:
+        de = exception_helper.create_discover_exception('WLSDPLY-06031', wioe.getLocalizedMessage())
+        __logger.throwing(class_name=_class_name, method_name=_method_name, error=de)
+        raise de
+
+    __logger.exiting(class_name=_class_name, method_name=_method_name)
+    return
+
+
 def __close_archive(model_context):
     """
     Close the archive object
@@ -448,6 +549,11 @@ def __log_and_exit(model_context, exit_code, class_name, method_name):
     """
     __logger.exiting(result=exit_code, class_name=class_name, method_name=method_name)
 
+    # discard the changes staged by discovery, if it did not complete
+    archive_file = model_context.get_archive_file()
+    if archive_file is not None:
+        archive_file.rollbackBatch()
+
     tool_exit.end(model_context, exit_code)
 
 
@@ -522,6 +628,13 @@ def main(args):
                         error=ex, class_name=_class_name, method_name=_method_name)
         __log_and_exit(model_context, CommandLineArgUtil.PROG_ERROR_EXIT_CODE, _class_name, _method_name)
 
+    try:
+        __save_archive(model_context)
+    except DiscoverException, ex:
+        __logger.severe('WLSDPLY-06030', _program_name, model_context.get_archive_file_name(),
+                        ex.getLocalizedMessage(), error=ex, class_name=_class_name, method_name=_method_name)
+        __log_and_exit(model_context, CommandLineArgUtil.PROG_ERROR_EXIT_CODE, _class_name, _method_name)
+
     __close_archive(model_context)
 
     __log_and_exit(model_context, exit_code, _class_name, _method_name)
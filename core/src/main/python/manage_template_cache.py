@@ -0,0 +1,107 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+The entry point for the manageTemplateCache tool.
+"""
+import os
+import sys
+from oracle.weblogic.deploy.util import CLAException
+from oracle.weblogic.deploy.util import WebLogicDeployToolingVersion
+
+sys.path.append(os.path.dirname(os.path.realpath(sys.argv[0])))
+
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.create import template_cache
+from wlsdeploy.util import cla_helper
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+
+_program_name = 'manageTemplateCache'
+_class_name = 'manage_template_cache'
+__logger = PlatformLogger('wlsdeploy.create')
+
+# the snapshots are listed and removed without the Oracle Home
+__required_arguments = []
+
+__optional_arguments = [
+    CommandLineArgUtil.CLEAR_CACHE_SWITCH
+]
+
+
+def __process_args(args):
+    """
+    Process the command-line arguments.
+    :param args: the command-line arguments list
+    :return: the map of the command-line arguments
+    :raises CLAException: if an error occurs while validating and processing the command-line arguments
+    """
+    cla_util = CommandLineArgUtil(_program_name, __required_arguments, __optional_arguments)
+    return cla_util.process_args(args)
+
+
+def manage_template_cache(clear_cache):
+    """
+    List the template snapshots in the cache, or remove them.
+    :param clear_cache: if True, remove the snapshots, otherwise list them
+    :return: an exit code
+    """
+    _method_name = 'manage_template_cache'
+
+    __logger.entering(clear_cache, class_name=_class_name, method_name=_method_name)
+
+    cache_dir = template_cache.get_cache_directory()
+    if cache_dir is None:
+        __logger.severe('WLSDPLY-10300', template_cache.TEMPLATE_CACHE_DIR_VARIABLE,
+                        class_name=_class_name, method_name=_method_name)
+        return CommandLineArgUtil.PROG_ERROR_EXIT_CODE
+
+    if clear_cache:
+        count = template_cache.clear_cache()
+        __logger.info('WLSDPLY-10301', count, cache_dir, class_name=_class_name, method_name=_method_name)
+    else:
+        snapshots = template_cache.list_snapshots()
+        for key, properties in snapshots:
+            names = properties.keys()
+            names.sort()
+            values = []
+            for name in names:
+                values.append('%s=%s' % (name, properties[name]))
+            __logger.info('WLSDPLY-10302', key, cache_dir, ', '.join(values),
+                          class_name=_class_name, method_name=_method_name)
+        __logger.info('WLSDPLY-10303', len(snapshots), cache_dir, class_name=_class_name, method_name=_method_name)
+
+    exit_code = CommandLineArgUtil.PROG_OK_EXIT_CODE
+    __logger.exiting(class_name=_class_name, method_name=_method_name, result=exit_code)
+    return exit_code
+
+
+def main(args):
+    """
+    The main entry point for the manageTemplateCache tool.
+    :param args: the command-line arguments
+    """
+    _method_name = 'main'
+
+    __logger.entering(class_name=_class_name, method_name=_method_name)
+    for index, arg in enumerate(args):
+        __logger.finer('sys.argv[{0}] = {1}', str(index), str(arg), class_name=_class_name, method_name=_method_name)
+
+    try:
+        argument_map = __process_args(args)
+    except CLAException, ex:
+        exit_code = ex.getExitCode()
+        if exit_code != CommandLineArgUtil.HELP_EXIT_CODE:
+            __logger.severe('WLSDPLY-20008', _program_name, ex.getLocalizedMessage(), error=ex,
+                            class_name=_class_name, method_name=_method_name)
+        cla_helper.clean_up_temp_files()
+        sys.exit(exit_code)
+
+    exit_code = manage_template_cache(CommandLineArgUtil.CLEAR_CACHE_SWITCH in argument_map)
+
+    __logger.exiting(result=exit_code, class_name=_class_name, method_name=_method_name)
+    sys.exit(exit_code)
+
+
+if __name__ == '__main__' or __name__ == 'main':
+    WebLogicDeployToolingVersion.logVersionInfo(_program_name)
+    main(sys.argv)
@@ -9,8 +9,6 @@
 #
 #
 
-import java.io.FileOutputStream as JFileOutputStream
-import java.io.PrintWriter as JPrintWriter
 import os
 import sets
 import sys
@@ -26,6 +24,7 @@ from oracle.weblogic.deploy.util import PyWLSTException
 from oracle.weblogic.deploy.util import VariableException
 from oracle.weblogic.deploy.util import WebLogicDeployToolingVersion
 from oracle.weblogic.deploy.validate import ValidateException
+from oracle.weblogic.deploy.yaml import YamlException
 
 from wlsdeploy.aliases.aliases import Aliases
 from wlsdeploy.aliases.location_context import LocationContext
@@ -98,6 +97,37 @@ def __process_args(args, logger):
     return ModelContext(_program_name, argument_map)
 
 
+class _ModelSession(object):
+    """
+    The model files of a prepare session.  Each file is parsed once, and an unchanged copy of each
+    parsed file is kept, so the merged model can be built without parsing the files again.
+    """
+
+    def __init__(self):
+        self._parsed_models = {}
+
+    def parse(self, model_file_name):
+        """
+        Parse the model file, and keep an unchanged copy of the result.
+        :param model_file_name: the model file name
+        :return: the model dictionary, which may be changed by the caller
+        """
+        model_dictionary = FileToPython(model_file_name, True).parse()
+        self._parsed_models[model_file_name] = model_dictionary.sharedCopy()
+        return model_dictionary
+
+    def get_model(self, model_file_name):
+        """
+        Get a copy of the model dictionary for the file, parsing the file if it was not parsed before.
+        This can be used as the model files loader for cla_helper.load_model().
+        :param model_file_name: the model file name
+        :return: a copy of the model dictionary
+        """
+        if model_file_name not in self._parsed_models:
+            self.parse(model_file_name)
+        return self._parsed_models[model_file_name].sharedCopy()
+
+
 class PrepareModel:
     """
       This is the main driver for the caller.  It compares two model files whether they are json or yaml format.
@@ -342,25 +372,23 @@ class PrepareModel:
         _method_name = "walk"
 
         model_file_name = None
+        model_session = _ModelSession()
 
         try:
+            validator = Validator(self.model_context, self._aliases, wlst_mode=WlstModes.OFFLINE)
+
+            variable_file = self.model_context.get_variable_file()
+            if not os.path.exists(variable_file):
+                variable_file=None
+
             model_file_list = self.model_files.split(',')
             for model_file in model_file_list:
                 self.cache.clear()
                 if os.path.splitext(model_file)[1].lower() == ".yaml":
                     model_file_name = model_file
-                    FileToPython(model_file_name, True).parse()
-
-                aliases = Aliases(model_context=self.model_context, wlst_mode=WlstModes.OFFLINE)
 
-                validator = Validator(self.model_context, aliases, wlst_mode=WlstModes.OFFLINE)
-
-                # Just merge and validate but without substitution
-                model_dictionary = cla_helper.merge_model_files(model_file_name, None)
-
-                variable_file = self.model_context.get_variable_file()
-                if not os.path.exists(variable_file):
-                    variable_file=None
+                # Just parse and validate but without substitution
+                model_dictionary = model_session.get_model(model_file_name)
 
                 return_code = validator.validate_in_tool_mode(model_dictionary,
                                                           variables_file_name=variable_file,
@@ -374,31 +402,29 @@ class PrepareModel:
 
 
                 self.__walk_model_section(model.get_model_domain_info_key(), self.current_dict,
-                                          aliases.get_model_section_top_level_folder_names(DOMAIN_INFO))
+                                          self._aliases.get_model_section_top_level_folder_names(DOMAIN_INFO))
 
                 self.__walk_model_section(model.get_model_topology_key(), self.current_dict,
-                                          aliases.get_model_topology_top_level_folder_names())
+                                          self._aliases.get_model_topology_top_level_folder_names())
 
                 self.__walk_model_section(model.get_model_resources_key(), self.current_dict,
-                                              aliases.get_model_resources_top_level_folder_names())
+                                              self._aliases.get_model_resources_top_level_folder_names())
 
                 self.current_dict = self._apply_filter_and_inject_variable(self.current_dict, self.model_context,
                                                                            validator)
 
                 file_name = os.path.join(self.output_dir, os.path.basename(model_file_name))
-                fos = JFileOutputStream(file_name, False)
-                writer = JPrintWriter(fos, True)
-                pty = PythonToYaml(self.current_dict)
-                pty._write_dictionary_to_yaml_file(self.current_dict, writer)
-                writer.close()
+                PythonToYaml(self.current_dict).write_to_yaml_file(file_name)
 
             self.cache.clear()
             for key in self.secrets_to_generate:
                 self.cache[key] = ''
 
             # use a merged, substituted, filtered model to get domain name and create additional target output.
+            # the merged model is built from the files that were already parsed.
             full_model_dictionary = cla_helper.load_model(_program_name, self.model_context, self._alias_helper,
-                                                          "discover", WlstModes.OFFLINE)
+                                                          "discover", WlstModes.OFFLINE,
+                                                          model_files_loader=model_session.get_model)
 
             target_configuration_helper.generate_k8s_script(self.model_context, self.cache, full_model_dictionary)
 
@@ -424,6 +450,12 @@ class PrepareModel:
             ex = exception_helper.create_compare_exception(pe.getLocalizedMessage(), error=pe)
             self._logger.throwing(ex, class_name=_class_name, method_name=_method_name)
             return VALIDATION_FAIL
+        except YamlException, ye:
+            self._logger.severe('WLSDPLY-20009', _program_name, model_file_name, ye.getLocalizedMessage(),
+                                error=ye, class_name=_class_name, method_name=_method_name)
+            ex = exception_helper.create_compare_exception(ye.getLocalizedMessage(), error=ye)
+            self._logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+            return VALIDATION_FAIL
 
         return 0
 
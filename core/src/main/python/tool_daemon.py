@@ -0,0 +1,178 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+The entry point for the toolDaemon tool, which runs the Jython tools for the tool scripts
+in a long-lived JVM.  The tool scripts use the daemon when the daemon file exists.
+"""
+import os
+import sys
+
+from java.io import File
+from java.io import IOException
+from java.lang import System
+from oracle.weblogic.deploy.daemon import ToolDaemon
+from oracle.weblogic.deploy.daemon import ToolRunner
+from oracle.weblogic.deploy.util import CLAException
+from oracle.weblogic.deploy.util import WLSDeployExitException
+from oracle.weblogic.deploy.util import WebLogicDeployToolingVersion
+
+sys.path.append(os.path.dirname(os.path.realpath(sys.argv[0])))
+
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.util import model_context_helper
+from wlsdeploy.util import cla_helper
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+
+_program_name = 'toolDaemon'
+_class_name = 'tool_daemon'
+__logger = PlatformLogger('wlsdeploy.util')
+
+__required_arguments = [
+    CommandLineArgUtil.ORACLE_HOME_SWITCH
+]
+
+__optional_arguments = []
+
+# The tools that the daemon can run, and their modules.
+# These tools don't use WLST, and don't read from standard input unless encryption is used,
+# and the tool scripts don't use the daemon when encryption is used.
+_tool_modules = {
+    'compareModel': 'compare_model',
+    'extractDomainResource': 'extract_resource',
+    'injectVariables': 'variable_inject',
+    'modelHelp': 'model_help',
+    'prepareModel': 'prepare_model',
+    'validateModel': 'validate'
+}
+
+_tools_dir = os.path.dirname(os.path.realpath(sys.argv[0]))
+
+
+class _StreamWriter:
+    """
+    Writes Python output to a Java print stream, so print statements in a tool go to the daemon client.
+    """
+
+    def __init__(self, print_stream):
+        self._print_stream = print_stream
+
+    def write(self, text):
+        # print is a reserved word in Jython
+        getattr(self._print_stream, 'print')(text)
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def flush(self):
+        self._print_stream.flush()
+
+
+class _ToolRunner(ToolRunner):
+    """
+    Runs the tool modules in this JVM.  The tool module is reloaded for each run, so its module
+    variables are reset, but the wlsdeploy modules and the aliases they have loaded are reused.
+    """
+
+    def canRun(self, program_name):
+        return program_name in _tool_modules
+
+    def runTool(self, program_name, args):
+        module_name = _tool_modules[program_name]
+        # the tool modules add their directory to the path when they are loaded
+        saved_path = list(sys.path)
+        saved_stdout = sys.stdout
+        saved_stderr = sys.stderr
+        sys.stdout = _StreamWriter(System.out)
+        sys.stderr = _StreamWriter(System.err)
+        try:
+            try:
+                if module_name in sys.modules:
+                    module = reload(sys.modules[module_name])
+                else:
+                    module = __import__(module_name)
+                WebLogicDeployToolingVersion.logVersionInfo(program_name)
+                tool_args = [os.path.join(_tools_dir, module_name + '.py')]
+                tool_args.extend(args)
+                module.main(tool_args)
+                return CommandLineArgUtil.PROG_OK_EXIT_CODE
+            except SystemExit, ex:
+                return _get_exit_code(ex.code)
+            except WLSDeployExitException, ex:
+                return ex.getExitCode()
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            sys.stdout = saved_stdout
+            sys.stderr = saved_stderr
+            sys.path[:] = saved_path
+
+
+def _get_exit_code(code):
+    """
+    Get the exit code for the value passed to sys.exit().
+    :param code: the value passed to sys.exit()
+    :return: the exit code
+    """
+    if code is None:
+        return CommandLineArgUtil.PROG_OK_EXIT_CODE
+    try:
+        return int(code)
+    except (TypeError, ValueError):
+        return CommandLineArgUtil.PROG_ERROR_EXIT_CODE
+
+
+def __process_args(args):
+    """
+    Process the command-line arguments.
+    :param args: the command-line arguments list
+    :raises CLAException: if an error occurs while validating and processing the command-line arguments
+    """
+    cla_util = CommandLineArgUtil(_program_name, __required_arguments, __optional_arguments)
+    argument_map = cla_util.process_args(args)
+    return model_context_helper.create_context(_program_name, argument_map)
+
+
+def main(args):
+    """
+    The main entry point for the toolDaemon tool.
+    :param args: the command-line arguments
+    """
+    _method_name = 'main'
+
+    __logger.entering(class_name=_class_name, method_name=_method_name)
+    for index, arg in enumerate(args):
+        __logger.finer('sys.argv[{0}] = {1}', str(index), str(arg), class_name=_class_name, method_name=_method_name)
+
+    try:
+        model_context = __process_args(args)
+    except CLAException, ex:
+        exit_code = ex.getExitCode()
+        if exit_code != CommandLineArgUtil.HELP_EXIT_CODE:
+            __logger.severe('WLSDPLY-20008', _program_name, ex.getLocalizedMessage(), error=ex,
+                            class_name=_class_name, method_name=_method_name)
+        cla_helper.clean_up_temp_files()
+        sys.exit(exit_code)
+
+    daemon_file = os.environ.get(ToolDaemon.DAEMON_FILE_ENV_VARIABLE)
+    if daemon_file is None:
+        __logger.severe('WLSDPLY-20033', _program_name, ToolDaemon.DAEMON_FILE_ENV_VARIABLE,
+                        class_name=_class_name, method_name=_method_name)
+        sys.exit(CommandLineArgUtil.PROG_ERROR_EXIT_CODE)
+
+    daemon = ToolDaemon(File(daemon_file), model_context.get_oracle_home(), _program_name, _ToolRunner())
+    try:
+        daemon.serve()
+    except IOException, ioe:
+        __logger.severe('WLSDPLY-20034', _program_name, daemon_file, ioe.getLocalizedMessage(), error=ioe,
+                        class_name=_class_name, method_name=_method_name)
+        sys.exit(CommandLineArgUtil.PROG_ERROR_EXIT_CODE)
+
+    __logger.exiting(class_name=_class_name, method_name=_method_name)
+    sys.exit(CommandLineArgUtil.PROG_OK_EXIT_CODE)
+
+
+if __name__ == '__main__' or __name__ == 'main':
+    WebLogicDeployToolingVersion.logVersionInfo(_program_name)
+    main(sys.argv)
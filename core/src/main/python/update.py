@@ -23,6 +23,7 @@ from wlsdeploy.aliases.wlst_modes import WlstModes
 from wlsdeploy.exception.expection_types import ExceptionType
 from wlsdeploy.logging.platform_logger import PlatformLogger
 from wlsdeploy.tool.create.domain_typedef import UPDATE_DOMAIN
+from wlsdeploy.tool.deploy import deployer
 from wlsdeploy.tool.deploy import deployer_utils
 from wlsdeploy.tool.deploy import model_deployer
 from wlsdeploy.tool.deploy.topology_updater import TopologyUpdater
@@ -160,6 +161,7 @@ def __update_online(model, model_context, aliases):
 
     if exit_code != CommandLineArgUtil.PROG_ROLLBACK_IF_RESTART_EXIT_CODE:
         model_deployer.deploy_applications(model, model_context, aliases, wlst_mode=__wlst_mode)
+    deployer.log_attribute_counts()
 
     try:
         __wlst_helper.disconnect()
@@ -0,0 +1,100 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import copy
+
+from wlsdeploy.aliases.alias_constants import WLST_PATH
+
+
+class AliasAttributeEntry(object):
+    """
+    A read-only view of a resolved alias attribute entry.
+
+    The view shares the attribute dictionary with the alias knowledge base instead of copying it,
+    so a single instance is created for each attribute and returned for every lookup.  The wlst_path
+    field is hidden, since the path tokens are not resolved for attribute entries.  The view does not
+    provide any methods to modify the entry, and callers should not modify the nested values.
+    """
+    __slots__ = ['_attribute_dict']
+
+    def __init__(self, attribute_dict):
+        """
+        Create a view of the specified attribute dictionary.
+        :param attribute_dict: the resolved attribute dictionary from the alias knowledge base
+        """
+        self._attribute_dict = attribute_dict
+
+    def __getitem__(self, key):
+        if key == WLST_PATH:
+            raise KeyError(key)
+        return self._attribute_dict[key]
+
+    def __contains__(self, key):
+        return key != WLST_PATH and key in self._attribute_dict
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __eq__(self, other):
+        if isinstance(other, AliasAttributeEntry):
+            other = other.copy()
+        return self.copy() == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __str__(self):
+        return str(self.copy())
+
+    def __repr__(self):
+        return repr(self.copy())
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(self.copy(), memo)
+
+    def has_key(self, key):
+        return self.__contains__(key)
+
+    def get(self, key, default=None):
+        if self.__contains__(key):
+            return self._attribute_dict[key]
+        return default
+
+    def keys(self):
+        result = []
+        for key in self._attribute_dict.keys():
+            if key != WLST_PATH:
+                result.append(key)
+        return result
+
+    def values(self):
+        result = []
+        for key in self.keys():
+            result.append(self._attribute_dict[key])
+        return result
+
+    def items(self):
+        result = []
+        for key in self.keys():
+            result.append((key, self._attribute_dict[key]))
+        return result
+
+    def iteritems(self):
+        return iter(self.items())
+
+    def copy(self):
+        """
+        Get a modifiable, shallow copy of the attribute entry, without the wlst_path field.
+        :return: the attribute entry dictionary
+        """
+        result = dict()
+        for key in self.keys():
+            result[key] = self._attribute_dict[key]
+        return result
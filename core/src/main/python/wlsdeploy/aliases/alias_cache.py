@@ -0,0 +1,278 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Persistent cache for the alias knowledge base.
+
+Loading the aliases requires parsing the category module JSON files, expanding the contains references,
+and filtering the resulting tree for the WLS version and WLST mode in use.  The fully resolved category
+dictionaries are stored in a binary pickle file for each (WLS version, WLST mode) combination, along with
+a checksum of the alias JSON files.  A cache file is ignored if the checksum or format does not match,
+so it is invalidated automatically when the alias files change.
+
+The cache directory is $WDT_ALIAS_CACHE_DIR if that variable is set, otherwise $WLSDEPLOY_HOME/cache/aliases.
+Setting WDT_ALIAS_CACHE_DIR to an empty value disables the cache.  If the cache directory is not writable,
+the cache files in it are used, but the tools do not build new ones.
+"""
+import cPickle
+import os
+
+from java.io import File
+from java.lang import Exception as JException
+from java.lang import String
+
+from oracle.weblogic.deploy.util import FileUtils
+
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.util import path_utils
+
+ALIAS_CACHE_DIR_VARIABLE = 'WDT_ALIAS_CACHE_DIR'
+
+# increment this if the structure of the resolved category dictionaries changes
+CACHE_FORMAT_VERSION = 1
+
+_class_name = 'alias_cache'
+_logger = PlatformLogger('wlsdeploy.aliases')
+
+_cache_file_prefix = 'aliases_'
+_cache_file_suffix = '.cache'
+_pickle_protocol = 1
+
+# the checksum of the alias files will not change during a tool run
+_checksums = {}
+
+
+def get_cache_directory():
+    """
+    Get the directory where alias cache files are stored.
+    :return: the cache directory path, or None if the cache is disabled
+    """
+    if os.environ.has_key(ALIAS_CACHE_DIR_VARIABLE):
+        cache_dir = os.environ.get(ALIAS_CACHE_DIR_VARIABLE)
+        if len(cache_dir.strip()) == 0:
+            return None
+        return cache_dir
+
+    wls_deploy_path = os.environ.get(path_utils.WLSDEPLOY_HOME_VARIABLE, None)
+    if wls_deploy_path is None or len(wls_deploy_path) == 0:
+        return None
+    return os.path.join(wls_deploy_path, 'cache', 'aliases')
+
+
+def is_enabled():
+    """
+    Determine if the alias cache is enabled for this tool run.
+    :return: True if a cache directory is configured, False otherwise
+    """
+    return get_cache_directory() is not None
+
+
+def is_writable():
+    """
+    Determine if cache files can be written to the cache directory.  If the directory does not exist,
+    its nearest existing parent directory must be writable, since the directory is created when needed.
+    :return: True if the cache is enabled and the cache directory is writable, False otherwise
+    """
+    cache_dir = get_cache_directory()
+    if cache_dir is None:
+        return False
+
+    directory = File(cache_dir).getAbsoluteFile()
+    while directory is not None and not directory.exists():
+        directory = directory.getParentFile()
+    return directory is not None and directory.isDirectory() and directory.canWrite()
+
+
+def get_cache_file_path(wls_version, wlst_mode):
+    """
+    Get the path of the cache file for the specified WLS version and WLST mode.
+    :param wls_version: the WLS version used to resolve the aliases
+    :param wlst_mode: the WlstModes value used to resolve the aliases
+    :return: the cache file path, or None if the cache is disabled
+    """
+    cache_dir = get_cache_directory()
+    if cache_dir is None:
+        return None
+
+    mode_name = WlstModes.from_value(wlst_mode).lower()
+    file_name = '%s%s_%s%s' % (_cache_file_prefix, str(wls_version), mode_name, _cache_file_suffix)
+    return os.path.join(cache_dir, file_name)
+
+
+def compute_checksum(resource_paths):
+    """
+    Compute a single checksum for the contents of the specified alias resource files.
+    The result is remembered for the remainder of the tool run.
+    :param resource_paths: the class path resource paths of the alias JSON files
+    :return: the Base64-encoded checksum
+    """
+    _method_name = 'compute_checksum'
+
+    key = tuple(resource_paths)
+    if key in _checksums:
+        return _checksums[key]
+
+    _logger.entering(len(resource_paths), class_name=_class_name, method_name=_method_name)
+    file_hashes = []
+    for resource_path in resource_paths:
+        file_hashes.append(resource_path)
+        input_stream = FileUtils.getResourceAsStream(resource_path)
+        if input_stream is None:
+            # a missing file is reported by the alias loader, not the cache
+            file_hashes.append('-')
+            continue
+        try:
+            file_hashes.append(FileUtils.computeHash(FileUtils.readInputStreamToByteArray(input_stream)))
+        finally:
+            input_stream.close()
+
+    result = FileUtils.computeHash(String(','.join(file_hashes)).getBytes('UTF-8'))
+    _checksums[key] = result
+    _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
+    return result
+
+
+def load_category_dictionary(wls_version, wlst_mode, checksum):
+    """
+    Load the resolved category dictionary for the WLS version and WLST mode from the cache.
+    Any problem reading the cache file is treated as a cache miss.
+    :param wls_version: the WLS version used to resolve the aliases
+    :param wlst_mode: the WlstModes value used to resolve the aliases
+    :param checksum: the current checksum of the alias files
+    :return: the category dictionary, or None if there is no valid cache entry
+    """
+    _method_name = 'load_category_dictionary'
+
+    cache_file = get_cache_file_path(wls_version, wlst_mode)
+    if cache_file is None or not os.path.isfile(cache_file):
+        return None
+
+    _logger.entering(cache_file, class_name=_class_name, method_name=_method_name)
+    result = None
+    try:
+        cache_entry = _read_cache_file(cache_file)
+        if _is_valid_entry(cache_entry, wls_version, wlst_mode, checksum):
+            result = cache_entry['categories']
+            _logger.fine('WLSDPLY-08600', cache_file, class_name=_class_name, method_name=_method_name)
+        else:
+            _logger.fine('WLSDPLY-08601', cache_file, class_name=_class_name, method_name=_method_name)
+    except (IOError, OSError, EOFError, cPickle.UnpicklingError, KeyError, TypeError), ex:
+        _logger.fine('WLSDPLY-08602', cache_file, ex, class_name=_class_name, method_name=_method_name)
+    except JException, ex:
+        _logger.fine('WLSDPLY-08602', cache_file, ex.getLocalizedMessage(),
+                     class_name=_class_name, method_name=_method_name)
+
+    _logger.exiting(class_name=_class_name, method_name=_method_name, result=result is not None)
+    return result
+
+
+def save_category_dictionary(wls_version, wlst_mode, checksum, category_dict):
+    """
+    Store the resolved category dictionary for the WLS version and WLST mode in the cache.
+    The file is written to a temporary name first, so concurrent tools never read a partial file.
+    A failure to write the cache is logged and otherwise ignored.
+    :param wls_version: the WLS version used to resolve the aliases
+    :param wlst_mode: the WlstModes value used to resolve the aliases
+    :param checksum: the current checksum of the alias files
+    :param category_dict: the fully resolved category dictionary
+    :return: the cache file path, or None if the file was not written
+    """
+    _method_name = 'save_category_dictionary'
+
+    cache_file = get_cache_file_path(wls_version, wlst_mode)
+    if cache_file is None:
+        return None
+
+    _logger.entering(cache_file, class_name=_class_name, method_name=_method_name)
+    cache_entry = {
+        'format': CACHE_FORMAT_VERSION,
+        'wls_version': str(wls_version),
+        'wlst_mode': WlstModes.from_value(wlst_mode),
+        'checksum': checksum,
+        'categories': category_dict
+    }
+
+    temp_file = '%s.%s.tmp' % (cache_file, str(id(cache_entry)))
+    try:
+        cache_dir = os.path.dirname(cache_file)
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        _write_cache_file(temp_file, cache_entry)
+        if os.path.exists(cache_file):
+            os.remove(cache_file)
+        os.rename(temp_file, cache_file)
+    except (IOError, OSError, cPickle.PicklingError), ex:
+        _logger.fine('WLSDPLY-08603', cache_file, ex, class_name=_class_name, method_name=_method_name)
+        _remove_quietly(temp_file)
+        cache_file = None
+
+    if cache_file is not None:
+        _logger.fine('WLSDPLY-08604', cache_file, class_name=_class_name, method_name=_method_name)
+    _logger.exiting(class_name=_class_name, method_name=_method_name, result=cache_file)
+    return cache_file
+
+
+def clear_cache():
+    """
+    Remove all the alias cache files from the cache directory.
+    :return: the number of files removed
+    """
+    _method_name = 'clear_cache'
+
+    cache_dir = get_cache_directory()
+    if cache_dir is None or not os.path.isdir(cache_dir):
+        return 0
+
+    count = 0
+    for file_name in os.listdir(cache_dir):
+        if file_name.startswith(_cache_file_prefix) and file_name.endswith(_cache_file_suffix):
+            if _remove_quietly(os.path.join(cache_dir, file_name)):
+                count += 1
+
+    _logger.fine('WLSDPLY-08605', count, cache_dir, class_name=_class_name, method_name=_method_name)
+    return count
+
+
+def _is_valid_entry(cache_entry, wls_version, wlst_mode, checksum):
+    """
+    Determine if the cache entry was produced from the same alias files, WLS version, and WLST mode.
+    :param cache_entry: the unpickled cache entry
+    :param wls_version: the WLS version used to resolve the aliases
+    :param wlst_mode: the WlstModes value used to resolve the aliases
+    :param checksum: the current checksum of the alias files
+    :return: True if the entry can be used, False otherwise
+    """
+    if type(cache_entry) is not dict:
+        return False
+    return cache_entry.get('format') == CACHE_FORMAT_VERSION and \
+        cache_entry.get('wls_version') == str(wls_version) and \
+        cache_entry.get('wlst_mode') == WlstModes.from_value(wlst_mode) and \
+        cache_entry.get('checksum') == checksum and \
+        type(cache_entry.get('categories')) is dict
+
+
+def _read_cache_file(cache_file):
+    cache_stream = open(cache_file, 'rb')
+    try:
+        return cPickle.load(cache_stream)
+    finally:
+        cache_stream.close()
+
+
+def _write_cache_file(cache_file, cache_entry):
+    cache_stream = open(cache_file, 'wb')
+    try:
+        cPickle.dump(cache_entry, cache_stream, _pickle_protocol)
+    finally:
+        cache_stream.close()
+
+
+def _remove_quietly(file_path):
+    try:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+            return True
+    except OSError:
+        pass
+    return False
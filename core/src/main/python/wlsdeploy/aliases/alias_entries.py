@@ -2,7 +2,7 @@
 Copyright (c) 2017, 2020, Oracle Corporation and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
-import copy
+from java.util.concurrent.locks import ReentrantLock
 
 from oracle.weblogic.deploy.aliases import VersionException
 from oracle.weblogic.deploy.aliases import VersionUtils
@@ -11,6 +11,8 @@ from oracle.weblogic.deploy.json import JsonStreamTranslator
 from oracle.weblogic.deploy.util import FileUtils
 
 import wlsdeploy.aliases.alias_utils as alias_utils
+from wlsdeploy.aliases import alias_cache
+from wlsdeploy.aliases.alias_folder_index import AliasFolderIndex
 from wlsdeploy.aliases import password_utils
 from wlsdeploy.aliases.alias_constants import ATTRIBUTES
 from wlsdeploy.aliases.alias_constants import CHILD_FOLDERS_TYPE
@@ -68,11 +70,15 @@ from wlsdeploy.aliases.wlst_modes import WlstModes
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.logging.platform_logger import PlatformLogger
 from wlsdeploy.util import dictionary_utils
+from wlsdeploy.util.lru_cache import LruCache
 from wlsdeploy.util.weblogic_helper import WebLogicHelper
 
 _class_name = 'AliasEntries'
 _logger = PlatformLogger('wlsdeploy.aliases')
 
+# the maximum number of folder dictionaries with resolved path tokens to keep for each AliasEntries instance
+RESOLVED_FOLDER_CACHE_SIZE = 512
+
 
 class AliasEntries(object):
     """
@@ -205,7 +211,18 @@ class AliasEntries(object):
         :param wls_version: the WLS version to use, the default is the version of WLST being used to run the program.
         """
         self._category_dict = {}
+        # the path name and folder dictionary for each model folder path, found on first use
+        self._folder_dicts = {}
+        # the attribute lookup tables for each model folder path, created on first use
+        self._folder_indexes = {}
+        # folder dictionaries with resolved path tokens, keyed by model folder path and name tokens
+        self._resolved_folders = LruCache(RESOLVED_FOLDER_CACHE_SIZE)
+        # guards the categories, folder dictionaries and indexes, since the tasks that discover
+        # MBean instances concurrently share this instance
+        self._lock = ReentrantLock()
         self._wlst_mode = wlst_mode
+        # the alias cache file that was loaded or written for this instance, if any
+        self._category_cache_file = None
         if wls_version is None:
             self._wls_helper = WebLogicHelper(_logger)
             self._wls_version = self._wls_helper.get_actual_weblogic_version()
@@ -213,8 +230,38 @@ class AliasEntries(object):
             self._wls_helper = WebLogicHelper(_logger, wls_version)
             self._wls_version = wls_version
 
+        if alias_cache.is_enabled():
+            self.__load_category_cache()
+        return
+
+    def load_all_categories(self):
+        """
+        Load and resolve every alias category that has not already been loaded.
+        This is used to populate the persistent alias cache.
+        :raises AliasException: if an error occurs while loading or processing the aliases
+        """
+        _method_name = 'load_all_categories'
+
+        _logger.entering(class_name=_class_name, method_name=_method_name)
+        for category_name in self.__get_all_category_names():
+            self.__get_category_dictionary(category_name)
+        _logger.exiting(class_name=_class_name, method_name=_method_name)
         return
 
+    def save_category_cache(self):
+        """
+        Load all the alias categories and write them to the persistent alias cache, unless this instance
+        already loaded them from the cache or wrote them to it.
+        :return: the cache file path, or None if the cache is disabled or could not be written
+        :raises AliasException: if an error occurs while loading or processing the aliases
+        """
+        if self._category_cache_file is None:
+            self.load_all_categories()
+            checksum = alias_cache.compute_checksum(self.__get_category_file_paths())
+            self._category_cache_file = alias_cache.save_category_dictionary(self._wls_version, self._wlst_mode,
+                                                                             checksum, self._category_dict)
+        return self._category_cache_file
+
     def get_dictionary_for_location(self, location, resolve=True):
         """
         Get the alias dictionary for the specified location with all the context applied to the data.  Note
@@ -227,7 +274,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_dictionary_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         result = self.__get_dictionary_for_location(location, resolve)
         # not one caller checks to see if the dictionary returned is None
         if result is None:
@@ -318,7 +365,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_model_subfolder_names_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         folder_dict = self.__get_dictionary_for_location(location, False)
         if folder_dict is not None and FOLDERS in folder_dict:
             subfolders_dict = folder_dict[FOLDERS]
@@ -338,7 +385,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_model_folder_path_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
 
         # Initialize return variable
         model_folder_path = ''
@@ -402,7 +449,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_wlst_attribute_path_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         tokenized_path = self.__get_path_for_location(location, WLST_ATTRIBUTES_PATH)
         result = alias_utils.replace_tokens_in_path(location, tokenized_path)
         _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
@@ -418,7 +465,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_wlst_subfolders_path_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         tokenized_path = self.__get_path_for_location(location, WLST_SUBFOLDERS_PATH)
         result = alias_utils.replace_tokens_in_path(location, tokenized_path)
         _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
@@ -434,7 +481,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_wlst_list_path_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         tokenized_path = self.__get_path_for_location(location, WLST_LIST_PATH)
         result = alias_utils.replace_tokens_in_path(location, tokenized_path)
         _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
@@ -450,7 +497,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_wlst_list_path_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         tokenized_path = self.__get_path_for_location(location, WLST_CREATE_PATH)
         result = alias_utils.replace_tokens_in_path(location, tokenized_path)
         _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
@@ -467,7 +514,7 @@ class AliasEntries(object):
         """
         _method_name = 'is_location_child_folder_type'
 
-        _logger.entering(str(location), ChildFoldersTypes.from_value(child_folders_type),
+        _logger.entering(location, ChildFoldersTypes.from_value(child_folders_type),
                          class_name=_class_name, method_name=_method_name)
         result = False
         folder_dict = self.__get_dictionary_for_location(location, False)
@@ -496,7 +543,7 @@ class AliasEntries(object):
         """
         _method_name = 'location_contains_flattened_folder'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         result = False
         folder_dict = self.__get_dictionary_for_location(location, False)
         if folder_dict is not None and FLATTENED_FOLDER_DATA in folder_dict:
@@ -512,7 +559,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_wlst_flattened_type_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         result = None
         folder_dict = self.__get_dictionary_for_location(location, False)
         if folder_dict is not None and FLATTENED_FOLDER_DATA in folder_dict and \
@@ -529,7 +576,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_wlst_flattened_name_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         result = None
         folder_dict = self.__get_dictionary_for_location(location, False)
         if folder_dict is not None and FLATTENED_FOLDER_DATA in folder_dict and \
@@ -548,7 +595,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_wlst_flattened_folder_list_path_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         tokenized_path = self.__get_path_for_location(location, WLST_CREATE_PATH)
         tokenized_child_path = alias_utils.strip_trailing_folders_in_path(tokenized_path, 1)
         result = alias_utils.replace_tokens_in_path(location, tokenized_child_path)
@@ -565,7 +612,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_wlst_flattened_folder_create_path_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         tokenized_path = self.__get_path_for_location(location, WLST_CREATE_PATH)
         tokenized_child_path = alias_utils.strip_trailing_folders_in_path(tokenized_path, 2)
         result = alias_utils.replace_tokens_in_path(location, tokenized_child_path)
@@ -581,7 +628,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_name_token_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
 
         result = None
 
@@ -645,7 +692,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_wlst_mbean_name_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         folder_dict = self.__get_dictionary_for_location(location, False)
 
         mbean_name = None
@@ -690,7 +737,7 @@ class AliasEntries(object):
         if not self.is_model_location_valid(location):
             return None
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         folder_dict = self.__get_dictionary_for_location(location, False)
         if folder_dict is None:
             wlst_type = None
@@ -707,25 +754,18 @@ class AliasEntries(object):
     def get_alias_attribute_entries_by_location(self, location):
         """
         Get the attribute entries for the specified location.  Note that since this method does not resolve
-        the paths, the wlst_path attribute is removed for the returned attribute entries.
+        the paths, the wlst_path attribute is not included in the returned attribute entries.
+        The entries are read-only views that are shared with other callers.
         :param location: the location
         :return: the dictionary of attribute entries, keyed by the model attribute names
         :raises AliasException: if an error occurs
         """
         _method_name = 'get_alias_attribute_entries_by_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         folder_dict = self.__get_dictionary_for_location(location, False)
-        model_attr_dict = dict()
         if folder_dict is not None and ATTRIBUTES in folder_dict:
-            attrs = folder_dict[ATTRIBUTES]
-            for attr_name in attrs:
-                attr = copy.deepcopy(attrs[attr_name])
-                if WLST_PATH in attr:
-                    del attr[WLST_PATH]
-                else:
-                    _logger.warning('WLSDPLY-08107', attr_name, location.get_folder_path(), WLST_PATH)
-                model_attr_dict[attr_name] = attr
+            model_attr_dict = self.__get_folder_index(location, folder_dict).get_attribute_entries()
         else:
             ex = exception_helper.create_alias_exception('WLSDPLY-08108', location.get_folder_path(), ATTRIBUTES)
             _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
@@ -737,6 +777,7 @@ class AliasEntries(object):
     def get_alias_attribute_entry_by_model_name(self, location, model_attribute_name):
         """
         Get a single alias attribute entry from the specified location by its model name.
+        The entry is a read-only view that does not include the wlst_path attribute.
         :param location: the location
         :param model_attribute_name: the model name for the attribute
         :return: the alias entry for the specified attribute
@@ -744,17 +785,10 @@ class AliasEntries(object):
         """
         _method_name = 'get_alias_attribute_entry_by_model_name'
 
-        _logger.entering(str(location), model_attribute_name, class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, model_attribute_name, class_name=_class_name, method_name=_method_name)
         folder_dict = self.__get_dictionary_for_location(location, False)
         if folder_dict is not None and ATTRIBUTES in folder_dict:
-            if model_attribute_name in folder_dict[ATTRIBUTES]:
-                model_attr_dict = copy.deepcopy(folder_dict[ATTRIBUTES][model_attribute_name])
-                if WLST_PATH in model_attr_dict:
-                    del model_attr_dict[WLST_PATH]
-                else:
-                    _logger.warning('WLSDPLY-08107', model_attribute_name, location.get_folder_path(), WLST_PATH)
-            else:
-                model_attr_dict = None
+            model_attr_dict = self.__get_folder_index(location, folder_dict).get_attribute_entry(model_attribute_name)
         else:
             ex = exception_helper.create_alias_exception('WLSDPLY-08109', model_attribute_name,
                                                          location.get_folder_path(), ATTRIBUTES)
@@ -767,6 +801,7 @@ class AliasEntries(object):
     def get_alias_attribute_entry_by_wlst_name(self, location, wlst_attribute_name):
         """
         Get a single alias attribute entry from the specified location by its WLST name.
+        The entry is a read-only view that does not include the wlst_path attribute.
         :param location: the location
         :param wlst_attribute_name: the WLST name for the attribute
         :return: the alias entry for the specified attribute
@@ -774,18 +809,15 @@ class AliasEntries(object):
         """
         _method_name = 'get_alias_attribute_entry_by_wlst_name'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         folder_dict = self.__get_dictionary_for_location(location, False)
         if self._is_wlst_attribute_skipped(folder_dict, wlst_attribute_name) or \
                 self._is_wlst_attribute_ignored(wlst_attribute_name):
             result = None
         elif folder_dict is not None and WLST_NAMES_MAP in folder_dict:
             if wlst_attribute_name in folder_dict[WLST_NAMES_MAP]:
-                result = copy.deepcopy(folder_dict[WLST_NAMES_MAP][wlst_attribute_name])
-                if WLST_PATH in result:
-                    del result[WLST_PATH]
-                else:
-                    _logger.warning('WLSDPLY-08110', wlst_attribute_name, location.get_folder_path(), WLST_PATH)
+                folder_index = self.__get_folder_index(location, folder_dict)
+                result = folder_index.get_attribute_entry_by_wlst_name(wlst_attribute_name)
             else:
                 if wlst_attribute_name not in self.IGNORE_FOR_MODEL_LIST:
                     ex = exception_helper.create_alias_exception('WLSDPLY-08111', location.get_folder_path(),
@@ -803,6 +835,19 @@ class AliasEntries(object):
         _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
         return result
 
+    def get_folder_index_for_location(self, location):
+        """
+        Get the attribute lookup tables for the specified location.  Since the tables are shared by all the
+        locations with the same model folder path, the attribute entries do not include the wlst_path attribute.
+        :param location: the location
+        :return: the AliasFolderIndex, or None if the folder has no attributes or is not relevant to the WLS version
+        :raises AliasException: if an error occurs
+        """
+        folder_dict = self.__get_dictionary_for_location(location, False)
+        if folder_dict is None or ATTRIBUTES not in folder_dict:
+            return None
+        return self.__get_folder_index(location, folder_dict)
+
     def is_valid_model_folder_name_for_location(self, location, model_folder_name):
         """
         Is the specified model folder name valid for the specified location?
@@ -814,7 +859,7 @@ class AliasEntries(object):
         """
         _method_name = 'is_valid_model_folder_name_for_location'
 
-        _logger.entering(str(location), model_folder_name, class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, model_folder_name, class_name=_class_name, method_name=_method_name)
         valid_version_range = None
         if len(location.get_model_folders()) == 0 and model_folder_name in self.get_model_domain_subfolder_names():
             sub_location = LocationContext(location).append_location(model_folder_name)
@@ -868,7 +913,7 @@ class AliasEntries(object):
         """
         _method_name = 'is_version_valid_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
 
         code = ValidationCodes.VALID
         message = ''
@@ -893,7 +938,7 @@ class AliasEntries(object):
         """
         _method_name = 'is_valid_model_attribute_name_for_location'
 
-        _logger.entering(str(location), model_attribute_name, class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, model_attribute_name, class_name=_class_name, method_name=_method_name)
         folder_dict = self.__get_dictionary_for_location(location, True)
         valid_version_range = None
         if folder_dict is None:
@@ -972,9 +1017,60 @@ class AliasEntries(object):
             return alternate_name
         return category_name
 
+    def __get_all_category_names(self):
+        """
+        Get the names of all the categories that can be loaded, including the domain category.
+        :return: the list of category names
+        """
+        result = [self.__domain_category]
+        result.extend(self.__all_model_categories)
+        return result
+
+    def __get_category_file_paths(self):
+        """
+        Get the resource paths of all the category module files, in a consistent order.
+        :return: the list of resource paths
+        """
+        result = []
+        for category_name in self.__get_all_category_names():
+            category_file_path = '%s%s.json' % (self.__category_modules_dir_name,
+                                                self._get_category_file_prefix(category_name))
+            if category_file_path not in result:
+                result.append(category_file_path)
+        return result
+
+    def __load_category_cache(self):
+        """
+        Use the persistent alias cache to populate the category dictionary.  If there is no valid cache
+        entry for this WLS version, WLST mode, and alias file checksum, load all the categories and
+        write a new cache entry for the next tool run.  If the cache directory is not writable,
+        the categories are loaded as they are used, as they are without the cache.
+        :raises AliasException: if an error occurs while loading or processing the aliases
+        """
+        _method_name = '__load_category_cache'
+
+        _logger.entering(class_name=_class_name, method_name=_method_name)
+        checksum = alias_cache.compute_checksum(self.__get_category_file_paths())
+        cached_dict = alias_cache.load_category_dictionary(self._wls_version, self._wlst_mode, checksum)
+        if cached_dict is not None:
+            self._category_dict = cached_dict
+            self._category_cache_file = alias_cache.get_cache_file_path(self._wls_version, self._wlst_mode)
+        elif alias_cache.is_writable():
+            self.load_all_categories()
+            self._category_cache_file = alias_cache.save_category_dictionary(self._wls_version, self._wlst_mode,
+                                                                             checksum, self._category_dict)
+        else:
+            _logger.fine('WLSDPLY-08606', alias_cache.get_cache_directory(),
+                         class_name=_class_name, method_name=_method_name)
+        _logger.exiting(class_name=_class_name, method_name=_method_name)
+        return
+
     def __get_dictionary_for_location(self, location, resolve_path_tokens=True):
         """
-        Get the dictionary for a location with or without path tokens resolved
+        Get the dictionary for a location with or without path tokens resolved.
+        The folder dictionary for each model folder path is found once, and the resolved dictionaries
+        for recently used locations are kept, so repeated calls for the same location do not repeat the work.
+        The resolved dictionary is shared with other callers and should not be modified.
         :param location: the location
         :param resolve_path_tokens: whether or not to resolve path tokens
         :return: the dictionary
@@ -982,13 +1078,48 @@ class AliasEntries(object):
         """
         _method_name = '__get_dictionary_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         if location is None:
             ex = exception_helper.create_alias_exception('WLSDPLY-08115')
             _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
             raise ex
 
         location_folders = location.get_model_folders()
+        folders_key = tuple(location_folders)
+        self._lock.lock()
+        try:
+            if folders_key in self._folder_dicts:
+                path_name, folder_dict = self._folder_dicts[folders_key]
+            else:
+                path_name, folder_dict = self.__find_dictionary_for_folders(location_folders)
+                self._folder_dicts[folders_key] = (path_name, folder_dict)
+        finally:
+            self._lock.unlock()
+
+        # the path tokens are not resolved for the domain folder, or when the folder is not version-relevant
+        if resolve_path_tokens and path_name is not None and folder_dict is not None:
+            name_tokens = location.get_name_tokens().items()
+            name_tokens.sort()
+            resolved_key = (folders_key, tuple(name_tokens))
+            resolved_dict = self._resolved_folders.get(resolved_key)
+            if resolved_dict is None:
+                resolved_dict = alias_utils.resolve_path_tokens(location, path_name, folder_dict)
+                self._resolved_folders.put(resolved_key, resolved_dict)
+        else:
+            resolved_dict = folder_dict
+
+        _logger.exiting(class_name=_class_name, method_name=_method_name)
+        return resolved_dict
+
+    def __find_dictionary_for_folders(self, location_folders):
+        """
+        Walk the category tree to find the unresolved dictionary for the model folder path.
+        :param location_folders: the list of model folders for the location
+        :return: the model path name and the folder dictionary, or a path name of None for the domain folder
+        :raises: AliasException: if a model folder is not found
+        """
+        _method_name = '__find_dictionary_for_folders'
+
         if len(location_folders) == 0:
             model_category_name = self.__domain_category
         else:
@@ -999,30 +1130,51 @@ class AliasEntries(object):
                 raise ex
 
         category_dict = self.__get_category_dictionary(model_category_name)
-        if category_dict is not None and len(location_folders) > 0:
-            path_name = '/' + location_folders[0]
-            location_subfolders = list(location_folders[1:])
-            child_dict = category_dict
-            for location_subfolder in location_subfolders:
-                if FOLDERS in child_dict and location_subfolder in child_dict[FOLDERS]:
-                    child_dict = child_dict[FOLDERS][location_subfolder]
-                else:
-                    ex = exception_helper.create_alias_exception('WLSDPLY-08117', location_subfolder, path_name)
-                    _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
-                    raise ex
-                if child_dict is None:
-                    break
-                path_name += '/' + location_subfolder
-
-            if resolve_path_tokens:
-                resolved_dict = alias_utils.resolve_path_tokens(location, path_name, child_dict)
+        if category_dict is None or len(location_folders) == 0:
+            return None, category_dict
+
+        path_name = '/' + location_folders[0]
+        location_subfolders = list(location_folders[1:])
+        child_dict = category_dict
+        for location_subfolder in location_subfolders:
+            if FOLDERS in child_dict and location_subfolder in child_dict[FOLDERS]:
+                child_dict = child_dict[FOLDERS][location_subfolder]
             else:
-                resolved_dict = child_dict
-        else:
-            resolved_dict = category_dict
+                ex = exception_helper.create_alias_exception('WLSDPLY-08117', location_subfolder, path_name)
+                _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+                raise ex
+            if child_dict is None:
+                break
+            path_name += '/' + location_subfolder
+        return path_name, child_dict
 
-        _logger.exiting(class_name=_class_name, method_name=_method_name)
-        return resolved_dict
+    def __get_folder_index(self, location, folder_dict):
+        """
+        Get the attribute lookup tables for the folder at the specified location.
+        The tables are created the first time the folder is used, and reused for subsequent calls.
+        :param location: the location
+        :param folder_dict: the unresolved folder dictionary for the location, containing the attributes
+        :return: the AliasFolderIndex for the folder
+        """
+        _method_name = '__get_folder_index'
+
+        key = tuple(location.get_model_folders())
+        self._lock.lock()
+        try:
+            if key in self._folder_indexes:
+                return self._folder_indexes[key]
+
+            attrs = folder_dict[ATTRIBUTES]
+            for attr_name in attrs:
+                if WLST_PATH not in attrs[attr_name]:
+                    _logger.warning('WLSDPLY-08107', attr_name, location.get_folder_path(), WLST_PATH,
+                                    class_name=_class_name, method_name=_method_name)
+
+            result = AliasFolderIndex(attrs)
+            self._folder_indexes[key] = result
+            return result
+        finally:
+            self._lock.unlock()
 
     def __get_category_dictionary(self, model_category_name):
         """
@@ -1032,9 +1184,13 @@ class AliasEntries(object):
         :return: the category dictionary, or None if the category is not relevant to the current WLS version
         :raises: AliasException: if an error occurs while loading the category dictionary
         """
-        if model_category_name not in self._category_dict:
-            self.__load_category(model_category_name)
-        return self._category_dict[model_category_name]
+        self._lock.lock()
+        try:
+            if model_category_name not in self._category_dict:
+                self.__load_category(model_category_name)
+            return self._category_dict[model_category_name]
+        finally:
+            self._lock.unlock()
 
     def __load_category(self, model_category_name):
         """
@@ -1516,7 +1672,7 @@ class AliasEntries(object):
         """
         _method_name = '__get_valid_version_range_for_folder'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         version_range = None
         parent_dict = self._category_dict
         path_name = ''
@@ -1562,7 +1718,7 @@ class AliasEntries(object):
         """
         _method_name = '__get_path_for_location'
 
-        _logger.entering(str(location), path_type, class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, path_type, class_name=_class_name, method_name=_method_name)
         folder_dict = self.__get_dictionary_for_location(location, False)
         if folder_dict is not None and path_type in folder_dict:
             paths_index = folder_dict[path_type]
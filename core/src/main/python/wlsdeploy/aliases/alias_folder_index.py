@@ -0,0 +1,179 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+from wlsdeploy.aliases import alias_utils
+from wlsdeploy.aliases.alias_attribute_entry import AliasAttributeEntry
+from wlsdeploy.aliases.alias_constants import ALIAS_LIST_TYPES
+from wlsdeploy.aliases.alias_constants import ALIAS_MAP_TYPES
+from wlsdeploy.aliases.alias_constants import GET
+from wlsdeploy.aliases.alias_constants import GET_MBEAN_TYPE
+from wlsdeploy.aliases.alias_constants import GET_METHOD
+from wlsdeploy.aliases.alias_constants import LSA
+from wlsdeploy.aliases.alias_constants import MBEAN
+from wlsdeploy.aliases.alias_constants import MERGE
+from wlsdeploy.aliases.alias_constants import PASSWORD
+from wlsdeploy.aliases.alias_constants import RESTART_REQUIRED
+from wlsdeploy.aliases.alias_constants import SET_MBEAN_TYPE
+from wlsdeploy.aliases.alias_constants import SET_METHOD
+from wlsdeploy.aliases.alias_constants import USES_PATH_TOKENS
+from wlsdeploy.aliases.alias_constants import WLST_NAME
+from wlsdeploy.aliases.alias_constants import WLST_TYPE
+
+
+class AliasFolderIndex(object):
+    """
+    The attribute lookup tables for a single alias folder.
+
+    The tables do not depend on the name tokens of a location, so they are computed once for each
+    model folder path, the first time the folder is used.  The name lists and dictionaries returned
+    by the get methods are copies that the caller may modify.
+    """
+    __slots__ = ['_attributes', '_wlst_attributes', '_password_names', '_restart_required_names',
+                 '_get_required_names', '_wlst_get_required_names', '_lsa_required_names',
+                 '_wlst_lsa_required_names', '_get_mbean_types', '_wlst_get_mbean_types', '_mbean_set_methods',
+                 '_merge_required_names', '_uses_path_tokens_names']
+
+    def __init__(self, attributes_dict):
+        """
+        Build the lookup tables for the resolved attributes of a folder.
+        :param attributes_dict: the attribute dictionaries for the folder, keyed by model name
+        """
+        self._attributes = dict()
+        self._wlst_attributes = dict()
+        self._password_names = list()
+        self._restart_required_names = list()
+        self._get_required_names = list()
+        self._wlst_get_required_names = list()
+        self._lsa_required_names = list()
+        self._wlst_lsa_required_names = list()
+        self._get_mbean_types = dict()
+        self._wlst_get_mbean_types = dict()
+        self._mbean_set_methods = dict()
+        self._merge_required_names = list()
+        self._uses_path_tokens_names = list()
+
+        for model_name, attribute_dict in attributes_dict.iteritems():
+            self.__add_attribute(model_name, attribute_dict)
+
+    def get_attribute_entries(self):
+        """
+        Get the read-only attribute entries, keyed by model name.
+        :return: a dictionary of AliasAttributeEntry objects
+        """
+        return dict(self._attributes)
+
+    def get_attribute_entry(self, model_name):
+        """
+        Get the read-only attribute entry for the model name.
+        :param model_name: the model attribute name
+        :return: the AliasAttributeEntry, or None if the name is not found
+        """
+        if model_name in self._attributes:
+            return self._attributes[model_name]
+        return None
+
+    def get_attribute_entry_by_wlst_name(self, wlst_name):
+        """
+        Get the read-only attribute entry for the WLST name.
+        :param wlst_name: the WLST attribute name
+        :return: the AliasAttributeEntry, or None if the name is not found
+        """
+        if wlst_name in self._wlst_attributes:
+            return self._wlst_attributes[wlst_name]
+        return None
+
+    def get_password_names(self):
+        return list(self._password_names)
+
+    def get_restart_required_names(self):
+        return list(self._restart_required_names)
+
+    def get_get_required_names(self):
+        return list(self._get_required_names)
+
+    def get_wlst_get_required_names(self):
+        return list(self._wlst_get_required_names)
+
+    def get_lsa_required_names(self):
+        return list(self._lsa_required_names)
+
+    def get_wlst_lsa_required_names(self):
+        return list(self._wlst_lsa_required_names)
+
+    def get_get_mbean_types(self):
+        return dict(self._get_mbean_types)
+
+    def get_wlst_get_mbean_types(self):
+        return dict(self._wlst_get_mbean_types)
+
+    def get_mbean_set_methods(self):
+        """
+        Get the set method and set MBean type for each attribute whose set method requires an MBean.
+        :return: a dictionary keyed by model name, with dictionaries containing the set_method and set_mbean_type
+        """
+        result = dict()
+        for model_name, set_method_dict in self._mbean_set_methods.iteritems():
+            result[model_name] = dict(set_method_dict)
+        return result
+
+    def get_merge_required_names(self):
+        return list(self._merge_required_names)
+
+    def get_uses_path_tokens_names(self):
+        return list(self._uses_path_tokens_names)
+
+    def __add_attribute(self, model_name, attribute_dict):
+        entry = AliasAttributeEntry(attribute_dict)
+        self._attributes[model_name] = entry
+
+        wlst_name = None
+        if WLST_NAME in attribute_dict:
+            wlst_name = attribute_dict[WLST_NAME]
+            self._wlst_attributes[wlst_name] = entry
+
+        wlst_type = None
+        if WLST_TYPE in attribute_dict:
+            wlst_type = attribute_dict[WLST_TYPE]
+            if wlst_type == PASSWORD:
+                self._password_names.append(model_name)
+
+        if RESTART_REQUIRED in attribute_dict and 'true' == attribute_dict[RESTART_REQUIRED].lower():
+            self._restart_required_names.append(model_name)
+
+        if GET_METHOD in attribute_dict:
+            get_method = attribute_dict[GET_METHOD]
+            if get_method == GET:
+                self._get_required_names.append(model_name)
+                self._wlst_get_required_names.append(wlst_name)
+            if LSA in get_method:
+                self._lsa_required_names.append(model_name)
+            if get_method == LSA:
+                self._wlst_lsa_required_names.append(wlst_name)
+
+        get_mbean_type = None
+        if GET_MBEAN_TYPE in attribute_dict:
+            get_mbean_type = attribute_dict[GET_MBEAN_TYPE]
+        self._get_mbean_types[model_name] = get_mbean_type
+        self._wlst_get_mbean_types[wlst_name] = get_mbean_type
+
+        if SET_METHOD in attribute_dict and attribute_dict[SET_METHOD].startswith(MBEAN):
+            set_method_name = None
+            set_method_value_components = attribute_dict[SET_METHOD].split('.')
+            if len(set_method_value_components) == 2:
+                set_method_name = set_method_value_components[1]
+
+            set_mbean_type = None
+            if SET_MBEAN_TYPE in attribute_dict:
+                set_mbean_type = attribute_dict[SET_MBEAN_TYPE]
+            self._mbean_set_methods[model_name] = {SET_METHOD: set_method_name, SET_MBEAN_TYPE: set_mbean_type}
+
+        if wlst_type in ALIAS_LIST_TYPES or wlst_type in ALIAS_MAP_TYPES:
+            merge = True
+            if MERGE in attribute_dict:
+                merge = alias_utils.convert_boolean(attribute_dict[MERGE])
+            if merge:
+                self._merge_required_names.append(model_name)
+
+        if USES_PATH_TOKENS in attribute_dict and alias_utils.convert_boolean(attribute_dict[USES_PATH_TOKENS]):
+            self._uses_path_tokens_names.append(model_name)
@@ -2,7 +2,6 @@
 Copyright (c) 2017, 2019, Oracle Corporation and/or its affiliates.  All rights reserved.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
-import copy
 from org.python.modules import jarray
 import re
 from sets import Set
@@ -46,6 +45,8 @@ from wlsdeploy.aliases.alias_constants import WLST_ATTRIBUTES_PATH
 from wlsdeploy.aliases.alias_constants import WLST_CREATE_PATH
 from wlsdeploy.aliases.alias_constants import WLST_LIST_PATH
 from wlsdeploy.aliases.alias_constants import WLST_MODE
+from wlsdeploy.aliases.alias_constants import WLST_NAME
+from wlsdeploy.aliases.alias_constants import WLST_NAMES_MAP
 from wlsdeploy.aliases.alias_constants import WLST_PATH
 from wlsdeploy.aliases.alias_constants import WLST_PATHS
 from wlsdeploy.aliases.alias_constants import WLST_READ_TYPE
@@ -274,10 +275,12 @@ def resolve_path_tokens(location, path_name, folder_dict):
 
     #
     # Now that we have the target dictionary, we need to make a copy of it and replace the path tokens.
+    # Only the dictionaries that hold paths are copied, the rest of the folder is shared with the original.
     #
-    resolved_dict = copy.deepcopy(folder_dict)
+    resolved_dict = dict(folder_dict)
     if WLST_PATHS in resolved_dict:
-        wlst_paths_dict = resolved_dict[WLST_PATHS]
+        wlst_paths_dict = dict(resolved_dict[WLST_PATHS])
+        resolved_dict[WLST_PATHS] = wlst_paths_dict
         for path_key in wlst_paths_dict:
             path_value = wlst_paths_dict[path_key]
             wlst_paths_dict[path_key] = replace_tokens_in_path(location, path_value)
@@ -348,9 +351,13 @@ def resolve_path_tokens(location, path_name, folder_dict):
     # Now that the wlst_paths have been resolved, resolve the references to them in each of the attributes
     #
     if ATTRIBUTES in resolved_dict:
-        attrs_dict = resolved_dict[ATTRIBUTES]
-        for attr_name in attrs_dict:
-            attr_dict = attrs_dict[attr_name]
+        attrs_dict = dict()
+        wlst_names_dict = dict()
+        for attr_name, folder_attr_dict in resolved_dict[ATTRIBUTES].iteritems():
+            attr_dict = dict(folder_attr_dict)
+            attrs_dict[attr_name] = attr_dict
+            if WLST_NAME in attr_dict:
+                wlst_names_dict[attr_dict[WLST_NAME]] = attr_dict
 
             if WLST_PATH in attr_dict:
                 wlst_path_key = attr_dict[WLST_PATH]
@@ -366,6 +373,10 @@ def resolve_path_tokens(location, path_name, folder_dict):
                 ex = exception_helper.create_alias_exception('WLSDPLY-08011', attr_name, path_name)
                 _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
                 raise ex
+
+        resolved_dict[ATTRIBUTES] = attrs_dict
+        if WLST_NAMES_MAP in resolved_dict:
+            resolved_dict[WLST_NAMES_MAP] = wlst_names_dict
     return resolved_dict
 
 
@@ -382,7 +393,7 @@ def resolve_path_index(folder_dict, paths_index, path_attribute_name_used, locat
     _method_name = 'resolve_path_index'
 
     # Don't log folder dictionary because it is likely very large
-    _logger.entering(paths_index, path_attribute_name_used, str(location),
+    _logger.entering(paths_index, path_attribute_name_used, location,
                      class_name=_class_name, method_name=_method_name)
     if WLST_PATHS in folder_dict:
         if paths_index in folder_dict[WLST_PATHS]:
@@ -410,7 +421,7 @@ def replace_tokens_in_path(location, path):
     """
     _method_name = 'replace_tokens_in_path'
 
-    _logger.entering(str(location), path, class_name=_class_name, method_name=_method_name)
+    _logger.entering(location, path, class_name=_class_name, method_name=_method_name)
     name_tokens = location.get_name_tokens()
     new_path = path
     if name_tokens:
@@ -3,6 +3,7 @@ Copyright (c) 2017, 2020, Oracle Corporation and/or its affiliates.  All rights
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 from java.lang import String
+from java.util import ArrayList
 
 from oracle.weblogic.deploy.aliases import TypeUtils
 from oracle.weblogic.deploy.aliases import VersionUtils
@@ -27,24 +28,17 @@ from wlsdeploy.aliases.alias_constants import ATTRIBUTES
 from wlsdeploy.aliases.alias_constants import DEFAULT
 from wlsdeploy.aliases.alias_constants import FLATTENED_FOLDER_DATA
 from wlsdeploy.aliases.alias_constants import FOLDERS
-from wlsdeploy.aliases.alias_constants import GET
-from wlsdeploy.aliases.alias_constants import GET_MBEAN_TYPE
-from wlsdeploy.aliases.alias_constants import GET_METHOD
 from wlsdeploy.aliases.alias_constants import JARRAY
 from wlsdeploy.aliases.alias_constants import LIST
-from wlsdeploy.aliases.alias_constants import LSA
-from wlsdeploy.aliases.alias_constants import MBEAN
 from wlsdeploy.aliases.alias_constants import MERGE
 from wlsdeploy.aliases.alias_constants import MODEL_NAME
 from wlsdeploy.aliases.alias_constants import PASSWORD
 from wlsdeploy.aliases.alias_constants import PASSWORD_TOKEN
 from wlsdeploy.aliases.alias_constants import PREFERRED_MODEL_TYPE
 from wlsdeploy.aliases.alias_constants import PROPERTIES
-from wlsdeploy.aliases.alias_constants import RESTART_REQUIRED
 from wlsdeploy.aliases.alias_constants import RO
 from wlsdeploy.aliases.alias_constants import ROD
 from wlsdeploy.aliases.alias_constants import SET_MBEAN_TYPE
-from wlsdeploy.aliases.alias_constants import SET_METHOD
 from wlsdeploy.aliases.alias_constants import STRING
 from wlsdeploy.aliases.alias_constants import USES_PATH_TOKENS
 from wlsdeploy.aliases.alias_constants import VALUE
@@ -77,6 +71,9 @@ class Aliases(object):
             self._wls_version = wls_version
 
         self._alias_entries = AliasEntries(wlst_mode, self._wls_version)
+
+        # clear text of the encrypted passwords that were decrypted in advance, keyed by encrypted text
+        self._decrypted_passwords = dict()
         return
 
     ###########################################################################
@@ -490,7 +487,7 @@ class Aliases(object):
         """
         _method_name = 'get_wlst_attribute_name'
 
-        self._logger.entering(str(location), model_attribute_name,
+        self._logger.entering(location, model_attribute_name,
                               class_name=self._class_name, method_name=_method_name)
         wlst_attribute_name = None
         alias_attr_dict = self._alias_entries.get_alias_attribute_entry_by_model_name(location, model_attribute_name)
@@ -514,20 +511,14 @@ class Aliases(object):
         """
         _method_name = 'get_wlst_get_required_attribute_names'
 
-        wlst_attribute_names = []
-
+        # resolve the paths to validate the location
         module_folder = self._alias_entries.get_dictionary_for_location(location)
-
         if ATTRIBUTES not in module_folder:
             ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
             self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
             raise ex
 
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if GET_METHOD in value and value[GET_METHOD] == GET:
-                wlst_attribute_names.append(value[WLST_NAME])
-
-        return wlst_attribute_names
+        return self.__get_folder_index(location, _method_name).get_wlst_get_required_names()
 
     def get_wlst_lsa_required_attribute_names(self, location):
         """
@@ -538,20 +529,14 @@ class Aliases(object):
         """
         _method_name = 'get_wlst_lsa_required_attribute_names'
 
-        wlst_attribute_names = []
-
+        # resolve the paths to validate the location
         module_folder = self._alias_entries.get_dictionary_for_location(location)
-
         if ATTRIBUTES not in module_folder:
             ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
             self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
             raise ex
 
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if GET_METHOD in value and value[GET_METHOD] == LSA:
-                wlst_attribute_names.append(value[WLST_NAME])
-
-        return wlst_attribute_names
+        return self.__get_folder_index(location, _method_name).get_wlst_lsa_required_names()
 
     def get_wlst_get_returns_mbean_attribute_names_and_types(self, location):
         """
@@ -562,22 +547,14 @@ class Aliases(object):
         """
         _method_name = 'get_wlst_get_returns_mbean_attribute_names_and_types'
 
-        wlst_attribute_names = dict()
-
+        # resolve the paths to validate the location
         module_folder = self._alias_entries.get_dictionary_for_location(location)
-
         if ATTRIBUTES not in module_folder:
             ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
             self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
             raise ex
 
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if GET_MBEAN_TYPE in value:
-                wlst_attribute_names[value[WLST_NAME]] = value[GET_MBEAN_TYPE]
-            else:
-                wlst_attribute_names[value[WLST_NAME]] = None
-
-        return wlst_attribute_names
+        return self.__get_folder_index(location, _method_name).get_wlst_get_mbean_types()
 
     ###########################################################################
     #                    Model folder-related methods                         #
@@ -639,7 +616,7 @@ class Aliases(object):
         """
         _method_name = 'is_valid_model_folder_name'
 
-        self._logger.entering(str(location), model_folder_name,
+        self._logger.entering(location, model_folder_name,
                               class_name=self._class_name, method_name=_method_name)
         result, valid_version_range = \
             self._alias_entries.is_valid_model_folder_name_for_location(location, model_folder_name)
@@ -678,17 +655,7 @@ class Aliases(object):
         """
         _method_name = 'get_model_password_type_attribute_names'
 
-        password_attribute_names = []
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if WLST_TYPE in value and value[WLST_TYPE] == 'password':
-                password_attribute_names.append(key)
-        return password_attribute_names
+        return self.__get_folder_index(location, _method_name).get_password_names()
 
     def get_model_restart_required_attribute_names(self, location):
         """
@@ -698,22 +665,7 @@ class Aliases(object):
         """
         _method_name = 'get_model_restart_required_attribute_names'
 
-        restart_attribute_names = []
-
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if RESTART_REQUIRED in value:
-                restart_required_value = value[RESTART_REQUIRED]
-                if "true" == restart_required_value.lower():
-                    restart_attribute_names.append(key)
-
-        return restart_attribute_names
+        return self.__get_folder_index(location, _method_name).get_restart_required_names()
 
     def get_model_get_required_attribute_names(self, location):
         """
@@ -724,19 +676,7 @@ class Aliases(object):
         """
         _method_name = 'get_model_get_required_attribute_names'
 
-        wlst_attribute_names = []
-
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if GET_METHOD in value and value[GET_METHOD] == GET:
-                wlst_attribute_names.append(key)
-
-        return wlst_attribute_names
+        return self.__get_folder_index(location, _method_name).get_get_required_names()
 
     def get_model_lsa_required_attribute_names(self, location):
         """
@@ -747,19 +687,7 @@ class Aliases(object):
         """
         _method_name = 'get_model_lsa_required_attribute_names'
 
-        lsa_required_attribute_names = []
-
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if GET_METHOD in value and LSA in value[GET_METHOD]:
-                lsa_required_attribute_names.append(key)
-
-        return lsa_required_attribute_names
+        return self.__get_folder_index(location, _method_name).get_lsa_required_names()
 
     def get_model_get_returns_mbean_attribute_names_and_types(self, location):
         """
@@ -770,21 +698,7 @@ class Aliases(object):
         """
         _method_name = 'get_model_get_returns_mbean_attribute_names_and_types'
 
-        model_attribute_names = dict()
-
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if GET_MBEAN_TYPE in value:
-                model_attribute_names[key] = value[GET_MBEAN_TYPE]
-            else:
-                model_attribute_names[key] = None
-
-        return model_attribute_names
+        return self.__get_folder_index(location, _method_name).get_get_mbean_types()
 
     def get_model_mbean_set_method_attribute_names_and_types(self, location):
         """
@@ -795,32 +709,7 @@ class Aliases(object):
         """
         _method_name = 'get_model_mbean_set_method_attribute_names_and_types'
 
-        model_attributes_dict = dict()
-
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if SET_METHOD in value and value[SET_METHOD].startswith(MBEAN):
-                attr_dict = dict()
-
-                attr_set_method_name = None
-                set_method_value_components = value[SET_METHOD].split('.')
-                if len(set_method_value_components) == 2:
-                    attr_set_method_name = set_method_value_components[1]
-
-                attr_dict[SET_METHOD] = attr_set_method_name
-                if SET_MBEAN_TYPE in value:
-                    attr_dict[SET_MBEAN_TYPE] = value[SET_MBEAN_TYPE]
-                else:
-                    attr_dict[SET_MBEAN_TYPE] = None
-
-                model_attributes_dict[key] = attr_dict
-
-        return model_attributes_dict
+        return self.__get_folder_index(location, _method_name).get_mbean_set_methods()
 
     def get_model_merge_required_attribute_names(self, location):
         """
@@ -831,23 +720,7 @@ class Aliases(object):
         """
         _method_name = 'get_model_merge_required_attribute_names'
 
-        model_attribute_names = list()
-
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if WLST_TYPE in value and (value[WLST_TYPE] in ALIAS_LIST_TYPES or value[WLST_TYPE] in ALIAS_MAP_TYPES):
-                merge = True
-                if MERGE in value:
-                    merge = alias_utils.convert_boolean(value[MERGE])
-                if merge:
-                    model_attribute_names.append(key)
-
-        return model_attribute_names
+        return self.__get_folder_index(location, _method_name).get_merge_required_names()
 
     def get_model_password_attribute_names(self, location):
         """
@@ -857,19 +730,7 @@ class Aliases(object):
         """
         _method_name = 'get_model_password_attribute_names'
 
-        model_attribute_names = list()
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if WLST_TYPE in value and value[WLST_TYPE] == PASSWORD:
-                model_attribute_names.append(key)
-
-        return model_attribute_names
+        return self.__get_folder_index(location, _method_name).get_password_names()
 
     def is_model_password_attribute(self, location, model_name):
         """
@@ -880,19 +741,8 @@ class Aliases(object):
         """
         _method_name = 'is_model_password_attribute'
 
-        is_password = False
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        if model_name in module_folder[ATTRIBUTES] and WLST_TYPE in module_folder[ATTRIBUTES][model_name] and \
-                module_folder[ATTRIBUTES][model_name][WLST_TYPE] == PASSWORD:
-            is_password = True
-
-        return is_password
+        attribute_info = self.__get_folder_index(location, _method_name).get_attribute_entry(model_name)
+        return attribute_info is not None and WLST_TYPE in attribute_info and attribute_info[WLST_TYPE] == PASSWORD
 
     def get_model_uses_path_tokens_attribute_names(self, location):
         """
@@ -903,19 +753,7 @@ class Aliases(object):
         """
         _method_name = 'get_model_uses_path_tokens_attribute_names'
 
-        model_attribute_names = list()
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if USES_PATH_TOKENS in value and alias_utils.convert_boolean(value[USES_PATH_TOKENS]):
-                model_attribute_names.append(key)
-
-        return model_attribute_names
+        return self.__get_folder_index(location, _method_name).get_uses_path_tokens_names()
 
     def get_model_attribute_name_and_value(self, location, wlst_attribute_name, wlst_attribute_value):
         """
@@ -931,7 +769,7 @@ class Aliases(object):
         """
         _method_name = 'get_model_attribute_name_and_value'
 
-        self._logger.entering(str(location), wlst_attribute_name, wlst_attribute_value,
+        self._logger.entering(location, wlst_attribute_name, wlst_attribute_value,
                               class_name=self._class_name, method_name=_method_name)
         model_attribute_name = None
         # Assume wlst_attribute_value is the same as default value of model_attribute_name
@@ -1012,7 +850,7 @@ class Aliases(object):
         """
         _method_name = 'get_model_attribute_name'
 
-        self._logger.entering(str(location), wlst_attribute_name,
+        self._logger.entering(location, wlst_attribute_name,
                               class_name=self._class_name, method_name=_method_name)
         model_attribute_name = None
 
@@ -1034,7 +872,7 @@ class Aliases(object):
         """
         _method_name = 'get_model_attribute_names'
 
-        self._logger.entering(str(location), class_name=self._class_name, method_name=_method_name)
+        self._logger.entering(location, class_name=self._class_name, method_name=_method_name)
         attributes_dict = self._alias_entries.get_alias_attribute_entries_by_location(location)
         result = list(attributes_dict.keys())
         self._logger.exiting(class_name=self._class_name, method_name=_method_name, result=result)
@@ -1049,7 +887,7 @@ class Aliases(object):
         """
         _method_name = 'get_model_attribute_names_and_types'
 
-        self._logger.entering(str(location), class_name=self._class_name, method_name=_method_name)
+        self._logger.entering(location, class_name=self._class_name, method_name=_method_name)
         result = {}
         attributes_dict = self._alias_entries.get_alias_attribute_entries_by_location(location)
         for key, value in attributes_dict.iteritems():
@@ -1087,12 +925,11 @@ class Aliases(object):
             self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
             raise ex
 
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if key == model_attribute_name:
-                attribute_info = module_folder[ATTRIBUTES][key]
-                if attribute_info and VALUE in attribute_info and DEFAULT in attribute_info[VALUE]:
-                    result = (model_attribute_value == wlst_attribute_value and
-                              model_attribute_value == attribute_info[VALUE][DEFAULT])
+        if model_attribute_name in module_folder[ATTRIBUTES]:
+            attribute_info = module_folder[ATTRIBUTES][model_attribute_name]
+            if attribute_info and VALUE in attribute_info and DEFAULT in attribute_info[VALUE]:
+                result = (model_attribute_value == wlst_attribute_value and
+                          model_attribute_value == attribute_info[VALUE][DEFAULT])
 
         return result
 
@@ -1114,7 +951,7 @@ class Aliases(object):
         """
         _method_name = 'is_wlst_version_model_attribute_name'
 
-        self._logger.entering(str(location), model_attribute_name,
+        self._logger.entering(location, model_attribute_name,
                               class_name=self._class_name, method_name=_method_name)
         result, valid_version_range = \
             self._alias_entries.is_valid_model_attribute_name_for_location(location, model_attribute_name)
@@ -1148,7 +985,7 @@ class Aliases(object):
         """
         _method_name = 'get_model_attribute_default_value'
 
-        self._logger.entering(str(location), model_attribute_name,
+        self._logger.entering(location, model_attribute_name,
                               class_name=self._class_name, method_name=_method_name)
         default_value = None
         attribute_info = self._alias_entries.get_alias_attribute_entry_by_model_name(location, model_attribute_name)
@@ -1193,7 +1030,7 @@ class Aliases(object):
         :return: alias attribute preferred model type or None if not present or attribute not found
         """
         _method_name = 'get_preferred_model_type'
-        self._logger.entering(str(location), model_attribute_name,
+        self._logger.entering(location, model_attribute_name,
                               class_name=self._class_name, method_name=_method_name)
         result = None
         attribute_info = self._alias_entries.get_alias_attribute_entry_by_model_name(location, model_attribute_name)
@@ -1210,7 +1047,7 @@ class Aliases(object):
         :return: WLST_READ_TYPE or None if not defined for the attribute in the alias definitions
         """
         _method_name = 'get_wlst_read_type'
-        self._logger.entering(str(location), model_attribute_name,
+        self._logger.entering(location, model_attribute_name,
                               class_name=self._class_name, method_name=_method_name)
         result = None
         attribute_info = self._alias_entries.get_alias_attribute_entry_by_model_name(location, model_attribute_name)
@@ -1231,6 +1068,8 @@ class Aliases(object):
                 not EncryptionUtils.isEncryptedString(text):
 
             rtnval = text
+        elif text in self._decrypted_passwords:
+            rtnval = self._decrypted_passwords[text]
         else:
             passphrase = self._model_context.get_encryption_passphrase()
             rtnval = EncryptionUtils.decryptString(text, String(passphrase).toCharArray())
@@ -1239,12 +1078,57 @@ class Aliases(object):
 
         return rtnval
 
+    def decrypt_passwords(self, texts):
+        """
+        Decrypt the specified passwords in one batch, if model encryption is used, so that later calls to
+        decrypt_password for these passwords do not decrypt them again.  The keys for the passwords are derived
+        concurrently, which is much faster than decrypting the passwords one at a time.
+        :param texts: the passwords to check and decrypt, if needed
+        :raises EncryptionException: if an error occurs while decrypting any of the passwords
+        """
+        _method_name = 'decrypt_passwords'
+
+        if self._model_context is None or not self._model_context.is_using_encryption():
+            return
+
+        cipher_texts = ArrayList()
+        for text in texts:
+            if EncryptionUtils.isEncryptedString(text) and text not in self._decrypted_passwords:
+                cipher_texts.add(text)
+        if cipher_texts.isEmpty():
+            return
+
+        self._logger.entering(cipher_texts.size(), class_name=self._class_name, method_name=_method_name)
+        passphrase = self._model_context.get_encryption_passphrase()
+        clear_texts = EncryptionUtils.decryptStrings(cipher_texts, String(passphrase).toCharArray())
+        for index in range(cipher_texts.size()):
+            clear_text = clear_texts.get(index)
+            if clear_text:
+                clear_text = String.valueOf(clear_text)
+            self._decrypted_passwords[cipher_texts.get(index)] = clear_text
+        self._logger.exiting(class_name=self._class_name, method_name=_method_name)
+
     ####################################################################################
     #
     # Private methods, private inner classes and static methods only, beyond here please
     #
     ####################################################################################
 
+    def __get_folder_index(self, location, method_name):
+        """
+        Get the attribute lookup tables for the specified location.
+        :param location: the location
+        :param method_name: the name of the calling method, for logging
+        :return: the AliasFolderIndex for the location
+        :raises: AliasException: if the location has no attributes
+        """
+        folder_index = self._alias_entries.get_folder_index_for_location(location)
+        if folder_index is None:
+            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
+            self._logger.throwing(ex, class_name=self._class_name, method_name=method_name)
+            raise ex
+        return folder_index
+
     def __is_model_attribute_read_only(self, location, attribute_info):
         """
         Is the model attribute read-only?
@@ -6,12 +6,16 @@ This model provider translation classes that convert between JSON and Python Dic
 """
 import types
 
+import java.io.BufferedWriter as JBufferedWriter
 import java.io.FileNotFoundException as JFileNotFoundException
 import java.io.FileOutputStream as JFileOutputStream
 import java.io.IOException as JIOException
+import java.io.OutputStreamWriter as JOutputStreamWriter
 import java.io.PrintWriter as JPrintWriter
 import java.lang.Boolean as JBoolean
 import java.lang.IllegalArgumentException as JIllegalArgumentException
+import java.lang.StringBuilder as JStringBuilder
+import java.lang.System as JSystem
 
 import oracle.weblogic.deploy.util.FileUtils as JFileUtils
 import oracle.weblogic.deploy.json.JsonStreamTranslator as JJsonStreamTranslator
@@ -20,6 +24,9 @@ import oracle.weblogic.deploy.json.JsonTranslator as JJsonTranslator
 from wlsdeploy.logging.platform_logger import PlatformLogger
 import wlsdeploy.exception.exception_helper as exception_helper
 
+# the size of the character buffer used when writing a model file
+_write_buffer_size = 65536
+
 
 class JsonToPython(object):
     """
@@ -96,6 +103,7 @@ class JsonStreamToPython(object):
 class PythonToJson(object):
     """
     This class writes a Python dictionary out in a JSON format.
+    The output is buffered, and each top-level section is written to the file in a single call.
     """
     _class_name = 'PythonToJson'
     # 4 spaces of indent
@@ -105,12 +113,15 @@ class PythonToJson(object):
         # Fix error handling for None
         self._dictionary = dictionary
         self._logger = PlatformLogger('wlsdeploy.json')
+        self._line_separator = JSystem.getProperty('line.separator')
         return
 
-    def write_to_json_file(self, file_name):
+    def write_to_json_file(self, file_name, sections=None):
         """
         Convert the Python dictionary to JSON and write it to the specified file.
         :param file_name:  the name of the file
+        :param sections: optional iterable of (name, value) pairs, such as a generator that yields each model section
+                         as it is built, to write instead of the dictionary
         :return: the java.io.File object of the JSON file
         """
         _method_name = 'writeToJsonFile'
@@ -124,12 +135,16 @@ class PythonToJson(object):
             self._logger.throwing(class_name=self._class_name, method_name=_method_name, error=json_ex)
             raise json_ex
 
+        if sections is None and self._dictionary is not None:
+            sections = self._dictionary.iteritems()
+
+        start_time = JSystem.currentTimeMillis()
         fos = None
         writer = None
         try:
             fos = JFileOutputStream(json_file, False)
-            writer = JPrintWriter(fos, True)
-            self._write_dictionary_to_json_file(self._dictionary, writer)
+            writer = JPrintWriter(JBufferedWriter(JOutputStreamWriter(fos), _write_buffer_size), False)
+            self._write_sections_to_json_file(sections, writer)
 
         except JFileNotFoundException, fnfe:
             json_ex = exception_helper.create_json_exception('WLSDPLY-18010', file_name,
@@ -144,61 +159,108 @@ class PythonToJson(object):
             self._close_streams(fos, writer)
             raise json_ex
 
+        # the print writer does not throw write errors, check for them before closing
+        write_failed = writer.checkError()
         self._close_streams(fos, writer)
+        if write_failed:
+            json_ex = exception_helper.create_json_exception('WLSDPLY-18031', file_name)
+            self._logger.throwing(class_name=self._class_name, method_name=_method_name, error=json_ex)
+            raise json_ex
+
+        elapsed = max(JSystem.currentTimeMillis() - start_time, 1)
+        byte_count = json_file.length()
+        self._logger.info('WLSDPLY-18030', byte_count, 'JSON', json_file.getPath(), elapsed,
+                          (byte_count * 1000L) / (elapsed * 1024L), class_name=self._class_name,
+                          method_name=_method_name)
         self._logger.exiting(class_name=self._class_name, method_name=_method_name, result=json_file)
         return json_file
 
-    def _write_dictionary_to_json_file(self, dictionary, writer, indent=''):
+    def _write_sections_to_json_file(self, sections, writer):
+        """
+        Write the top-level sections as a JSON object, converting and writing each section with a single call.
+        :param sections: iterable of (name, value) pairs, may be None
+        :param writer: where to write the sections into json syntax
+        """
+        if sections is None:
+            return
+
+        writer.write('{')
+        end_line = ''
+        for key, value in sections:
+            parts = [end_line, self._line_separator]
+            self._add_entry_parts(key, value, parts, self._indent_unit)
+            writer.write(''.join(parts))
+            end_line = ','
+        writer.write(self._line_separator + '}')
+        return
+
+    def _write_dictionary_to_json_file(self, dictionary, writer):
         """
         Write the python dictionary in json syntax using the provided writer stream.
         :param dictionary: python dictionary to convert to json syntax
         :param writer: where to write the dictionary into json syntax
-        :param indent: current string indention of the json syntax. If not provided, indent is an empty string
         """
-        _start_dict = '{'
-        _end_dict = '}'
+        if dictionary is not None:
+            self._write_sections_to_json_file(dictionary.iteritems(), writer)
+        return
 
+    def _add_entry_parts(self, key, value, parts, indent):
+        """
+        Convert a single dictionary entry to json syntax.
+        :param key: the key of the entry
+        :param value: the value of the entry
+        :param parts: the list of json fragments to append to
+        :param indent: current string indention of the json syntax
+        """
+        parts.append(indent + '"' + _quote_embedded_quotes(key) + '" : ')
+        if isinstance(value, dict):
+            self._add_dictionary_parts(value, parts, indent)
+        elif isinstance(value, list):
+            self._add_list_parts(value, parts, indent)
+        else:
+            parts.append(_format_json_value(value))
+        return
+
+    def _add_dictionary_parts(self, dictionary, parts, indent=''):
+        """
+        Convert the python dictionary to json syntax.
+        :param dictionary: python dictionary to convert to json syntax
+        :param parts: the list of json fragments to append to
+        :param indent: current string indention of the json syntax. If not provided, indent is an empty string
+        """
         if dictionary is None:
             return
         end_line = ''
-        # writer.print causes print to be flagged with error in ide
-        writer.write(_start_dict)
-        end_indent = indent
-
-        indent += self._indent_unit
+        parts.append('{')
+        entry_indent = indent + self._indent_unit
         for key, value in dictionary.iteritems():
-            writer.println(end_line)
+            parts.append(end_line)
+            parts.append(self._line_separator)
             end_line = ','
-            writer.write(indent + '"' + _quote_embedded_quotes(key) + '" : ')
-            if isinstance(value, dict):
-                self._write_dictionary_to_json_file(value, writer, indent)
-            elif isinstance(value, list):
-                self._write_list_to_json_file(value, writer, indent)
-            else:
-                writer.write(_format_json_value(value))
-        writer.println()
-        writer.write(end_indent + _end_dict)
-
+            self._add_entry_parts(key, value, parts, entry_indent)
+        parts.append(self._line_separator)
+        parts.append(indent + '}')
         return
 
-    def _write_list_to_json_file(self, alist, writer, indent=''):
+    def _add_list_parts(self, alist, parts, indent=''):
         """
-        Write the python list in json syntax using the provided writer stream.
+        Convert the python list to json syntax.
         :param alist: python list to convert to json syntax
-        :param writer: where to write the list into json syntax
+        :param parts: the list of json fragments to append to
         :param indent: current string indention of the json syntax. If not provided, indent is an empty string
         """
-        writer.write('[')
+        parts.append('[')
         end_line = ''
         list_indent = indent + self._indent_unit
         for value in alist:
-            writer.write(end_line)
-            writer.println()
-            writer.write(list_indent)
-            writer.write(_format_json_value(value))
+            parts.append(end_line)
+            parts.append(self._line_separator)
+            parts.append(list_indent)
+            parts.append(_format_json_value(value))
             end_line = ','
-        writer.println()
-        writer.write(indent + ']')
+        parts.append(self._line_separator)
+        parts.append(indent + ']')
+        return
 
     def _close_streams(self, fos, writer):
         """
@@ -225,15 +287,13 @@ def _format_json_value(value):
     :param value: the value
     :return: the JSON snippet
     """
-    import java.lang.StringBuilder as StringBuilder
-    builder = StringBuilder()
     if type(value) == bool or (isinstance(value, types.StringTypes) and (value == 'true' or value == 'false')):
-        builder.append(JBoolean.toString(value))
+        result = JBoolean.toString(value)
     elif isinstance(value, types.StringTypes):
-        builder.append('"').append(_quote_embedded_quotes(value.strip())).append('"')
+        result = '"' + _quote_embedded_quotes(value.strip()) + '"'
     else:
-        builder.append(value)
-    return builder.toString()
+        result = JStringBuilder().append(value).toString()
+    return result
 
 
 def _quote_embedded_quotes(text):
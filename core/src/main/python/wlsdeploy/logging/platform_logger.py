@@ -1,5 +1,5 @@
 """
-Copyright (c) 2017, 2019, Oracle Corporation and/or its affiliates.  All rights reserved.
+Copyright (c) 2017, 2020, Oracle Corporation and/or its affiliates.  All rights reserved.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import java.lang.System as JSystem
@@ -113,6 +113,8 @@ class PlatformLogger(object):
         :param args: the arguments to use to populate the message placeholders
         :param kwargs: the keyword arguments
         """
+        if not self.logger.isLoggable(JLevel.CONFIG):
+            return
         method = kwargs.pop('method_name', None)
         clazz = kwargs.pop('class_name', None)
         error = kwargs.pop('error', None)
@@ -128,6 +130,8 @@ class PlatformLogger(object):
         :param args: the arguments to use to populate the message placeholders
         :param kwargs: the keyword arguments
         """
+        if not self.logger.isLoggable(level):
+            return
         method = kwargs.pop('method_name', None)
         clazz = kwargs.pop('class_name', None)
         error = kwargs.pop('error', None)
@@ -138,12 +142,15 @@ class PlatformLogger(object):
     def entering(self, *args, **kwargs):
         """
         Log an entering method message at the finer level.
+        The method args are only converted to strings if finer-level logging is enabled.
         :param args: the method args
         :param kwargs: the keyword arguments
         """
+        if not self.logger.isLoggable(JLevel.FINER):
+            return
         method = kwargs.pop('method_name', None)
         clazz = kwargs.pop('class_name', None)
-        self.logger.entering(clazz, method, args)
+        self.logger.entering(clazz, method, _get_args_as_java_array(*args))
         return
 
     def exiting(self, class_name, method_name, result=None):
@@ -153,6 +160,8 @@ class PlatformLogger(object):
         :param method_name: the name of the method
         :param result: the method result, if any
         """
+        if not self.logger.isLoggable(JLevel.FINER):
+            return
         if result is not None:
             self.logger.exiting(class_name, method_name, result)
         else:
@@ -166,6 +175,8 @@ class PlatformLogger(object):
         :param args: the arguments to use to populate the message placeholders
         :param kwargs: the keyword arguments
         """
+        if not self.logger.isLoggable(JLevel.FINE):
+            return
         method = kwargs.pop('method_name', None)
         clazz = kwargs.pop('class_name', None)
         error = kwargs.pop('error', None)
@@ -180,6 +191,8 @@ class PlatformLogger(object):
         :param args: the arguments to use to populate the message placeholders
         :param kwargs: the keyword arguments
         """
+        if not self.logger.isLoggable(JLevel.FINER):
+            return
         method = kwargs.pop('method_name', None)
         clazz = kwargs.pop('class_name', None)
         error = kwargs.pop('error', None)
@@ -194,6 +207,8 @@ class PlatformLogger(object):
         :param args: the arguments to use to populate the message placeholders
         :param kwargs: the keyword arguments
         """
+        if not self.logger.isLoggable(JLevel.FINEST):
+            return
         method = kwargs.pop('method_name', None)
         clazz = kwargs.pop('class_name', None)
         error = kwargs.pop('error', None)
@@ -208,6 +223,8 @@ class PlatformLogger(object):
         :param args: the arguments to use to populate the message placeholders
         :param kwargs: the keyword arguments
         """
+        if not self.logger.isLoggable(JLevel.INFO):
+            return
         method = kwargs.pop('method_name', None)
         clazz = kwargs.pop('class_name', None)
         error = kwargs.pop('error', None)
@@ -222,6 +239,8 @@ class PlatformLogger(object):
         :param args: the arguments to use to populate the message placeholders
         :param kwargs: the keyword arguments
         """
+        if not self.logger.isLoggable(JLevel.WARNING):
+            return
         method = kwargs.pop('method_name', None)
         clazz = kwargs.pop('class_name', None)
         error = kwargs.pop('error', None)
@@ -236,6 +255,8 @@ class PlatformLogger(object):
         :param args: the arguments to use to populate the message placeholders
         :param kwargs: the keyword arguments
         """
+        if not self.logger.isLoggable(JLevel.SEVERE):
+            return
         method = kwargs.pop('method_name', None)
         clazz = kwargs.pop('class_name', None)
         error = kwargs.pop('error', None)
@@ -250,6 +271,8 @@ class PlatformLogger(object):
         :param method_name: the method name where the exception is being created and thrown
         :param class_name: the Python class name or module name
         """
+        if not self.logger.isLoggable(JLevel.FINER):
+            return
         if method_name is not None:
             self.logger.throwing(class_name, method_name, error)
         else:
@@ -277,9 +300,34 @@ class PlatformLogger(object):
 
         return record
 
+
+class LazyArg(object):
+    """
+    A log message argument whose value is only computed when the message is actually logged.
+    The logging methods check the level before converting any argument to a string, so passing
+    a value directly (instead of str(value)) already defers the conversion. Use a LazyArg when
+    the argument itself is expensive to compute, for example:
+
+        _logger.finest('WLSDPLY-06157', LazyArg(alias_helper.get_model_folder_path, location), ...)
+    """
+    def __init__(self, function, *args):
+        """
+        Create the deferred argument.
+        :param function: the function that computes the argument value
+        :param args: the arguments to pass to the function
+        """
+        self._function = function
+        self._args = args
+        return
+
+    def __str__(self):
+        return str(self._function(*self._args))
+
+
 def _get_args_as_java_array(*args):
     """
     Convert the Python args list into a Java array of strings.
+    Any LazyArg values are computed as part of the conversion.
     :param args: the args list
     :return: the Java array of strings
     """
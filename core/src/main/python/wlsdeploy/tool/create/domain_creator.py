@@ -3,10 +3,13 @@ Copyright (c) 2017, 2020, Oracle Corporation and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import os
+import sys
 import weblogic.security.internal.SerializedSystemIni as SerializedSystemIni
 import weblogic.security.internal.encryption.ClearOrEncryptedService as ClearOrEncryptedService
 from java.io import FileOutputStream
+from java.io import IOException
 from java.util import Properties
+from oracle.weblogic.deploy.create import CreateException
 from oracle.weblogic.deploy.create import RCURunner
 from oracle.weblogic.deploy.util import WLSDeployArchive, FileUtils
 from wlsdeploy.util import string_utils
@@ -76,6 +79,7 @@ from wlsdeploy.aliases.model_constants import XML_REGISTRY
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.exception.expection_types import ExceptionType
 from wlsdeploy.tool.create import atp_helper
+from wlsdeploy.tool.create import template_cache
 from wlsdeploy.tool.create.creator import Creator
 from wlsdeploy.tool.create.rcudbinfo_helper import RcuDbInfo
 from wlsdeploy.tool.create.security_provider_creator import SecurityProviderCreator
@@ -91,6 +95,8 @@ from wlsdeploy.tool.util.topology_helper import TopologyHelper
 from wlsdeploy.util import dictionary_utils
 from wlsdeploy.util import model as model_helper
 
+ASYNC_RCU_VARIABLE = 'WDT_ASYNC_RCU'
+
 
 class DomainCreator(Creator):
     """
@@ -140,6 +146,7 @@ class DomainCreator(Creator):
         self.__default_domain_name = None
         self.__default_admin_server_name = None
         self.__default_security_realm_name = None
+        self.__rcu_runner = None
 
         archive_file_name = self.model_context.get_archive_file_name()
         if archive_file_name is not None:
@@ -171,8 +178,15 @@ class DomainCreator(Creator):
 
         self.logger.entering(class_name=self.__class_name, method_name=_method_name)
         self.__run_rcu()
-        self.__fail_mt_1221_domain_creation()
-        self.__create_domain()
+        try:
+            self.__fail_mt_1221_domain_creation()
+            self.__create_domain()
+        except:
+            # RCU may still be running in the background, let it complete before reporting the failure
+            exc_type, exc_value, exc_traceback = sys.exc_info()
+            self.__wait_for_rcu(report_failure=False)
+            raise exc_type, exc_value, exc_traceback
+        self.__wait_for_rcu()
         self.__deploy()
         self.__deploy_after_update()
         self.__create_boot_dot_properties()
@@ -281,7 +295,7 @@ class DomainCreator(Creator):
 
                 runner = RCURunner(domain_type, oracle_home, java_home, rcu_schemas, rcu_runner_map,
                                    rcu_db_info.get_rcu_variables())
-                runner.runRcu(rcu_sys_pass, rcu_schema_pass)
+                self.__start_rcu(runner, rcu_sys_pass, rcu_schema_pass)
             else:
                 # Has RCUDbInfo in the model but non ATP case
                 rcu_db = rcu_db_info.get_rcu_regular_db_conn()
@@ -294,7 +308,7 @@ class DomainCreator(Creator):
                 runner = RCURunner(domain_type, oracle_home, java_home, rcu_db, rcu_prefix, rcu_schemas,
                                    rcu_db_info.get_rcu_variables())
                 runner.setRCUAdminUser(rcu_db_user)
-                runner.runRcu(rcu_sys_pass, rcu_schema_pass)
+                self.__start_rcu(runner, rcu_sys_pass, rcu_schema_pass)
         else:
             # No RCUDbInfo in the model. CLI case
             rcu_db = self.model_context.get_rcu_database()
@@ -305,11 +319,58 @@ class DomainCreator(Creator):
 
             runner = RCURunner(domain_type, oracle_home, java_home, rcu_db, rcu_prefix, rcu_schemas, None)
             runner.setRCUAdminUser(rcu_db_user)
-            runner.runRcu(rcu_sys_pass, rcu_schema_pass)
+            self.__start_rcu(runner, rcu_sys_pass, rcu_schema_pass)
 
         self.logger.exiting(class_name=self.__class_name, method_name=_method_name)
         return
 
+    def __start_rcu(self, runner, rcu_sys_pass, rcu_schema_pass):
+        """
+        Run RCU to drop and then create the schemas.  If $WDT_ASYNC_RCU is true, RCU is started in the background,
+        and the domain templates are read while it runs.  The domain waits for RCU before it configures the
+        FMW Infrastructure database.
+        :param runner: the RCU runner
+        :param rcu_sys_pass: the RCU database SYS password
+        :param rcu_schema_pass: the RCU schema password
+        :raises CreateException: if running rcu fails
+        """
+        _method_name = '__start_rcu'
+
+        value = os.environ.get(ASYNC_RCU_VARIABLE, None)
+        if value is not None and value.strip().lower() == 'true':
+            self.logger.info('WLSDPLY-12263', ASYNC_RCU_VARIABLE, class_name=self.__class_name,
+                             method_name=_method_name)
+            runner.startRcu(rcu_sys_pass, rcu_schema_pass)
+            self.__rcu_runner = runner
+        else:
+            runner.runRcu(rcu_sys_pass, rcu_schema_pass)
+        return
+
+    def __wait_for_rcu(self, report_failure=True):
+        """
+        Wait for RCU that was started in the background to complete.  This returns immediately if RCU
+        was not started in the background, or if it has already been waited for.
+        :param report_failure: if False, a failure of RCU is logged instead of raised
+        :raises CreateException: if running rcu fails
+        """
+        _method_name = '__wait_for_rcu'
+
+        runner = self.__rcu_runner
+        if runner is None:
+            return
+
+        self.__rcu_runner = None
+        self.logger.info('WLSDPLY-12264', class_name=self.__class_name, method_name=_method_name)
+        try:
+            runner.waitForRcu()
+        except CreateException, ce:
+            if report_failure:
+                self.logger.throwing(ce, class_name=self.__class_name, method_name=_method_name)
+                raise ce
+            self.logger.severe('WLSDPLY-12265', ce.getLocalizedMessage(), error=ce,
+                               class_name=self.__class_name, method_name=_method_name)
+        return
+
     def __fail_mt_1221_domain_creation(self):
         """
         Abort create if domain contains MT artifacts that cannot be created in the version of WLST offline being used
@@ -347,8 +408,9 @@ class DomainCreator(Creator):
         self.model_context.set_domain_home(self._domain_home)
 
         if self.wls_helper.is_select_template_supported():
-            self.__create_base_domain_with_select_template(self._domain_home)
-            self.__extend_domain_with_select_template(self._domain_home)
+            if not self.__create_domain_from_template_snapshot(self._domain_home):
+                self.__create_base_domain_with_select_template(self._domain_home)
+                self.__extend_domain_with_select_template(self._domain_home)
         else:
             self.__create_base_domain(self._domain_home)
             self.__extend_domain(self._domain_home)
@@ -522,7 +584,24 @@ class DomainCreator(Creator):
             self.__configure_opss_secrets()
         topology_folder_list = self.alias_helper.get_model_topology_top_level_folder_names()
         self.__apply_base_domain_config(topology_folder_list)
+        self.__target_server_groups_with_select_template()
+
+        self.logger.info('WLSDPLY-12205', self._domain_name, domain_home,
+                         class_name=self.__class_name, method_name=_method_name)
+        self.wlst_helper.write_domain(domain_home)
+        self.wlst_helper.close_template()
+        self.logger.info('WLSDPLY-12206', self._domain_name, domain_home,
+                         class_name=self.__class_name, method_name=_method_name)
+        self.wlst_helper.read_domain(domain_home)
+        self.logger.exiting(class_name=self.__class_name, method_name=_method_name)
+        return
 
+    def __target_server_groups_with_select_template(self):
+        """
+        Target the server groups from the domain typedef to the servers and dynamic clusters,
+        for WebLogic Server versions 12.2.1 and above.
+        :raises: CreateException: if an error occurs
+        """
         server_groups_to_target = self._domain_typedef.get_server_groups_to_target()
         dynamic_cluster_server_groups_to_target = self._domain_typedef.get_dynamic_cluster_server_groups()
         server_assigns = self.target_helper.target_server_groups_to_servers(server_groups_to_target)
@@ -534,17 +613,188 @@ class DomainCreator(Creator):
 
         if len(dynamic_assigns) > 0:
             self.target_helper.target_dynamic_server_groups(dynamic_assigns)
+        return
+
+    def __create_domain_from_template_snapshot(self, domain_home):
+        """
+        Create the domain from a snapshot of the domain that was written from the same templates, if the
+        template snapshot cache is enabled.  If there is no snapshot, the domain is written from the templates
+        and stored as a snapshot.  The model topology is then added to the domain, which is read from disk.
+        The cache is not used for JRF domains, since their templates are configured with the RCU database.
+        :param domain_home: the domain home directory
+        :return: True if the domain was created, False if the domain should be created from the templates
+        :raises: CreateException: if an error occurs
+        """
+        _method_name = '__create_domain_from_template_snapshot'
+
+        if not template_cache.is_enabled():
+            return False
+
+        if not template_cache.is_shared_secrets_accepted():
+            self.logger.info('WLSDPLY-12267', template_cache.get_cache_directory(),
+                             template_cache.SHARED_SECRETS_VARIABLE,
+                             class_name=self.__class_name, method_name=_method_name)
+            return False
+
+        if self._domain_typedef.is_jrf_domain_type() or len(self._domain_typedef.get_rcu_schemas()) > 0:
+            self.logger.info('WLSDPLY-12260', self.model_context.get_domain_type(),
+                             class_name=self.__class_name, method_name=_method_name)
+            return False
+
+        if os.path.isdir(domain_home) and len(os.listdir(domain_home)) > 0:
+            self.logger.info('WLSDPLY-12261', domain_home, class_name=self.__class_name, method_name=_method_name)
+            return False
+
+        self.logger.entering(domain_home, class_name=self.__class_name, method_name=_method_name)
+        try:
+            key_values = self.__get_template_snapshot_key_values()
+            key = template_cache.get_snapshot_key(key_values)
+            snapshot_domain_dir = template_cache.find_snapshot(key, key_values)
+        except IOException, ioe:
+            self.logger.warning('WLSDPLY-12262', self._domain_name, ioe.getLocalizedMessage(),
+                                class_name=self.__class_name, method_name=_method_name)
+            self.logger.exiting(class_name=self.__class_name, method_name=_method_name, result=False)
+            return False
+
+        if snapshot_domain_dir is None:
+            self.logger.info('WLSDPLY-12259', self._domain_name, key,
+                             class_name=self.__class_name, method_name=_method_name)
+            self.__write_domain_from_templates(domain_home)
+            snapshot_values = [
+                (template_cache.SNAPSHOT_DOMAIN_NAME, self._domain_name),
+                (template_cache.SNAPSHOT_ADMIN_USER_NAME, self.__get_admin_user_name())
+            ]
+            template_cache.store_snapshot(key, key_values, domain_home, snapshot_values)
+            self.wlst_helper.read_domain(domain_home)
+        else:
+            self.logger.info('WLSDPLY-12258', self._domain_name, key,
+                             class_name=self.__class_name, method_name=_method_name)
+            try:
+                snapshot_values = template_cache.clone_snapshot(snapshot_domain_dir, domain_home, self._domain_name)
+            except (IOError, OSError), ex:
+                ex = exception_helper.create_create_exception('WLSDPLY-12262', self._domain_name, str(ex))
+                self.logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
+                raise ex
+            except IOException, ioe:
+                ex = exception_helper.create_create_exception('WLSDPLY-12262', self._domain_name,
+                                                              ioe.getLocalizedMessage(), error=ioe)
+                self.logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
+                raise ex
+
+            self.wlst_helper.read_domain(domain_home)
+
+            # the domain name is not part of the snapshot key.  SecurityConfiguration is renamed
+            # after the domain is written and read again, so the password is set after that.
+            snapshot_domain_name = snapshot_values[template_cache.SNAPSHOT_DOMAIN_NAME]
+            if snapshot_domain_name != self._domain_name:
+                self.logger.info('WLSDPLY-12266', snapshot_domain_name, key, self._domain_name,
+                                 class_name=self.__class_name, method_name=_method_name)
+                self.wlst_helper.cd('/')
+                self.wlst_helper.set_if_needed(DOMAIN_NAME, self._domain_name)
+                self.wlst_helper.update_domain()
+                self.wlst_helper.close_domain()
+                self.wlst_helper.read_domain(domain_home)
+
+            # the administrative user and password are not part of the snapshot key, so they are set for each domain
+            self.__set_admin_password(snapshot_values[template_cache.SNAPSHOT_ADMIN_USER_NAME])
+            self.wlst_helper.cd('/')
+            self._admin_server_name = self.wlst_helper.get(ADMIN_SERVER_NAME)
+
+        topology_folder_list = self.alias_helper.get_model_topology_top_level_folder_names()
+        self.__apply_base_domain_config(topology_folder_list)
+        self.__target_server_groups_with_select_template()
 
         self.logger.info('WLSDPLY-12205', self._domain_name, domain_home,
                          class_name=self.__class_name, method_name=_method_name)
+        self.wlst_helper.update_domain()
+        self.wlst_helper.close_domain()
+        self.wlst_helper.read_domain(domain_home)
+        self.logger.exiting(class_name=self.__class_name, method_name=_method_name, result=True)
+        return True
+
+    def __write_domain_from_templates(self, domain_home):
+        """
+        Write the domain from the templates, with only the domain options that are part of the snapshot key.
+        :param domain_home: the domain home directory
+        :raises: CreateException: if an error occurs
+        """
+        _method_name = '__write_domain_from_templates'
+
+        self.logger.entering(domain_home, class_name=self.__class_name, method_name=_method_name)
+        self.__create_base_domain_with_select_template(domain_home)
+
+        extension_templates = self._domain_typedef.get_extension_templates()
+        for extension_template in extension_templates:
+            self.logger.info('WLSDPLY-12211', extension_template,
+                             class_name=self.__class_name, method_name=_method_name)
+            self.wlst_helper.select_template(extension_template)
+
+        for custom_template in self._domain_typedef.get_custom_extension_templates():
+            self.logger.info('WLSDPLY-12245', custom_template,
+                             class_name=self.__class_name, method_name=_method_name)
+            self.wlst_helper.select_custom_template(custom_template)
+
+        self.logger.info('WLSDPLY-12212', class_name=self.__class_name, method_name=_method_name)
+        self.wlst_helper.load_templates()
+
+        self.__set_core_domain_params()
+        if len(extension_templates) > 0:
+            self.__set_app_dir()
+
         self.wlst_helper.write_domain(domain_home)
         self.wlst_helper.close_template()
-        self.logger.info('WLSDPLY-12206', self._domain_name, domain_home,
-                         class_name=self.__class_name, method_name=_method_name)
-        self.wlst_helper.read_domain(domain_home)
         self.logger.exiting(class_name=self.__class_name, method_name=_method_name)
         return
 
+    def __get_template_snapshot_key_values(self):
+        """
+        Get the values that identify the snapshot of the domain written from the templates.
+        These are the templates and their contents, and the domain options that are set before the domain is written
+        and do not depend on the domain.  The domain home, domain name and administrative user are set when a
+        snapshot is cloned, so they are not included.
+        :return: a list of (name, value) tuples
+        :raises: IOException: if a template file cannot be read
+        """
+        extension_templates = self._domain_typedef.get_extension_templates()
+        custom_templates = self._domain_typedef.get_custom_extension_templates()
+        template_paths = [self._domain_typedef.get_base_template()]
+        template_paths.extend(extension_templates)
+        template_paths.extend(custom_templates)
+        template_hashes = template_cache.get_template_hashes(template_paths)
+
+        key_values = [
+            ('oracleHome', self.model_context.get_oracle_home()),
+            ('wlsVersion', self.wls_helper.get_actual_weblogic_version()),
+            ('domainType', self.model_context.get_domain_type()),
+            ('customTemplateCount', len(custom_templates))
+        ]
+        for index in range(len(template_paths)):
+            key_values.append(('template.%s' % index, template_paths[index]))
+            key_values.append(('template.%s.hash' % index, template_hashes[index]))
+
+        app_dir = ''
+        if len(extension_templates) > 0:
+            app_dir = self.__get_app_dir()
+
+        server_start_mode = dictionary_utils.get_element(self._domain_info, SERVER_START_MODE)
+        key_values.extend([
+            ('adminServerName', self._admin_server_name),
+            ('javaHome', self.model_context.get_java_home()),
+            ('serverStartMode', server_start_mode),
+            ('appDir', app_dir)
+        ])
+        return key_values
+
+    def __get_admin_user_name(self):
+        """
+        Get the decrypted name of the administrative user.
+        :return: the user name
+        """
+        admin_username = self.wls_helper.get_default_admin_username()
+        if ADMIN_USERNAME in self._domain_info:
+            admin_username = self._domain_info[ADMIN_USERNAME]
+        return self.aliases.decrypt_password(admin_username)
+
     def __set_server_groups(self):
         _method_name = '__set_server_groups'
         self.logger.entering(class_name=self.__class_name, method_name=_method_name)
@@ -868,6 +1118,9 @@ class DomainCreator(Creator):
         _method_name = '__configure_fmw_infra_database'
         self.logger.entering(class_name=self.__class_name, method_name=_method_name)
 
+        # the RCU schemas must exist before the FMW Infrastructure database is configured
+        self.__wait_for_rcu()
+
         # only continue with RCU configuration for a JRF domain.
         if not self._domain_typedef.is_jrf_domain_type():
             self.logger.finer('WLSDPLY-12249', class_name=self.__class_name, method_name=_method_name)
@@ -1036,6 +1289,19 @@ class DomainCreator(Creator):
         _method_name = '__set_app_dir'
 
         self.logger.entering(class_name=self.__class_name, method_name=_method_name)
+        app_dir = self.__get_app_dir()
+        self.wlst_helper.set_option_if_needed(SET_OPTION_APP_DIR, app_dir)
+
+        self.logger.exiting(class_name=self.__class_name, method_name=_method_name)
+        return
+
+    def __get_app_dir(self):
+        """
+        Get the AppDir domain option from the model, or the default value.
+        :return: the application directory
+        """
+        _method_name = '__get_app_dir'
+
         if APP_DIR in self._domain_info:
             app_dir = self._domain_info[APP_DIR]
             self.logger.fine('WLSDPLY-12225', model_helper.get_model_domain_info_key(), APP_DIR, app_dir,
@@ -1048,11 +1314,7 @@ class DomainCreator(Creator):
             app_dir = os.path.join(app_parent, 'applications')
             self.logger.fine('WLSDPLY-12226', model_helper.get_model_domain_info_key(), APP_DIR, app_dir,
                              class_name=self.__class_name, method_name=_method_name)
-
-        self.wlst_helper.set_option_if_needed(SET_OPTION_APP_DIR, app_dir)
-
-        self.logger.exiting(class_name=self.__class_name, method_name=_method_name)
-        return
+        return app_dir
 
     def __set_domain_name(self):
         _method_name = '__set_domain_name'
@@ -1076,9 +1338,10 @@ class DomainCreator(Creator):
                              class_name=self.__class_name, method_name=_method_name)
         return
 
-    def __set_admin_password(self):
+    def __set_admin_password(self, current_username=None):
         """
         Set the administrative user's password.
+        :param current_username: the current name of the administrative user, or None for the default name
         :raises: CreateException: if an error occurs
         """
         _method_name = '__set_admin_password'
@@ -1094,10 +1357,13 @@ class DomainCreator(Creator):
             if token_name is not None:
                 location.add_name_token(token_name, self._domain_name)
 
+            if current_username is None:
+                current_username = self.wls_helper.get_default_admin_username()
+
             location.append_location(USER)
             token_name = self.alias_helper.get_name_token(location)
             if token_name is not None:
-                location.add_name_token(token_name, self.wls_helper.get_default_admin_username())
+                location.add_name_token(token_name, current_username)
 
             admin_user_path = self.alias_helper.get_wlst_attributes_path(location)
             self.wlst_helper.cd(admin_user_path)
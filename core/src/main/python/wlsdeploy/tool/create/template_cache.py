@@ -0,0 +1,394 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Snapshot cache for the domain directories that are written from the domain templates.
+
+Reading, selecting and loading the domain templates and writing the domain takes the same time for every
+domain created from the same templates.  A snapshot of the domain directory is stored after the templates are
+applied and the domain is written, before any model topology or resources are added.  The snapshot is keyed
+by a hash of the Oracle Home, WebLogic version, template files and their contents, and the domain options that
+are set in the templates and do not depend on the domain, so a different key is used when any of these change.
+
+The domain home and domain name are recorded with the snapshot, but are not part of the key, so one snapshot
+is used for many domains.  When a snapshot is cloned, the paths of the snapshot domain home in the domain
+files are changed to the new domain home, and the caller sets the domain name.
+The snapshot includes the domain encryption key and the security data that is encrypted with it, so the
+domains created from one snapshot share that key.  The cache is used only when $WDT_TEMPLATE_CACHE_SHARED_SECRETS
+is true, to accept that.
+
+The cache directory is $WDT_TEMPLATE_CACHE_DIR.  The cache is disabled if that variable is not set.
+"""
+import os
+
+from java.io import File
+from java.io import FileInputStream
+from java.io import FileOutputStream
+from java.io import IOException
+from java.lang import String
+from java.util import UUID
+from java.security import NoSuchAlgorithmException
+from java.util import Properties
+
+from oracle.weblogic.deploy.util import FileDigestCache
+from oracle.weblogic.deploy.util import FileUtils
+
+from wlsdeploy.logging.platform_logger import PlatformLogger
+
+TEMPLATE_CACHE_DIR_VARIABLE = 'WDT_TEMPLATE_CACHE_DIR'
+SHARED_SECRETS_VARIABLE = 'WDT_TEMPLATE_CACHE_SHARED_SECRETS'
+
+# names of the values that are recorded with a snapshot, but are not part of its key
+SNAPSHOT_DOMAIN_HOME = 'domainHome'
+SNAPSHOT_DOMAIN_NAME = 'domainName'
+SNAPSHOT_ADMIN_USER_NAME = 'adminUserName'
+
+# increment this if the contents of the snapshots change
+CACHE_FORMAT_VERSION = 2
+
+_class_name = 'template_cache'
+_logger = PlatformLogger('wlsdeploy.create')
+
+_FORMAT_KEY = 'format'
+_DOMAIN_DIR_NAME = 'domain'
+_SNAPSHOT_FILE_NAME = 'snapshot.properties'
+_HASHES_FILE_NAME = 'template_hashes.properties'
+_TEMP_SUFFIX = '.tmp'
+_SNAPSHOT_VALUE_PREFIX = 'snapshot.'
+_NODE_MANAGER_DOMAINS_FILE = os.path.join('nodemanager', 'nodemanager.domains')
+
+# larger files are not domain scripts or descriptors, so the domain home is not replaced in them
+_MAX_REWRITE_FILE_SIZE = 1024 * 1024
+
+
+def get_cache_directory():
+    """
+    Get the directory where the template snapshots are stored.
+    :return: the cache directory path, or None if the cache is disabled
+    """
+    cache_dir = os.environ.get(TEMPLATE_CACHE_DIR_VARIABLE, None)
+    if cache_dir is None or len(cache_dir.strip()) == 0:
+        return None
+    return cache_dir
+
+
+def is_enabled():
+    """
+    Determine if the template snapshot cache is enabled for this tool run.
+    :return: True if a cache directory is configured, False otherwise
+    """
+    return get_cache_directory() is not None
+
+
+def is_shared_secrets_accepted():
+    """
+    Determine if the user accepts that the domains created from one snapshot share the domain encryption key
+    and the security data encrypted with it.  The snapshots are not used unless this is accepted.
+    :return: True if the shared secrets variable is set to true, False otherwise
+    """
+    value = os.environ.get(SHARED_SECRETS_VARIABLE, None)
+    return value is not None and value.strip().lower() == 'true'
+
+
+def get_template_hashes(template_paths):
+    """
+    Get the hashes of the contents of the template files.  The hashes are kept in a file in the cache
+    directory, and are computed again only for template files that have changed.
+    :param template_paths: the list of template file paths
+    :return: the list of hashes, in the same order
+    :raises IOException: if a template file cannot be read
+    """
+    digest_cache = FileDigestCache(File(get_cache_directory(), _HASHES_FILE_NAME))
+    result = []
+    try:
+        for template_path in template_paths:
+            result.append(digest_cache.getFileHash(template_path))
+    except NoSuchAlgorithmException, nsae:
+        raise IOException(nsae.getLocalizedMessage())
+    digest_cache.save()
+    return result
+
+
+def get_snapshot_key(key_values):
+    """
+    Get the key of the snapshot for the key values.
+    :param key_values: a list of (name, value) tuples that identify the snapshot
+    :return: the snapshot key, which can be used as a directory name
+    """
+    entries = ['%s=%s' % (_FORMAT_KEY, CACHE_FORMAT_VERSION)]
+    for name, value in key_values:
+        entries.append('%s=%s' % (name, value))
+    key = FileUtils.computeHash(String('\n'.join(entries)).getBytes('UTF-8'))
+    return key.replace('/', '_').replace('+', '-').replace('=', '')
+
+
+def find_snapshot(key, key_values):
+    """
+    Find the domain directory of the snapshot with the key.  The snapshot is used only if the key values
+    that were recorded when it was stored match the key values, and its domain configuration exists.
+    :param key: the snapshot key
+    :param key_values: a list of (name, value) tuples that identify the snapshot
+    :return: the domain directory of the snapshot, or None if there is no valid snapshot
+    """
+    _method_name = 'find_snapshot'
+
+    snapshot_dir = os.path.join(get_cache_directory(), key)
+    if not os.path.isdir(snapshot_dir):
+        return None
+
+    domain_dir = os.path.join(snapshot_dir, _DOMAIN_DIR_NAME)
+    try:
+        recorded_values = _read_snapshot_properties(snapshot_dir)
+    except IOException, ioe:
+        _logger.fine('WLSDPLY-12600', snapshot_dir, ioe.getLocalizedMessage(),
+                     class_name=_class_name, method_name=_method_name)
+        return None
+
+    for name in recorded_values.keys():
+        if name.startswith(_SNAPSHOT_VALUE_PREFIX):
+            del recorded_values[name]
+
+    expected_values = _get_snapshot_properties(key_values)
+    if recorded_values != expected_values or \
+            not os.path.isfile(os.path.join(domain_dir, 'config', 'config.xml')):
+        _logger.fine('WLSDPLY-12601', snapshot_dir, class_name=_class_name, method_name=_method_name)
+        return None
+    return domain_dir
+
+
+def store_snapshot(key, key_values, domain_home, snapshot_values):
+    """
+    Store a copy of the domain directory as the snapshot with the key.  The copy is made in a temporary
+    directory first, so concurrent tools never use a partial snapshot.  Each tool uses its own temporary
+    directory, so tools that store the same snapshot at the same time do not remove each other's files.
+    A failure to store the snapshot is logged and otherwise ignored.
+    :param key: the snapshot key
+    :param key_values: a list of (name, value) tuples that identify the snapshot
+    :param domain_home: the domain directory that was written from the templates
+    :param snapshot_values: a list of (name, value) tuples of the domain values that are not part of the key,
+                            such as SNAPSHOT_DOMAIN_NAME, which are returned when the snapshot is cloned
+    :return: the snapshot directory, or None if the snapshot was not stored
+    """
+    _method_name = 'store_snapshot'
+
+    cache_dir = get_cache_directory()
+    snapshot_dir = os.path.join(cache_dir, key)
+    temp_dir = '%s.%s%s' % (snapshot_dir, str(UUID.randomUUID()), _TEMP_SUFFIX)
+    temp_dir_created = False
+    try:
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        os.makedirs(temp_dir)
+        temp_dir_created = True
+        FileUtils.copyDirectory(File(domain_home), File(temp_dir, _DOMAIN_DIR_NAME))
+        properties = _get_snapshot_properties(key_values)
+        properties[_SNAPSHOT_VALUE_PREFIX + SNAPSHOT_DOMAIN_HOME] = os.path.abspath(domain_home)
+        for name, value in snapshot_values:
+            properties[_SNAPSHOT_VALUE_PREFIX + name] = str(value)
+        _write_snapshot_properties(temp_dir, properties)
+        if os.path.exists(snapshot_dir):
+            if find_snapshot(key, key_values) is not None:
+                # a concurrent tool stored the snapshot first
+                FileUtils.deleteDirectory(File(temp_dir))
+                return snapshot_dir
+            FileUtils.deleteDirectory(File(snapshot_dir))
+        if not File(temp_dir).renameTo(File(snapshot_dir)):
+            if find_snapshot(key, key_values) is None:
+                raise IOException(snapshot_dir)
+            # a concurrent tool stored the snapshot after the check
+            FileUtils.deleteDirectory(File(temp_dir))
+            return snapshot_dir
+    except (IOError, OSError), ex:
+        _logger.warning('WLSDPLY-12602', snapshot_dir, ex, class_name=_class_name, method_name=_method_name)
+        if temp_dir_created:
+            FileUtils.deleteDirectory(File(temp_dir))
+        return None
+    except IOException, ioe:
+        _logger.warning('WLSDPLY-12602', snapshot_dir, ioe.getLocalizedMessage(),
+                        class_name=_class_name, method_name=_method_name)
+        if temp_dir_created:
+            FileUtils.deleteDirectory(File(temp_dir))
+        return None
+
+    _logger.info('WLSDPLY-12603', domain_home, snapshot_dir, class_name=_class_name, method_name=_method_name)
+    return snapshot_dir
+
+
+def clone_snapshot(snapshot_domain_dir, domain_home, domain_name):
+    """
+    Copy the domain directory of the snapshot to the domain home.
+    The files are copied, since WLST rewrites the domain files in place.  The snapshot domain home is replaced
+    with the domain home in the domain files, and the node manager domain entry is renamed to the domain name.
+    The caller sets the domain name in the domain configuration with WLST.
+    :param snapshot_domain_dir: the domain directory of the snapshot
+    :param domain_home: the domain home, which must not exist or must be empty
+    :param domain_name: the name of the domain
+    :return: a dictionary of the domain values that were recorded when the snapshot was stored
+    :raises IOException: if the snapshot cannot be read or copied
+    """
+    _method_name = 'clone_snapshot'
+
+    snapshot_values = {}
+    recorded_values = _read_snapshot_properties(os.path.dirname(snapshot_domain_dir))
+    for name in recorded_values.keys():
+        if name.startswith(_SNAPSHOT_VALUE_PREFIX):
+            snapshot_values[name[len(_SNAPSHOT_VALUE_PREFIX):]] = recorded_values[name]
+
+    parent_dir = os.path.dirname(os.path.abspath(domain_home))
+    if not os.path.isdir(parent_dir):
+        os.makedirs(parent_dir)
+    FileUtils.copyDirectory(File(snapshot_domain_dir), File(domain_home))
+
+    snapshot_domain_home = snapshot_values.get(SNAPSHOT_DOMAIN_HOME, None)
+    new_domain_home = os.path.abspath(domain_home)
+    replacements = []
+    if snapshot_domain_home is not None and snapshot_domain_home != new_domain_home:
+        replacements.append((snapshot_domain_home, new_domain_home))
+        if snapshot_domain_home.find('\\') >= 0:
+            replacements.append((snapshot_domain_home.replace('\\', '/'), new_domain_home.replace('\\', '/')))
+
+    count = 0
+    if len(replacements) > 0:
+        count = _replace_in_files(domain_home, replacements)
+
+    snapshot_domain_name = snapshot_values.get(SNAPSHOT_DOMAIN_NAME, None)
+    if snapshot_domain_name is not None and snapshot_domain_name != domain_name:
+        _rename_node_manager_domain(domain_home, snapshot_domain_name, domain_name)
+
+    _logger.fine('WLSDPLY-12605', snapshot_domain_home, domain_home, count,
+                 class_name=_class_name, method_name=_method_name)
+    return snapshot_values
+
+
+def list_snapshots():
+    """
+    List the snapshots in the cache directory.
+    :return: a list of (key, properties) tuples, where properties is a dictionary of the recorded key values
+    """
+    cache_dir = get_cache_directory()
+    if cache_dir is None or not os.path.isdir(cache_dir):
+        return []
+
+    result = []
+    names = os.listdir(cache_dir)
+    names.sort()
+    for name in names:
+        snapshot_dir = os.path.join(cache_dir, name)
+        if name.endswith(_TEMP_SUFFIX) or not os.path.isdir(snapshot_dir):
+            continue
+        try:
+            result.append((name, _read_snapshot_properties(snapshot_dir)))
+        except IOException:
+            result.append((name, {}))
+    return result
+
+
+def clear_cache():
+    """
+    Remove all the snapshots and the template hashes from the cache directory.
+    :return: the number of snapshots removed
+    """
+    _method_name = 'clear_cache'
+
+    cache_dir = get_cache_directory()
+    if cache_dir is None or not os.path.isdir(cache_dir):
+        return 0
+
+    count = 0
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        if os.path.isdir(path):
+            FileUtils.deleteDirectory(File(path))
+            if not name.endswith(_TEMP_SUFFIX):
+                count += 1
+        elif name == _HASHES_FILE_NAME:
+            os.remove(path)
+
+    _logger.fine('WLSDPLY-12604', count, cache_dir, class_name=_class_name, method_name=_method_name)
+    return count
+
+
+def _replace_in_files(directory, replacements):
+    """
+    Replace the text in the domain files under the directory.  Binary files and large files are skipped.
+    :return: the number of files that were changed
+    """
+    count = 0
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        if os.path.isdir(path):
+            count += _replace_in_files(path, replacements)
+        elif os.path.isfile(path) and os.path.getsize(path) <= _MAX_REWRITE_FILE_SIZE:
+            contents = _read_file(path)
+            if contents.find('\0') >= 0:
+                continue
+            new_contents = contents
+            for old_text, new_text in replacements:
+                new_contents = new_contents.replace(old_text, new_text)
+            if new_contents != contents:
+                _write_file(path, new_contents)
+                count += 1
+    return count
+
+
+def _rename_node_manager_domain(domain_home, old_name, new_name):
+    """
+    Rename the domain entry in the node manager domains file, if it exists.
+    """
+    path = os.path.join(domain_home, _NODE_MANAGER_DOMAINS_FILE)
+    if not os.path.isfile(path):
+        return
+
+    lines = _read_file(path).split('\n')
+    for index in range(len(lines)):
+        if lines[index].startswith(old_name + '='):
+            lines[index] = new_name + lines[index][len(old_name):]
+    _write_file(path, '\n'.join(lines))
+
+
+def _read_file(path):
+    input_file = open(path, 'rb')
+    try:
+        return input_file.read()
+    finally:
+        input_file.close()
+
+
+def _write_file(path, contents):
+    output_file = open(path, 'wb')
+    try:
+        output_file.write(contents)
+    finally:
+        output_file.close()
+
+
+def _get_snapshot_properties(key_values):
+    result = {_FORMAT_KEY: str(CACHE_FORMAT_VERSION)}
+    for name, value in key_values:
+        result[name] = str(value)
+    return result
+
+
+def _read_snapshot_properties(snapshot_dir):
+    properties = Properties()
+    input_stream = FileInputStream(os.path.join(snapshot_dir, _SNAPSHOT_FILE_NAME))
+    try:
+        properties.load(input_stream)
+    finally:
+        input_stream.close()
+
+    result = {}
+    for name in properties.stringPropertyNames():
+        result[str(name)] = str(properties.getProperty(name))
+    return result
+
+
+def _write_snapshot_properties(snapshot_dir, values):
+    properties = Properties()
+    for name in values:
+        properties.setProperty(name, values[name])
+    output_stream = FileOutputStream(os.path.join(snapshot_dir, _SNAPSHOT_FILE_NAME))
+    try:
+        properties.store(output_stream, None)
+    finally:
+        output_stream.close()
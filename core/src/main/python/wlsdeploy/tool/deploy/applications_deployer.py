@@ -9,6 +9,7 @@ from java.io import FileInputStream
 from java.io import FileNotFoundException
 from java.io import IOException
 from java.lang import IllegalStateException
+from java.lang import System
 from java.security import NoSuchAlgorithmException
 from java.util.jar import JarFile
 from java.util.jar import Manifest
@@ -34,14 +35,16 @@ from wlsdeploy.aliases.model_constants import TARGETS
 from wlsdeploy.aliases.wlst_modes import WlstModes
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.tool.deploy import deployer_utils
+from wlsdeploy.tool.deploy import deployment_waves
 from wlsdeploy.tool.deploy.deployer import Deployer
 from wlsdeploy.util import dictionary_utils
 from wlsdeploy.util import string_utils
 from wlsdeploy.util import model_helper
+from wlsdeploy.util import task_runner
 from wlsdeploy.aliases import model_constants
 
 
-import oracle.weblogic.deploy.util.FileUtils as FileUtils
+import oracle.weblogic.deploy.util.FileDigestCache as FileDigestCache
 import oracle.weblogic.deploy.util.PyOrderedDict as OrderedDict
 
 
@@ -54,12 +57,15 @@ class ApplicationsDeployer(Deployer):
     _IMPL_INDEX = 2
 
     _APP_VERSION_MANIFEST_KEY = 'Weblogic-Application-Version'
+    _FILE_HASHES_FILE_NAME = 'file_hashes.properties'
 
     def __init__(self, model, model_context, aliases, wlst_mode=WlstModes.OFFLINE, base_location=LocationContext()):
         Deployer.__init__(self, model, model_context, aliases, wlst_mode)
         self._class_name = 'ApplicationDeployer'
         self._base_location = base_location
         self._parent_dict, self._parent_name, self._parent_type = self.__get_parent_by_location(self._base_location)
+        self._digest_cache = FileDigestCache(self.__get_file_hashes_file())
+        self._hashes = dict()
 
     def deploy(self):
         """
@@ -243,22 +249,38 @@ class ApplicationsDeployer(Deployer):
         existing_libs = existing_lib_refs.keys()
         existing_apps = existing_app_refs.keys()
 
+        lib_location = LocationContext(base_location).append_location(LIBRARY)
+        app_location = LocationContext(base_location).append_location(APPLICATION)
+        self.__compute_hashes(lib_location, model_shared_libraries, existing_lib_refs,
+                              app_location, model_applications, existing_app_refs)
+
         # stop the app if the referenced shared library is newer or
         # if the source path changes
         stop_app_list = list()
         stop_and_undeploy_app_list = list()
         update_library_list = list()
+        unchanged_lib_list = list()
+        unchanged_app_list = list()
 
-        lib_location = LocationContext(base_location).append_location(LIBRARY)
         # Go through the model libraries and find existing libraries that are referenced
         # by applications and compute a processing strategy for each library.
         self.__build_library_deploy_strategy(lib_location, model_shared_libraries, existing_libs, existing_lib_refs,
-                                             stop_app_list, update_library_list, stop_and_undeploy_app_list)
+                                             stop_app_list, update_library_list, stop_and_undeploy_app_list,
+                                             unchanged_lib_list)
 
         # Go through the model applications and compute the processing strategy for each application.
-        app_location = LocationContext(base_location).append_location(APPLICATION)
         self.__build_app_deploy_strategy(app_location, model_applications, existing_apps,
-                                         existing_app_refs, stop_and_undeploy_app_list)
+                                         existing_app_refs, stop_and_undeploy_app_list, unchanged_app_list)
+
+        if len(unchanged_lib_list) > 0:
+            self.logger.info('WLSDPLY-09336', len(unchanged_lib_list), ', '.join(unchanged_lib_list),
+                             class_name=self._class_name, method_name=_method_name)
+        if len(unchanged_app_list) > 0:
+            self.logger.info('WLSDPLY-09337', len(unchanged_app_list), ', '.join(unchanged_app_list),
+                             class_name=self._class_name, method_name=_method_name)
+
+        # the hashes of the binaries are reused by the next update, if the binaries have not changed
+        self._digest_cache.save()
 
         # deployed_app_list is list of apps that has been deployed and stareted again
         # redeploy_app_list is list of apps that needs to be redeplyed
@@ -300,7 +322,7 @@ class ApplicationsDeployer(Deployer):
     def __get_parent_by_location(self, location):
         _method_name = '_get_parent_by_location'
 
-        self.logger.entering(str(location), class_name=self._class_name, method_name=_method_name)
+        self.logger.entering(location, class_name=self._class_name, method_name=_method_name)
         location_folders = location.get_model_folders()
         if len(location_folders) == 0:
             parent_dict = self.model.get_model_app_deployments()
@@ -372,7 +394,7 @@ class ApplicationsDeployer(Deployer):
     def __get_parent_dict_and_name_for_resource_group(self, location, parent_dict, parent_path):
         _method_name = '__get_parent_dict_and_name_for_resource_group'
 
-        self.logger.entering(str(location), parent_path, class_name=self._class_name, method_name=_method_name)
+        self.logger.entering(location, parent_path, class_name=self._class_name, method_name=_method_name)
         if RESOURCE_GROUP not in parent_dict:
             ex = exception_helper.create_deploy_exception('WLSDPLY-09305', RESOURCE_GROUP, parent_path)
             self.logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
@@ -393,7 +415,7 @@ class ApplicationsDeployer(Deployer):
     def __get_existing_apps(self, base_location):
         _method_name = '__get_existing_apps'
 
-        self.logger.entering(str(base_location), class_name=self._class_name, method_name=_method_name)
+        self.logger.entering(base_location, class_name=self._class_name, method_name=_method_name)
         ref_dictionary = OrderedDict()
 
         location = LocationContext(base_location).append_location(APPLICATION)
@@ -438,21 +460,15 @@ class ApplicationsDeployer(Deployer):
 
                 deployment_order = attributes_map['DeploymentOrder']
 
-                app_hash = self.__get_file_hash(absolute_sourcepath)
-                if absolute_planpath is not None:
-                    plan_hash = self.__get_file_hash(absolute_planpath)
-                else:
-                    plan_hash = None
-
-                _update_ref_dictionary(ref_dictionary, app, absolute_sourcepath, app_hash, config_targets,
-                                       absolute_plan_path=absolute_planpath, deploy_order=deployment_order,
-                                       plan_hash=plan_hash)
+                # the hashes are added by __compute_hashes, after all the WLST reads
+                _update_ref_dictionary(ref_dictionary, app, absolute_sourcepath, None, config_targets,
+                                       absolute_plan_path=absolute_planpath, deploy_order=deployment_order)
         return ref_dictionary
 
     def __get_library_references(self, base_location):
         _method_name = '__get_library_references'
 
-        self.logger.entering(str(base_location), class_name=self._class_name, method_name=_method_name)
+        self.logger.entering(base_location, class_name=self._class_name, method_name=_method_name)
         # In 12.1.3 and older release this internal library is accidentally exposed in libraryruntimes mbean
 
         internal_skip_list = ['bea_wls_async_response']
@@ -496,7 +512,8 @@ class ApplicationsDeployer(Deployer):
                     absolute_source_path = self.model_context.get_domain_home() + '/' + absolute_source_path
 
                 deployment_order = config_attributes[DEPLOYMENT_ORDER]
-                lib_hash = self.__get_file_hash(absolute_source_path)
+                # the hash is added by __compute_hashes, after all the WLST reads
+                lib_hash = None
 
                 if string_utils.to_boolean(runtime_attributes['Referenced']) is True:
                     referenced_path = library_runtime_path + lib + '/ReferencingRuntimes/'
@@ -520,7 +537,8 @@ class ApplicationsDeployer(Deployer):
         return existing_libraries
 
     def __build_library_deploy_strategy(self, location, model_libs, existing_libs, existing_lib_refs,
-                                        stop_app_list, update_library_list, stop_and_undeploy_app_list):
+                                        stop_app_list, update_library_list, stop_and_undeploy_app_list,
+                                        unchanged_lib_list):
 
         _method_name = '__build_library_deploy_strategy'
 
@@ -569,6 +587,8 @@ class ApplicationsDeployer(Deployer):
                     if self.__is_builtin_library_or_app(model_src_path) and existing_src_path == model_src_path:
                         self.__handle_builtin_libraries(targets_not_changed, model_libs, lib,
                                                         existing_lib_targets_set, model_targets_set)
+                        if lib not in model_libs:
+                            unchanged_lib_list.append(lib)
                         continue
 
                     # user libraries
@@ -591,6 +611,7 @@ class ApplicationsDeployer(Deployer):
                         # to redeploy them ot the referencing applications unless the targets are different.
                         if existing_lib_targets_set.issuperset(model_targets_set):
                             self.__remove_lib_from_deployment(model_libs, lib)
+                            unchanged_lib_list.append(lib)
                         else:
                             # Adjust the targets to only the new targets so that existing apps on
                             # already targeted servers are not impacted.
@@ -600,7 +621,7 @@ class ApplicationsDeployer(Deployer):
         return
 
     def __build_app_deploy_strategy(self, location, model_apps, existing_apps, existing_app_refs,
-                                    stop_and_undeploy_app_list):
+                                    stop_and_undeploy_app_list, unchanged_app_list):
         if model_apps is not None:
             uses_path_tokens_model_attribute_names = self.__get_uses_path_tokens_attribute_names(location)
 
@@ -654,6 +675,7 @@ class ApplicationsDeployer(Deployer):
 
                             if existing_app_targets_set.issuperset(model_targets_set):
                                 self.__remove_app_from_deployment(model_apps, app)
+                                unchanged_app_list.append(app)
                             else:
                                 # Adjust the targets to only the new targets so that existing apps on
                                 # already targeted servers are not impacted.
@@ -699,23 +721,128 @@ class ApplicationsDeployer(Deployer):
 
         return self.alias_helper.get_model_uses_path_tokens_attribute_names(location)
 
+    def __compute_hashes(self, lib_location, model_libs, existing_lib_refs, app_location, model_apps,
+                         existing_app_refs):
+        """
+        Compute the hashes that the deployment strategy will compare, for the model libraries and applications
+        that are already deployed.  The files are hashed concurrently, and the archive entries are hashed by one
+        of the concurrent tasks, since the archive files are not thread-safe.  The hashes of the existing binaries
+        are added to the reference dictionaries.  Existing binaries that are not in the model are not hashed.
+        :param lib_location: the location of the libraries
+        :param model_libs: the model libraries
+        :param existing_lib_refs: the reference dictionary of the existing libraries
+        :param app_location: the location of the applications
+        :param model_apps: the model applications
+        :param existing_app_refs: the reference dictionary of the existing applications
+        :raises: DeployException: if an error occurs
+        """
+        _method_name = '__compute_hashes'
+        self.logger.entering(class_name=self._class_name, method_name=_method_name)
+
+        file_paths = []
+        archive_paths = []
+
+        uses_path_tokens_attribute_names = self.__get_uses_path_tokens_attribute_names(lib_location)
+        for lib, lib_dict in model_libs.items():
+            if existing_lib_refs.has_key(lib):
+                self.__replace_path_tokens(LIBRARY, lib, lib_dict, uses_path_tokens_attribute_names)
+                model_src_path = dictionary_utils.get_element(lib_dict, SOURCE_PATH)
+                existing_src_path = dictionary_utils.get_element(existing_lib_refs[lib], 'sourcePath')
+                if self.__is_builtin_library_or_app(model_src_path) and existing_src_path == model_src_path:
+                    continue
+                self.__add_hash_path(model_src_path, file_paths, archive_paths)
+                self.__add_hash_path(existing_src_path, file_paths, archive_paths)
+
+        uses_path_tokens_attribute_names = self.__get_uses_path_tokens_attribute_names(app_location)
+        for app, app_dict in model_apps.items():
+            if existing_app_refs.has_key(app):
+                self.__replace_path_tokens(APPLICATION, app, app_dict, uses_path_tokens_attribute_names)
+                model_src_path = dictionary_utils.get_element(app_dict, SOURCE_PATH)
+                # the hash of an exploded application in the archive is not calculated
+                if (model_src_path is None) or not deployer_utils.is_path_into_archive(model_src_path) \
+                        or not self.archive_helper.contains_path(model_src_path):
+                    self.__add_hash_path(model_src_path, file_paths, archive_paths)
+                self.__add_hash_path(dictionary_utils.get_element(app_dict, PLAN_PATH), file_paths, archive_paths)
+
+                existing_app_ref = existing_app_refs[app]
+                self.__add_hash_path(dictionary_utils.get_element(existing_app_ref, 'sourcePath'),
+                                     file_paths, archive_paths)
+                self.__add_hash_path(dictionary_utils.get_element(existing_app_ref, 'planPath'),
+                                     file_paths, archive_paths)
+
+        tasks = []
+        for file_path in file_paths:
+            tasks.append(lambda path=file_path: [self.__compute_file_hash(path)])
+        if len(archive_paths) > 0:
+            tasks.append(lambda paths=archive_paths: map(self.__compute_archive_hash, paths))
+
+        thread_count = task_runner.get_default_thread_count()
+        start_time = System.currentTimeMillis()
+        results = task_runner.run_tasks(tasks, thread_count)
+        elapsed_time = System.currentTimeMillis() - start_time
+
+        hashes = []
+        for result in results:
+            hashes.extend(result)
+        paths = file_paths + archive_paths
+        for index in range(len(paths)):
+            self._hashes[paths[index]] = hashes[index]
+        self.logger.fine('WLSDPLY-09335', len(paths), min(thread_count, len(tasks)), elapsed_time,
+                         class_name=self._class_name, method_name=_method_name)
+
+        for lib_ref in existing_lib_refs.values():
+            lib_ref['hash'] = self._hashes.get(lib_ref['sourcePath'])
+        for app_ref in existing_app_refs.values():
+            app_ref['hash'] = self._hashes.get(app_ref['sourcePath'])
+            app_ref['planHash'] = self._hashes.get(app_ref['planPath'])
+
+        self.logger.exiting(class_name=self._class_name, method_name=_method_name)
+        return
+
+    def __replace_path_tokens(self, model_type, model_name, model_dict, uses_path_tokens_attribute_names):
+        for param in uses_path_tokens_attribute_names:
+            if param in model_dict:
+                self.model_context.replace_tokens(model_type, model_name, param, model_dict)
+        return
+
+    def __add_hash_path(self, path, file_paths, archive_paths):
+        """
+        Add the path to the file or archive paths to be hashed, if it has not been added or hashed already.
+        Paths that are not valid are left for __get_hash to report.
+        """
+        if string_utils.is_empty(path) or path in self._hashes or path in file_paths or path in archive_paths:
+            return
+        if os.path.isabs(path):
+            file_paths.append(path)
+        elif deployer_utils.is_path_into_archive(path):
+            archive_paths.append(path)
+        return
+
     def __get_file_hash(self, filename):
-        _method_name = '__get_file_hash'
+        if filename is None:
+            return None
 
-        try:
-            if filename is None:
-                return None
+        if filename not in self._hashes:
+            self._hashes[filename] = self.__compute_file_hash(filename)
+        return self._hashes[filename]
+
+    def __compute_file_hash(self, filename):
+        _method_name = '__compute_file_hash'
 
+        try:
             if File(filename).isDirectory():  # can't calculate for exploded apps, libraries, etc.
                 return None
 
-            hash_value = FileUtils.computeHash(filename)
+            hash_value = self._digest_cache.getFileHash(filename)
         except (IOException, NoSuchAlgorithmException), e:
             ex = exception_helper.create_deploy_exception('WLSDPLY-09309', filename, e.getLocalizedMessage(), error=e)
             self.logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
             raise ex
         return hash_value
 
+    def __compute_archive_hash(self, path):
+        return self.archive_helper.get_file_hash(path, self._digest_cache)
+
     def __get_hash(self, path):
         _method_name = '__get_hash'
 
@@ -724,13 +851,26 @@ class ApplicationsDeployer(Deployer):
         elif os.path.isabs(path):
             hash_value = self.__get_file_hash(path)
         elif deployer_utils.is_path_into_archive(path):
-            hash_value = self.archive_helper.get_file_hash(path)
+            if path not in self._hashes:
+                self._hashes[path] = self.__compute_archive_hash(path)
+            hash_value = self._hashes[path]
         else:
             ex = exception_helper.create_deploy_exception('WLSDPLY-09310', path)
             self.logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
             raise ex
         return hash_value
 
+    def __get_file_hashes_file(self):
+        """
+        Get the file that holds the hashes of the deployed binaries and the archive entries,
+        in the wlsdeploy directory of the domain.
+        :return: the file, or None if the domain home is not a local directory
+        """
+        domain_home = self.model_context.get_domain_home()
+        if domain_home is None or not os.path.isdir(domain_home):
+            return None
+        return File(domain_home + os.sep + 'wlsdeploy' + os.sep + self._FILE_HASHES_FILE_NAME)
+
     def __get_config_targets(self):
         self.wlst_helper.cd(TARGETS)
         config_targets = self.wlst_helper.lsc()
@@ -778,12 +918,13 @@ class ApplicationsDeployer(Deployer):
             raise ex
         return
 
-    def __start_app(self, application_name, partition_name=None):
+    def __start_app(self, application_name, partition_name=None, block=True):
         _method_name = '__start_app'
 
         self.logger.info('WLSDPLY-09313', application_name, class_name=self._class_name, method_name=_method_name)
-        self.wlst_helper.start_application(application_name, partition=partition_name)
-        return
+        if block:
+            return self.wlst_helper.start_application(application_name, partition=partition_name)
+        return self.wlst_helper.start_application(application_name, partition=partition_name, block='false')
 
     def __undeploy_app(self, application_name, library_module='false', partition_name=None,
                        resource_group_template=None, timeout=None):
@@ -827,35 +968,61 @@ class ApplicationsDeployer(Deployer):
         return
 
     def __deploy_model_applications(self, model_apps, app_location, deployed_applist):
+        _method_name = '__deploy_model_applications'
+
         if model_apps is not None:
             uses_path_tokens_attribute_names = self.__get_uses_path_tokens_attribute_names(app_location)
             deploy_ordered_keys = self.__get_deployment_ordering(model_apps)
-            location = LocationContext(app_location)
-            token_name = self.alias_helper.get_name_token(location)
-            for app_name in deploy_ordered_keys:
-                app_dict = model_apps[app_name]
-                src_path = dictionary_utils.get_element(app_dict, SOURCE_PATH)
-                plan_file = dictionary_utils.get_element(app_dict, PLAN_PATH)
-                targets = dictionary_utils.get_element(app_dict, TARGET)
-                options = _get_deploy_options(model_apps, app_name, library_module='false')
-
-                # any attribute with 'uses_path_tokens' may be in the archive (such as SourcePath)
-                for uses_path_tokens_attribute_name in uses_path_tokens_attribute_names:
-                    if uses_path_tokens_attribute_name in app_dict:
-                        path = app_dict[uses_path_tokens_attribute_name]
-                        if deployer_utils.is_path_into_archive(path):
-                            self.__extract_source_path_from_archive(path, APPLICATION, app_name)
+            parallel_count = deployment_waves.get_parallel_deployments()
+            if parallel_count > 1 and len(deploy_ordered_keys) > 1:
+                # the applications with the same deployment order are deployed concurrently
+                waves = deployment_waves.get_deployment_waves(deploy_ordered_keys, model_apps)
+                self.logger.info('WLSDPLY-09342', len(deploy_ordered_keys), len(waves), parallel_count,
+                                 class_name=self._class_name, method_name=_method_name)
+                new_app_names = dict()
+
+                def _deploy_app(app_name):
+                    new_name, progress = self.__deploy_model_application(model_apps, app_name, app_location,
+                                                                         uses_path_tokens_attribute_names,
+                                                                         block=False)
+                    new_app_names[app_name] = new_name
+                    return progress
+
+                deployment_waves.run_waves(waves, _deploy_app, 'deploy', parallel_count,
+                                           deployment_waves.get_deployment_timeout())
+                for app_name in deploy_ordered_keys:
+                    deployed_applist.append(new_app_names[app_name])
+            else:
+                for app_name in deploy_ordered_keys:
+                    new_app_name, progress = self.__deploy_model_application(model_apps, app_name, app_location,
+                                                                             uses_path_tokens_attribute_names)
+                    deployed_applist.append(new_app_name)
+        return
 
-                location.add_name_token(token_name, app_name)
-                resource_group_template_name, resource_group_name, partition_name = \
-                    self.__get_mt_names_from_location(location)
+    def __deploy_model_application(self, model_apps, app_name, app_location, uses_path_tokens_attribute_names,
+                                   block=True):
+        app_dict = model_apps[app_name]
+        src_path = dictionary_utils.get_element(app_dict, SOURCE_PATH)
+        plan_file = dictionary_utils.get_element(app_dict, PLAN_PATH)
+        targets = dictionary_utils.get_element(app_dict, TARGET)
+        options = _get_deploy_options(model_apps, app_name, library_module='false')
+
+        # any attribute with 'uses_path_tokens' may be in the archive (such as SourcePath)
+        for uses_path_tokens_attribute_name in uses_path_tokens_attribute_names:
+            if uses_path_tokens_attribute_name in app_dict:
+                path = app_dict[uses_path_tokens_attribute_name]
+                if deployer_utils.is_path_into_archive(path):
+                    self.__extract_source_path_from_archive(path, APPLICATION, app_name)
 
-                new_app_name = self.__deploy_app_online(app_name, src_path, targets, plan=plan_file,
-                                         partition=partition_name, resource_group=resource_group_name,
-                                         resource_group_template=resource_group_template_name, options=options)
-                location.remove_name_token(token_name)
-                deployed_applist.append(new_app_name)
-        return
+        location = LocationContext(app_location)
+        location.add_name_token(self.alias_helper.get_name_token(location), app_name)
+        resource_group_template_name, resource_group_name, partition_name = \
+            self.__get_mt_names_from_location(location)
+
+        return self.__deploy_app_online(app_name, src_path, targets, plan=plan_file,
+                                        partition=partition_name, resource_group=resource_group_name,
+                                        resource_group_template=resource_group_template_name, options=options,
+                                        block=block)
 
     def __get_mt_names_from_location(self, app_location):
         dummy_location = LocationContext()
@@ -879,7 +1046,12 @@ class ApplicationsDeployer(Deployer):
         return resource_group_template_name, resource_group_name, partition_name
 
     def __deploy_app_online(self, application_name, source_path, targets, plan=None, partition=None,
-                            resource_group=None, resource_group_template=None, options=None):
+                            resource_group=None, resource_group_template=None, options=None, block=True):
+        """
+        Deploy the application or shared library.
+        :return: the versioned application name, and the WLST progress object
+        :raises: DeployException: if an error occurs
+        """
         _method_name = '__deploy_app_online'
 
         self.logger.info('WLSDPLY-09316', application_name, class_name=self._class_name, method_name=_method_name)
@@ -922,11 +1094,13 @@ class ApplicationsDeployer(Deployer):
         if options is not None:
             for key, value in options.iteritems():
                 kwargs[key] = value
+        if not block:
+            kwargs['block'] = 'false'
 
         self.logger.fine('WLSDPLY-09320', application_name, kwargs,
                          class_name=self._class_name, method_name=_method_name)
-        self.wlst_helper.deploy_application(application_name, *args, **kwargs)
-        return application_name
+        progress = self.wlst_helper.deploy_application(application_name, *args, **kwargs)
+        return application_name, progress
 
     def __extract_file_from_archive(self, path):
         if path is not None and deployer_utils.is_path_into_archive(path):
@@ -1109,11 +1283,12 @@ class ApplicationsDeployer(Deployer):
         if name_sorted_keys is not None:
             result_deploy_order.extend(name_sorted_keys)
 
-        self.logger.fine('WLSDPLY-09326', str(result_deploy_order),
+        self.logger.fine('WLSDPLY-09326', result_deploy_order,
                          class_name=self._class_name, method_name=_method_name)
         return result_deploy_order
 
     def __start_all_apps(self, deployed_app_list, base_location):
+        _method_name = '__start_all_apps'
 
         temp_app_dict = OrderedDict()
         location = LocationContext(base_location).append_location(APPLICATION)
@@ -1131,8 +1306,21 @@ class ApplicationsDeployer(Deployer):
             temp_app_dict[app][DEPLOYMENT_ORDER] = deployment_order
 
         start_order = self.__get_deployment_ordering(temp_app_dict)
-        for app in start_order:
-            self.__start_app(app)
+        parallel_count = deployment_waves.get_parallel_deployments()
+        if parallel_count > 1 and len(start_order) > 1:
+            # the applications with the same deployment order are started concurrently
+            waves = deployment_waves.get_deployment_waves(start_order, temp_app_dict)
+            self.logger.info('WLSDPLY-09343', len(start_order), len(waves), parallel_count,
+                             class_name=self._class_name, method_name=_method_name)
+
+            def _start_app(app_name):
+                return self.__start_app(app_name, block=False)
+
+            deployment_waves.run_waves(waves, _start_app, 'startApplication', parallel_count,
+                                       deployment_waves.get_deployment_timeout())
+        else:
+            for app in start_order:
+                self.__start_app(app)
         return
 
 def _get_deploy_options(model_apps, app_name, library_module):
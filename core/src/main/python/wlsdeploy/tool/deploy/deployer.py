@@ -6,6 +6,8 @@ import os
 
 from array import array
 from java.lang import Class
+from oracle.weblogic.deploy.aliases import AliasException
+from oracle.weblogic.deploy.deploy import DeployException
 from oracle.weblogic.deploy.util import PyWLSTException
 
 from wlsdeploy.aliases.wlst_modes import WlstModes
@@ -24,6 +26,9 @@ from wlsdeploy.tool.util.wlst_helper import WlstHelper
 import wlsdeploy.util.dictionary_utils as dictionary_utils
 from wlsdeploy.util.weblogic_helper import WebLogicHelper
 
+# the number of model attributes that were set online, and that were skipped because the domain had the same value
+_attribute_counts = {'applied': 0, 'skipped': 0}
+
 
 class Deployer(object):
     """
@@ -168,10 +173,10 @@ class Deployer(object):
         _method_name = 'set_attributes'
         attribute_names = self.alias_helper.get_model_attribute_names(location)
         uses_path_tokens_attribute_names = self.alias_helper.get_model_uses_path_tokens_attribute_names(location)
-        restart_attribute_names = self.alias_helper.get_model_restart_required_attribute_names(location)
         merge_attribute_names = self.alias_helper.get_model_merge_required_attribute_names(location)
         lsa_required_attribute_names = self.aliases.get_model_lsa_required_attribute_names(location)
         set_method_map = self.alias_helper.get_model_mbean_set_method_attribute_names_and_types(location)
+        existing_values = self._get_existing_wlst_values(location, model_nodes, attribute_names)
 
         for key in model_nodes:
             key_excluded = (excludes is not None) and (key in excludes)
@@ -183,10 +188,18 @@ class Deployer(object):
 
                 wlst_merge_value = None
                 if key in merge_attribute_names:
-                    wlst_merge_value = self._get_existing_wlst_value(location, key, lsa_required_attribute_names)
-
-                if not self._skip_setting_attribute(key, value, wlst_merge_value, restart_attribute_names) and \
-                        (not self.set_special_attribute(location, key, value, wlst_merge_value, set_method_map)):
+                    wlst_merge_value = self._get_existing_wlst_value(location, key, lsa_required_attribute_names,
+                                                                     existing_values)
+
+                if existing_values is not None:
+                    can_skip = key not in merge_attribute_names and key not in uses_path_tokens_attribute_names \
+                        and key not in set_method_map
+                    if can_skip and self._skip_setting_attribute(location, key, value, existing_values):
+                        _attribute_counts['skipped'] += 1
+                        continue
+                    _attribute_counts['applied'] += 1
+
+                if not self.set_special_attribute(location, key, value, wlst_merge_value, set_method_map):
                     try:
                         self.attribute_setter.set_attribute(location, key, value, wlst_merge_value)
                     except PyWLSTException, pwe:
@@ -197,29 +210,83 @@ class Deployer(object):
                         raise ex
         return
 
-    def _skip_setting_attribute(self, key, value, wlst_merge_value, restart_attribute_names):
+    def _get_existing_wlst_values(self, location, model_nodes, attribute_names):
         """
-        For the case where a change to an attribute will require restart, verify that the new value is different
-        from the current value in WLST.
-        :param key: the attribute key
+        In online mode, read the current attribute values of the MBean at the current WLST location with one lsa,
+        so the attributes with unchanged values are not set.  The values that lsa does not read correctly
+        are removed, so those attributes are always set.
+        :param location: the location of the attributes to be set
+        :param model_nodes: a map of model nodes with attributes to be set
+        :param attribute_names: the model attribute names for the location
+        :return: the WLST values keyed by WLST name, or None if the values are not compared
+        """
+        _method_name = '_get_existing_wlst_values'
+
+        if self.wlst_mode != WlstModes.ONLINE:
+            return None
+
+        has_attributes = False
+        for key in model_nodes:
+            if key in attribute_names:
+                has_attributes = True
+                break
+        if not has_attributes:
+            return None
+
+        try:
+            existing_values = self.wlst_helper.lsa()
+        except DeployException, de:
+            self.logger.fine('WLSDPLY-09206', self.alias_helper.get_model_folder_path(location),
+                             de.getLocalizedMessage(), class_name=self._class_name, method_name=_method_name)
+            return None
+
+        # lsa does not read these values correctly, or shows them masked
+        excluded_names = list(self.alias_helper.get_wlst_get_required_attribute_names(location))
+        for model_name in self.aliases.get_model_password_attribute_names(location):
+            excluded_names.append(self.alias_helper.get_wlst_attribute_name(location, model_name))
+        for wlst_name in excluded_names:
+            if wlst_name in existing_values:
+                del existing_values[wlst_name]
+        return existing_values
+
+    def _skip_setting_attribute(self, location, key, value, existing_values):
+        """
+        Determine if the model value of the attribute is the same as the current value in the domain, so the
+        attribute does not need to be set.  Both values are compared after conversion to the model type
+        by the aliases.  If the values cannot be compared, the attribute is set.
+        :param location: the location of the attribute
+        :param key: the model attribute name
         :param value: the attribute value from the model
-        :param wlst_merge_value: the WLST value to check for merge
-        :param restart_attribute_names: a list of attribute names that require system restart
+        :param existing_values: the current WLST values at the location, keyed by WLST name
         :return: True if the attribute does not need to be set
         """
         _method_name = '_skip_setting_attribute'
 
-        # Needs implementation. Return true if model key in restart attribute_names,
-        # and WLST helper determines that set is required,
-        # based on model key, model value, and the WLST merge value
+        try:
+            wlst_name, wlst_value = self.aliases.get_wlst_attribute_name_and_value(location, key, value)
+            if wlst_name is None or wlst_name not in existing_values:
+                return False
+            model_value = self.aliases.get_model_attribute_name_and_value(location, wlst_name, wlst_value)[1]
+            existing_model_value = \
+                self.aliases.get_model_attribute_name_and_value(location, wlst_name, existing_values[wlst_name])[1]
+        except AliasException, ae:
+            self.logger.finer('WLSDPLY-09207', key, self.alias_helper.get_model_folder_path(location),
+                              ae.getLocalizedMessage(), class_name=self._class_name, method_name=_method_name)
+            return False
 
-        return False
+        if model_value != existing_model_value:
+            return False
 
-    def _get_existing_wlst_value(self, location, key, lsa_required_attribute_names):
+        self.logger.finer('WLSDPLY-09208', key, self.alias_helper.get_model_folder_path(location),
+                          class_name=self._class_name, method_name=_method_name)
+        return True
+
+    def _get_existing_wlst_value(self, location, key, lsa_required_attribute_names, existing_values=None):
         """
         Returns the existing value for the specified attribute key in the specified location.
         :param location: the location to be checked
         :param key: the attribute key
+        :param existing_values: optional map of the WLST values already read with lsa at the location
         :return: The value of the attribute in WLST
         """
         _method_name = '_get_existing_wlst_value'
@@ -234,7 +301,9 @@ class Deployer(object):
             return None
 
         if key in lsa_required_attribute_names:
-            attribute_map = self.wlst_helper.lsa()
+            attribute_map = existing_values
+            if attribute_map is None or wlst_key not in attribute_map:
+                attribute_map = self.wlst_helper.lsa()
             if wlst_key in attribute_map:
                 wlst_value = attribute_map[wlst_key]
             else:
@@ -288,7 +357,7 @@ class Deployer(object):
         :return: the type of the last element in the location
         """
         _method_name = 'get_location_type'
-        self.logger.entering(str(location), class_name=self._class_name, method_name=_method_name)
+        self.logger.entering(location, class_name=self._class_name, method_name=_method_name)
 
         folders = location.get_model_folders()
         if len(folders) == 0:
@@ -340,7 +409,7 @@ class Deployer(object):
         """
         _method_name = '_extract_from_archive_if_needed'
 
-        self.logger.entering(str(location), key, value, class_name=self._class_name, method_name=_method_name)
+        self.logger.entering(location, key, value, class_name=self._class_name, method_name=_method_name)
         result = False
         short_value = deployer_utils.get_rel_path_from_uri(self.model_context, value)
         if deployer_utils.is_path_into_archive(short_value):
@@ -365,7 +434,7 @@ class Deployer(object):
         """
         _method_name = '__process_archive_entry'
 
-        self.logger.entering(str(location), key, value, class_name=self._class_name, method_name=_method_name)
+        self.logger.entering(location, key, value, class_name=self._class_name, method_name=_method_name)
         result = False
         fullpath = os.path.join(self.model_context.get_domain_home(), value)
         if self.archive_helper.contains_file(value):
@@ -416,7 +485,7 @@ class Deployer(object):
         :return: True, if the directory was created, False otherwise
         """
         _method_name = '__process_directory_entry'
-        self.logger.entering(str(path), class_name=self._class_name, method_name=_method_name)
+        self.logger.entering(path, class_name=self._class_name, method_name=_method_name)
 
         result = False
         if not os.path.isdir(path):
@@ -424,3 +493,15 @@ class Deployer(object):
             os.makedirs(path)
             result = True
         return result
+
+
+def log_attribute_counts():
+    """
+    Log the number of model attributes that were set online, and the number that were skipped
+    because the domain already had the model value.
+    """
+    _method_name = 'log_attribute_counts'
+    if _attribute_counts['applied'] > 0 or _attribute_counts['skipped'] > 0:
+        PlatformLogger('wlsdeploy.deploy').info('WLSDPLY-09205', _attribute_counts['applied'],
+                                                _attribute_counts['skipped'], class_name=Deployer._class_name,
+                                                method_name=_method_name)
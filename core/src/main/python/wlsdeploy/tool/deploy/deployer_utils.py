@@ -50,7 +50,7 @@ def create_and_cd(location, existing_names, alias_helper):
     :param alias_helper: the alias helper used to determine path names
     """
     method_name = 'create_and_cd'
-    _logger.entering(str(location), existing_names, _class_name, method_name)
+    _logger.entering(location, existing_names, _class_name, method_name)
 
     mbean_name = get_mbean_name(location, existing_names, alias_helper)
     create_path = alias_helper.get_wlst_create_path(location)
@@ -0,0 +1,149 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Run the online deploy and start operations for applications concurrently, in waves.
+
+A wave is a group of applications with the same deployment order.  The applications in a wave do not depend
+on each other, since the shared libraries they reference are deployed before any application.  The operations
+in a wave are started without blocking, up to the parallel limit, and their WLST progress objects are tracked
+until they are complete.  The next wave starts only after every operation in the previous wave has completed.
+"""
+import os
+
+from java.lang import System
+from java.lang import Thread
+from oracle.weblogic.deploy.deploy import DeployException
+
+from wlsdeploy.aliases.model_constants import DEPLOYMENT_ORDER
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.util import dictionary_utils
+
+PARALLEL_DEPLOYMENTS_VARIABLE = 'WDT_PARALLEL_DEPLOYMENTS'
+DEPLOYMENT_TIMEOUT_VARIABLE = 'WDT_DEPLOYMENT_TIMEOUT'
+
+_class_name = 'deployment_waves'
+_logger = PlatformLogger('wlsdeploy.deploy')
+
+_POLL_MILLIS = 250
+
+
+def get_parallel_deployments():
+    """
+    Get the maximum number of concurrent deploy or start operations from the environment.
+    :return: the number of operations, 1 if the variable is not set or is not valid
+    """
+    return _get_positive_integer(PARALLEL_DEPLOYMENTS_VARIABLE, 1)
+
+
+def get_deployment_timeout():
+    """
+    Get the number of seconds to wait for each concurrent deploy or start operation from the environment.
+    :return: the number of seconds, or None if the operations do not time out
+    """
+    return _get_positive_integer(DEPLOYMENT_TIMEOUT_VARIABLE, None)
+
+
+def get_deployment_waves(ordered_names, apps_dict):
+    """
+    Divide the applications into waves of applications with the same deployment order.
+    :param ordered_names: the application names, sorted by deployment order
+    :param apps_dict: the application dictionaries, keyed by name
+    :return: the list of waves, each a list of application names in the original order
+    """
+    waves = []
+    wave_order = None
+    for name in ordered_names:
+        order = dictionary_utils.get_element(apps_dict[name], DEPLOYMENT_ORDER)
+        if len(waves) == 0 or order != wave_order:
+            waves.append([])
+            wave_order = order
+        waves[-1].append(name)
+    return waves
+
+
+def run_waves(waves, start_operation, wlst_function_name, parallel_count, timeout_seconds=None):
+    """
+    Run the operation for each application in the waves.  If an operation fails, no more operations are
+    started, the running operations are allowed to complete, and the failure of the first application
+    in wave order is raised, as if the operations had been run in sequence.
+    :param waves: the list of waves, each a list of application names
+    :param start_operation: a function that starts the operation for an application name without blocking,
+                            and returns the WLST progress object, or None if the operation has completed
+    :param wlst_function_name: the name of the WLST function used for the operation, for messages
+    :param parallel_count: the maximum number of operations to run at the same time
+    :param timeout_seconds: the number of seconds to wait for each operation, or None to wait until it completes
+    :raises: DeployException: if an operation fails or does not complete in time
+    """
+    _method_name = 'run_waves'
+    _logger.entering(len(waves), wlst_function_name, parallel_count, timeout_seconds,
+                     class_name=_class_name, method_name=_method_name)
+
+    for wave in waves:
+        _logger.fine('WLSDPLY-09338', wlst_function_name, wave, class_name=_class_name, method_name=_method_name)
+        failures = _run_wave(wave, start_operation, wlst_function_name, parallel_count, timeout_seconds)
+        for name in wave:
+            if name in failures:
+                ex = failures[name]
+                _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+                raise ex
+
+    _logger.exiting(class_name=_class_name, method_name=_method_name)
+
+
+def _run_wave(wave, start_operation, wlst_function_name, parallel_count, timeout_seconds):
+    """
+    Run the operations for the applications in a single wave, and wait for them to complete.
+    :return: a dictionary of the DeployException for each application that failed
+    """
+    pending = list(wave)
+    running = []
+    failures = dict()
+    while len(running) > 0 or (len(pending) > 0 and len(failures) == 0):
+        while len(pending) > 0 and len(failures) == 0 and len(running) < parallel_count:
+            name = pending.pop(0)
+            try:
+                progress = start_operation(name)
+            except DeployException, de:
+                failures[name] = de
+                continue
+            if progress is not None:
+                running.append((name, progress, System.currentTimeMillis()))
+
+        still_running = []
+        for name, progress, start_time in running:
+            if progress.isRunning():
+                elapsed_seconds = (System.currentTimeMillis() - start_time) / 1000
+                if timeout_seconds is not None and elapsed_seconds >= timeout_seconds:
+                    failures[name] = exception_helper.create_deploy_exception('WLSDPLY-09340', wlst_function_name,
+                                                                              name, timeout_seconds)
+                else:
+                    still_running.append((name, progress, start_time))
+            elif progress.isFailed():
+                failures[name] = exception_helper.create_deploy_exception('WLSDPLY-09339', wlst_function_name,
+                                                                          name, progress.getMessage())
+        running = still_running
+
+        if len(running) > 0:
+            Thread.sleep(_POLL_MILLIS)
+    return failures
+
+
+def _get_positive_integer(variable_name, default_value):
+    _method_name = '_get_positive_integer'
+
+    value = os.environ.get(variable_name, None)
+    if value is None or len(value.strip()) == 0:
+        return default_value
+
+    result = 0
+    try:
+        result = int(value.strip())
+    except ValueError:
+        pass
+
+    if result < 1:
+        _logger.warning('WLSDPLY-09341', value, variable_name, class_name=_class_name, method_name=_method_name)
+        return default_value
+    return result
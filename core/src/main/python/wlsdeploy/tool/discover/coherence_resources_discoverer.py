@@ -105,7 +105,7 @@ class CoherenceResourcesDiscoverer(Discoverer):
         :return: model name for the coherence cache config: resource dictionary containing the discovered cache config
         """
         _method_name = '_get_coherence_cache_config'
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         result = OrderedDict()
         model_top_folder_name = model_constants.COHERENCE_CACHE_CONFIG
         location.append_location(model_top_folder_name)
@@ -132,7 +132,7 @@ class CoherenceResourcesDiscoverer(Discoverer):
         :return: model name for coherence resource: dictionary containing coherence resources.
         """
         _method_name = '_get_coherence_resource'
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         result = OrderedDict()
         model_top_folder_name = model_constants.COHERENCE_RESOURCE
         location.append_location(model_top_folder_name)
@@ -0,0 +1,348 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Read the configuration of an offline domain directly from config/config.xml, and from the JDBC, JMS and WLDF
+module descriptors that it references, with a streaming XML parser.
+
+The elements are found by WLST offline path, so offline discovery can use the names, attribute values and
+subfolders in the files instead of listing every MBean with WLST.  This is experimental.  Attributes that are
+not in the files have their default values, and element names are matched to WLST names only by removing dashes
+and ignoring case, so the model can differ from the model discovered with WLST.  Any path that cannot be matched
+to the files with certainty is not answered, and the caller should use WLST for that path.
+"""
+import os
+
+from java.io import FileInputStream
+from java.io import IOException
+from java.lang import Boolean
+from javax.xml.stream import XMLInputFactory
+from javax.xml.stream import XMLStreamConstants
+from javax.xml.stream import XMLStreamException
+
+from wlsdeploy.logging.platform_logger import PlatformLogger
+
+CONFIG_XML_VARIABLE = 'WDT_DISCOVER_CONFIG_XML'
+
+_class_name = 'ConfigXmlReader'
+_logger = PlatformLogger('wlsdeploy.discover')
+
+_XSI_NAMESPACE = 'http://www.w3.org/2001/XMLSchema-instance'
+_DESCRIPTOR_FILE_NAME = 'descriptorfilename'
+_NAME = 'name'
+
+# the normalized config.xml element types with module descriptors, and the WLST type of the descriptor root
+_DESCRIPTOR_ROOT_TYPES = {
+    'jdbcsystemresource': 'jdbcresource',
+    'jmssystemresource': 'jmsresource',
+    'wldfsystemresource': 'wldfresource'
+}
+
+
+def is_enabled():
+    """
+    Determine if offline discovery should read the domain configuration from config.xml.
+    This is disabled, unless the environment variable is set to true.
+    :return: True if the configuration should be read from config.xml, False otherwise
+    """
+    value = os.environ.get(CONFIG_XML_VARIABLE, None)
+    return value is not None and value.strip().lower() == 'true'
+
+
+def normalize(type_name):
+    """
+    Get the normalized form of a WLST MBean type or attribute name, or of an XML element name,
+    so that the name ListenPort matches the element listen-port.
+    :param type_name: the name to normalize
+    :return: the normalized name
+    """
+    return type_name.replace('-', '').lower()
+
+
+class ConfigXmlReader(object):
+    """
+    Read and hold the elements of the domain configuration files, to answer WLST offline path queries.
+    The files are read the first time that a path is requested.  If config.xml cannot be read, no paths are answered.
+    """
+
+    def __init__(self, domain_home):
+        self._config_dir = os.path.join(domain_home, 'config')
+        self._root = None
+        self._loaded = False
+
+    def get_names(self, list_path):
+        """
+        Get the names of the MBeans at the WLST list path.
+        :param list_path: the WLST list path, such as /Server or /Server/s1/Log
+        :return: the list of names, or None if the names are not known
+        """
+        elements = self.__get_elements_of_type(list_path)
+        if elements is None:
+            return None
+        names = []
+        for element in elements:
+            name = element.get_name()
+            if name is None:
+                # WLST names the unnamed MBeans, use WLST to get the name
+                return None
+            names.append(name)
+        return names
+
+    def has_names(self, list_path):
+        """
+        Determine if there are any MBeans at the WLST list path.
+        :param list_path: the WLST list path
+        :return: True or False, or None if it is not known
+        """
+        elements = self.__get_elements_of_type(list_path)
+        if elements is None:
+            return None
+        return len(elements) > 0
+
+    def get_attribute_values(self, attributes_path):
+        """
+        Get the attribute values of the MBean at the WLST attributes path.
+        :param attributes_path: the WLST attributes path, such as /Server/s1
+        :return: a dictionary of the string values keyed by normalized name, or None if the MBean is not known
+        """
+        element = self.__get_element(_split_path(attributes_path))
+        if element is None:
+            return None
+        return element.get_values()
+
+    def get_subfolder_types(self, subfolders_path):
+        """
+        Get the types of the subfolders of the MBean at the WLST subfolders path.
+        :param subfolders_path: the WLST subfolders path
+        :return: the list of normalized subfolder types, or None if the MBean is not known
+        """
+        element = self.__get_element(_split_path(subfolders_path))
+        if element is None:
+            return None
+        return element.get_child_types()
+
+    def __get_elements_of_type(self, list_path):
+        segments = _split_path(list_path)
+        if len(segments) % 2 == 0:
+            return None
+        parent = self.__get_element(segments[:-1])
+        if parent is None:
+            return None
+        return parent.get_children(normalize(segments[-1]))
+
+    def __get_element(self, segments):
+        if len(segments) % 2 != 0:
+            return None
+        element = self.__get_root()
+        index = 0
+        while element is not None and element.is_complete() and index < len(segments):
+            element = element.find_child(normalize(segments[index]), segments[index + 1])
+            index += 2
+        if element is None or not element.is_complete():
+            return None
+        return element
+
+    def __get_root(self):
+        _method_name = '__get_root'
+        if not self._loaded:
+            self._loaded = True
+            config_file = os.path.join(self._config_dir, 'config.xml')
+            _logger.info('WLSDPLY-06164', config_file, class_name=_class_name, method_name=_method_name)
+            try:
+                self._root = _parse_file(config_file, False)
+            except (IOException, XMLStreamException), ex:
+                _logger.warning('WLSDPLY-06165', config_file, ex.getLocalizedMessage(),
+                                class_name=_class_name, method_name=_method_name)
+                self._root = None
+            if self._root is not None:
+                self.__add_descriptors(self._root)
+        return self._root
+
+    def __add_descriptors(self, element):
+        """
+        Add the root elements of the module descriptors to their resource elements.
+        The resources with descriptors that are not read are marked incomplete, so WLST is used for them.
+        :param element: the element to search for resources
+        """
+        _method_name = '__add_descriptors'
+        for child in element.get_all_children():
+            descriptor_file_name = child.get_values().get(_DESCRIPTOR_FILE_NAME)
+            if descriptor_file_name is None:
+                self.__add_descriptors(child)
+                continue
+
+            root_type = _DESCRIPTOR_ROOT_TYPES.get(child.get_type())
+            if root_type is None:
+                child.set_incomplete()
+                continue
+
+            descriptor_file = os.path.join(self._config_dir, descriptor_file_name)
+            try:
+                descriptor_root = _parse_file(descriptor_file, True)
+                descriptor_root.set_type(root_type)
+                child.add_child(descriptor_root)
+            except (IOException, XMLStreamException), ex:
+                _logger.warning('WLSDPLY-06166', descriptor_file, child.get_name(), ex.getLocalizedMessage(),
+                                class_name=_class_name, method_name=_method_name)
+                child.set_incomplete()
+
+
+class _ConfigElement(object):
+    """
+    An element of a configuration file that represents an MBean, with its attribute values and child elements.
+    """
+    __slots__ = ['_type', '_name', '_text', '_nil', '_values', '_children', '_child_elements', '_complete']
+
+    def __init__(self, element_name):
+        self._type = normalize(element_name)
+        self._name = None
+        self._text = []
+        self._nil = False
+        self._values = dict()
+        self._children = dict()
+        self._child_elements = []
+        self._complete = True
+
+    def get_type(self):
+        return self._type
+
+    def set_type(self, element_type):
+        self._type = element_type
+
+    def get_name(self):
+        return self._name
+
+    def set_name(self, name):
+        self._name = name
+
+    def set_nil(self):
+        self._nil = True
+
+    def add_text(self, text):
+        self._text.append(text)
+
+    def is_complete(self):
+        return self._complete
+
+    def set_incomplete(self):
+        self._complete = False
+
+    def get_values(self):
+        return self._values
+
+    def get_child_types(self):
+        return self._children.keys()
+
+    def get_children(self, child_type):
+        if child_type in self._children:
+            return self._children[child_type]
+        return []
+
+    def get_all_children(self):
+        return list(self._child_elements)
+
+    def add_child(self, child):
+        if child.get_type() not in self._children:
+            self._children[child.get_type()] = []
+        self._children[child.get_type()].append(child)
+        self._child_elements.append(child)
+
+    def end_element(self, element):
+        """
+        Add a completed element to this element, as an attribute value or as a child MBean.
+        An empty element without a name may be either, so it is added as both.
+        :param element: the completed element
+        """
+        if len(element._child_elements) > 0 or element.get_name() is not None:
+            self.add_child(element)
+            return
+
+        value = None
+        if not element._nil:
+            value = ''.join(element._text).strip()
+        if element.get_type() == _NAME and self._name is None:
+            self._name = value
+
+        # repeated elements are the values of a list attribute
+        if element.get_type() in self._values and self._values[element.get_type()] is not None:
+            if value is not None:
+                value = self._values[element.get_type()] + ',' + value
+            else:
+                value = self._values[element.get_type()]
+        self._values[element.get_type()] = value
+
+        if value == '':
+            self.add_child(element)
+
+    def find_child(self, child_type, name):
+        """
+        Find the child element of the type with the WLST name.  If there is a single child of the type
+        without a name, it is the child with the name that WLST assigned.
+        :param child_type: the normalized child type
+        :param name: the WLST name of the child
+        :return: the child element, or None if it is not found
+        """
+        children = self.get_children(child_type)
+        for child in children:
+            if child.get_name() == name:
+                return child
+        if len(children) == 1 and children[0].get_name() is None:
+            return children[0]
+        return None
+
+
+def _split_path(wlst_path):
+    segments = []
+    for segment in wlst_path.split('/'):
+        if len(segment) > 0:
+            segments.append(segment)
+    return segments
+
+
+def _parse_file(file_name, is_descriptor):
+    """
+    Parse the configuration file with a streaming parser.
+    :param file_name: the name of the file
+    :param is_descriptor: True if the file is a module descriptor, with entity names in name attributes
+    :return: the root element
+    :raises IOException: if the file cannot be read
+    :raises XMLStreamException: if the file cannot be parsed
+    """
+    factory = XMLInputFactory.newInstance()
+    factory.setProperty(XMLInputFactory.SUPPORT_DTD, Boolean.FALSE)
+    factory.setProperty(XMLInputFactory.IS_SUPPORTING_EXTERNAL_ENTITIES, Boolean.FALSE)
+
+    root = None
+    input_stream = FileInputStream(file_name)
+    try:
+        reader = factory.createXMLStreamReader(input_stream)
+        try:
+            stack = []
+            while reader.hasNext():
+                event = reader.next()
+                if event == XMLStreamConstants.START_ELEMENT:
+                    element = _ConfigElement(reader.getLocalName())
+                    for index in range(reader.getAttributeCount()):
+                        attribute_name = reader.getAttributeLocalName(index)
+                        if attribute_name == _NAME and is_descriptor:
+                            element.set_name(reader.getAttributeValue(index))
+                        elif attribute_name == 'nil' and reader.getAttributeNamespace(index) == _XSI_NAMESPACE \
+                                and reader.getAttributeValue(index) == 'true':
+                            element.set_nil()
+                    stack.append(element)
+                elif event == XMLStreamConstants.CHARACTERS or event == XMLStreamConstants.CDATA:
+                    if len(stack) > 0:
+                        stack[-1].add_text(reader.getText())
+                elif event == XMLStreamConstants.END_ELEMENT:
+                    element = stack.pop()
+                    if len(stack) > 0:
+                        stack[-1].end_element(element)
+                    else:
+                        root = element
+        finally:
+            reader.close()
+    finally:
+        input_stream.close()
+    if root is None:
+        raise XMLStreamException('No root element in ' + file_name)
+    return root
@@ -95,7 +95,7 @@ class CustomFolderHelper(object):
         :return: model ready dictionary of the discovered MBean
         """
         _method_name = 'get_model_attribute_map'
-        _logger.entering(str(attribute_helper), class_name=_class_name, method_name=_method_name)
+        _logger.entering(attribute_helper, class_name=_class_name, method_name=_method_name)
         mbean_attributes = PyOrderedDict()
         for attribute_name in attribute_helper.get_mbean_attributes():
             model_value = self.get_model_attribute_value(attribute_helper, attribute_name)
@@ -128,7 +128,7 @@ class CustomFolderHelper(object):
                 if model_type == alias_constants.PASSWORD:
                     print_orig = alias_constants.MASKED
                     print_conv = print_orig
-                _logger.finer('WLSDPLY-06770', mbean_string, attribute_name, model_type, str(print_conv),
+                _logger.finer('WLSDPLY-06770', mbean_string, attribute_name, model_type, print_conv,
                               class_name=_class_name, method_name=_method_name)
                 default_value = self.__get_default_value(attribute_helper, attribute_name)
                 if not is_empty(model_value):
@@ -198,7 +198,7 @@ class CustomFolderHelper(object):
                 _logger.fine('WLSDPLY-06768', value_type, converted_type,
                              class_name=_class_name, method_name=_method_name)
         except Exception, e:
-            _logger.fine('WLSDPLY-06769', value_type, converted_type, str(e),
+            _logger.fine('WLSDPLY-06769', value_type, converted_type, e,
                          class_name=_class_name, method_name=_method_name)
         return converted_type, converted
 
@@ -286,7 +286,7 @@ class CustomFolderHelper(object):
     def __offline_default(self, model_value, model_type, default_value):
         _method_name = '__offline_default'
         if self._model_context.is_wlst_offline() and is_empty(model_value) and not is_empty(default_value):
-            _logger.fine('WLSDPLY-06775', model_type, str(model_value), str(default_value),
+            _logger.fine('WLSDPLY-06775', model_type, model_value, default_value,
                          class_name=_class_name, method_name=_method_name)
             return True
         return False
@@ -295,7 +295,7 @@ class CustomFolderHelper(object):
         _method_name = '__offline_default_numeric'
         if self._model_context.is_wlst_offline() and \
                 (model_value is None or model_value == 0) and default_value != 0:
-            _logger.fine('WLSDPLY-06775', model_type, str(model_value), str(default_value),
+            _logger.fine('WLSDPLY-06775', model_type, model_value, default_value,
                          class_name=_class_name, method_name=_method_name)
             return True
         return False
@@ -19,11 +19,18 @@ from wlsdeploy.aliases.location_context import LocationContext
 from wlsdeploy.aliases.wlst_modes import WlstModes
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.exception.expection_types import ExceptionType
+from wlsdeploy.logging.platform_logger import LazyArg
 from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.discover import config_xml_reader
+from wlsdeploy.tool.discover import mbean_attribute_reader
+from wlsdeploy.tool.discover.config_xml_reader import ConfigXmlReader
 from wlsdeploy.tool.discover.custom_folder_helper import CustomFolderHelper
+from wlsdeploy.tool.discover.mbean_attribute_reader import MBeanAttributeReader
 from wlsdeploy.tool.util.alias_helper import AliasHelper
 from wlsdeploy.tool.util.mbean_utils import MBeanUtils
 from wlsdeploy.tool.util.mbean_utils import get_interface_name
+from wlsdeploy.tool.util import variable_injector
+from wlsdeploy.tool.util import wlst_helper
 from wlsdeploy.tool.util.variable_injector import STANDARD_PASSWORD_INJECTOR
 from wlsdeploy.tool.util.wlst_helper import WlstHelper
 from wlsdeploy.util import path_utils
@@ -35,6 +42,15 @@ _DISCOVER_LOGGER_NAME = 'wlsdeploy.discover'
 _class_name = 'Discoverer'
 _logger = PlatformLogger(_DISCOVER_LOGGER_NAME)
 
+# the pool of separate WLST sessions used to discover named MBean instances concurrently in online mode
+_session_pool = None
+
+# the attribute values read in bulk from the MBean server in online mode, shared by all the discoverers
+_attribute_reader = None
+
+# the domain configuration read from config.xml in offline mode, shared by all the discoverers
+_config_xml_reader = None
+
 
 class Discoverer(object):
     """
@@ -63,6 +79,12 @@ class Discoverer(object):
         self._wlst_helper = WlstHelper(ExceptionType.DISCOVER)
         self._mbean_utils = MBeanUtils(self._model_context, self._alias_helper, ExceptionType.DISCOVER)
         self._wls_version = self._weblogic_helper.get_actual_weblogic_version()
+        self._attribute_reader = None
+        self._config_xml_reader = None
+        if self._wlst_mode == WlstModes.ONLINE:
+            self._attribute_reader = _get_attribute_reader()
+        else:
+            self._config_xml_reader = _get_config_xml_reader(self._model_context)
 
     def discover_domain_mbean(self, model_top_folder_name):
         """
@@ -100,16 +122,21 @@ class Discoverer(object):
         if not self.wlst_cd(wlst_path, location):
             return
 
+        if self._populate_model_parameters_from_config_xml(dictionary, location, wlst_path):
+            return
+
         wlst_lsa_params = self._get_attributes_for_current_location(location)
         _logger.finest('WLSDPLY-06102', self._wlst_helper.get_pwd(), wlst_lsa_params, class_name=_class_name,
                        method_name=_method_name)
         wlst_get_params = self._get_required_attributes(location)
-        _logger.finest('WLSDPLY-06103', str(location), wlst_get_params,
+        _logger.finest('WLSDPLY-06103', location, wlst_get_params,
                        class_name=_class_name, method_name=_method_name)
+        wlst_get_values = self._get_bulk_attribute_values(wlst_get_params)
         if wlst_lsa_params is not None:
             for wlst_lsa_param in wlst_lsa_params:
                 if wlst_lsa_param in wlst_get_params:
-                    success, wlst_value = self._get_attribute_value_with_get(wlst_lsa_param, wlst_path)
+                    success, wlst_value = self._get_attribute_value_with_get(wlst_lsa_param, wlst_path,
+                                                                             wlst_get_values)
                     if not success:
                         continue
                 else:
@@ -118,13 +145,14 @@ class Discoverer(object):
                 self._add_to_dictionary(dictionary, location, wlst_lsa_param, wlst_value, wlst_path)
 
         # These will come after the lsa / get params in the ordered dictionary
-        wlst_extra_params = self._get_additional_parameters(location)
-        _logger.finest('WLSDPLY-06149', str(location), wlst_extra_params,
+        wlst_extra_params = self._get_additional_parameters(location, wlst_lsa_params)
+        _logger.finest('WLSDPLY-06149', location, wlst_extra_params,
                        class_name=_class_name, method_name=_method_name)
         if wlst_extra_params is not None:
             for wlst_extra_param in wlst_extra_params:
                 if wlst_extra_param in wlst_get_params:
-                    success, wlst_value = self._get_attribute_value_with_get(wlst_extra_param, wlst_path)
+                    success, wlst_value = self._get_attribute_value_with_get(wlst_extra_param, wlst_path,
+                                                                             wlst_get_values)
                     if success:
                         self._add_to_dictionary(dictionary, location, wlst_extra_param, wlst_value, wlst_path)
                     else:
@@ -137,8 +165,69 @@ class Discoverer(object):
                     _logger.info('WLSDPLY-06153', wlst_extra_param, location.get_folder_path(),
                                  class_name=_class_name, method_name=_method_name)
 
-    def _get_attribute_value_with_get(self, wlst_get_param, wlst_path):
+    def _populate_model_parameters_from_config_xml(self, dictionary, location, wlst_path):
+        """
+        In offline mode, populate the model dictionary with the attribute values in config.xml for the current
+        location, instead of using lsa.  Attributes that are not in config.xml have their default values, and
+        are not added to the model.  Attributes that require get are only read with WLST if they are in config.xml.
+        :param dictionary: where to store the discovered attributes
+        :param location: context containing current location information
+        :param wlst_path: the WLST attributes path of the current location
+        :return: True if the dictionary was populated, False if the location is not in config.xml
+        """
+        _method_name = '_populate_model_parameters_from_config_xml'
+        if self._config_xml_reader is None:
+            return False
+        config_values = self._config_xml_reader.get_attribute_values(wlst_path)
+        if config_values is None:
+            return False
+
+        try:
+            wlst_attributes = self._get_wlst_attributes(location)
+        except DiscoverException, de:
+            _logger.fine('WLSDPLY-06162', location.get_folder_path(), de.getLocalizedMessage(),
+                         class_name=_class_name, method_name=_method_name)
+            return False
+
+        wlst_values = dict()
+        for wlst_name in wlst_attributes:
+            config_name = config_xml_reader.normalize(wlst_name)
+            if config_name in config_values:
+                wlst_values[wlst_name] = config_values[config_name]
+        _logger.finest('WLSDPLY-06161', wlst_path, wlst_values, class_name=_class_name, method_name=_method_name)
+
+        wlst_get_params = self._get_required_attributes(location)
+        wlst_names = wlst_values.keys()
+        wlst_names.sort()
+        for wlst_name in wlst_names:
+            if wlst_name in wlst_get_params:
+                success, wlst_value = self._get_attribute_value_with_get(wlst_name, wlst_path)
+                if not success:
+                    continue
+            else:
+                wlst_value = wlst_values[wlst_name]
+            self._add_to_dictionary(dictionary, location, wlst_name, wlst_value, wlst_path)
+        return True
+
+    def _get_bulk_attribute_values(self, wlst_get_params):
+        """
+        In online mode, read the values of the attributes that require get at the current location
+        from the MBean server in bulk, instead of using a WLST get for each attribute.
+        :param wlst_get_params: the WLST names of the attributes that require get
+        :return: dictionary of the values that were read, keyed by WLST name, may be empty
+        """
+        values = None
+        if self._attribute_reader is not None:
+            values = self._attribute_reader.get_attribute_values(wlst_get_params)
+        if values is None:
+            values = dict()
+        return values
+
+    def _get_attribute_value_with_get(self, wlst_get_param, wlst_path, wlst_get_values=None):
         _method_name = '_get_attribute_value_with_get'
+        if wlst_get_values is not None and wlst_get_param in wlst_get_values:
+            return True, wlst_get_values[wlst_get_param]
+
         _logger.finest('WLSDPLY-06104', wlst_get_param, class_name=_class_name, method_name=_method_name)
         success = False
         wlst_value = None
@@ -187,7 +276,7 @@ class Discoverer(object):
             attributes = self._wlst_helper.lsa(path)
         except DiscoverException, de:
             name = location.get_model_folders()[-1]
-            _logger.fine('WLSDPLY-06109', name, str(location), de.getLocalizedMessage(), class_name=_class_name,
+            _logger.fine('WLSDPLY-06109', name, location, de.getLocalizedMessage(), class_name=_class_name,
                          method_name=_method_name)
         return attributes
 
@@ -216,11 +305,14 @@ class Discoverer(object):
                             class_name=_class_name, method_name=_method_name)
         return attributes
 
-    def _get_additional_parameters(self, location):
+    def _get_additional_parameters(self, location, lsa_map=None):
         _method_name = '_get_additional_parameters'
         other_attributes = list()
+        if not lsa_map:
+            # an empty map may indicate that lsa failed, so let the utility try again
+            lsa_map = None
         try:
-            other_attributes = self._mbean_utils.get_attributes_not_in_lsa_map(location)
+            other_attributes = self._mbean_utils.get_attributes_not_in_lsa_map(location, lsa_map)
         except DiscoverException, de:
             name = 'DomainConfig'
             folders = location.get_model_folders()
@@ -237,6 +329,11 @@ class Discoverer(object):
         :return: True if MBeans of the type at the location exist
         """
         path = self._alias_helper.get_wlst_list_path(location)
+        if self._config_xml_reader is not None:
+            names_exist = self._config_xml_reader.has_names(path)
+            if names_exist is not None:
+                return names_exist
+
         mbean_name_map = None
         try:
             mbean_name_map = self._wlst_helper.lsc(path)
@@ -280,7 +377,11 @@ class Discoverer(object):
         else:
             folder_path = self._alias_helper.get_wlst_list_path(location)
             _logger.finest('WLSDPLY-06111', folder_path, class_name=_class_name, method_name=_method_name)
-            if self._wlst_helper.path_exists(folder_path):
+            if self._config_xml_reader is not None:
+                names = self._config_xml_reader.get_names(folder_path)
+            if names is not None:
+                _logger.finest('WLSDPLY-06146', names, location, class_name=_class_name, method_name=_method_name)
+            elif self._wlst_helper.path_exists(folder_path):
                 self.wlst_cd(folder_path, location)
                 names = self._wlst_helper.lsc()
                 _logger.finest('WLSDPLY-06146', names, location, class_name=_class_name, method_name=_method_name)
@@ -320,6 +421,10 @@ class Discoverer(object):
         :return: list of subfolders
         """
         wlst_path = self._alias_helper.get_wlst_subfolders_path(location)
+        config_subfolders = self._find_subfolders_in_config_xml(location, wlst_path)
+        if config_subfolders is not None:
+            return config_subfolders
+
         wlst_subfolders = []
         if self.wlst_cd(wlst_path, location):
             wlst_subfolders = self._wlst_helper.lsc()
@@ -332,6 +437,38 @@ class Discoverer(object):
                 wlst_subfolders = new_subfolders
         return wlst_subfolders
 
+    def _find_subfolders_in_config_xml(self, location, wlst_path):
+        """
+        In offline mode, find the subfolders of the current location in config.xml.
+        The WLST subfolder names are the WLST types in the aliases that match the config.xml elements.
+        :param location: context containing current location information
+        :param wlst_path: the WLST subfolders path of the current location
+        :return: list of WLST subfolder names, or None if the location is not in config.xml
+        """
+        _method_name = '_find_subfolders_in_config_xml'
+        if self._config_xml_reader is None:
+            return None
+        config_types = self._config_xml_reader.get_subfolder_types(wlst_path)
+        if config_types is None:
+            return None
+
+        wlst_subfolders = []
+        for model_subfolder_name in self._alias_helper.get_model_subfolder_names(location):
+            subfolder_location = LocationContext(location).append_location(model_subfolder_name)
+            try:
+                wlst_types = [self._alias_helper.get_wlst_mbean_type(subfolder_location)]
+                if self._alias_helper.is_flattened_folder(subfolder_location):
+                    wlst_types.append(self._alias_helper.get_wlst_flattened_mbean_type(subfolder_location))
+            except DiscoverException, de:
+                _logger.finest('WLSDPLY-06163', model_subfolder_name, location.get_folder_path(),
+                               de.getLocalizedMessage(), class_name=_class_name, method_name=_method_name)
+                continue
+            for wlst_type in wlst_types:
+                if wlst_type and config_xml_reader.normalize(wlst_type) in config_types and \
+                        wlst_type not in wlst_subfolders:
+                    wlst_subfolders.append(wlst_type)
+        return wlst_subfolders
+
     def _find_subfolders_online(self, location):
         wlst_path = self._alias_helper.get_wlst_subfolders_path(location)
         wlst_subfolders = []
@@ -356,7 +493,7 @@ class Discoverer(object):
         :return: model subfolder name: subfolder result dictionary:
         """
         _method_name = '_discover_subfolder_singleton'
-        _logger.entering(model_subfolder_name, str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(model_subfolder_name, location, class_name=_class_name, method_name=_method_name)
         subfolder_result = OrderedDict()
         # For all server subfolder names there should only be one path
         if self._mbean_names_exist(location):
@@ -364,7 +501,7 @@ class Discoverer(object):
             if self.wlst_cd(subfolder_path, location):
                 self._populate_model_parameters(subfolder_result, location)
                 self._discover_subfolders(subfolder_result, location)
-        _logger.finest('WLSDPLY-06111', str(location), class_name=_class_name, method_name=_method_name)
+        _logger.finest('WLSDPLY-06111', location, class_name=_class_name, method_name=_method_name)
         _logger.exiting(class_name=_class_name, method_name=_method_name)
         return subfolder_result
 
@@ -399,7 +536,7 @@ class Discoverer(object):
         :return: dictionary containing the discovered folder attributes
         """
         _method_name = '_discover_artifical_folder'
-        _logger.entering(model_subfolder_type, str(location), name_token, class_name=_class_name,
+        _logger.entering(model_subfolder_type, location, name_token, class_name=_class_name,
                          method_name=_method_name)
         subfolder_result = OrderedDict()
         names = self._find_names_in_folder(location)
@@ -440,25 +577,80 @@ class Discoverer(object):
         :return: model subfolder name: dictionary results:
         """
         _method_name = '_discover_subfolder_with_names'
-        _logger.entering(model_subfolder_name, str(location), name_token, class_name=_class_name,
+        _logger.entering(model_subfolder_name, location, name_token, class_name=_class_name,
                          method_name=_method_name)
         subfolder_result = OrderedDict()
         names = self._find_names_in_folder(location)
         if names is not None:
-            for name in names:
-                _logger.finer('WLSDPLY-06113', name, self._alias_helper.get_model_folder_path(location),
-                              class_name=_class_name, method_name=_method_name)
-                subfolder_result[name] = OrderedDict()
-                location.add_name_token(name_token, name)
-                subfolder_path = self._alias_helper.get_wlst_attributes_path(location)
-                if self.wlst_cd(subfolder_path, location):
-                    self._populate_model_parameters(subfolder_result[name], location)
-                    self._discover_subfolders(subfolder_result[name], location)
-                location.remove_name_token(name_token)
-        _logger.finest('WLSDPLY-06114', str(location), class_name=_class_name, method_name=_method_name)
+            subfolder_result = self._discover_named_instances(location, name_token, names, 'WLSDPLY-06113')
+        _logger.finest('WLSDPLY-06114', location, class_name=_class_name, method_name=_method_name)
         _logger.exiting(class_name=_class_name, method_name=_method_name)
         return subfolder_result
 
+    def _discover_named_instances(self, location, name_token, names, message_key, check_cd=True):
+        """
+        Discover the attributes and subfolders of each named MBean instance in the folder at the current location.
+        If a session pool is available, the instances are discovered concurrently, using a separate WLST
+        session for each instance.  The result is in the same order as the names, in either case.
+        The variables injected while the instances are discovered concurrently are added to the variable cache
+        in the same order as the names, so the variable file is the same as with a single session.
+        :param location: context of the current location, the name token is not changed
+        :param name_token: aliases token for the type of model folder name
+        :param names: the names of the MBean instances
+        :param message_key: the key of the message to log for each name, with the name and model folder path
+        :param check_cd: if True, the subfolders of an instance are not discovered if its folder cannot be reached
+        :return: dictionary containing a dictionary of discovered attributes and subfolders for each name
+        """
+        _method_name = '_discover_named_instances'
+
+        if _session_pool is None or len(names) < 2 or wlst_helper.is_thread_bound():
+            instance_results = []
+            for name in names:
+                instance_results.append(self._discover_named_instance(location, name_token, name, message_key,
+                                                                      check_cd))
+        else:
+            _logger.fine('WLSDPLY-06157', len(names), LazyArg(self._alias_helper.get_model_folder_path, location),
+                         _session_pool.get_size(), class_name=_class_name, method_name=_method_name)
+            tasks = []
+            for name in names:
+                tasks.append(_NamedInstanceTask(self, location, name_token, name, message_key, check_cd))
+            instance_results = []
+            for instance_result, instance_variables in _session_pool.run_all(tasks):
+                instance_results.append(instance_result)
+                if self._variable_injector is not None and len(instance_variables) > 0:
+                    self._variable_injector.add_to_cache(dictionary=instance_variables)
+
+        result = OrderedDict()
+        for index in range(len(names)):
+            result[names[index]] = instance_results[index]
+        return result
+
+    def _discover_named_instance(self, location, name_token, name, message_key, check_cd=True):
+        """
+        Discover the attributes and subfolders of a single named MBean instance.
+        A copy of the location is used, so that instances can be discovered concurrently.
+        :param location: context of the current location, without the name token
+        :param name_token: aliases token for the type of model folder name
+        :param name: the name of the MBean instance
+        :param message_key: the key of the message to log, with the name and model folder path
+        :param check_cd: if True, the subfolders are not discovered if the instance folder cannot be reached
+        :return: dictionary containing the discovered attributes and subfolders
+        """
+        _method_name = '_discover_named_instance'
+
+        instance_location = LocationContext(location)
+        instance_location.add_name_token(name_token, name)
+        _logger.finer(message_key, name, self._alias_helper.get_model_folder_path(location),
+                      class_name=_class_name, method_name=_method_name)
+        result = OrderedDict()
+        if check_cd:
+            subfolder_path = self._alias_helper.get_wlst_attributes_path(instance_location)
+            if not self.wlst_cd(subfolder_path, instance_location):
+                return result
+        self._populate_model_parameters(result, instance_location)
+        self._discover_subfolders(result, instance_location)
+        return result
+
     def _discover_subfolder(self, model_subfolder_name, location, result=None):
         """
         Discover the subfolder indicated by the model subfolder name. Append the model subfolder to the
@@ -503,7 +695,7 @@ class Discoverer(object):
         :return: populated dictionary
         """
         _method_name = '_discover_subfolders'
-        _logger.entering(str(location), method_name=_method_name, class_name=_class_name)
+        _logger.entering(location, method_name=_method_name, class_name=_class_name)
         wlst_subfolders = self._find_subfolders(location)
         if wlst_subfolders is not None:
             for wlst_subfolder in wlst_subfolders:
@@ -511,7 +703,7 @@ class Discoverer(object):
                 # will return a None if subfolder not in current wls version
                 if model_subfolder_name is not None:
                     result = self._discover_subfolder(model_subfolder_name, location, result)
-        _logger.finest('WLSDPLY-06114', str(location), class_name=_class_name, method_name=_method_name)
+        _logger.finest('WLSDPLY-06114', location, class_name=_class_name, method_name=_method_name)
         _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
         return result
 
@@ -524,7 +716,7 @@ class Discoverer(object):
         :return: folder result dictionary:
         """
         _method_name = '_discover_single_folder'
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         result = OrderedDict()
         subfolder_path = self._alias_helper.get_wlst_attributes_path(location)
         if self.wlst_cd(subfolder_path, location):
@@ -624,7 +816,7 @@ class Discoverer(object):
         :return: short artificial name for the model
         """
         _method_name = '_get_artificial_type'
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         mbean_name = None
         subfolder_path = self._alias_helper.get_wlst_attributes_path(location)
         if subfolder_path:
@@ -655,7 +847,7 @@ class Discoverer(object):
                     _logger.fine('WLSDPLY-06122', interface_name, ae.getLocalizedMessage(), class_name=_class_name,
                                  method_name=_method_name)
                 if mbean_name is None:
-                    _logger.fine('WLSDPLY-06125', interface_name, str(location), class_name=_class_name,
+                    _logger.fine('WLSDPLY-06125', interface_name, location, class_name=_class_name,
                                  method_name=_method_name)
                 break
         return mbean_name
@@ -774,6 +966,39 @@ class Discoverer(object):
 
         return True, url, path
 
+
+def _get_attribute_reader():
+    """
+    Get the reader for attribute values of online MBeans that is shared by all the discoverers.
+    :return: the MBeanAttributeReader, or None if bulk reads are disabled
+    """
+    global _attribute_reader
+    if _attribute_reader is None and mbean_attribute_reader.is_enabled():
+        _attribute_reader = MBeanAttributeReader(ExceptionType.DISCOVER)
+    return _attribute_reader
+
+
+def _get_config_xml_reader(model_context):
+    """
+    Get the reader for the domain configuration in config.xml that is shared by all the discoverers.
+    :param model_context: the model context, with the domain home
+    :return: the ConfigXmlReader, or None if offline discovery does not read config.xml
+    """
+    global _config_xml_reader
+    if _config_xml_reader is None and config_xml_reader.is_enabled():
+        _config_xml_reader = ConfigXmlReader(model_context.get_domain_home())
+    return _config_xml_reader
+
+
+def set_session_pool(session_pool):
+    """
+    Set the pool of separate WLST sessions used to discover named MBean instances concurrently.
+    :param session_pool: the WlstSessionPool, or None to discover all the instances with the tool's WLST session
+    """
+    global _session_pool
+    _session_pool = session_pool
+
+
 def add_to_model_if_not_empty(dictionary, entry_name, entry_value):
     """
     Helper method for discover to add a non-empty value to the dictionary with the provided entry-name
@@ -811,3 +1036,30 @@ def get_discover_logger_name():
     :return: logger name
     """
     return _DISCOVER_LOGGER_NAME
+
+
+class _NamedInstanceTask(object):
+    """
+    A task that discovers a single named MBean instance, for the session pool.
+    """
+
+    def __init__(self, discoverer, location, name_token, name, message_key, check_cd):
+        self._discoverer = discoverer
+        self._location = LocationContext(location)
+        self._name_token = name_token
+        self._name = name
+        self._message_key = message_key
+        self._check_cd = check_cd
+
+    def __call__(self):
+        """
+        Discover the instance, keeping the injected variables apart from the shared variable cache.
+        :return: a tuple of the discovered dictionary and the variables injected for the instance
+        """
+        variable_injector.begin_thread_variable_cache()
+        try:
+            result = self._discoverer._discover_named_instance(self._location, self._name_token, self._name,
+                                                               self._message_key, self._check_cd)
+        finally:
+            instance_variables = variable_injector.end_thread_variable_cache()
+        return result, instance_variables
@@ -236,7 +236,7 @@ class JmsResourcesDiscoverer(Discoverer):
         :return: model folder name: dictionary containing the discovered foreign servers for the JMS resource
         """
         _method_name = 'get_foreign_servers'
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         result = OrderedDict()
         model_top_folder_name = model_constants.FOREIGN_SERVER
         location.append_location(model_top_folder_name)
@@ -275,7 +275,7 @@ class JmsResourcesDiscoverer(Discoverer):
         :return: model folder name: dictionary containing the discovered JMS template
         """
         _method_name = 'get_jms_templates'
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         result = OrderedDict()
         model_top_folder_name = model_constants.TEMPLATE
         location.append_location(model_top_folder_name)
@@ -315,7 +315,7 @@ class JmsResourcesDiscoverer(Discoverer):
         :return: model folder name: dictionary containing the discovered group params
         """
         _method_name = 'get_group_params'
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         model_subfolder_name = model_constants.GROUP_PARAMS
         subfolder_result = OrderedDict()
         location.append_location(model_subfolder_name)
@@ -359,7 +359,7 @@ class JmsResourcesDiscoverer(Discoverer):
         :return: model name for the properties: dictionary containing the discovered foreign server properties
         """
         _method_name = 'get_foreign_server_properties'
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         model_subfolder_name = model_constants.JNDI_PROPERTY
         subfolder_result = OrderedDict()
         location.append_location(model_subfolder_name)
@@ -0,0 +1,186 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Read the attribute values of online configuration MBeans directly from the MBean server, in bulk.
+
+When the values of an MBean are first requested, the values of every MBean of the same type are read,
+using one getAttributes request per MBean, and kept until discovery is complete.  The values are the
+same objects that WLST get returns, so they are converted to the model by the usual alias methods.
+The reader is shared by the tasks that discover MBean instances concurrently, so it reads and loads
+the values while holding a lock.
+"""
+import os
+
+from jarray import array
+from java.lang import Exception as JException
+from java.lang import String
+from java.util.concurrent.locks import ReentrantLock
+from javax.management import ObjectName
+
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.util.wlst_helper import WlstHelper
+
+BULK_ATTRIBUTES_VARIABLE = 'WDT_DISCOVER_BULK_ATTRIBUTES'
+
+_class_name = 'MBeanAttributeReader'
+_logger = PlatformLogger('wlsdeploy.discover')
+
+
+def is_enabled():
+    """
+    Determine if the attribute values of online MBeans should be read in bulk.
+    This is the default, unless the environment variable is set to false.
+    :return: True if the values should be read in bulk, False otherwise
+    """
+    value = os.environ.get(BULK_ATTRIBUTES_VARIABLE, None)
+    return value is None or value.strip().lower() != 'false'
+
+
+class MBeanAttributeReader(object):
+    """
+    Read and hold the attribute values of online MBeans, by MBean type.
+    If the MBean information or the MBeans of a type cannot be read from the MBean server, the values of that type
+    are not available, and the caller should use WLST get.  If the values of one MBean cannot be read, the caller
+    should use WLST get for that MBean.
+    """
+
+    def __init__(self, exception_type):
+        self._wlst_helper = WlstHelper(exception_type)
+        # readable attribute names for each MBean type, from the MBeanInfo
+        self._readable_names = dict()
+        # the MBean types and attribute names that were read, and the types that cannot be read
+        self._loaded_types = dict()
+        self._failed_types = dict()
+        # attribute values for each object name, and the attribute names that were requested
+        self._values = dict()
+        self._requested_names = dict()
+        self._lock = ReentrantLock()
+
+    def get_attribute_values(self, attribute_names):
+        """
+        Get the values of the attributes of the MBean at the current WLST location.
+        Attributes that are not readable from the MBean server are not in the result.
+        :param attribute_names: the WLST names of the attributes
+        :return: a dictionary of the values keyed by attribute name, or None if the values cannot be read
+        """
+        if attribute_names is None or len(attribute_names) == 0:
+            return None
+
+        object_name = self.__get_current_object_name()
+        if object_name is None:
+            return None
+
+        mbean_type = object_name.getKeyProperty('Type')
+        if mbean_type is None:
+            return None
+
+        self._lock.lock()
+        try:
+            return self.__get_attribute_values(object_name, mbean_type, attribute_names)
+        finally:
+            self._lock.unlock()
+
+    def __get_attribute_values(self, object_name, mbean_type, attribute_names):
+        """
+        Get the values of the attributes of the MBean, reading them first if required.  The caller holds the lock.
+        """
+        _method_name = 'get_attribute_values'
+        if mbean_type in self._failed_types:
+            return None
+
+        try:
+            connection = self._wlst_helper.get_mbean_server_connection()
+            names = self.__get_readable_names(connection, object_name, mbean_type, attribute_names)
+            if len(names) == 0:
+                return dict()
+            load_key = (object_name.getDomain(), mbean_type, tuple(names))
+            if load_key not in self._loaded_types:
+                self.__load_type(connection, object_name.getDomain(), mbean_type, names)
+                self._loaded_types[load_key] = True
+        except (Exception, JException), e:
+            _logger.fine('WLSDPLY-06158', mbean_type, e, class_name=_class_name, method_name=_method_name)
+            self._failed_types[mbean_type] = True
+            return None
+
+        key = object_name.getCanonicalName()
+        if key not in self._values or not self.__has_all(self._requested_names[key], names):
+            # created after the type was read, not returned by the query, or not read with the type
+            try:
+                self.__load_mbean(connection, object_name, names)
+            except (Exception, JException), e:
+                _logger.fine('WLSDPLY-06167', key, e, class_name=_class_name, method_name=_method_name)
+                return None
+
+        mbean_values = self._values[key]
+        result = dict()
+        for name in names:
+            if name in mbean_values:
+                result[name] = mbean_values[name]
+        return result
+
+    def __get_current_object_name(self):
+        _method_name = '__get_current_object_name'
+        object_name = None
+        try:
+            cmo = self._wlst_helper.get_cmo()
+            if cmo is not None:
+                object_name = cmo.getObjectName()
+        except (Exception, JException), e:
+            _logger.finest('WLSDPLY-06159', self._wlst_helper.get_pwd(), e,
+                           class_name=_class_name, method_name=_method_name)
+        if object_name is not None and not isinstance(object_name, ObjectName):
+            object_name = None
+        return object_name
+
+    def __get_readable_names(self, connection, object_name, mbean_type, attribute_names):
+        if mbean_type not in self._readable_names:
+            readable = dict()
+            for attribute_info in connection.getMBeanInfo(object_name).getAttributes():
+                if attribute_info.isReadable():
+                    readable[attribute_info.getName()] = True
+            self._readable_names[mbean_type] = readable
+
+        readable = self._readable_names[mbean_type]
+        names = []
+        for attribute_name in attribute_names:
+            if attribute_name in readable:
+                names.append(attribute_name)
+        return names
+
+    def __load_type(self, connection, domain, mbean_type, names):
+        _method_name = '__load_type'
+        object_names = connection.queryNames(ObjectName(domain + ':Type=' + mbean_type + ',*'), None)
+        _logger.finer('WLSDPLY-06160', len(names), object_names.size(), mbean_type,
+                      class_name=_class_name, method_name=_method_name)
+        for object_name in object_names.toArray():
+            try:
+                self.__load_mbean(connection, object_name, names)
+            except (Exception, JException), e:
+                # the MBean is read again if its values are requested
+                _logger.fine('WLSDPLY-06167', object_name.getCanonicalName(), e,
+                             class_name=_class_name, method_name=_method_name)
+
+    def __load_mbean(self, connection, object_name, names):
+        """
+        Read the attribute values of one MBean.  The names are recorded as requested only after the values are read.
+        """
+        attribute_list = connection.getAttributes(object_name, array(names, String))
+
+        key = object_name.getCanonicalName()
+        if key not in self._values:
+            self._values[key] = dict()
+            self._requested_names[key] = dict()
+        mbean_values = self._values[key]
+        requested_names = self._requested_names[key]
+        for index in range(attribute_list.size()):
+            attribute = attribute_list.get(index)
+            mbean_values[attribute.getName()] = attribute.getValue()
+        for name in names:
+            requested_names[name] = True
+
+    def __has_all(self, requested_names, names):
+        for name in names:
+            if name not in requested_names:
+                return False
+        return True
@@ -121,11 +121,7 @@ class TopologyDiscoverer(Discoverer):
             name_token = self._alias_helper.get_name_token(location)
             for cluster in clusters:
                 _logger.info('WLSDPLY-06602', cluster, class_name=_class_name, method_name=_method_name)
-                location.add_name_token(name_token, cluster)
-                result[cluster] = OrderedDict()
-                self._populate_model_parameters(result[cluster], location)
-                self._discover_subfolders(result[cluster], location)
-                location.remove_name_token(name_token)
+            result = self._discover_named_instances(location, name_token, clusters, 'WLSDPLY-06113', check_cd=False)
             location.pop_location()
 
         _logger.exiting(class_name=_class_name, method_name=_method_name, result=model_top_folder_name)
@@ -148,11 +144,7 @@ class TopologyDiscoverer(Discoverer):
             name_token = self._alias_helper.get_name_token(location)
             for server in servers:
                 _logger.info('WLSDPLY-06604', server, class_name=_class_name, method_name=_method_name)
-                location.add_name_token(name_token, server)
-                result[server] = OrderedDict()
-                self._populate_model_parameters(result[server], location)
-                self._discover_subfolders(result[server], location)
-                location.remove_name_token(name_token)
+            result = self._discover_named_instances(location, name_token, servers, 'WLSDPLY-06113', check_cd=False)
         _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
         return model_top_folder_name, result
 
@@ -575,7 +567,7 @@ class TopologyDiscoverer(Discoverer):
         :return: modified location and name for the model keystore file
         """
         _method_name = '_add_keystore_file_to_archive'
-        _logger.entering(model_name, str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(model_name, location, class_name=_class_name, method_name=_method_name)
         new_name = None
         if not string_utils.is_empty(model_value):
             _logger.finer('WLSDPLY-06641', location.get_folder_path(), model_value,
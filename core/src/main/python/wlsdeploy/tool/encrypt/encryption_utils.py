@@ -3,6 +3,7 @@ Copyright (c) 2017, 2020, Oracle Corporation and/or its affiliates.  All rights
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 from java.lang import String
+from java.util import ArrayList
 from oracle.weblogic.deploy.encrypt import EncryptionUtils
 
 from wlsdeploy.aliases.location_context import LocationContext
@@ -36,6 +37,11 @@ class _ModelEncrypter(object):
         self.model_changes = 0
         self.variable_changes = 0
 
+        # the values to be encrypted in one batch, after the model has been examined
+        self._model_values = []
+        self._variable_values = []
+        self._variable_names = dict()
+
     def encrypt_model_dictionary(self, model_dict):
         """
         Encrypt the model dictionary (and referenced variables, if provided) using the specified passphrase.
@@ -66,6 +72,7 @@ class _ModelEncrypter(object):
             location = LocationContext()
             self._encrypt_nodes(location, deployments_nodes, top_folder_names)
 
+        self._encrypt_values()
         return self.model_changes, self.variable_changes
 
     def _encrypt_info_nodes(self, info_nodes):
@@ -145,11 +152,7 @@ class _ModelEncrypter(object):
         variable_names = variable_helper.get_variable_names(value)
         if len(variable_names) == 0:
             if not EncryptionUtils.isEncryptedString(value):
-                encrypted_value = EncryptionUtils.encryptString(value, String(self.passphrase).toCharArray())
-                model_nodes[key] = encrypted_value
-                self._logger.fine('WLSDPLY-04103', folder_name, key,
-                                  class_name=self._class_name, method_name=_method_name)
-                self.model_changes += 1
+                self._model_values.append((folder_name, model_nodes, key))
             else:
                 self._logger.fine('WLSDPLY-04104', folder_name, key,
                                   class_name=self._class_name, method_name=_method_name)
@@ -179,20 +182,49 @@ class _ModelEncrypter(object):
             if len(var_value) > 0:
 
                 # don't encrypt an already encrypted variable. Matches logic in model
-                if EncryptionUtils.isEncryptedString(var_value):
+                if EncryptionUtils.isEncryptedString(var_value) or var_name in self._variable_names:
                     self._logger.fine('WLSDPLY-04109', folder_name, field_name, var_name)
                     return
 
-                encrypted_value = EncryptionUtils.encryptString(var_value, String(self.passphrase).toCharArray())
-                self.variables[var_name] = encrypted_value
-                self.variable_changes += 1
-                self._logger.fine('WLSDPLY-04106', folder_name, field_name, var_name,
-                                  class_name=self._class_name, method_name=_method_name)
+                self._variable_names[var_name] = True
+                self._variable_values.append((folder_name, field_name, var_name))
         else:
             ex = exception_helper.create_encryption_exception('WLSDPLY-04107', var_name, field_name, folder_name)
             self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
             raise ex
 
+    def _encrypt_values(self):
+        """
+        Encrypt the model and variable values that were collected, and replace them with the encrypted values.
+        The values are encrypted in one batch, so the encryption key is derived only once.
+        """
+        _method_name = '_encrypt_values'
+
+        clear_texts = ArrayList()
+        for folder_name, model_nodes, key in self._model_values:
+            clear_texts.add(model_nodes[key])
+        for folder_name, field_name, var_name in self._variable_values:
+            clear_texts.add(self.variables[var_name])
+        if clear_texts.isEmpty():
+            return
+
+        encrypted_values = EncryptionUtils.encryptStrings(clear_texts, String(self.passphrase).toCharArray())
+
+        index = 0
+        for folder_name, model_nodes, key in self._model_values:
+            model_nodes[key] = encrypted_values.get(index)
+            index += 1
+            self._logger.fine('WLSDPLY-04103', folder_name, key,
+                              class_name=self._class_name, method_name=_method_name)
+            self.model_changes += 1
+
+        for folder_name, field_name, var_name in self._variable_values:
+            self.variables[var_name] = encrypted_values.get(index)
+            index += 1
+            self.variable_changes += 1
+            self._logger.fine('WLSDPLY-04106', folder_name, field_name, var_name,
+                              class_name=self._class_name, method_name=_method_name)
+
 
 def encrypt_model_dictionary(passphrase, model_dict, alias_helper, variables):
     """
@@ -789,6 +789,14 @@ class AliasHelper(object):
             raise ex
         return result
 
+    def decrypt_passwords(self, texts):
+        """
+        Decrypt the specified passwords in one batch, if encryption is used, so that they are not decrypted again.
+        :param texts: the passwords to check and decrypt, if needed
+        :raises EncryptionException: if an error occurs while decrypting any of the passwords
+        """
+        self.__aliases.decrypt_passwords(texts)
+
     def get_ignore_attribute_names(self):
         """
         Return the list of ignored attribute names - the attributes for all MBeans that are not discovered or set.
@@ -232,10 +232,11 @@ class ArchiveHelper(object):
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name, result=result)
         return result
 
-    def get_file_hash(self, path):
+    def get_file_hash(self, path, digest_cache=None):
         """
         Get the Base64-encoded hash value for the file at the specified path within the archive.
         :param path: the path in the archive
+        :param digest_cache: an optional FileDigestCache, used to avoid reading entries that have not changed
         :return: the Base64-encoded hash value
         :raises: BundleAwareException of the appropriate type: if an error occurs
         """
@@ -244,7 +245,10 @@ class ArchiveHelper(object):
 
         try:
             archive_file = self._find_archive_for_path(path, True)
-            result = archive_file.getFileHash(path)
+            if digest_cache is not None:
+                result = digest_cache.getArchiveEntryHash(archive_file, path)
+            else:
+                result = archive_file.getFileHash(path)
         except (IllegalArgumentException, WLSDeployArchiveIOException), e:
             ex = exception_helper.create_exception(self.__exception_type, "WLSDPLY-19304", path,
                                                    self.__archive_files_text, e.getLocalizedMessage(), error=e)
@@ -16,6 +16,8 @@ from wlsdeploy.aliases.alias_jvmargs import JVMArguments
 from wlsdeploy.aliases.location_context import LocationContext
 from wlsdeploy.aliases.wlst_modes import WlstModes
 from wlsdeploy.exception import exception_helper
+from wlsdeploy.tool.util import mbean_directory
+from wlsdeploy.tool.util import wlst_helper
 from wlsdeploy.tool.util.alias_helper import AliasHelper
 from wlsdeploy.tool.util.wlst_helper import WlstHelper
 
@@ -910,7 +912,8 @@ class AttributeSetter(object):
         method_name = '__find_in_location'
 
         location = LocationContext(location).append_location(element_type)
-        if self.__alias_helper.get_wlst_mbean_type(location) is not None:
+        mbean_type = self.__alias_helper.get_wlst_mbean_type(location)
+        if mbean_type is not None:
             existing_names = self.__get_existing_object_list(location)
             if name in existing_names:
                 location_type, location_name = self.__alias_helper.get_model_type_and_name(location)
@@ -919,7 +922,15 @@ class AttributeSetter(object):
                 token = self.__alias_helper.get_name_token(location)
                 location.add_name_token(token, name)
                 path = self.__alias_helper.get_wlst_attributes_path(location)
-                return self.__wlst_helper.get_mbean_for_wlst_path(path)
+                directory = self.__get_mbean_directory()
+                if directory is None:
+                    return self.__wlst_helper.get_mbean_for_wlst_path(path)
+
+                mbean = directory.get_mbean(path)
+                if mbean is None:
+                    mbean = self.__wlst_helper.get_mbean_for_wlst_path(path)
+                    directory.put_mbean(path, mbean_type, mbean)
+                return mbean
 
         if required:
             ex = exception_helper.create_exception(self.__exception_type, 'WLSDPLY-19210', element_type, name,
@@ -936,7 +947,7 @@ class AttributeSetter(object):
         :return: the domain location
         """
         _method_name = '__get_domain_location'
-        self.__logger.entering(str(location), class_name=self._class_name, method_name=_method_name)
+        self.__logger.entering(location, class_name=self._class_name, method_name=_method_name)
 
         location = LocationContext(location)
         while len(location.get_model_folders()) > 0:
@@ -967,19 +978,36 @@ class AttributeSetter(object):
 
     def __get_existing_object_list(self, location):
         """
-        Convenience method to get the existing object list by location's list path
+        Convenience method to get the existing object list by location's list path.
+        The names are read from the MBean directory if they were already listed in this session.
         :param location: the location
         :return: the list of existing names
         :raises BundleAwareException of the specified type: if an error occurs
         """
         _method_name = '__get_existing_object_list'
 
-        self.__logger.entering(str(location), class_name=self._class_name, method_name=_method_name)
+        self.__logger.entering(location, class_name=self._class_name, method_name=_method_name)
         list_path = self.__alias_helper.get_wlst_list_path(location)
-        existing_names = self.__wlst_helper.get_existing_object_list(list_path)
+        directory = self.__get_mbean_directory()
+        existing_names = None
+        if directory is not None:
+            existing_names = directory.get_names(list_path)
+        if existing_names is None:
+            existing_names = self.__wlst_helper.get_existing_object_list(list_path)
+            if directory is not None:
+                directory.put_names(list_path, self.__alias_helper.get_wlst_mbean_type(location), existing_names)
         self.__logger.exiting(class_name=self._class_name, method_name=_method_name, result=existing_names)
         return existing_names
 
+    def __get_mbean_directory(self):
+        """
+        Get the directory of existing MBeans for the tool's WLST session.
+        :return: the MBean directory, or None if the current thread uses a separate WLST session
+        """
+        if wlst_helper.is_thread_bound():
+            return None
+        return mbean_directory.get_mbean_directory()
+
     #
     # methods for merging existing values
     #
@@ -993,7 +1021,7 @@ class AttributeSetter(object):
         :raises BundleAwareException of the specified type: if the WLDF Action/Notification is not found
         """
         _method_name = '__merge_existing_items'
-        self.__logger.entering(str(items), str(existing_value), class_name=self._class_name, method_name=_method_name)
+        self.__logger.entering(items, existing_value, class_name=self._class_name, method_name=_method_name)
 
         existing_items = TypeUtils.convertToType(List, existing_value)  # type: list of str
         no_existing_items = (existing_items is None) or (len(existing_items) == 0)
@@ -0,0 +1,102 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+A directory of the MBeans that exist in the current WLST session, used to resolve MBean references
+by name without listing the WLST folders again for every reference.
+"""
+
+
+class MBeanDirectory(object):
+    """
+    The existing MBean names for each WLST list path, and the MBeans found for WLST attribute paths.
+    Entries are recorded with their WLST MBean type, so creating an MBean only invalidates the entries
+    for that type.  Deleting an MBean, or ending the WLST session or edit session, clears the directory.
+    """
+
+    def __init__(self):
+        # list path -> (mbean type, list of existing names)
+        self._names = {}
+        # attributes path -> (mbean type, MBean)
+        self._mbeans = {}
+        self._hits = 0
+        self._misses = 0
+
+    def get_names(self, list_path):
+        """
+        Get the existing names at the list path.
+        :param list_path: the WLST list path
+        :return: the list of existing names, or None if the names at the path are not known
+        """
+        if list_path in self._names:
+            self._hits += 1
+            return self._names[list_path][1]
+        self._misses += 1
+        return None
+
+    def put_names(self, list_path, mbean_type, names):
+        """
+        Record the existing names at the list path.
+        :param list_path: the WLST list path
+        :param mbean_type: the WLST MBean type of the names
+        :param names: the list of existing names
+        """
+        if mbean_type is not None:
+            self._names[list_path] = (mbean_type, names)
+
+    def get_mbean(self, attributes_path):
+        """
+        Get the MBean for the attributes path.
+        :param attributes_path: the WLST attributes path of the MBean
+        :return: the MBean, or None if it is not known
+        """
+        if attributes_path in self._mbeans:
+            self._hits += 1
+            return self._mbeans[attributes_path][1]
+        self._misses += 1
+        return None
+
+    def put_mbean(self, attributes_path, mbean_type, mbean):
+        """
+        Record the MBean for the attributes path.
+        :param attributes_path: the WLST attributes path of the MBean
+        :param mbean_type: the WLST MBean type
+        :param mbean: the MBean
+        """
+        if mbean_type is not None and mbean is not None:
+            self._mbeans[attributes_path] = (mbean_type, mbean)
+
+    def invalidate_type(self, mbean_type):
+        """
+        Remove the names and MBeans of the specified MBean type, after an MBean of that type was created.
+        :param mbean_type: the WLST MBean type
+        """
+        for entries in [self._names, self._mbeans]:
+            for key in entries.keys():
+                if entries[key][0] == mbean_type:
+                    del entries[key]
+
+    def clear(self):
+        """
+        Remove all the names and MBeans.
+        """
+        self._names.clear()
+        self._mbeans.clear()
+
+    def get_statistics(self):
+        """
+        Get the directory statistics.
+        :return: a tuple of the number of lookups that were found, and the number that were not
+        """
+        return self._hits, self._misses
+
+
+_directory = MBeanDirectory()
+
+
+def get_mbean_directory():
+    """
+    Get the MBean directory for the tool's WLST session.
+    :return: the MBean directory
+    """
+    return _directory
@@ -18,6 +18,9 @@ from wlsdeploy.util.weblogic_helper import WebLogicHelper
 
 _logger = PlatformLogger('wlsdeploy.mbean.utils')
 
+# the consolidated MBeanInfo and Interface attribute names for each MBean interface, computed once per type
+_collapsed_attributes = dict()
+
 
 class MBeanUtils(object):
     """
@@ -106,6 +109,11 @@ class MBeanUtils(object):
     def __collapse_attributes(self, location):
         _method_name = '__filter_attributes'
         info_helper = self.__get_info_helper(location)
+        interface_name = info_helper.get_mbean_interface_name()
+        cache_key = (self.__model_context.get_target_wlst_mode(), interface_name)
+        if cache_key in _collapsed_attributes:
+            return list(_collapsed_attributes[cache_key])
+
         info_attributes = self.get_mbean_attributes(info_helper)
 
         interface_helper = self.__get_interface_helper(location)
@@ -121,6 +129,7 @@ class MBeanUtils(object):
         consolidated.extend(info_attributes)
         consolidated.extend(interface_attributes)
         _logger.finer('WLSDPLY-01787', consolidated, class_name=self.__class__.__name__, method_name=_method_name)
+        _collapsed_attributes[cache_key] = list(consolidated)
         return consolidated
 
     def __slim_list(self, attributes, attribute_helper, remove_readonly=False):
@@ -188,6 +197,8 @@ class MBeanUtils(object):
                             attributes = list()
                     except BundleAwareException:
                         pass
+        else:
+            attributes = lsa_map.keys()
         if attributes is None:
             ex = exception_helper.create_exception(self.__exception_type, 'WLSDPLY-01771', attribute_path)
             _logger.throwing(ex, class_name=self.__class__.__name__, method_name=_method_name)
@@ -8,6 +8,7 @@ import re
 
 import java.lang.Boolean as Boolean
 import java.lang.IllegalArgumentException as IllegalArgumentException
+from java.lang import ThreadLocal
 
 import oracle.weblogic.deploy.aliases.AliasException as AliasException
 import oracle.weblogic.deploy.json.JsonException as JsonException
@@ -56,6 +57,9 @@ VARIABLE_VALUE = 'variable_value'
 VARIABLE_SEP = '.'
 SUFFIX_SEP = '--'
 
+# variables added by a thread that discovers part of the model concurrently, kept apart from the shared cache
+_thread_variable_cache = ThreadLocal()
+
 MANAGED_SERVERS = 'MANAGED_SERVERS'
 ADMIN_SERVER = 'ADMIN_SERVER'
 
@@ -74,11 +78,34 @@ STANDARD_PASSWORD_INJECTOR = {
 _find_special_names_pattern = re.compile('[\[\]]')
 _fake_name_marker = 'fakename'
 _split_around_special_names = re.compile('([\w]+\[[\w\.,]+\])|\.')
+# injector regular expressions, compiled once for all the attributes they are applied to
+_compiled_patterns = dict()
 
 _class_name = 'variable_injector'
 _logger = PlatformLogger('wlsdeploy.tool.util')
 
 
+def begin_thread_variable_cache():
+    """
+    Add the variables from all the injections made by the current thread to a separate cache, instead of
+    the shared cache of the variable injector.  The caller adds the variables to the shared cache later,
+    so the variables from concurrent threads are added in a defined order.
+    """
+    _thread_variable_cache.set(OrderedDict())
+
+
+def end_thread_variable_cache():
+    """
+    Stop adding the variables from the injections made by the current thread to a separate cache.
+    :return: the variables that were added by the current thread since begin_thread_variable_cache()
+    """
+    result = _thread_variable_cache.get()
+    _thread_variable_cache.remove()
+    if result is None:
+        result = OrderedDict()
+    return result
+
+
 class VariableInjector(object):
 
     def __init__(self, program_name, model, model_context, version=None, variable_dictionary=None):
@@ -90,7 +117,12 @@ class VariableInjector(object):
         :param version: of model if model context is not provided
         """
         self.__program_name = program_name
-        self.__original = copy.deepcopy(model)
+        # the original is only returned if no variables are injected, share the parts of the model
+        # that are not changed instead of copying them
+        if isinstance(model, OrderedDict):
+            self.__original = model.sharedCopy()
+        else:
+            self.__original = copy.deepcopy(model)
         self.__model = model
         self.__model_context = model_context
         if self.__model_context:
@@ -129,7 +161,9 @@ class VariableInjector(object):
         :param token_name: single token name to insert into the cache
         :param token_value: value to insert into the cache with the provided token name
         """
-        cache = self.get_variable_cache()
+        cache = _thread_variable_cache.get()
+        if cache is None:
+            cache = self.get_variable_cache()
         if dictionary is not None and len(dictionary) > 0:
             cache.update(dictionary)
         if token_name is not None:
@@ -261,10 +295,21 @@ class VariableInjector(object):
         """
         _method_name = 'inject_variables_keyword_dictionary'
         _logger.entering(injector_file_list, class_name=_class_name, method_name=_method_name)
-        variable_dictionary = OrderedDict()
+        injector_files = []
+        injectors = []
         for filename in injector_file_list:
             injector_dictionary = _load_injector_file(self._replace_tokens(filename))
-            entries = self.inject_variables(injector_dictionary)
+            injector_files.append((filename, len(injector_dictionary)))
+            injectors.extend(injector_dictionary.items())
+
+        # all injector files are applied in a single pass of the model
+        injector_dicts = self.__inject_variables(injectors)
+
+        variable_dictionary = OrderedDict()
+        index = 0
+        for filename, injector_count in injector_files:
+            entries = _merge_variable_dicts(injector_dicts[index:index + injector_count])
+            index += injector_count
             if entries:
                 _logger.finer('WLSDPLY-19513', filename, class_name=_class_name, method_name=_method_name)
                 variable_dictionary.update(entries)
@@ -280,83 +325,162 @@ class VariableInjector(object):
         """
         variable_dict = OrderedDict()
         if injector_dictionary:
-            location = LocationContext()
-            domain_token = self.__aliases.get_name_token(location)
-            location.add_name_token(domain_token, _fake_name_marker)
-            for injector, injector_values in injector_dictionary.iteritems():
-                entries_dict = self.__inject_variable(location, injector, injector_values)
-                if len(entries_dict) > 0:
-                    variable_dict.update(entries_dict)
-
+            variable_dict = _merge_variable_dicts(self.__inject_variables(injector_dictionary.items()))
         return variable_dict
 
-    def __inject_variable(self, location, injector, injector_values):
-        _method_name = '__inject_variable'
-        _logger.entering(injector, class_name=_class_name, method_name=_method_name)
-        variable_dict = OrderedDict()
-        start_mbean_list, attribute = _split_injector(injector)
-
-        def _traverse_variables(model_section, mbean_list):
-            if mbean_list:
-                mbean = mbean_list.pop(0)
+    def __inject_variables(self, injectors):
+        """
+        Compile the injector paths into a trie of model folders, and walk the model once, applying every
+        injector that ends at a folder when that folder is reached.
+        :param injectors: list of (injector path, injector values) pairs, in the order they are applied
+        :return: list with a variable dictionary for each of the injectors
+        """
+        _method_name = '__inject_variables'
+        _logger.entering(len(injectors), class_name=_class_name, method_name=_method_name)
+        injector_dicts = []
+        section_names = []
+        section_roots = dict()
+        for index in range(len(injectors)):
+            injector, injector_values = injectors[index]
+            injector_dicts.append(OrderedDict())
+            mbean_list, attribute = _split_injector(injector)
+            section_name = self.__get_injector_section_name(mbean_list)
+            if section_name not in section_roots:
+                section_names.append(section_name)
+                section_roots[section_name] = _InjectorFolder(index)
+            folder = section_roots[section_name]
+            for mbean in mbean_list:
                 mbean, mbean_name_list = self._find_special_name(mbean)
-                _logger.finer('WLSDPLY-19523', mbean, location.get_folder_path(), class_name=_class_name,
-                              method_name=_method_name)
-                if mbean in model_section:
-                    _logger.finest('WLSDPLY-19514', mbean, class_name=_class_name, method_name=_method_name)
-                    next_model_section = model_section[mbean]
-                    location.append_location(mbean)
-                    name_token = self.__aliases.get_name_token(location)
-                    if not mbean_name_list:
-                        if self.__aliases.supports_multiple_mbean_instances(location):
-                            mbean_name_list = next_model_section
-                        else:
-                            self._check_name_token(location, name_token)
-                    else:
-                        _logger.fine('WLSDPLY-19506', mbean_name_list, attribute, location.get_folder_path(),
-                                     class_name=_class_name, method_name=_method_name)
-                    if mbean_name_list:
-                        for mbean_name in mbean_name_list:
-                            if mbean_name in next_model_section:
-                                continue_mbean_list = copy.copy(mbean_list)
-                                location.add_name_token(name_token, mbean_name)
-                                _traverse_variables(next_model_section[mbean_name], continue_mbean_list)
-                                location.remove_name_token(name_token)
-                    else:
-                        _traverse_variables(next_model_section, mbean_list)
-                    location.pop_location()
-                else:
-                    self._log_mbean_not_found(mbean, injector, location)
-                    return False
-            else:
-                self._check_insert_attribute_model(location, model_section, attribute, injector_values)
-                if attribute in model_section:
-                    returned_dict = self._add_variable_info(model_section, attribute, location, injector_values)
-                    if returned_dict:
-                        variable_dict.update(returned_dict)
+                folder = folder.get_folder(mbean, mbean_name_list, index)
+                folder.injectors.append(injector)
+            folder.attributes.append((index, injector, attribute, injector_values))
+
+        if injectors:
+            location = LocationContext()
+            domain_token = self.__aliases.get_name_token(location)
+            location.add_name_token(domain_token, _fake_name_marker)
+            for section_name in section_names:
+                if section_name is None:
+                    # if it wasn't found, will log appropriately when the folders are not found.
+                    # This also will allow someone to put the section in the injector string
+                    section = self.__model
                 else:
-                    _logger.finer('WLSDPLY-19517', attribute, injector, location.get_folder_path(),
-                                  class_name=_class_name, method_name=_method_name)
-            return True
+                    section = self.__model[section_name]
+                self.__apply_injectors([section_roots[section_name]], section, location, injector_dicts)
 
-        section = self.__model
-        if start_mbean_list:
+        _logger.exiting(class_name=_class_name, method_name=_method_name)
+        return injector_dicts
+
+    def __get_injector_section_name(self, mbean_list):
+        if mbean_list:
             # Find out in what section is the mbean top folder so can move to that section in the model
-            top_mbean, __ = self._find_special_name(start_mbean_list[0])
+            top_mbean = _find_special_names_pattern.split(mbean_list[0])[0]
             for entry in self.__section_keys:
                 if entry in self.__model and top_mbean in self.__model[entry]:
-                    section = self.__model[entry]
-                    break
-        else:
-            # This is a domain attribute
-            section = self.__model[model_sections.get_model_topology_key()]
-        # if it wasn't found, will log appropriately in the called method
-        # This also will allow someone to put the section in the injector string
-        _traverse_variables(section, start_mbean_list)
-
-        _logger.exiting(class_name=_class_name, method_name=_method_name, result=variable_dict)
+                    return entry
+            return None
+        # This is a domain attribute
+        return model_sections.get_model_topology_key()
 
-        return variable_dict
+    def __apply_injectors(self, folders, model_section, location, injector_dicts):
+        """
+        Apply the injectors of the trie folders that match the model section, then continue into the
+        model sub-folders with the matching trie sub-folders.
+        :param folders: the trie folders that match the model section
+        :param model_section: the model section at the location
+        :param location: the location of the model section
+        :param injector_dicts: the variable dictionary of each injector, updated with the injected variables
+        """
+        _method_name = '__apply_injectors'
+        attributes = []
+        for folder in folders:
+            attributes.extend(folder.attributes)
+        # apply in injector order so that the first injector for an attribute wins, as it would in the file
+        attributes.sort()
+
+        mbeans = []
+        first_indexes = dict()
+        for folder in folders:
+            for mbean in folder.folder_names:
+                if mbean not in mbeans:
+                    mbeans.append(mbean)
+                for __, sub_folder in folder.folders[mbean]:
+                    if mbean not in first_indexes or sub_folder.first_index < first_indexes[mbean]:
+                        first_indexes[mbean] = sub_folder.first_index
+
+        # an attribute that is also a folder in the injector paths, such as a properties dictionary,
+        # is applied after the folder if it comes after the folder injectors in the file
+        after_folders = []
+        for entry in attributes:
+            attribute = entry[2]
+            if attribute in first_indexes and entry[0] > first_indexes[attribute]:
+                after_folders.append(entry)
+            else:
+                self.__apply_attribute_injector(entry, model_section, location, injector_dicts)
+
+        for mbean in mbeans:
+            branches = []
+            for folder in folders:
+                if mbean in folder.folders:
+                    branches.extend(folder.folders[mbean])
+            _logger.finer('WLSDPLY-19523', mbean, location.get_folder_path(), class_name=_class_name,
+                          method_name=_method_name)
+            if mbean not in model_section:
+                for __, sub_folder in branches:
+                    for injector in sub_folder.injectors:
+                        self._log_mbean_not_found(mbean, injector, location)
+                continue
+
+            _logger.finest('WLSDPLY-19514', mbean, class_name=_class_name, method_name=_method_name)
+            next_model_section = model_section[mbean]
+            location.append_location(mbean)
+            name_token = self.__aliases.get_name_token(location)
+
+            # group the trie folders by the mbean names they select, in model order
+            single_folders = []
+            mbean_names = []
+            name_folders = dict()
+            for mbean_name_list, sub_folder in branches:
+                if not mbean_name_list:
+                    if self.__aliases.supports_multiple_mbean_instances(location):
+                        mbean_name_list = next_model_section.keys()
+                    else:
+                        single_folders.append(sub_folder)
+                        continue
+                else:
+                    _logger.fine('WLSDPLY-19506', mbean_name_list, sub_folder.injectors, location.get_folder_path(),
+                                 class_name=_class_name, method_name=_method_name)
+                for mbean_name in mbean_name_list:
+                    if mbean_name in next_model_section:
+                        if mbean_name not in name_folders:
+                            mbean_names.append(mbean_name)
+                            name_folders[mbean_name] = []
+                        name_folders[mbean_name].append(sub_folder)
+
+            if single_folders:
+                self._check_name_token(location, name_token)
+                self.__apply_injectors(single_folders, next_model_section, location, injector_dicts)
+            for mbean_name in mbean_names:
+                location.add_name_token(name_token, mbean_name)
+                self.__apply_injectors(name_folders[mbean_name], next_model_section[mbean_name], location,
+                                       injector_dicts)
+                location.remove_name_token(name_token)
+            location.pop_location()
+
+        for entry in after_folders:
+            self.__apply_attribute_injector(entry, model_section, location, injector_dicts)
+
+    def __apply_attribute_injector(self, entry, model_section, location, injector_dicts):
+        _method_name = '__apply_attribute_injector'
+        index, injector, attribute, injector_values = entry
+        self._check_insert_attribute_model(location, model_section, attribute, injector_values)
+        if attribute in model_section:
+            returned_dict = self._add_variable_info(model_section, attribute, location, injector_values)
+            if returned_dict:
+                injector_dicts[index].update(returned_dict)
+        else:
+            _logger.finer('WLSDPLY-19517', attribute, injector, location.get_folder_path(),
+                          class_name=_class_name, method_name=_method_name)
 
     def get_folder_short_name(self, location):
         """
@@ -676,6 +800,51 @@ class VariableInjector(object):
         return variables_dictionary
 
 
+class _InjectorFolder(object):
+    """
+    A model folder in the injector trie. Injector paths that share leading folders share trie folders,
+    so the model is walked once for all of the injectors.
+    """
+
+    def __init__(self, first_index):
+        # the index of the first injector that passes through this folder
+        self.first_index = first_index
+        # (injector index, injector, attribute, injector values) for each injector that ends at this folder
+        self.attributes = []
+        # the injectors that pass through this folder, for logging if the folder is not in the model
+        self.injectors = []
+        self.folder_names = []
+        # mbean -> list of [mbean name list, _InjectorFolder]
+        self.folders = dict()
+
+    def get_folder(self, mbean, mbean_name_list, index):
+        """
+        Get the sub-folder for the mbean and selected mbean names, creating it if needed.
+        :param mbean: the mbean folder name
+        :param mbean_name_list: the mbean names selected by the injector, or an empty list for all names
+        :param index: the index of the injector
+        :return: the trie sub-folder
+        """
+        if mbean not in self.folders:
+            self.folder_names.append(mbean)
+            self.folders[mbean] = []
+        branches = self.folders[mbean]
+        for branch in branches:
+            if branch[0] == mbean_name_list:
+                return branch[1]
+        folder = _InjectorFolder(index)
+        branches.append([mbean_name_list, folder])
+        return folder
+
+
+def _merge_variable_dicts(variable_dicts):
+    variable_dict = OrderedDict()
+    for entries_dict in variable_dicts:
+        if len(entries_dict) > 0:
+            variable_dict.update(entries_dict)
+    return variable_dict
+
+
 def _load_variable_file(variable_file_location, append_option):
     """
     Load the variable dictionary from the file, and determine if append or update.
@@ -787,11 +956,15 @@ def _replace_segment(regexp, variable_value, attribute_value):
 
 
 def _compile_pattern(pattern):
+    if pattern in _compiled_patterns:
+        return _compiled_patterns[pattern]
+    compiled = None
     try:
-        return re.compile(pattern)
+        compiled = re.compile(pattern)
     except Exception, e:
         _logger.warning('WLSDPLY-19511', pattern, e, class_name=_class_name, method_name='_compile_pattern')
-    return None
+    _compiled_patterns[pattern] = compiled
+    return compiled
 
 
 def _already_property(check_string):
@@ -5,15 +5,61 @@ Licensed under the Universal Permissive License v 1.0 as shown at https://oss.or
 
 import types
 
+from java.lang import ThreadLocal
+
 import com.oracle.cie.domain.script.jython.WLSTException as offlineWLSTException
 import oracle.weblogic.deploy.util.StringUtils as StringUtils
 import weblogic.management.mbeanservers.edit.ValidationException as ValidationException
 
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.util import mbean_directory
 
 wlst_functions = None
 
+# WLST globals for a separate WLST session, used instead of wlst_functions by the thread they are bound to
+_thread_wlst_functions = ThreadLocal()
+
+
+def bind_thread_wlst_functions(functions):
+    """
+    Use the WLST globals of a separate WLST session for all WlstHelper calls made by the current thread.
+    :param functions: the WLST globals for the session, or None to use the tool's WLST session again
+    """
+    _thread_wlst_functions.set(functions)
+
+
+def unbind_thread_wlst_functions():
+    """
+    Use the tool's WLST session again for WlstHelper calls made by the current thread.
+    """
+    _thread_wlst_functions.remove()
+
+
+def is_thread_bound():
+    """
+    Determine if the current thread is bound to a separate WLST session.
+    :return: True if the current thread uses a separate WLST session, False otherwise
+    """
+    return _thread_wlst_functions.get() is not None
+
+
+def _invalidate_mbean_directory(mbean_type):
+    """
+    Remove the MBean directory entries for the MBean type, if the tool's WLST session is being used.
+    :param mbean_type: the WLST MBean type that was created
+    """
+    if not is_thread_bound():
+        mbean_directory.get_mbean_directory().invalidate_type(mbean_type)
+
+
+def _clear_mbean_directory():
+    """
+    Clear the MBean directory, if the tool's WLST session is being used.
+    """
+    if not is_thread_bound():
+        mbean_directory.get_mbean_directory().clear()
+
 
 class WlstHelper(object):
     """
@@ -259,6 +305,7 @@ class WlstHelper(object):
         Cancel current edit session
         """
         self.__load_global('cancelEdit')('y')
+        _clear_mbean_directory()
 
     def create(self, name, folder, base_provider_type=None):
         """
@@ -288,6 +335,10 @@ class WlstHelper(object):
                                                     _format_exception(e), self.get_pwd(), error=e)
             self.__logger.throwing(class_name=self.__class_name, method_name=_method_name, error=pwe)
             raise pwe
+        # the lists of existing names for this MBean type are no longer complete
+        _invalidate_mbean_directory(folder)
+        if base_provider_type is not None:
+            _invalidate_mbean_directory(base_provider_type)
         self.__logger.finest('WLSDPLY-00018', name, folder, base_provider_type, result,
                              class_name=self.__class_name, method_name=_method_name)
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
@@ -332,6 +383,7 @@ class WlstHelper(object):
             self.__logger.throwing(class_name=self.__class_name, method_name=_method_name, error=pwe)
             raise pwe
         self.__logger.finest('WLSDPLY-00021', name, folder, class_name=self.__class_name, method_name=_method_name)
+        _clear_mbean_directory()
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
         return
 
@@ -387,6 +439,7 @@ class WlstHelper(object):
                                                     _format_exception(e), error=e)
             self.__logger.throwing(class_name=self.__class_name, method_name=_method_name, error=pwe)
             raise pwe
+        _clear_mbean_directory()
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
 
     def set_server_group_dynamic_cluster(self, cluster, server_group):
@@ -408,6 +461,7 @@ class WlstHelper(object):
                                                     _format_exception(e), error=e)
             self.__logger.throwing(class_name=self.__class_name, method_name=_method_name, error=pwe)
             raise pwe
+        _clear_mbean_directory()
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
 
     def set_option_if_needed(self, option_name, option_value):
@@ -599,6 +653,7 @@ class WlstHelper(object):
                                                     e.getLocalizedMessage(), error=e)
             self.__logger.throwing(class_name=self.__class_name, method_name=_method_name, error=pwe)
             raise pwe
+        _clear_mbean_directory()
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
 
     def add_template(self, template):
@@ -617,6 +672,7 @@ class WlstHelper(object):
                                                     e.getLocalizedMessage(), error=e)
             self.__logger.throwing(class_name=self.__class_name, method_name=_method_name, error=pwe)
             raise pwe
+        _clear_mbean_directory()
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
 
     def close_template(self):
@@ -633,6 +689,7 @@ class WlstHelper(object):
                                                     e.getLocalizedMessage(), error=e)
             self.__logger.throwing(class_name=self.__class_name, method_name=_method_name, error=pwe)
             raise pwe
+        _clear_mbean_directory()
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
 
     def select_template(self, template):
@@ -686,6 +743,7 @@ class WlstHelper(object):
                                                     e.getLocalizedMessage(), error=e)
             self.__logger.throwing(class_name=self.__class_name, method_name=_method_name, error=pwe)
             raise pwe
+        _clear_mbean_directory()
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
 
     def read_domain(self, domain_home):
@@ -703,6 +761,7 @@ class WlstHelper(object):
                                                     e.getLocalizedMessage(), error=e)
             self.__logger.throwing(class_name=self.__class_name, method_name=_method_name, error=pwe)
             raise pwe
+        _clear_mbean_directory()
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
 
     def write_domain(self, domain_home):
@@ -761,6 +820,7 @@ class WlstHelper(object):
                                                     e.getLocalizedMessage(), error=e)
             self.__logger.throwing(class_name=self.__class_name, method_name=_method_name, error=pwe)
             raise pwe
+        _clear_mbean_directory()
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
 
     def connect(self, username, password, url):
@@ -782,6 +842,7 @@ class WlstHelper(object):
             self.__logger.throwing(class_name=self.__class_name, method_name=_method_name, error=pwe)
             raise pwe
 
+        _clear_mbean_directory()
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
 
     def disconnect(self):
@@ -799,6 +860,7 @@ class WlstHelper(object):
                                                     _format_exception(e), error=e)
             self.__logger.throwing(class_name=self.__class_name, method_name=_method_name, error=pwe)
             raise pwe
+        _clear_mbean_directory()
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
 
     def edit(self):
@@ -816,6 +878,7 @@ class WlstHelper(object):
                                                     _format_exception(e), error=e)
             self.__logger.throwing(class_name=self.__class_name, method_name=_method_name, error=pwe)
             raise pwe
+        _clear_mbean_directory()
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
 
     def start_edit(self):
@@ -833,6 +896,7 @@ class WlstHelper(object):
                                                     _format_exception(e), error=e)
             self.__logger.throwing(class_name=self.__class_name, method_name=_method_name, error=pwe)
             raise pwe
+        _clear_mbean_directory()
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
 
     def stop_edit(self):
@@ -850,6 +914,7 @@ class WlstHelper(object):
                                                     _format_exception(e), error=e)
             self.__logger.throwing(class_name=self.__class_name, method_name=_method_name, error=pwe)
             raise pwe
+        _clear_mbean_directory()
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
 
     def undo(self):
@@ -867,6 +932,7 @@ class WlstHelper(object):
                                                     _format_exception(e), error=e)
             self.__logger.throwing(class_name=self.__class_name, method_name=_method_name, error=pwe)
             raise pwe
+        _clear_mbean_directory()
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
 
     def save(self):
@@ -1081,6 +1147,7 @@ class WlstHelper(object):
         except (self.__load_global('WLSTException'), offlineWLSTException), e:
             raise exception_helper.create_exception(self.__exception_type, 'WLSDPLY-00071', jrf_target, domain_home,
                                                     _format_exception(e), error=e)
+        _clear_mbean_directory()
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
         return
 
@@ -1349,6 +1416,20 @@ class WlstHelper(object):
         self.__logger.exiting(result=str(result), class_name=self.__class_name, method_name=_method_name)
         return result
 
+    def get_mbean_server_connection(self):
+        """
+        Get the connection to the MBean server of the current online WLST tree.
+        :return: javax.management.MBeanServerConnection instance for the current tree
+        :raises: Exception for the specified tool type: if WLST is not connected
+        """
+        _method_name = 'get_mbean_server_connection'
+        self.__logger.entering(class_name=self.__class_name, method_name=_method_name)
+
+        result = self.__load_global('mbs')
+
+        self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
+        return result
+
     def set_shared_secret_store_with_password(self, wallet_path, password):
         """
         Set opss store password
@@ -1484,8 +1565,11 @@ class WlstHelper(object):
         :raises: Exception for the specified tool type: If the global name is not found in the globals
         """
         member = None
-        if wlst_functions is not None and global_name in wlst_functions:
-            member = wlst_functions[global_name]
+        functions = _thread_wlst_functions.get()
+        if functions is None:
+            functions = wlst_functions
+        if functions is not None and global_name in functions:
+            member = functions[global_name]
 
         if member is None:
             raise exception_helper.create_exception(self.__exception_type, 'WLSDPLY-00087', global_name)
@@ -0,0 +1,237 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+A pool of separate, online WLST sessions and a worker pool that runs tasks on them.
+
+Each session is a separate WLST interpreter with its own connection to the Admin Server, so tasks that
+only read the domain configuration can run concurrently.  A task is bound to one session while it runs,
+and all the WlstHelper calls made by the task use that session.
+"""
+import sys
+
+from java.lang import Runnable
+from java.lang import Throwable
+from java.util.concurrent import Executors
+from java.util.concurrent import LinkedBlockingQueue
+from java.util.concurrent.locks import ReentrantLock
+
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.util import wlst_helper
+from wlsdeploy.tool.util.wlst_helper import WlstHelper
+
+_class_name = 'WlstSessionPool'
+_logger = PlatformLogger('wlsdeploy.wlst')
+
+
+class WlstSessionPool(object):
+    """
+    A fixed number of online WLST sessions, each used by one task at a time.
+    """
+
+    def __init__(self, size, exception_type):
+        """
+        Create a pool that will hold the specified number of sessions.
+        :param size: the number of sessions to open
+        :param exception_type: the exception type to raise for WLST errors
+        """
+        self._size = size
+        self._exception_type = exception_type
+        self._sessions = []
+        self._available = LinkedBlockingQueue()
+        self._executor = None
+
+    def get_size(self):
+        return self._size
+
+    def open(self, username, password, url):
+        """
+        Open the sessions, connecting each one to the Admin Server.
+        :param username: the WebLogic user name
+        :param password: the WebLogic password
+        :param url: the Admin Server URL
+        :raises: Exception for the specified tool type: if a session cannot be created or connected
+        """
+        _method_name = 'open'
+        _logger.entering(self._size, url, class_name=_class_name, method_name=_method_name)
+
+        try:
+            from weblogic.management.scripting.utils import WLSTInterpreter
+        except ImportError, ie:
+            ex = exception_helper.create_exception(self._exception_type, 'WLSDPLY-00127', str(ie), error=ie)
+            _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+            raise ex
+
+        helper = WlstHelper(self._exception_type)
+        try:
+            for index in range(self._size):
+                session = _WlstSession(WLSTInterpreter())
+                self._sessions.append(session)
+                wlst_helper.bind_thread_wlst_functions(session)
+                try:
+                    helper.silence()
+                    helper.connect(username, password, url)
+                finally:
+                    wlst_helper.unbind_thread_wlst_functions()
+                self._available.put(session)
+        except:
+            self.close()
+            raise
+
+        self._executor = Executors.newFixedThreadPool(self._size)
+        _logger.info('WLSDPLY-00128', self._size, url, class_name=_class_name, method_name=_method_name)
+        _logger.exiting(class_name=_class_name, method_name=_method_name)
+
+    def open_with_sessions(self, sessions):
+        """
+        Use sessions that are already connected, instead of opening new ones.  Each session holds the WLST
+        globals in the form expected by WlstHelper, and has a cleanup() method that is called when the pool closes.
+        :param sessions: the list of connected sessions, one for each worker thread
+        """
+        for session in sessions:
+            self._sessions.append(session)
+            self._available.put(session)
+        self._executor = Executors.newFixedThreadPool(len(sessions))
+
+    def run_all(self, tasks):
+        """
+        Run the tasks concurrently, each on its own session, and wait for them to complete.
+        The results are returned in the same order as the tasks, regardless of the order in which they finish.
+        If any task fails, the first failure in task order is raised after all the tasks have completed.
+        :param tasks: a list of functions with no arguments
+        :return: the list of results returned by the tasks
+        """
+        _method_name = 'run_all'
+        _logger.entering(len(tasks), class_name=_class_name, method_name=_method_name)
+
+        runners = []
+        futures = []
+        for task in tasks:
+            runner = _SessionTask(task, self._available)
+            runners.append(runner)
+            futures.append(self._executor.submit(runner))
+
+        for future in futures:
+            future.get()
+
+        results = []
+        for runner in runners:
+            if runner.error is not None:
+                error_type, error_value, error_traceback = runner.error
+                raise error_type, error_value, error_traceback
+            results.append(runner.result)
+
+        _logger.exiting(class_name=_class_name, method_name=_method_name)
+        return results
+
+    def close(self):
+        """
+        Stop the worker threads and disconnect all the sessions.  Disconnect errors are logged and ignored.
+        """
+        _method_name = 'close'
+        _logger.entering(class_name=_class_name, method_name=_method_name)
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+        helper = WlstHelper(self._exception_type)
+        for session in self._sessions:
+            wlst_helper.bind_thread_wlst_functions(session)
+            try:
+                try:
+                    if helper.is_connected():
+                        helper.disconnect()
+                except (Exception, Throwable), ex:
+                    _logger.fine('WLSDPLY-00129', str(ex), class_name=_class_name, method_name=_method_name)
+            finally:
+                wlst_helper.unbind_thread_wlst_functions()
+                session.cleanup()
+
+        self._sessions = []
+        self._available.clear()
+        _logger.exiting(class_name=_class_name, method_name=_method_name)
+
+
+class _WlstSession(object):
+    """
+    The WLST globals of a separate WLST interpreter, in the form expected by WlstHelper.
+    """
+
+    def __init__(self, interpreter):
+        self._interpreter = interpreter
+
+    def __contains__(self, global_name):
+        return self._interpreter.get(global_name) is not None
+
+    def __getitem__(self, global_name):
+        member = self._interpreter.get(global_name)
+        if member is None:
+            raise KeyError(global_name)
+        return member
+
+    def cleanup(self):
+        self._interpreter.cleanup()
+
+
+class _SessionTask(Runnable):
+    """
+    Run a task on the current worker thread, bound to an available session.
+    The result or the failure is recorded, for the submitting thread to examine.
+    """
+
+    def __init__(self, task, available_sessions):
+        self._task = task
+        self._available_sessions = available_sessions
+        self.result = None
+        self.error = None
+
+    def run(self):
+        session = self._available_sessions.take()
+        wlst_helper.bind_thread_wlst_functions(session)
+        try:
+            try:
+                self.result = self._task()
+            except:
+                self.error = sys.exc_info()
+        finally:
+            wlst_helper.unbind_thread_wlst_functions()
+            self._available_sessions.put(session)
+
+
+class SynchronizedProxy(object):
+    """
+    Wrap an object that is shared by concurrent tasks, such as the archive file,
+    so that only one thread at a time calls its methods.
+    """
+
+    def __init__(self, target):
+        self._target = target
+        self._lock = ReentrantLock()
+
+    def get_target(self):
+        return self._target
+
+    def __getattr__(self, name):
+        member = getattr(self._target, name)
+        if callable(member):
+            return _SynchronizedMethod(member, self._lock)
+        return member
+
+
+class _SynchronizedMethod(object):
+    """
+    Call a method of the target object while holding the lock of its SynchronizedProxy.
+    """
+
+    def __init__(self, method, lock):
+        self._method = method
+        self._lock = lock
+
+    def __call__(self, *args, **kwargs):
+        self._lock.lock()
+        try:
+            return self._method(*args, **kwargs)
+        finally:
+            self._lock.unlock()
@@ -18,6 +18,7 @@ from wlsdeploy.aliases.validation_codes import ValidationCodes
 from wlsdeploy.aliases.wlst_modes import WlstModes
 from wlsdeploy.exception.expection_types import ExceptionType
 from wlsdeploy.exception import exception_helper
+from wlsdeploy.logging.platform_logger import LazyArg
 from wlsdeploy.tool.create import wlsroles_helper
 from wlsdeploy.tool.util.alias_helper import AliasHelper
 from wlsdeploy.tool.util.archive_helper import ArchiveHelper
@@ -347,10 +348,10 @@ class Validator(object):
 
         if attribute_location is not None:
             valid_attr_infos = self._alias_helper.get_model_attribute_names_and_types(attribute_location)
-            self._logger.finer('WLSDPLY-05012', str(attribute_location), str(valid_attr_infos),
+            self._logger.finer('WLSDPLY-05012', attribute_location, valid_attr_infos,
                                class_name=_class_name, method_name=_method_name)
             path_tokens_attr_keys = self._alias_helper.get_model_uses_path_tokens_attribute_names(attribute_location)
-            self._logger.finer('WLSDPLY-05013', str(attribute_location), str(path_tokens_attr_keys),
+            self._logger.finer('WLSDPLY-05013', attribute_location, path_tokens_attr_keys,
                                class_name=_class_name, method_name=_method_name)
 
         model_section_dict = model_dict[model_section_key]
@@ -381,7 +382,7 @@ class Validator(object):
 
                 # Append section_dict_key to location context
                 validation_location.append_location(section_dict_key)
-                self._logger.finest('validation_location = {0}', str(validation_location),
+                self._logger.finest('validation_location = {0}', validation_location,
                                     class_name=_class_name, method_name=_method_name)
 
                 # Call self.__validate_section_folder() passing in section_dict_value as the model_node to process
@@ -451,7 +452,7 @@ class Validator(object):
                 new_location = LocationContext(validation_location)
 
                 name_token = self._alias_helper.get_name_token(new_location)
-                self._logger.finest('WLSDPLY-05014', str(validation_location), name_token,
+                self._logger.finest('WLSDPLY-05014', validation_location, name_token,
                                     class_name=_class_name, method_name=_method_name)
 
                 if name_token is not None:
@@ -523,12 +524,12 @@ class Validator(object):
         valid_attr_infos = self._alias_helper.get_model_attribute_names_and_types(validation_location)
         model_folder_path = self._alias_helper.get_model_folder_path(validation_location)
 
-        self._logger.finest('5 model_node={0}', str(model_node), class_name=_class_name, method_name=_method_name)
+        self._logger.finest('5 model_node={0}', model_node, class_name=_class_name, method_name=_method_name)
         self._logger.finest('5 aliases.get_model_subfolder_names(validation_location) returned: {0}',
-                            str(valid_folder_keys),
+                            valid_folder_keys,
                             class_name=_class_name, method_name=_method_name)
         self._logger.finest('5 aliases.get_model_attribute_names_and_types(validation_location) returned: {0}',
-                            str(valid_attr_infos),
+                            valid_attr_infos,
                             class_name=_class_name, method_name=_method_name)
         self._logger.finest('5 model_folder_path={0}', model_folder_path, class_name=_class_name,
                             method_name=_method_name)
@@ -619,11 +620,11 @@ class Validator(object):
     def __validate_attributes(self, attributes_dict, valid_attr_infos, validation_location):
         _method_name = '__validate_attributes'
 
-        self._logger.finest('attributes_dict={0}', str(attributes_dict),
+        self._logger.finest('attributes_dict={0}', attributes_dict,
                             class_name=_class_name, method_name=_method_name)
 
         path_tokens_attr_keys = self._alias_helper.get_model_uses_path_tokens_attribute_names(validation_location)
-        self._logger.finer('WLSDPLY-05013', str(validation_location), str(path_tokens_attr_keys),
+        self._logger.finer('WLSDPLY-05013', validation_location, path_tokens_attr_keys,
                            class_name=_class_name, method_name=_method_name)
 
         model_folder_path = self._alias_helper.get_model_folder_path(validation_location)
@@ -636,9 +637,9 @@ class Validator(object):
                              model_folder_path, validation_location):
         _method_name = '__validate_attribute'
 
-        log_value = self.__get_attribute_log_value(attribute_name, attribute_value, valid_attr_infos)
-        self._logger.entering(attribute_name, log_value, str(valid_attr_infos), str(path_tokens_attr_keys),
-                              model_folder_path, str(validation_location),
+        log_value = LazyArg(self.__get_attribute_log_value, attribute_name, attribute_value, valid_attr_infos)
+        self._logger.entering(attribute_name, log_value, valid_attr_infos, path_tokens_attr_keys,
+                              model_folder_path, validation_location,
                               class_name=_class_name, method_name=_method_name)
 
         if variables.has_variables(attribute_name):
@@ -672,7 +673,7 @@ class Validator(object):
     def __validate_properties(self, properties_dict, valid_prop_infos, validation_location):
         _method_name = '__validate_properties'
 
-        self._logger.entering(str(properties_dict), str(validation_location),
+        self._logger.entering(properties_dict, validation_location,
                               class_name=_class_name, method_name=_method_name)
 
         for property_name, property_value in properties_dict.iteritems():
@@ -685,7 +686,7 @@ class Validator(object):
 
         _method_name = '__validate_property'
 
-        self._logger.entering(property_name, property_value, str(valid_prop_infos), model_folder_path,
+        self._logger.entering(property_name, property_value, valid_prop_infos, model_folder_path,
                               class_name=_class_name, method_name=_method_name)
 
         if variables.has_variables(property_name):
@@ -806,7 +807,7 @@ class Validator(object):
                                         class_name=_class_name, method_name=_method_name)
         else:
             tokens = validation_utils.extract_path_tokens(path)
-            self._logger.finest('tokens={0}', str(tokens), class_name=_class_name, method_name=_method_name)
+            self._logger.finest('tokens={0}', tokens, class_name=_class_name, method_name=_method_name)
             # TODO(mwooten) - This would be a good place to validate any path token found...
 
             if not self._model_context.has_token_prefix(path):
@@ -30,12 +30,14 @@ class ValidatorLogger(PlatformLogger):
         :param args: the arguments to use to populate the message placeholders
         :param kwargs: the keyword arguments
         """
-        method = kwargs.pop('method_name', None)
-        clazz = kwargs.pop('class_name', None)
-        error = kwargs.pop('error', None)
         level = Level.INFO
         if self._mode_type == TOOL:
             level = Level.FINE
+        if not self.logger.isLoggable(level):
+            return
+        method = kwargs.pop('method_name', None)
+        clazz = kwargs.pop('class_name', None)
+        error = kwargs.pop('error', None)
         record = self._get_log_record(level, clazz, method, message, error, *args)
         self.logger.log(record)
         return
@@ -10,6 +10,8 @@ from java.io import File
 from java.io import IOException
 from java.lang import IllegalArgumentException
 from java.lang import String
+from oracle.weblogic.deploy.encrypt import EncryptionException
+from oracle.weblogic.deploy.encrypt import EncryptionUtils
 from oracle.weblogic.deploy.util import FileUtils
 from oracle.weblogic.deploy.util import TranslateException
 from oracle.weblogic.deploy.util import VariableException
@@ -197,7 +199,7 @@ def validate_model(program_name, model_dictionary, model_context, aliases, wlst_
         tool_exit.end(model_context, CommandLineArgUtil.PROG_ERROR_EXIT_CODE)
 
 
-def load_model(program_name, model_context, aliases, filter_type, wlst_mode):
+def load_model(program_name, model_context, aliases, filter_type, wlst_mode, model_files_loader=None):
     """
     Load the model based on the arguments in the model context.
     Apply the variable substitution, if specified, and validate the model.
@@ -208,6 +210,8 @@ def load_model(program_name, model_context, aliases, filter_type, wlst_mode):
     :param aliases: the alias configuration
     :param filter_type: the type of any filters to be applied
     :param wlst_mode: offline or online
+    :param model_files_loader: function that returns the dictionary for a model file name, if the caller has
+        already parsed the model files. The dictionaries are merged and changed, so it should return copies.
     :return: the resulting model dictionary
     """
     _method_name = 'load_model'
@@ -225,7 +229,7 @@ def load_model(program_name, model_context, aliases, filter_type, wlst_mode):
 
     model_file_value = model_context.get_model_file()
     try:
-        model_dictionary = merge_model_files(model_file_value, variable_map)
+        model_dictionary = merge_model_files(model_file_value, variable_map, model_files_loader)
     except TranslateException, te:
         __logger.severe('WLSDPLY-09014', program_name, model_file_value, te.getLocalizedMessage(), error=te,
                         class_name=_class_name, method_name=_method_name)
@@ -240,6 +244,17 @@ def load_model(program_name, model_context, aliases, filter_type, wlst_mode):
         clean_up_temp_files()
         tool_exit.end(model_context, CommandLineArgUtil.PROG_ERROR_EXIT_CODE)
 
+    if model_context.is_using_encryption():
+        try:
+            encrypted_values = []
+            _collect_encrypted_values(model_dictionary, encrypted_values)
+            aliases.decrypt_passwords(encrypted_values)
+        except EncryptionException, ex:
+            __logger.severe('WLSDPLY-20032', program_name, ex.getLocalizedMessage(), error=ex,
+                            class_name=_class_name, method_name=_method_name)
+            clean_up_temp_files()
+            tool_exit.end(model_context, CommandLineArgUtil.PROG_ERROR_EXIT_CODE)
+
     persist_model(model_context, model_dictionary)
 
     validate_model(program_name, model_dictionary, model_context, aliases, wlst_mode)
@@ -251,6 +266,24 @@ def load_model(program_name, model_context, aliases, filter_type, wlst_mode):
     return model_dictionary
 
 
+def _collect_encrypted_values(model_node, encrypted_values):
+    """
+    Add the encrypted string values in the model node and its child nodes to the list.
+    :param model_node: the model dictionary or list to search
+    :param encrypted_values: the list of encrypted values
+    """
+    if isinstance(model_node, dict):
+        values = model_node.values()
+    else:
+        values = model_node
+
+    for value in values:
+        if isinstance(value, dict) or isinstance(value, list):
+            _collect_encrypted_values(value, encrypted_values)
+        elif type(value) in [str, unicode] and EncryptionUtils.isEncryptedString(value):
+            encrypted_values.append(value)
+
+
 def process_online_args(optional_arg_map):
     """
     Determine if we are executing in online mode and if so, validate/prompt for the necessary parameters.
@@ -298,56 +331,70 @@ def clean_up_temp_files():
         __tmp_model_dir = None
 
 
-def merge_model_files(model_file_value, variable_map=None):
+def merge_model_files(model_file_value, variable_map=None, model_files_loader=None):
     """
     Merge the model files specified by the model file value.
     It may be a single file, or a comma-separated list of files.
     :param variable_map: variables to be used for name resolution, or None
     :param model_file_value: the value specified as a command argument
+    :param model_files_loader: function that returns the dictionary for a model file name, or None to parse the files
     :return: the merge model dictionary
     """
     merged_model = OrderedDict()
+    merge_indexes = {}
     model_files = cla_utils.get_model_files(model_file_value)
 
     for model_file in model_files:
-        model = FileToPython(model_file, True).parse()
-        _merge_dictionaries(merged_model, model, variable_map)
+        if model_files_loader is None:
+            model = FileToPython(model_file, True).parse()
+        else:
+            model = model_files_loader(model_file)
+        _merge_dictionaries(merged_model, model, variable_map, merge_indexes)
 
     return merged_model
 
 
-def _merge_dictionaries(dictionary, new_dictionary, variable_map):
+def _merge_dictionaries(dictionary, new_dictionary, variable_map, merge_indexes=None):
     """
     Merge the values from the new dictionary to the existing one.
     Use variables to resolve keys.
     :param dictionary: the existing dictionary
     :param new_dictionary: the new dictionary to be merged
     :param variable_map: variables to be used for name resolution, or None
+    :param merge_indexes: the merge key indexes for the existing dictionaries, to be reused for more merges, or None
     """
+    if merge_indexes is None:
+        merge_indexes = {}
+
     for new_key in new_dictionary:
         new_value = new_dictionary[new_key]
-        dictionary_key, replace_key = _find_dictionary_merge_key(dictionary, new_key, variable_map)
+        dictionary_key, replace_key = _find_dictionary_merge_key(dictionary, new_key, variable_map, merge_indexes)
 
         # the key is not in the original dictionary, just add it
         if dictionary_key is None:
             dictionary[new_key] = new_value
+            _add_merge_index_key(dictionary, new_key, variable_map, merge_indexes)
 
         # the new key should replace the existing one - delete the existing key and add the new one
         elif replace_key:
             del dictionary[dictionary_key]
+            _remove_merge_index_key(dictionary, dictionary_key, variable_map, merge_indexes)
             if not model_helper.is_delete_name(new_key):
                 dictionary[new_key] = new_value
+                _add_merge_index_key(dictionary, new_key, variable_map, merge_indexes)
 
         # the key is in both dictionaries - merge if the values are dictionaries, otherwise replace the value
         else:
             value = dictionary[dictionary_key]
             if isinstance(value, dict) and isinstance(new_value, dict):
-                _merge_dictionaries(value, new_value, variable_map)
+                _merge_dictionaries(value, new_value, variable_map, merge_indexes)
             else:
+                if new_key != dictionary_key:
+                    _add_merge_index_key(dictionary, new_key, variable_map, merge_indexes)
                 dictionary[new_key] = new_value
 
 
-def _find_dictionary_merge_key(dictionary, new_key, variable_map):
+def _find_dictionary_merge_key(dictionary, new_key, variable_map, merge_indexes):
     """
     Find the key corresponding to new_key in the specified dictionary.
     Determine if the new_key should completely replace the value in the dictionary.
@@ -356,6 +403,7 @@ def _find_dictionary_merge_key(dictionary, new_key, variable_map):
     :param dictionary: the dictionary to be searched
     :param new_key: the key being checked
     :param variable_map: variables to be used for name resolution, or None
+    :param merge_indexes: the merge key indexes for the existing dictionaries
     :return: tuple - the corresponding key from the dictionary, True if dictionary key should be replaced
     """
     if new_key in dictionary:
@@ -364,16 +412,79 @@ def _find_dictionary_merge_key(dictionary, new_key, variable_map):
     new_is_delete = model_helper.is_delete_name(new_key)
     match_new_key = _get_merge_match_key(new_key, variable_map)
 
-    for dictionary_key in dictionary.keys():
-        dictionary_is_delete = model_helper.is_delete_name(dictionary_key)
-        match_dictionary_key = _get_merge_match_key(dictionary_key, variable_map)
-        if match_dictionary_key == match_new_key:
-            replace_key = new_is_delete != dictionary_is_delete
-            return dictionary_key, replace_key
+    merge_index = _get_merge_index(dictionary, variable_map, merge_indexes, True)
+    if match_new_key in merge_index:
+        dictionary_key = merge_index[match_new_key][0]
+        replace_key = new_is_delete != model_helper.is_delete_name(dictionary_key)
+        return dictionary_key, replace_key
 
     return None, False
 
 
+def _get_merge_index(dictionary, variable_map, merge_indexes, create):
+    """
+    Get the merge key index for the dictionary, which maps each merge match key to a list of the
+    dictionary keys with that match key, in dictionary order.
+    The index is built the first time a key is not found directly, and is updated as keys are added and removed.
+    :param dictionary: the dictionary for the index
+    :param variable_map: variables to be used for name resolution, or None
+    :param merge_indexes: the merge key indexes for the existing dictionaries
+    :param create: if True, build the index if it does not exist
+    :return: the merge key index, or None if it does not exist and create is False
+    """
+    entry = merge_indexes.get(id(dictionary))
+    # the index entry keeps a reference to the dictionary, so its id is not reused
+    if entry is not None and entry[0] is dictionary:
+        return entry[1]
+
+    if not create:
+        return None
+
+    merge_index = {}
+    for key in dictionary.keys():
+        match_key = _get_merge_match_key(key, variable_map)
+        if match_key in merge_index:
+            merge_index[match_key].append(key)
+        else:
+            merge_index[match_key] = [key]
+    merge_indexes[id(dictionary)] = (dictionary, merge_index)
+    return merge_index
+
+
+def _add_merge_index_key(dictionary, key, variable_map, merge_indexes):
+    """
+    Add a key that was added to the end of the dictionary to its merge key index, if the index exists.
+    :param dictionary: the dictionary
+    :param key: the key that was added
+    :param variable_map: variables to be used for name resolution, or None
+    :param merge_indexes: the merge key indexes for the existing dictionaries
+    """
+    merge_index = _get_merge_index(dictionary, variable_map, merge_indexes, False)
+    if merge_index is not None:
+        match_key = _get_merge_match_key(key, variable_map)
+        if match_key in merge_index:
+            merge_index[match_key].append(key)
+        else:
+            merge_index[match_key] = [key]
+
+
+def _remove_merge_index_key(dictionary, key, variable_map, merge_indexes):
+    """
+    Remove a key that was deleted from the dictionary from its merge key index, if the index exists.
+    :param dictionary: the dictionary
+    :param key: the key that was deleted
+    :param variable_map: variables to be used for name resolution, or None
+    :param merge_indexes: the merge key indexes for the existing dictionaries
+    """
+    merge_index = _get_merge_index(dictionary, variable_map, merge_indexes, False)
+    if merge_index is not None:
+        match_key = _get_merge_match_key(key, variable_map)
+        keys = merge_index[match_key]
+        keys.remove(key)
+        if not keys:
+            del merge_index[match_key]
+
+
 def _get_merge_match_key(key, variable_map):
     """
     Get the key name to use for matching in model merge.
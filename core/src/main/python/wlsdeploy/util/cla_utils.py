@@ -75,6 +75,7 @@ class CommandLineArgUtil(object):
     # deprecated
     MODEL_SAMPLE_SWITCH        = '-model_sample'
     RECURSIVE_SWITCH           = '-recursive'
+    CLEAR_CACHE_SWITCH         = '-clear'
     UPDATE_RCU_SCHEMA_PASS_SWITCH = '-updateRCUSchemaPassword'
     VALIDATION_METHOD          = '-method'
     # overrides for the variable injector
@@ -90,6 +91,7 @@ class CommandLineArgUtil(object):
     # arguments that are true if specified, false if not
     BOOLEAN_SWITCHES = [
         ATTRIBUTES_ONLY_SWITCH,
+        CLEAR_CACHE_SWITCH,
         ENCRYPT_MANUAL_SWITCH,
         FOLDERS_ONLY_SWITCH,
         MODEL_SAMPLE_SWITCH,
@@ -0,0 +1,125 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+A bounded cache with least-recently-used eviction, for use with the WLST version of Jython.
+"""
+from java.util.concurrent.locks import ReentrantLock
+
+
+class LruCache(object):
+    """
+    A dictionary-like cache that holds at most max_size entries.  Each entry records the time
+    of its last use, and when the cache is full, the least-recently-used quarter of the entries
+    are removed together, so the cost of eviction is spread over many insertions.
+    The cache can be shared by threads, such as the tasks that discover MBean instances concurrently.
+    """
+
+    def __init__(self, max_size):
+        """
+        Create a new cache.
+        :param max_size: the maximum number of entries to keep, must be greater than zero
+        """
+        self._max_size = max_size
+        self._entries = {}
+        self._clock = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = ReentrantLock()
+
+    def __len__(self):
+        self._lock.lock()
+        try:
+            return len(self._entries)
+        finally:
+            self._lock.unlock()
+
+    def __contains__(self, key):
+        self._lock.lock()
+        try:
+            return key in self._entries
+        finally:
+            self._lock.unlock()
+
+    def get(self, key, default=None):
+        """
+        Get the value for the key, marking it as recently used.
+        :param key: the key
+        :param default: the value to return if the key is not in the cache
+        :return: the cached value, or the default
+        """
+        self._lock.lock()
+        try:
+            if key in self._entries:
+                entry = self._entries[key]
+                self._clock += 1
+                entry[1] = self._clock
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+            return default
+        finally:
+            self._lock.unlock()
+
+    def put(self, key, value):
+        """
+        Add or replace the value for the key, evicting the least-recently-used entries if the cache is full.
+        :param key: the key
+        :param value: the value
+        """
+        self._lock.lock()
+        try:
+            if key not in self._entries and len(self._entries) >= self._max_size:
+                self._evict()
+            self._clock += 1
+            self._entries[key] = [value, self._clock]
+        finally:
+            self._lock.unlock()
+
+    def remove(self, key):
+        """
+        Remove the entry for the key, if present.
+        :param key: the key
+        """
+        self._lock.lock()
+        try:
+            if key in self._entries:
+                del self._entries[key]
+        finally:
+            self._lock.unlock()
+
+    def clear(self):
+        """
+        Remove all the entries from the cache.
+        """
+        self._lock.lock()
+        try:
+            self._entries.clear()
+        finally:
+            self._lock.unlock()
+
+    def get_statistics(self):
+        """
+        Get the usage counts for the cache.
+        :return: a tuple of the number of hits, misses, and current entries
+        """
+        self._lock.lock()
+        try:
+            return self._hits, self._misses, len(self._entries)
+        finally:
+            self._lock.unlock()
+
+    def _evict(self):
+        """
+        Remove the least-recently-used entries.  The caller holds the lock.
+        """
+        usage = []
+        for key, entry in self._entries.items():
+            usage.append((entry[1], key))
+        usage.sort()
+
+        evict_count = self._max_size / 4
+        if evict_count < 1:
+            evict_count = 1
+        for last_used, key in usage[:evict_count]:
+            del self._entries[key]
@@ -384,6 +384,13 @@ class ModelContext(object):
         """
         return self._archive_file
 
+    def set_archive_file(self, archive_file):
+        """
+        Set the archive file.
+        :param archive_file: the archive file
+        """
+        self._archive_file = archive_file
+
     def get_model_file(self):
         """
         Get the model file.
@@ -0,0 +1,92 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Run independent tasks concurrently on a bounded pool of worker threads.
+
+The tasks must not use WLST, since the WLST functions of the tool are bound to the main thread.
+Use WlstSessionPool for tasks that read the domain configuration.
+"""
+import sys
+
+from java.lang import Runnable
+from java.lang import Runtime
+from java.util.concurrent import Executors
+
+from wlsdeploy.logging.platform_logger import PlatformLogger
+
+_class_name = 'task_runner'
+_logger = PlatformLogger('wlsdeploy.util')
+
+
+def get_default_thread_count():
+    """
+    Get the default number of worker threads, which is the number of processors available to the JVM.
+    :return: the number of worker threads
+    """
+    return Runtime.getRuntime().availableProcessors()
+
+
+def run_tasks(tasks, thread_count=None):
+    """
+    Run the tasks concurrently and wait for them to complete.
+    The results are returned in the same order as the tasks, regardless of the order in which they finish.
+    If any task fails, the first failure in task order is raised after all the tasks have completed.
+    A single task is run on the current thread.
+    :param tasks: a list of functions with no arguments
+    :param thread_count: the maximum number of worker threads, defaults to the number of processors
+    :return: the list of results returned by the tasks
+    """
+    _method_name = 'run_tasks'
+
+    if thread_count is None:
+        thread_count = get_default_thread_count()
+    thread_count = max(1, min(thread_count, len(tasks)))
+    _logger.entering(len(tasks), thread_count, class_name=_class_name, method_name=_method_name)
+
+    runners = []
+    for task in tasks:
+        runners.append(_Task(task))
+
+    if thread_count == 1:
+        for runner in runners:
+            runner.run()
+    else:
+        executor = Executors.newFixedThreadPool(thread_count)
+        try:
+            futures = []
+            for runner in runners:
+                futures.append(executor.submit(runner))
+
+            for future in futures:
+                future.get()
+        finally:
+            executor.shutdown()
+
+    results = []
+    for runner in runners:
+        if runner.error is not None:
+            error_type, error_value, error_traceback = runner.error
+            raise error_type, error_value, error_traceback
+        results.append(runner.result)
+
+    _logger.exiting(class_name=_class_name, method_name=_method_name)
+    return results
+
+
+class _Task(Runnable):
+    """
+    Run a task on the current thread.
+    The result or the failure is recorded, for the submitting thread to examine.
+    """
+
+    def __init__(self, task):
+        self._task = task
+        self.result = None
+        self.error = None
+
+    def run(self):
+        try:
+            self.result = self._task()
+        except:
+            self.error = sys.exc_info()
@@ -25,11 +25,12 @@ from wlsdeploy.util.cla_utils import CommandLineArgUtil
 
 _class_name = "variables"
 _logger = platform_logger.PlatformLogger('wlsdeploy.variables')
-_file_variable_pattern = re.compile("@@FILE:[\w.\\\/:-]+@@")
 _property_pattern = re.compile("(@@PROP:([\\w.-]+)@@)")
 _environment_pattern = re.compile("(@@ENV:([\\w.-]+)@@)")
 _secret_pattern = re.compile("(@@SECRET:([\\w.-]+):([\\w.-]+)@@)")
-_file_nested_variable_pattern = re.compile("@@FILE:@@[\w]+@@[\w.\\\/:-]+@@")
+_file_path_pattern = re.compile("[\w.\\\/:-]+$")
+_path_token_pattern = re.compile("@@[\w]+@@")
+_file_token_prefix = "@@FILE:"
 
 # if this pattern is found, token substitution was incomplete
 _unresolved_token_pattern = re.compile("(@@(PROP|FILE|ENV|SECRET):)")
@@ -167,111 +168,74 @@ def substitute(dictionary, variables, model_context):
     :param variables: a dictionary of variables for substitution
     :param model_context: used to resolve variables in file paths
     """
-    _process_node(dictionary, variables, model_context)
+    # each file is read once, no matter how many @@FILE tokens refer to it
+    file_values = dict()
+    _process_node(dictionary, variables, model_context, file_values)
 
 
-def _process_node(nodes, variables, model_context):
+def _process_node(nodes, variables, model_context, file_values):
     """
     Process variables in the node.
+    The node is updated in place, and the order of its keys is preserved if any of them are substituted.
     :param nodes: the dictionary to process
     :param variables: the variables to use
     :param model_context: used to resolve variables in file paths
+    :param file_values: the values that have been read from files, keyed by file path
     """
-    # iterate over copy to avoid concurrent change for add/delete
-    if isinstance(nodes, OrderedDict):
-        nodes_iterator = OrderedDict(nodes)
-    else:
-        nodes_iterator = dict(nodes)
-    for key in nodes_iterator:
+    keys_changed = False
+    items = []
+    for key in nodes.keys():
         value = nodes[key]
 
-        # if the key changes with substitution, remove old key and map value to new key
-        new_key = _substitute(key, variables, model_context)
-        if new_key is not key:
-            del nodes[key]
-            nodes[new_key] = value
+        new_key = _substitute(key, variables, model_context, file_values=file_values)
+        if new_key != key:
+            keys_changed = True
 
         if isinstance(value, dict):
-            _process_node(value, variables, model_context)
+            _process_node(value, variables, model_context, file_values)
 
         elif isinstance(value, list):
-            for member in value:
+            for index in range(len(value)):
+                member = value[index]
                 if type(member) in [str, unicode]:
-                    index = value.index(member)
-                    value[index] = _substitute(member, variables, model_context, key)
+                    value[index] = _substitute(member, variables, model_context, key, file_values)
 
         elif type(value) in [str, unicode]:
-            nodes[key] = _substitute(value, variables, model_context, key)
+            value = _substitute(value, variables, model_context, key, file_values)
+            nodes[key] = value
+
+        items.append((new_key, value))
 
+    # if any key changes with substitution, rebuild the node with the new keys in the same order
+    if keys_changed:
+        nodes.clear()
+        for key, value in items:
+            nodes[key] = value
 
-def _substitute(text, variables, model_context, attribute_name=None):
+
+def _substitute(text, variables, model_context, attribute_name=None, file_values=None):
     """
     Substitute token placeholders with their derived values.
     :param text: the text to process for token placeholders
     :param variables: the variables to use
     :param model_context: used to determine the validation method (strict, lax, etc.)
+    :param attribute_name: the name of the attribute with the text, used for error messages
+    :param file_values: optional values that have been read from files, keyed by file path
     :return: the replaced text
     """
     method_name = '_substitute'
 
     # skip lookups for text with no @@
     if '@@' in text:
+        if file_values is None:
+            file_values = dict()
 
-        # do properties first, to cover the case @@FILE:/dir/@@PROP:name@@.txt@@
-        matches = _property_pattern.findall(text)
-        for token, key in matches:
-            # log, or throw an exception if key is not found.
-            if key not in variables:
-                _report_token_issue('WLSDPLY-01732', method_name, model_context, key)
-                continue
-
-            value = variables[key]
-            text = text.replace(token, value)
-
-        # check environment variables before @@FILE:/dir/@@ENV:name@@.txt@@
-        matches = _environment_pattern.findall(text)
-        for token, key in matches:
-            # log, or throw an exception if key is not found.
-            if not os.environ.has_key(key):
-                _report_token_issue('WLSDPLY-01737', method_name, model_context, key)
-                continue
-
-            value = os.environ.get(key)
-            text = text.replace(token, value)
-
-        # check secret variables before @@FILE:/dir/@@SECRET:name:key@@.txt@@
-        matches = _secret_pattern.findall(text)
-        for token, name, key in matches:
-            value = _resolve_secret_token(name, key, model_context)
-            if value is None:
-                secret_token = name + ':' + key
-                known_tokens = _list_known_secret_tokens()
-                _report_token_issue('WLSDPLY-01739', method_name, model_context, secret_token, known_tokens)
-                continue
-
-            text = text.replace(token, value)
-
-        tokens = _file_variable_pattern.findall(text)
-        if tokens:
-            for token in tokens:
-                path = token[7:-2]
-                value = _read_value_from_file(path, model_context)
-                text = text.replace(token, value)
-
-        # special case for @@FILE:@@ORACLE_HOME@@/dir/name.txt@@
-        tokens = _file_nested_variable_pattern.findall(text)
-        if tokens:
-            for token in tokens:
-                path = token[7:-2]
-                path = model_context.replace_token_string(path)
-                value = _read_value_from_file(path, model_context)
-                text = text.replace(token, value)
+        text = _scan_tokens(text, 0, False, variables, model_context, file_values)[0]
 
         # if any @@TOKEN: remains in the value, throw an exception
-        matches = _unresolved_token_pattern.findall(text)
-        if matches:
-            match = matches[0]
-            token = match[1]
+        match = _unresolved_token_pattern.search(text)
+        if match:
+            token = match.group(2)
             sample = "@@" + token + ":<name>"
             if token == "SECRET":
                 sample += ":<key>"
@@ -285,29 +249,149 @@ def _substitute(text, variables, model_context, attribute_name=None):
     return text
 
 
-def _read_value_from_file(file_path, model_context):
+def _scan_tokens(text, start, in_file_path, variables, model_context, file_values):
+    """
+    Scan the text once from the start position, replacing each token with its value.
+    Property, environment and secret tokens may be nested in a file token, such as
+    @@FILE:/dir/@@PROP:name@@.txt@@, so they are replaced before the file is read.
+    Tokens in the replaced values are not replaced again.
+    :param text: the text to scan
+    :param start: the position at which to start
+    :param in_file_path: if True, the scan stops at the @@ that closes the file token
+    :param variables: the variables to use
+    :param model_context: used to determine the validation method (strict, lax, etc.)
+    :param file_values: the values that have been read from files, keyed by file path
+    :return: a tuple with the replaced text, the position at which the scan stopped,
+        and True if the scan stopped at the @@ that closes a file token
+    """
+    method_name = '_substitute'
+
+    pieces = []
+    position = start
+    while True:
+        index = text.find('@@', position)
+        if index == -1:
+            pieces.append(text[position:])
+            return ''.join(pieces), len(text), False
+
+        pieces.append(text[position:index])
+
+        match = _property_pattern.match(text, index)
+        if match:
+            key = match.group(2)
+            if key in variables:
+                pieces.append(variables[key])
+            else:
+                # log, or throw an exception if key is not found.
+                _report_token_issue('WLSDPLY-01732', method_name, model_context, key)
+                pieces.append(match.group(1))
+            position = match.end()
+            continue
+
+        match = _environment_pattern.match(text, index)
+        if match:
+            key = match.group(2)
+            if os.environ.has_key(key):
+                pieces.append(os.environ.get(key))
+            else:
+                # log, or throw an exception if key is not found.
+                _report_token_issue('WLSDPLY-01737', method_name, model_context, key)
+                pieces.append(match.group(1))
+            position = match.end()
+            continue
+
+        match = _secret_pattern.match(text, index)
+        if match:
+            name = match.group(2)
+            key = match.group(3)
+            value = _resolve_secret_token(name, key, model_context)
+            if value is not None:
+                pieces.append(value)
+            else:
+                secret_token = name + ':' + key
+                known_tokens = _list_known_secret_tokens()
+                _report_token_issue('WLSDPLY-01739', method_name, model_context, secret_token, known_tokens)
+                pieces.append(match.group(1))
+            position = match.end()
+            continue
+
+        if in_file_path:
+            return ''.join(pieces), index, True
+
+        if text.startswith(_file_token_prefix, index):
+            value, position = _scan_file_token(text, index, variables, model_context, file_values)
+            pieces.append(value)
+            continue
+
+        # not a token, look for one starting at the next character, as in @@@PROP:name@@
+        pieces.append(text[index])
+        position = index + 1
+
+
+def _scan_file_token(text, start, variables, model_context, file_values):
+    """
+    Replace the file token at the start position with the value from the file.
+    The file path may start with a path token, such as @@FILE:@@ORACLE_HOME@@/dir/name.txt@@.
+    If the file token is not valid, it is returned with any nested tokens replaced.
+    :param text: the text to scan
+    :param start: the position of the file token
+    :param variables: the variables to use
+    :param model_context: used to resolve path tokens, and to determine the validation method
+    :param file_values: the values that have been read from files, keyed by file path
+    :return: a tuple with the replacement text and the position after the file token
+    """
+    position = start + len(_file_token_prefix)
+    path_token = ''
+    match = _path_token_pattern.match(text, position)
+    if match:
+        path_token = match.group(0)
+        position = match.end()
+
+    path, position, closed = _scan_tokens(text, position, True, variables, model_context, file_values)
+    if not closed:
+        return _file_token_prefix + path_token + path, position
+
+    position += 2
+    if not _file_path_pattern.match(path):
+        return _file_token_prefix + path_token + path + '@@', position
+
+    path = path_token + path
+    if path_token:
+        path = model_context.replace_token_string(path)
+    return _read_value_from_file(path, model_context, file_values), position
+
+
+def _read_value_from_file(file_path, model_context, file_values=None):
     """
     Read a single text value from the first line in the specified file.
     :param file_path: the file from which to read the value
+    :param model_context: used to determine the validation method (strict, lax, etc.)
+    :param file_values: optional values that have been read from files, keyed by file path
     :return: the text value
     :raises BundleAwareException if an error occurs while reading the value
     """
     method_name = '_read_value_from_file'
 
+    if file_values is not None and file_path in file_values:
+        return file_values[file_path]
+
     try:
         file_reader = BufferedReader(FileReader(file_path))
         line = file_reader.readLine()
         file_reader.close()
     except IOException, e:
         _report_token_issue('WLSDPLY-01733', method_name, model_context, file_path, e.getLocalizedMessage())
-        line = ''
+        return ''
 
     if line is None:
         ex = exception_helper.create_variable_exception('WLSDPLY-01734', file_path)
         _logger.throwing(ex, class_name=_class_name, method_name=method_name)
         raise ex
 
-    return str(line).strip()
+    value = str(line).strip()
+    if file_values is not None:
+        file_values[file_path] = value
+    return value
 
 
 def _resolve_secret_token(name, key, model_context):
@@ -6,11 +6,14 @@ Module to handle translating between Yaml files and Python dictionaries.
 """
 import re
 
+import java.io.BufferedWriter as JBufferedWriter
 import java.io.FileNotFoundException as JFileNotFoundException
 import java.io.FileOutputStream as JFileOutputStream
 import java.io.IOException as JIOException
+import java.io.OutputStreamWriter as JOutputStreamWriter
 import java.io.PrintWriter as JPrintWriter
 import java.lang.IllegalArgumentException as JIllegalArgumentException
+import java.lang.System as JSystem
 
 import oracle.weblogic.deploy.util.FileUtils as JFileUtils
 import oracle.weblogic.deploy.yaml.YamlStreamTranslator as JYamlStreamTranslator
@@ -20,6 +23,11 @@ from wlsdeploy.exception import exception_helper
 from wlsdeploy.logging.platform_logger import PlatformLogger
 from wlsdeploy.yaml.dictionary_list import DictionaryList
 
+# the size of the character buffer used when writing a model file
+_write_buffer_size = 65536
+
+_requires_quotes_chars_regex = re.compile('[:{}\[\],&*#?|<>=!%@`-]')
+
 
 class YamlToPython(object):
     """
@@ -98,22 +106,26 @@ class YamlStreamToPython(object):
 class PythonToYaml(object):
     """
     A class that converts a Python dictionary into Yaml and writes the output to a file.
+    The output is buffered, and each top-level section is written to the file in a single call.
     """
     _class_name = 'PythonToYaml'
     # 4 spaces
     _indent_unit = '    '
-    _requires_quotes_chars_regex = '[:{}\[\],&*#?|<>=!%@`-]'
 
     def __init__(self, dictionary):
         # Fix error handling for None
         self._dictionary = dictionary
         self._logger = PlatformLogger('wlsdeploy.yaml')
+        self._line_separator = JSystem.getProperty('line.separator')
+        self._quoted_keys = dict()
         return
 
-    def write_to_yaml_file(self, file_name):
+    def write_to_yaml_file(self, file_name, sections=None):
         """
         Convert the Python dictionary to Yaml and write it to the specified file.
         :param file_name: the file name to which to write the Yaml output
+        :param sections: optional iterable of (name, value) pairs, such as a generator that yields each model section
+                         as it is built, to write instead of the dictionary
         :return: The canonical java.io.File object for the Yaml File
         :raises: YamlException: if an error occurs while converting the dictionary to Yaml or writing to the file
         """
@@ -128,12 +140,16 @@ class PythonToYaml(object):
             self._logger.throwing(class_name=self._class_name, method_name=_method_name, error=yaml_ex)
             raise yaml_ex
 
+        if sections is None and self._dictionary is not None:
+            sections = self._dictionary.iteritems()
+
+        start_time = JSystem.currentTimeMillis()
         fos = None
         writer = None
         try:
             fos = JFileOutputStream(yaml_file, False)
-            writer = JPrintWriter(fos, True)
-            self._write_dictionary_to_yaml_file(self._dictionary, writer)
+            writer = JPrintWriter(JBufferedWriter(JOutputStreamWriter(fos), _write_buffer_size), False)
+            self._write_sections_to_yaml_file(sections, writer)
 
         except JFileNotFoundException, fnfe:
             yaml_ex = exception_helper.create_yaml_exception('WLSDPLY-18010', file_name,
@@ -148,36 +164,82 @@ class PythonToYaml(object):
             self._close_streams(fos, writer)
             raise yaml_ex
 
+        # the print writer does not throw write errors, check for them before closing
+        write_failed = writer.checkError()
         self._close_streams(fos, writer)
+        if write_failed:
+            yaml_ex = exception_helper.create_yaml_exception('WLSDPLY-18031', file_name)
+            self._logger.throwing(class_name=self._class_name, method_name=_method_name, error=yaml_ex)
+            raise yaml_ex
+
+        elapsed = max(JSystem.currentTimeMillis() - start_time, 1)
+        byte_count = yaml_file.length()
+        self._logger.info('WLSDPLY-18030', byte_count, 'YAML', yaml_file.getPath(), elapsed,
+                          (byte_count * 1000L) / (elapsed * 1024L), class_name=self._class_name,
+                          method_name=_method_name)
         self._logger.exiting(class_name=self._class_name, method_name=_method_name, result=yaml_file)
         return yaml_file
 
-    def _write_dictionary_to_yaml_file(self, dictionary, writer, indent=''):
+    def _write_sections_to_yaml_file(self, sections, writer):
         """
-        Do the actual heavy lifting of converting a dictionary and writing it to the file.  This method is
-        called recursively when a value of the dictionary entry is itself a dictionary.
-        :param dictionary: the Python dictionary to convert
+        Convert each top-level section and write it to the file with a single call.
+        :param sections: iterable of (name, value) pairs, may be None
         :param writer: the java.io.PrintWriter for the output file
+        """
+        if sections is None:
+            return
+
+        for key, value in sections:
+            lines = []
+            self._add_entry_lines(key, value, lines, '')
+            writer.println(self._line_separator.join(lines))
+        return
+
+    def _write_dictionary_to_yaml_file(self, dictionary, writer):
+        """
+        Convert a dictionary and write it to the specified writer, one top-level entry at a time.
+        :param dictionary: the Python dictionary to convert
+        :param writer: the java.io.PrintWriter or java.io.PrintStream for the output
+        """
+        if dictionary is not None:
+            self._write_sections_to_yaml_file(dictionary.iteritems(), writer)
+        return
+
+    def _add_dictionary_lines(self, dictionary, lines, indent):
+        """
+        Convert a dictionary to Yaml lines.  This method is called recursively when a value of the
+        dictionary entry is itself a dictionary.
+        :param dictionary: the Python dictionary to convert
+        :param lines: the list of lines to append to
         :param indent: the amount of indent to use (based on the level of recursion)
-        :raises: IOException: if an error occurs while writing the output
         """
         if dictionary is None:
             return
 
         for key, value in dictionary.iteritems():
-            quoted_key = self._quotify_string(key)
-            if isinstance(value, DictionaryList):
-                writer.println(indent + quoted_key + ':')
-                self._write_dictionary_list_to_yaml_file(value, writer, indent)
-            elif isinstance(value, dict):
-                writer.println(indent + quoted_key + ':')
-                self._write_dictionary_to_yaml_file(value, writer, indent + self._indent_unit)
-            else:
-                writer.println(indent + quoted_key + ': ' + self._get_value_string(value))
+            self._add_entry_lines(key, value, lines, indent)
+        return
 
+    def _add_entry_lines(self, key, value, lines, indent):
+        """
+        Convert a single dictionary entry to Yaml lines.
+        :param key: the key of the entry
+        :param value: the value of the entry
+        :param lines: the list of lines to append to
+        :param indent: the amount of indent to use
+        """
+        quoted_key = self._quotify_key(key)
+        if isinstance(value, DictionaryList):
+            lines.append(indent + quoted_key + ':')
+            self._add_dictionary_list_lines(value, lines, indent)
+        elif isinstance(value, dict):
+            lines.append(indent + quoted_key + ':')
+            self._add_dictionary_lines(value, lines, indent + self._indent_unit)
+        else:
+            lines.append(indent + quoted_key + ': ' + self._get_value_string(value))
         return
 
-    def _write_dictionary_list_to_yaml_file(self, dictionary_list, writer, indent=''):
+    def _add_dictionary_list_lines(self, dictionary_list, lines, indent=''):
         """
         Dictionary list is a special case for YAML. The result should look like:
 
@@ -188,10 +250,9 @@ class PythonToYaml(object):
                 subkey1: value1
                 subkey2: value2
 
-        :param dictionary: the Python dictionary to convert
-        :param writer: the java.io.PrintWriter for the output file
+        :param dictionary_list: the list of Python dictionaries to convert
+        :param lines: the list of lines to append to
         :param indent: the amount of indent to use (based on the level of recursion)
-        :raises: IOException: if an error occurs while writing the output
         """
         if dictionary_list is None:
             return
@@ -199,16 +260,16 @@ class PythonToYaml(object):
         for dictionary in dictionary_list:
             first = True
             for key, value in dictionary.items():
-                quoted_key = self._quotify_string(key)
+                quoted_key = self._quotify_key(key)
                 this_indent = indent + self._indent_unit
                 if first:
                     this_indent = indent + "-   "
 
                 if isinstance(value, dict):
-                    writer.println(this_indent + quoted_key + ':')
-                    self._write_dictionary_to_yaml_file(value, writer, this_indent + self._indent_unit)
+                    lines.append(this_indent + quoted_key + ':')
+                    self._add_dictionary_lines(value, lines, this_indent + self._indent_unit)
                 else:
-                    writer.println(this_indent + quoted_key + ': ' + self._get_value_string(value))
+                    lines.append(this_indent + quoted_key + ': ' + self._get_value_string(value))
 
                 first = False
         return
@@ -224,13 +285,10 @@ class PythonToYaml(object):
         elif type(value) is int or type(value) is long or type(value) is float:
             result = str(value)
         elif type(value) is list:
-            new_value = '['
+            elements = []
             for element in value:
-                new_value += ' ' + self._get_value_string(element) + ','
-            if len(new_value) > 1:
-                new_value = new_value[:-1]
-            new_value += ' ]'
-            result = str(new_value)
+                elements.append(' ' + self._get_value_string(element))
+            result = '[' + ','.join(elements) + ' ]'
         else:
             result = self._quotify_string(str(value))
         return result
@@ -254,6 +312,18 @@ class PythonToYaml(object):
                                   class_name=self._class_name, method_name=_method_name)
         return
 
+    def _quotify_key(self, key):
+        """
+        Quote a dictionary key if required.  Model keys repeat often, so the results are saved.
+        :param key: the key
+        :return: the quoted key, or the original key if no quoting was required
+        """
+        result = self._quoted_keys.get(key)
+        if result is None:
+            result = self._quotify_string(key)
+            self._quoted_keys[key] = result
+        return result
+
     def _quotify_string(self, text):
         """
         Insert quotes around the string value if it contains Yaml special characters that require it,
@@ -261,7 +331,7 @@ class PythonToYaml(object):
         :param text: the input string
         :return: the quoted string, or the original string if no quoting was required
         """
-        if bool(re.search(self._requires_quotes_chars_regex, text)):
+        if _requires_quotes_chars_regex.search(text) is not None:
             result = '\'' + _quote_embedded_quotes(text) + '\''
         elif len(text) == 0:
             result = '\'\''
@@ -269,6 +339,7 @@ class PythonToYaml(object):
             result = _quote_embedded_quotes(text)
         return result
 
+
 def _quote_embedded_quotes(text):
     """
     Replace any embedded quotes with two quotes.
@@ -0,0 +1,90 @@
+/*
+ * Copyright (c) 2020, Oracle Corporation and/or its affiliates.  All rights reserved.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.create;
+
+import java.io.File;
+import java.io.PrintWriter;
+import java.util.Arrays;
+
+import oracle.weblogic.deploy.util.FileUtils;
+import oracle.weblogic.deploy.util.WLSDeployZipFileTest;
+
+import org.junit.Assert;
+import org.junit.Assume;
+import org.junit.Before;
+import org.junit.Test;
+
+public class RCURunnerTest {
+    private static final File UNIT_TEST_TARGET_DIR = new File(WLSDeployZipFileTest.UNIT_TEST_TARGET_DIR, "rcurunner");
+    private static final String JAVA_HOME = System.getProperty("java.home");
+
+    @Before
+    public void setup() {
+        // the stand-in RCU scripts are shell scripts
+        Assume.assumeTrue(File.separatorChar == '/');
+        if (UNIT_TEST_TARGET_DIR.exists()) {
+            FileUtils.deleteDirectory(UNIT_TEST_TARGET_DIR);
+        }
+    }
+
+    @Test
+    public void testStartRcuReturnsBeforeRcuCompletes() throws Exception {
+        RCURunner runner = getRunner("success", 0);
+
+        long beginTime = System.currentTimeMillis();
+        runner.startRcu("sysPassword", "schemaPassword");
+        long startTime = System.currentTimeMillis() - beginTime;
+        Assert.assertTrue("startRcu() waited for RCU: " + startTime + " ms", startTime < 1000L);
+        Assert.assertTrue("RCU is not running after startRcu()", runner.isRcuRunning());
+
+        runner.waitForRcu();
+        Assert.assertFalse("RCU is running after waitForRcu()", runner.isRcuRunning());
+
+        // a second wait returns immediately
+        runner.waitForRcu();
+    }
+
+    @Test
+    public void testWaitForRcuReportsFailure() throws Exception {
+        RCURunner runner = getRunner("failure", 3);
+        runner.startRcu("sysPassword", "schemaPassword");
+        try {
+            runner.waitForRcu();
+            Assert.fail("waitForRcu() did not report the RCU failure");
+        } catch (CreateException expected) {
+            Assert.assertTrue(expected.getLocalizedMessage(), expected.getLocalizedMessage().contains("3"));
+        }
+
+        // the failure is reported once
+        runner.waitForRcu();
+    }
+
+    @Test(expected = CreateException.class)
+    public void testStartRcuValidatesArguments() throws Exception {
+        RCURunner runner = getRunner("validate", 0);
+        runner.startRcu("sysPassword", "");
+    }
+
+    private static RCURunner getRunner(String name, int exitCode) throws Exception {
+        File oracleHome = new File(UNIT_TEST_TARGET_DIR, name);
+        File binDir = new File(new File(oracleHome, "oracle_common"), "bin");
+        Assert.assertTrue("Unable to create " + binDir, binDir.mkdirs());
+
+        // a stand-in for RCU that reads the passwords, takes a while, and exits with the exit code
+        File rcuScript = new File(binDir, "rcu");
+        try (PrintWriter writer = new PrintWriter(rcuScript, "UTF-8")) {
+            writer.println("#!/bin/sh");
+            writer.println("read SYS_PASSWORD");
+            writer.println("read SCHEMA_PASSWORD");
+            writer.println("sleep 2");
+            writer.println("echo \"stand-in RCU $2 exiting with " + exitCode + "\"");
+            writer.println("exit " + exitCode);
+        }
+        Assert.assertTrue("Unable to make " + rcuScript + " executable", rcuScript.setExecutable(true));
+
+        return new RCURunner("JRF", oracleHome.getAbsolutePath(), JAVA_HOME, "localhost:1521/pdb", "TEST",
+            Arrays.asList("STB", "MDS"), null);
+    }
+}
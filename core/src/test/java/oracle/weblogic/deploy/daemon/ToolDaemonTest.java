@@ -0,0 +1,146 @@
+/*
+ * Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.daemon;
+
+import java.io.File;
+import java.io.FileInputStream;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.net.InetAddress;
+import java.net.ServerSocket;
+import java.net.Socket;
+import java.util.Properties;
+
+import oracle.weblogic.deploy.util.WLSDeployExit;
+
+import org.junit.Assert;
+import org.junit.Before;
+import org.junit.Test;
+
+
+public class ToolDaemonTest {
+    private static final String UNIT_TEST_TARGET_DIR = "target" + File.separator + "unit-tests";
+    private static final String ORACLE_HOME = UNIT_TEST_TARGET_DIR;
+    private static final long WAIT_MILLIS = 10000;
+
+    private File daemonFile;
+
+    @Before
+    public void init() {
+        File folder = new File(UNIT_TEST_TARGET_DIR);
+        if (!folder.exists()) {
+            Assert.assertTrue("Could not create directory " + folder.getPath(), folder.mkdirs());
+        }
+        daemonFile = new File(folder, "toolDaemonTest.properties");
+        if (daemonFile.exists()) {
+            Assert.assertTrue("Could not delete " + daemonFile.getPath(), daemonFile.delete());
+        }
+    }
+
+    @Test
+    public void testNoDaemon() {
+        int exitCode = ToolDaemonClient.run(daemonFile, ORACLE_HOME, "validateModel", new String[0]);
+        Assert.assertEquals(ToolDaemon.NOT_RUN_EXIT_CODE, exitCode);
+    }
+
+    @Test
+    public void testRunTools() throws Exception {
+        Thread daemonThread = startDaemon();
+
+        String[] args = { "-model_file", "model.yaml" };
+        Assert.assertEquals(2, ToolDaemonClient.run(daemonFile, ORACLE_HOME, "validateModel", args));
+        Assert.assertEquals(5, ToolDaemonClient.run(daemonFile, ORACLE_HOME, "modelHelp", new String[0]));
+        Assert.assertEquals(ToolDaemon.NOT_RUN_EXIT_CODE,
+            ToolDaemonClient.run(daemonFile, ORACLE_HOME, "createDomain", new String[0]));
+        Assert.assertEquals(ToolDaemon.NOT_RUN_EXIT_CODE,
+            ToolDaemonClient.run(daemonFile, "no-such-oracle-home", "validateModel", args));
+
+        stopDaemon(daemonThread);
+    }
+
+    @Test
+    public void testStalledConnectionIsClosed() throws Exception {
+        Thread daemonThread = startDaemon();
+
+        // a connection that never sends its request does not block the requests after it
+        Properties properties = new Properties();
+        try (FileInputStream fis = new FileInputStream(daemonFile)) {
+            properties.load(fis);
+        }
+        int port = Integer.parseInt(properties.getProperty(ToolDaemon.PORT_PROPERTY));
+        try (Socket stalled = new Socket(InetAddress.getLoopbackAddress(), port)) {
+            String[] args = { "-model_file", "model.yaml" };
+            Assert.assertEquals(2, ToolDaemonClient.run(daemonFile, ORACLE_HOME, "validateModel", args));
+            Assert.assertEquals(-1, stalled.getInputStream().read());
+        }
+
+        stopDaemon(daemonThread);
+    }
+
+    @Test
+    public void testStalledDaemonIsNotUsed() throws Exception {
+        try (ServerSocket stalled = new ServerSocket(0, 1, InetAddress.getLoopbackAddress())) {
+            Properties properties = new Properties();
+            properties.setProperty(ToolDaemon.PORT_PROPERTY, Integer.toString(stalled.getLocalPort()));
+            properties.setProperty(ToolDaemon.TOKEN_PROPERTY, "token");
+            try (FileOutputStream fos = new FileOutputStream(daemonFile)) {
+                properties.store(fos, null);
+            }
+
+            // the daemon accepts the connection but never starts the tool
+            long begin = System.currentTimeMillis();
+            int exitCode = ToolDaemonClient.run(daemonFile, ORACLE_HOME, "validateModel", new String[0]);
+            Assert.assertEquals(ToolDaemon.NOT_RUN_EXIT_CODE, exitCode);
+            Assert.assertTrue(System.currentTimeMillis() - begin < ToolDaemon.START_TIMEOUT_MILLIS + WAIT_MILLIS);
+        }
+    }
+
+    private Thread startDaemon() throws InterruptedException {
+        final ToolDaemon daemon = new ToolDaemon(daemonFile, ORACLE_HOME, "toolDaemonTest", new TestRunner());
+        Thread daemonThread = new Thread(new Runnable() {
+            @Override
+            public void run() {
+                try {
+                    daemon.serve();
+                } catch (IOException ioe) {
+                    throw new IllegalStateException(ioe);
+                }
+            }
+        });
+        daemonThread.start();
+
+        long end = System.currentTimeMillis() + WAIT_MILLIS;
+        while (!daemonFile.exists() && System.currentTimeMillis() < end) {
+            Thread.sleep(50);
+        }
+        Assert.assertTrue("Daemon file was not written", daemonFile.exists());
+        return daemonThread;
+    }
+
+    private void stopDaemon(Thread daemonThread) throws InterruptedException {
+        Assert.assertEquals(0,
+            ToolDaemonClient.run(daemonFile, ORACLE_HOME, ToolDaemon.STOP_PROGRAM_NAME, new String[0]));
+        daemonThread.join(WAIT_MILLIS);
+        Assert.assertFalse("Daemon did not stop", daemonThread.isAlive());
+        Assert.assertFalse("Daemon file was not removed", daemonFile.exists());
+    }
+
+    private static class TestRunner implements ToolRunner {
+
+        @Override
+        public boolean canRun(String programName) {
+            return "validateModel".equals(programName) || "modelHelp".equals(programName);
+        }
+
+        @Override
+        public int runTool(String programName, String[] args) {
+            System.out.println(programName + " was run by the tool daemon");
+            if ("modelHelp".equals(programName)) {
+                WLSDeployExit.exit(5);
+            }
+            return args.length;
+        }
+    }
+}
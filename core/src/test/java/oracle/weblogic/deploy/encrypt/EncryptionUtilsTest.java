@@ -1,9 +1,13 @@
 /*
- * Copyright (c) 2017, 2019, Oracle Corporation and/or its affiliates.  All rights reserved.
+ * Copyright (c) 2017, 2020, Oracle Corporation and/or its affiliates.  All rights reserved.
  * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
  */
 package oracle.weblogic.deploy.encrypt;
 
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.List;
+
 import oracle.weblogic.deploy.encrypt.EncryptionUtils;
 import org.junit.Assert;
 import org.junit.Test;
@@ -45,4 +49,33 @@ public class EncryptionUtilsTest {
         result = new String(password);
         Assert.assertEquals("Excepted decrypted password to match", PASSWORD1, result);
     }
+
+    @Test
+    public void bulkEncryptDecryptTest() throws Exception {
+        List<String> clearTexts = Arrays.asList(PASSWORD1, "", "welcome2", PASSWORD1);
+        List<String> encrypted = EncryptionUtils.encryptStrings(clearTexts, PASSPHRASE);
+        Assert.assertEquals("Expected an encrypted string for each string", clearTexts.size(), encrypted.size());
+        Assert.assertEquals("Expected an empty string to be unchanged", "", encrypted.get(1));
+        Assert.assertNotEquals("Expected a different nonce for each string", encrypted.get(0), encrypted.get(3));
+
+        List<String> cipherTexts = new ArrayList<>(encrypted);
+        cipherTexts.add(ENCRYPTED_PASSWORD1_1);
+        cipherTexts.add(ENCRYPTED_PASSWORD1_2);
+        List<char[]> decrypted = EncryptionUtils.decryptStrings(cipherTexts, PASSPHRASE);
+        Assert.assertEquals("Expected a result for each string", cipherTexts.size(), decrypted.size());
+        Assert.assertEquals(PASSWORD1, new String(decrypted.get(0)));
+        Assert.assertNull("Expected a null result for an empty string", decrypted.get(1));
+        Assert.assertEquals("welcome2", new String(decrypted.get(2)));
+        Assert.assertEquals(PASSWORD1, new String(decrypted.get(3)));
+        Assert.assertEquals(PASSWORD1, new String(decrypted.get(4)));
+        Assert.assertEquals(PASSWORD1, new String(decrypted.get(5)));
+
+        // the cached keys must not be used for a different passphrase
+        try {
+            EncryptionUtils.decryptStrings(cipherTexts, "not my passphrase".toCharArray());
+            Assert.fail("Expected decryption with the wrong passphrase to fail");
+        } catch (EncryptionException expected) {
+            // expected behavior
+        }
+    }
 }
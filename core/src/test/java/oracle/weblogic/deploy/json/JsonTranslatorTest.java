@@ -6,6 +6,12 @@ package oracle.weblogic.deploy.json;
 
 import org.junit.Assert;
 import org.junit.Test;
+import org.python.core.Py;
+import org.python.core.PyDictionary;
+import org.python.core.PyList;
+import org.python.core.PyLong;
+import org.python.core.PyObject;
+import org.python.core.PyString;
 
 import java.io.ByteArrayInputStream;
 import java.io.InputStream;
@@ -41,4 +47,90 @@ public class JsonTranslatorTest {
             logger.setLevel(originalLevel);
         }
     }
+
+    /**
+     * Verify that nested objects, arrays of scalars and arrays of objects are placed in the correct containers
+     * when the dictionary is built from the parse events.
+     */
+    @Test
+    public void testNestedObjects() throws Exception {
+        String text = "{\n"
+            + "  \"topology\": {\n"
+            + "    \"Name\": \"base_domain\",\n"
+            + "    \"Server\": {\n"
+            + "      \"s1\": { \"ListenPort\": 7001, \"Targets\": [ \"c1\", \"c2\" ], \"Enabled\": true },\n"
+            + "      \"s2\": { \"ListenPort\": 7002, \"Notes\": null }\n"
+            + "    },\n"
+            + "    \"Cluster\": { \"c1\": { } }\n"
+            + "  },\n"
+            + "  \"resources\": {\n"
+            + "    \"Items\": [ { \"Name\": \"first\" }, [ 1, 2 ], { \"Name\": \"second\" } ]\n"
+            + "  }\n"
+            + "}\n";
+        InputStream stream = new ByteArrayInputStream(text.getBytes(UTF_8));
+        JsonStreamTranslator translator = new JsonStreamTranslator("String", stream, true);
+        PyDictionary model = translator.parse();
+        Assert.assertEquals(2, model.__len__());
+
+        PyObject topology = model.__getitem__(new PyString("topology"));
+        Assert.assertEquals("base_domain", topology.__getitem__(new PyString("Name")).toString());
+
+        PyObject servers = topology.__getitem__(new PyString("Server"));
+        Assert.assertEquals(2, servers.__len__());
+        PyObject server1 = servers.__getitem__(new PyString("s1"));
+        Assert.assertEquals(new PyLong(7001), server1.__getitem__(new PyString("ListenPort")));
+        Assert.assertEquals("True", server1.__getitem__(new PyString("Enabled")).toString());
+        PyObject targets = server1.__getitem__(new PyString("Targets"));
+        Assert.assertTrue(targets instanceof PyList);
+        Assert.assertEquals(2, targets.__len__());
+        Assert.assertEquals("c2", targets.__getitem__(1).toString());
+        PyObject server2 = servers.__getitem__(new PyString("s2"));
+        Assert.assertEquals(new PyLong(7002), server2.__getitem__(new PyString("ListenPort")));
+        Assert.assertEquals(Py.None, server2.__getitem__(new PyString("Notes")));
+
+        PyObject clusters = topology.__getitem__(new PyString("Cluster"));
+        Assert.assertEquals(0, clusters.__getitem__(new PyString("c1")).__len__());
+
+        PyObject items = model.__getitem__(new PyString("resources")).__getitem__(new PyString("Items"));
+        Assert.assertTrue(items instanceof PyList);
+        Assert.assertEquals(3, items.__len__());
+        Assert.assertEquals("first", items.__getitem__(0).__getitem__(new PyString("Name")).toString());
+        Assert.assertEquals(new PyLong(2), items.__getitem__(1).__getitem__(1));
+        Assert.assertEquals("second", items.__getitem__(2).__getitem__(new PyString("Name")).toString());
+    }
+
+    /**
+     * Verify that a syntax error makes the SLL parse fall back to the LL parse, which reports the error,
+     * and that the partial results of the failed parse are not used by the next parse.
+     */
+    @Test
+    public void testFallbackToLLParse() throws Exception {
+        Logger logger = Logger.getLogger("wlsdeploy.json");
+        Level originalLevel  = logger.getLevel();
+        logger.setLevel(Level.OFF);
+
+        JsonStreamTranslator translator = new JsonStreamTranslator("String", null);
+        try {
+            // the array and object are still open at the syntax error
+            String text = "{ \"top\": { \"list\": [ \"a\", { \"b\": 1 } : ] } }";
+            translator.parseInternal("String", new ByteArrayInputStream(text.getBytes(UTF_8)));
+            Assert.fail("Test must raise JsonException when model has a syntax error");
+
+        } catch(JsonException e) {
+            // expected result
+
+        } finally {
+            logger.setLevel(originalLevel);
+        }
+
+        String text = "{ \"top\": { \"list\": [ \"a\" ], \"other\": { \"key\": \"value\" } } }";
+        PyDictionary model = translator.parseInternal("String", new ByteArrayInputStream(text.getBytes(UTF_8)));
+        Assert.assertEquals(1, model.__len__());
+        PyObject top = model.__getitem__(new PyString("top"));
+        Assert.assertEquals(2, top.__len__());
+        Assert.assertEquals(1, top.__getitem__(new PyString("list")).__len__());
+        PyObject other = top.__getitem__(new PyString("other"));
+        Assert.assertTrue(other instanceof PyDictionary);
+        Assert.assertEquals("value", other.__getitem__(new PyString("key")).toString());
+    }
 }
@@ -7,6 +7,7 @@ package oracle.weblogic.deploy.util;
 import java.io.ByteArrayOutputStream;
 import java.io.File;
 import java.io.FileOutputStream;
+import java.nio.file.Files;
 import java.text.MessageFormat;
 import java.util.zip.ZipEntry;
 import java.util.zip.ZipOutputStream;
@@ -117,6 +118,54 @@ public class FileUtilsTest {
         String appHash = FileUtils.computeHash(appFile.getAbsolutePath());
 
         Assert.assertEquals(appHash, archiveHash);
+        Assert.assertEquals(appHash, FileUtils.computeHash(FileUtils.readFileToByteArray(appFile)));
+    }
+
+    @Test
+    public void testCachedHashing() throws Exception {
+        File archiveFile = FileUtils.getCanonicalFile(new File(ARCHIVE_FILE_NAME));
+        WLSDeployArchive archive = new WLSDeployArchive(archiveFile.getAbsolutePath());
+        File appFile = FileUtils.getCanonicalFile(new File(APP_FILE_NAME));
+        String appHash = FileUtils.computeHash(appFile);
+
+        File cacheFile = new File(UNIT_TEST_TARGET_DIR, "file_hashes.properties");
+        if (cacheFile.exists() && !cacheFile.delete()) {
+            throw new Exception("Unable to delete hash cache file: " + cacheFile);
+        }
+
+        FileDigestCache cache = new FileDigestCache(cacheFile);
+        Assert.assertEquals(appHash, cache.getFileHash(appFile.getAbsolutePath()));
+        Assert.assertEquals(appHash, cache.getArchiveEntryHash(archive, APP_PATH));
+        cache.save();
+        Assert.assertTrue("expected hash cache file to be saved", cacheFile.isFile());
+
+        // a new cache reads the saved hashes
+        FileDigestCache savedCache = new FileDigestCache(cacheFile);
+        Assert.assertEquals(appHash, savedCache.getFileHash(appFile.getAbsolutePath()));
+        Assert.assertEquals(appHash, savedCache.getArchiveEntryHash(archive, APP_PATH));
+        archive.close();
+    }
+
+    @Test
+    public void testCopyDirectory() throws Exception {
+        File sourceDir = new File(UNIT_TEST_TARGET_DIR, "copySource");
+        File targetDir = new File(UNIT_TEST_TARGET_DIR, "copyTarget");
+        FileUtils.deleteDirectory(sourceDir);
+        FileUtils.deleteDirectory(targetDir);
+
+        File binDir = new File(sourceDir, "bin");
+        Assert.assertTrue("unable to create " + binDir, binDir.mkdirs());
+        File scriptFile = new File(binDir, "start.sh");
+        Files.write(scriptFile.toPath(), "echo start".getBytes());
+        Assert.assertTrue("unable to set executable " + scriptFile, scriptFile.setExecutable(true));
+        Assert.assertTrue("unable to create empty directory", new File(sourceDir, "empty").mkdir());
+
+        FileUtils.copyDirectory(sourceDir, targetDir);
+
+        File copiedScript = new File(targetDir, "bin/start.sh");
+        Assert.assertEquals("echo start", new String(Files.readAllBytes(copiedScript.toPath())));
+        Assert.assertTrue("expected copied script to be executable", copiedScript.canExecute());
+        Assert.assertTrue("expected empty directory to be copied", new File(targetDir, "empty").isDirectory());
     }
 
     @Test
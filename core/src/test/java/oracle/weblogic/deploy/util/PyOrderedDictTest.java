@@ -125,4 +125,46 @@ public class PyOrderedDictTest {
 
         Assert.assertEquals("", myOrderedDictKeys, expected);
     }
+
+    @Test
+    public void testDeleteAndReinsert() throws Exception {
+        PyOrderedDict myOrderedDict = new PyOrderedDict();
+        myOrderedDict.__setitem__("one", new PyInteger(1));
+        myOrderedDict.__setitem__("two", new PyInteger(2));
+        myOrderedDict.__setitem__("three", new PyInteger(3));
+
+        myOrderedDict.__delitem__(new PyString("one"));
+        myOrderedDict.__setitem__("one", new PyInteger(11));
+        myOrderedDict.__delitem__(new PyString("two"));
+
+        PyObject[] keys = new PyObject[2];
+        keys[0] = new PyString("three");
+        keys[1] = new PyString("one");
+
+        Assert.assertEquals("", new PyList(keys), myOrderedDict.keys());
+        Assert.assertEquals("", 2, myOrderedDict.__len__());
+        Assert.assertEquals("", 11, ((PyInteger) myOrderedDict.get(new PyString("one"))).getValue());
+        Assert.assertFalse("", myOrderedDict.has_key(new PyString("two")));
+    }
+
+    @Test
+    public void testSharedCopy() throws Exception {
+        PyOrderedDict server = new PyOrderedDict();
+        server.__setitem__("ListenPort", new PyInteger(7001));
+        PyOrderedDict servers = new PyOrderedDict();
+        servers.__setitem__("s1", server);
+        PyOrderedDict topology = new PyOrderedDict();
+        topology.__setitem__("Server", servers);
+
+        PyOrderedDict copy = topology.sharedCopy();
+        PyOrderedDict copyServer = (PyOrderedDict) ((PyOrderedDict) copy.get(new PyString("Server")))
+            .get(new PyString("s1"));
+        copyServer.__setitem__("ListenPort", new PyInteger(8001));
+
+        PyOrderedDict originalServer = (PyOrderedDict) ((PyOrderedDict) topology.get(new PyString("Server")))
+            .get(new PyString("s1"));
+        Assert.assertEquals("", 7001, ((PyInteger) originalServer.get(new PyString("ListenPort"))).getValue());
+        Assert.assertEquals("", 8001, ((PyInteger) copyServer.get(new PyString("ListenPort"))).getValue());
+        Assert.assertEquals("", topology.keys(), copy.keys());
+    }
 }
@@ -43,6 +43,7 @@ public class WLSDeployZipFileTest {
        "wlsdeploy/applications/get-listen-address-app.war", "wlsdeploy/applications/simpleear.ear" };
 
     private static final String ZIP_FILE_SIMPLE_APPS_MODEL_FILE3 = "sample-apps-archive3.zip";
+    private static final String ZIP_FILE_SIMPLE_APPS_MODEL_FILE4 = "sample-apps-archive4.zip";
     private static final String LOG_PROPERTIES_SOURCE_LOCATION =
         UNIT_TEST_SOURCE_DIR + File.separator + "log.properties";
 
@@ -206,6 +207,90 @@ public class WLSDeployZipFileTest {
         zf.close();
     }
 
+    @Test
+    public void testIndexedLookups() throws Exception {
+        File f = new File(UNIT_TEST_TARGET_DIR + File.separator + ZIP_FILE_SIMPLE_APPS_MODEL_FILE2);
+        WLSDeployZipFile zf = new WLSDeployZipFile(f);
+
+        Assert.assertTrue("expected entry to be found", zf.containsZipEntry("wlsdeploy/applications/simpleear.ear"));
+        Assert.assertFalse("expected entry not to be found", zf.containsZipEntry("wlsdeploy/applications/simple"));
+        Assert.assertTrue("expected prefix to be found",
+            zf.containsZipEntryWithPrefix("wlsdeploy/applications/simple"));
+        Assert.assertTrue("expected prefix to be found", zf.containsZipEntryWithPrefix("wlsdeploy/sharedLibraries/"));
+        Assert.assertFalse("expected prefix not to be found",
+            zf.containsZipEntryWithPrefix("wlsdeploy/classpathLibraries"));
+        Assert.assertFalse("expected prefix not to be found", zf.containsZipEntryWithPrefix("zzz"));
+
+        // reading entries keeps the zip file open, and the index is still valid
+        InputStream stream = zf.getZipEntry("model/SingleAppDomain.yaml");
+        Assert.assertNotNull("expected non-null InputStream to be returned", stream);
+        stream.close();
+        Assert.assertEquals("unexpected number of entries", ZIP_FILE_SIMPLE_APPS_MODEL_FILE2_ENTRIES.length,
+            zf.listZipEntries().size());
+
+        // the index is rebuilt after the zip file is modified
+        File logPropertiesFile = new File(LOG_PROPERTIES_SOURCE_LOCATION);
+        boolean added = zf.addZipEntry("model/logging/log.properties", new FileInputStream(logPropertiesFile));
+        Assert.assertTrue("expected entry to be added", added);
+        Assert.assertTrue("expected added entry to be found", zf.containsZipEntry("model/logging/log.properties"));
+        Assert.assertTrue("expected added prefix to be found", zf.containsZipEntryWithPrefix("model/logging/"));
+
+        boolean removed = zf.removeZipEntries("wlsdeploy/applications/");
+        Assert.assertTrue("expected entries to be removed", removed);
+        Assert.assertFalse("expected removed entry not to be found",
+            zf.containsZipEntry("wlsdeploy/applications/simpleear.ear"));
+        Assert.assertFalse("expected removed prefix not to be found",
+            zf.containsZipEntryWithPrefix("wlsdeploy/applications/"));
+        Assert.assertTrue("expected remaining prefix to be found", zf.containsZipEntryWithPrefix("wlsdeploy/shared"));
+        zf.close();
+    }
+
+    @Test
+    public void testBatchChanges() throws Exception {
+        copyFile(ZIP_FILE_SIMPLE_APPS_MODEL_FILE, ZIP_FILE_SIMPLE_APPS_MODEL_FILE4);
+        File f = new File(UNIT_TEST_TARGET_DIR + File.separator + ZIP_FILE_SIMPLE_APPS_MODEL_FILE4);
+        long originalLength = f.length();
+        File logPropertiesFile = new File(LOG_PROPERTIES_SOURCE_LOCATION);
+
+        WLSDeployZipFile zf = new WLSDeployZipFile(f);
+        zf.beginBatch();
+        Assert.assertTrue("expected batch to be open", zf.isBatchOpen());
+
+        // staged entries are considered when renaming new entries
+        String appEntry = "wlsdeploy/applications/simpleear.ear";
+        String firstName = zf.addZipEntry(appEntry, new FileInputStream(logPropertiesFile), true);
+        String secondName = zf.addZipEntry(appEntry, new FileInputStream(logPropertiesFile), true);
+        Assert.assertEquals("unexpected name", "wlsdeploy/applications/simpleear(1).ear", firstName);
+        Assert.assertEquals("unexpected name", "wlsdeploy/applications/simpleear(2).ear", secondName);
+
+        boolean removed = zf.removeZipEntries("wlsdeploy/sharedLibraries/");
+        Assert.assertTrue("expected entries to be removed", removed);
+        Assert.assertFalse("expected removed prefix not to be found",
+            zf.containsZipEntryWithPrefix("wlsdeploy/sharedLibraries/"));
+
+        InputStream stream = zf.getZipEntry(secondName);
+        Assert.assertNotNull("expected staged entry to be read", stream);
+        stream.close();
+        Assert.assertEquals("expected zip file to be unchanged", originalLength, f.length());
+
+        zf.commitBatch();
+        Assert.assertFalse("expected batch to be closed", zf.isBatchOpen());
+
+        WLSDeployZipFile savedZipFile = new WLSDeployZipFile(f);
+        List<String> entries = savedZipFile.listZipEntries();
+        Assert.assertTrue("expected saved entry", entries.contains(firstName));
+        Assert.assertTrue("expected saved entry", entries.contains(secondName));
+        Assert.assertTrue("expected original entry", entries.contains(appEntry));
+        Assert.assertFalse("expected removed entry", entries.contains("wlsdeploy/sharedLibraries/jsf-2.0.war"));
+
+        // discarded changes leave the zip file unchanged
+        savedZipFile.beginBatch();
+        savedZipFile.removeZipEntries("model/");
+        savedZipFile.rollbackBatch();
+        Assert.assertTrue("expected entry to remain", savedZipFile.containsZipEntry("model/SingleAppDomain.yaml"));
+        savedZipFile.close();
+    }
+
     @Test
     public void testReallyMatches() throws Exception {
         File f = new File(UNIT_TEST_TARGET_DIR + File.separator + ZIP_FILE_EXISTING_EMPTY_FILE);
@@ -6,6 +6,11 @@ package oracle.weblogic.deploy.yaml;
 
 import org.junit.Assert;
 import org.junit.Test;
+import org.python.core.PyDictionary;
+import org.python.core.PyList;
+import org.python.core.PyLong;
+import org.python.core.PyObject;
+import org.python.core.PyString;
 
 import java.io.ByteArrayInputStream;
 import java.io.InputStream;
@@ -43,4 +48,88 @@ public class YamlTranslatorTest {
             logger.setLevel(originalLevel);
         }
     }
+
+    /**
+     * Verify that nested objects, lists and values are placed in the correct containers
+     * when the dictionary is built from the parse events.
+     */
+    @Test
+    public void testNestedObjects() throws Exception {
+        String text = "topology:\n"
+            + "  Name: base_domain\n"
+            + "  Server:\n"
+            + "    s1:\n"
+            + "      ListenPort: 7001\n"
+            + "      Targets:\n"
+            + "        - c1\n"
+            + "        - c2\n"
+            + "    s2:\n"
+            + "      ListenPort: 7002\n"
+            + "  Cluster:\n"
+            + "    c1:\n"
+            + "appDeployments:\n"
+            + "  Library: [ lib1, lib2 ]\n";
+        InputStream stream = new ByteArrayInputStream(text.getBytes(UTF_8));
+        YamlStreamTranslator translator = new YamlStreamTranslator("String", stream, true);
+        PyDictionary model = translator.parse();
+
+        PyObject topology = model.__getitem__(new PyString("topology"));
+        Assert.assertEquals("base_domain", topology.__getitem__(new PyString("Name")).toString());
+
+        PyObject servers = topology.__getitem__(new PyString("Server"));
+        Assert.assertEquals(2, servers.__len__());
+        PyObject server1 = servers.__getitem__(new PyString("s1"));
+        Assert.assertEquals(new PyLong(7001), server1.__getitem__(new PyString("ListenPort")));
+        PyObject targets = server1.__getitem__(new PyString("Targets"));
+        Assert.assertTrue(targets instanceof PyList);
+        Assert.assertEquals(2, targets.__len__());
+        Assert.assertEquals("c2", targets.__getitem__(1).toString());
+        PyObject server2 = servers.__getitem__(new PyString("s2"));
+        Assert.assertEquals(new PyLong(7002), server2.__getitem__(new PyString("ListenPort")));
+
+        PyObject clusters = topology.__getitem__(new PyString("Cluster"));
+        Assert.assertEquals(0, clusters.__getitem__(new PyString("c1")).__len__());
+
+        PyObject libraries = model.__getitem__(new PyString("appDeployments")).__getitem__(new PyString("Library"));
+        Assert.assertEquals(2, libraries.__len__());
+    }
+
+    /**
+     * Verify that a list left open by a failed parse is not written over an object by the next parse,
+     * as can happen when an SLL parse is abandoned for the LL parse.
+     */
+    @Test
+    public void testOpenListDiscardedByNextParse() throws Exception {
+        Logger logger = Logger.getLogger("wlsdeploy.yaml");
+        Level originalLevel  = logger.getLevel();
+        logger.setLevel(Level.OFF);
+
+        YamlStreamTranslator translator = new YamlStreamTranslator("String", null, true);
+        try {
+            // the Targets list is open at the syntax error
+            String text = "topology:\n"
+                + "  Targets:\n"
+                + "    - c1\n"
+                + "    - c2\n"
+                + "    ]]\n";
+            translator.parseInternal("String", new ByteArrayInputStream(text.getBytes(UTF_8)));
+            Assert.fail("Test must raise YamlException when model has a syntax error");
+
+        } catch(YamlException e) {
+            // expected result
+
+        } finally {
+            logger.setLevel(originalLevel);
+        }
+
+        String text = "topology:\n"
+            + "  Server:\n"
+            + "    s1:\n"
+            + "      ListenPort: 7001\n";
+        PyDictionary model = translator.parseInternal("String", new ByteArrayInputStream(text.getBytes(UTF_8)));
+        PyObject server1 = model.__getitem__(new PyString("topology")).__getitem__(new PyString("Server"))
+            .__getitem__(new PyString("s1"));
+        Assert.assertTrue(server1 instanceof PyDictionary);
+        Assert.assertEquals(new PyLong(7001), server1.__getitem__(new PyString("ListenPort")));
+    }
 }
@@ -0,0 +1,116 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from wlsdeploy.aliases import alias_cache
+from wlsdeploy.aliases.alias_entries import AliasEntries
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.aliases.wlst_modes import WlstModes
+
+
+class AliasCacheTestCase(unittest.TestCase):
+    """
+    Test the persistent cache of resolved alias categories.
+    """
+    _wls_version = '12.2.1.3'
+
+    def setUp(self):
+        self._cache_dir = os.path.join(tempfile.gettempdir(), 'AliasCacheTestCase')
+        if os.path.exists(self._cache_dir):
+            shutil.rmtree(self._cache_dir)
+        self._saved_cache_dir = os.environ.get(alias_cache.ALIAS_CACHE_DIR_VARIABLE, None)
+        os.environ[alias_cache.ALIAS_CACHE_DIR_VARIABLE] = self._cache_dir
+
+    def tearDown(self):
+        if self._saved_cache_dir is None:
+            del os.environ[alias_cache.ALIAS_CACHE_DIR_VARIABLE]
+        else:
+            os.environ[alias_cache.ALIAS_CACHE_DIR_VARIABLE] = self._saved_cache_dir
+        if os.path.exists(self._cache_dir):
+            shutil.rmtree(self._cache_dir)
+
+    def testCacheRoundTrip(self):
+        categories = {'Server': {'folders': {}, 'wlst_type': 'Server'}, 'Partition': None}
+        cache_file = alias_cache.save_category_dictionary(self._wls_version, WlstModes.OFFLINE, 'abc', categories)
+        self.assertNotEqual(cache_file, None)
+        self.assertEqual(os.path.isfile(cache_file), True)
+
+        result = alias_cache.load_category_dictionary(self._wls_version, WlstModes.OFFLINE, 'abc')
+        self.assertEqual(result, categories)
+
+    def testCacheInvalidation(self):
+        categories = {'Server': {'folders': {}}}
+        alias_cache.save_category_dictionary(self._wls_version, WlstModes.OFFLINE, 'abc', categories)
+
+        # a different checksum, version, or mode is a cache miss
+        self.assertEqual(alias_cache.load_category_dictionary(self._wls_version, WlstModes.OFFLINE, 'xyz'), None)
+        self.assertEqual(alias_cache.load_category_dictionary('12.2.1.4', WlstModes.OFFLINE, 'abc'), None)
+        self.assertEqual(alias_cache.load_category_dictionary(self._wls_version, WlstModes.ONLINE, 'abc'), None)
+
+    def testCorruptCacheFile(self):
+        cache_file = alias_cache.get_cache_file_path(self._wls_version, WlstModes.OFFLINE)
+        os.makedirs(os.path.dirname(cache_file))
+        cache_stream = open(cache_file, 'wb')
+        cache_stream.write('not a cache file')
+        cache_stream.close()
+
+        self.assertEqual(alias_cache.load_category_dictionary(self._wls_version, WlstModes.OFFLINE, 'abc'), None)
+
+    def testDisabledCache(self):
+        os.environ[alias_cache.ALIAS_CACHE_DIR_VARIABLE] = ''
+        self.assertEqual(alias_cache.is_enabled(), False)
+        self.assertEqual(alias_cache.save_category_dictionary(self._wls_version, WlstModes.OFFLINE, 'abc', {}), None)
+
+    def testAliasEntriesUseCache(self):
+        # the first instance builds the cache, the next one loads it
+        AliasEntries(WlstModes.OFFLINE, self._wls_version)
+        cache_file = alias_cache.get_cache_file_path(self._wls_version, WlstModes.OFFLINE)
+        self.assertEqual(os.path.isfile(cache_file), True)
+        cached = AliasEntries(WlstModes.OFFLINE, self._wls_version)
+        self.assertEqual(cached.save_category_cache(), cache_file)
+
+        os.environ[alias_cache.ALIAS_CACHE_DIR_VARIABLE] = ''
+        uncached = AliasEntries(WlstModes.OFFLINE, self._wls_version)
+
+        location = LocationContext().append_location('JDBCSystemResource')
+        self.assertEqual(cached.get_model_subfolder_names_for_location(location),
+                         uncached.get_model_subfolder_names_for_location(location))
+        self.assertEqual(cached.get_wlst_mbean_type_for_location(location),
+                         uncached.get_wlst_mbean_type_for_location(location))
+
+    def testUnwritableCacheDirectory(self):
+        # a cache directory under a file can't be created
+        os.makedirs(self._cache_dir)
+        blocking_file = os.path.join(self._cache_dir, 'file')
+        blocking_stream = open(blocking_file, 'w')
+        blocking_stream.close()
+        os.environ[alias_cache.ALIAS_CACHE_DIR_VARIABLE] = os.path.join(blocking_file, 'aliases')
+        self.assertEqual(alias_cache.is_writable(), False)
+
+        # the aliases are loaded as they are used, and no cache file is written
+        alias_entries = AliasEntries(WlstModes.OFFLINE, self._wls_version)
+        self.assertEqual(alias_entries.save_category_cache(), None)
+
+        os.environ[alias_cache.ALIAS_CACHE_DIR_VARIABLE] = ''
+        uncached = AliasEntries(WlstModes.OFFLINE, self._wls_version)
+        location = LocationContext().append_location('JDBCSystemResource')
+        self.assertEqual(alias_entries.get_wlst_mbean_type_for_location(location),
+                         uncached.get_wlst_mbean_type_for_location(location))
+
+        os.environ[alias_cache.ALIAS_CACHE_DIR_VARIABLE] = self._cache_dir
+        self.assertEqual(alias_cache.is_writable(), True)
+
+    def testClearCache(self):
+        alias_cache.save_category_dictionary(self._wls_version, WlstModes.OFFLINE, 'abc', {})
+        alias_cache.save_category_dictionary(self._wls_version, WlstModes.ONLINE, 'abc', {})
+        self.assertEqual(alias_cache.clear_cache(), 2)
+        self.assertEqual(alias_cache.load_category_dictionary(self._wls_version, WlstModes.OFFLINE, 'abc'), None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,6 +12,10 @@ from java.util import Properties
 from oracle.weblogic.deploy.aliases import AliasException
 from oracle.weblogic.deploy.aliases import TypeUtils
 
+from wlsdeploy.aliases.alias_constants import MODEL_NAME
+from wlsdeploy.aliases.alias_constants import WLST_ATTRIBUTES_PATH
+from wlsdeploy.aliases.alias_constants import WLST_PATH
+from wlsdeploy.aliases.alias_entries import AliasEntries
 from wlsdeploy.aliases.aliases import Aliases
 from wlsdeploy.aliases.location_context import LocationContext
 import wlsdeploy.aliases.model_constants as FOLDERS
@@ -1355,6 +1359,57 @@ class AliasesTestCase(unittest.TestCase):
             self.aliases.get_wlst_attribute_name_and_value(location, FOLDERS.CONSTRAINED_CANDIDATE_SERVER, model_value)
         self.assertEquals(wlst_value_expected, wlst_value)
 
+    def testAttributeEntriesAreSharedViews(self):
+        alias_entries = AliasEntries(wlst_mode=WlstModes.OFFLINE, wls_version=self.wls_version)
+        location = LocationContext().append_location(FOLDERS.SERVER)
+        location.add_name_token(self.aliases.get_name_token(location), 'AdminServer')
+
+        model_entry = alias_entries.get_alias_attribute_entry_by_model_name(location, 'ListenPort')
+        self.assertEqual(model_entry[MODEL_NAME], 'ListenPort')
+        self.assertEqual(WLST_PATH in model_entry, False)
+        self.assertEqual(WLST_PATH in model_entry.keys(), False)
+        self.assertRaises(KeyError, model_entry.__getitem__, WLST_PATH)
+
+        # lookups by model name, WLST name, and location return the same instance
+        wlst_entry = alias_entries.get_alias_attribute_entry_by_wlst_name(location, 'ListenPort')
+        self.assertEqual(wlst_entry is model_entry, True)
+        all_entries = alias_entries.get_alias_attribute_entries_by_location(location)
+        self.assertEqual(all_entries['ListenPort'] is model_entry, True)
+
+        # the entry can not be modified, but a copy can
+        try:
+            model_entry[MODEL_NAME] = 'foo'
+            self.fail('Alias attribute entry should be read-only')
+        except (TypeError, AttributeError):
+            pass
+        entry_copy = model_entry.copy()
+        entry_copy[MODEL_NAME] = 'foo'
+        self.assertEqual(model_entry[MODEL_NAME], 'ListenPort')
+        return
+
+    def testResolvedLocationsAreCachedByNameTokens(self):
+        alias_entries = AliasEntries(wlst_mode=WlstModes.OFFLINE, wls_version=self.wls_version)
+        location = LocationContext().append_location(FOLDERS.SERVER)
+        token = self.aliases.get_name_token(location)
+        location.add_name_token(token, 'AdminServer')
+        other_location = LocationContext().append_location(FOLDERS.SERVER)
+        other_location.add_name_token(token, 'ManagedServer1')
+
+        folder_dict = alias_entries.get_dictionary_for_location(location)
+        other_folder_dict = alias_entries.get_dictionary_for_location(other_location)
+        self.assertEqual(folder_dict[WLST_ATTRIBUTES_PATH], '/Server/AdminServer')
+        self.assertEqual(other_folder_dict[WLST_ATTRIBUTES_PATH], '/Server/ManagedServer1')
+        self.assertEqual(alias_entries.get_dictionary_for_location(LocationContext(location)) is folder_dict, True)
+
+        # the name lists from the folder index can be modified by the caller
+        names = self.aliases.get_model_restart_required_attribute_names(location)
+        names.append('NotAnAttribute')
+        names = self.aliases.get_model_restart_required_attribute_names(location)
+        self.assertEqual('NotAnAttribute' in names, False)
+        self.assertEqual(self.aliases.is_model_password_attribute(location, 'CustomIdentityKeyStorePassPhraseEncrypted'),
+                         True)
+        return
+
     def testReadOnlyDiscoverAttribute(self):
         location = LocationContext()
         location.add_name_token(self.online_aliases.get_name_token(location), 'my-domain')
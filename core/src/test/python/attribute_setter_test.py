@@ -0,0 +1,147 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import unittest
+
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.aliases.model_constants import SERVER
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.exception.expection_types import ExceptionType
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.util import mbean_directory
+from wlsdeploy.tool.util import wlst_helper
+from wlsdeploy.tool.util.attribute_setter import AttributeSetter
+from wlsdeploy.tool.util.wlst_helper import WlstHelper
+from wlsdeploy.util.cla_utils import CommandLineArgUtil as CLA
+from wlsdeploy.util.model_context import ModelContext
+
+
+class AttributeSetterTestCase(unittest.TestCase):
+    """
+    Test that the AttributeSetter finds MBeans that WLST created after the MBean directory listed their type,
+    using a stub offline WLST session.
+    """
+    _wls_version = '12.2.1.3'
+    _logger = PlatformLogger('wlsdeploy.unittest')
+
+    def setUp(self):
+        arg_map = dict()
+        arg_map[CLA.ORACLE_HOME_SWITCH] = '/my/path/to/oracle'
+        arg_map[CLA.TARGET_MODE_SWITCH] = 'offline'
+        model_context = ModelContext('test', arg_map)
+        aliases = Aliases(model_context=model_context, wlst_mode=WlstModes.OFFLINE, wls_version=self._wls_version)
+
+        self._saved_functions = wlst_helper.wlst_functions
+        self._wlst = _StubWlst()
+        wlst_helper.wlst_functions = self._wlst.get_functions()
+        mbean_directory.get_mbean_directory().clear()
+
+        self._wlst_helper = WlstHelper(ExceptionType.CREATE)
+        self._attribute_setter = AttributeSetter(aliases, self._logger, ExceptionType.CREATE)
+        self._server_location = LocationContext().append_location(SERVER)
+        self._server_location.add_name_token(aliases.get_name_token(self._server_location), 'm1')
+
+    def tearDown(self):
+        mbean_directory.get_mbean_directory().clear()
+        wlst_helper.wlst_functions = self._saved_functions
+
+    def testMBeanCreatedBySetServerGroups(self):
+        self._check_created_mbean(lambda helper: helper.set_server_groups('m1', ['JRF-MAN-SVR']))
+
+    def testMBeanCreatedByLoadTemplates(self):
+        self._check_created_mbean(lambda helper: helper.load_templates())
+
+    def testMBeanCreatedByApplyJrf(self):
+        self._check_created_mbean(lambda helper: helper.apply_jrf('m1', '/my/domain'))
+
+    def _check_created_mbean(self, create_function):
+        # the cluster names are listed, and kept in the MBean directory
+        self._wlst_helper.cd('/Server/m1')
+        self._attribute_setter.set_cluster_mbean(self._server_location, 'Cluster', 'cluster-1', None)
+        self.assertEqual(self._wlst.get_set_values(), [('/Server/m1', 'Cluster', 'mbean:/Cluster/cluster-1')])
+
+        # the WLST function creates a cluster, as the templates and server groups can do
+        self._wlst.set_created_mbean('/Cluster', 'cluster-2')
+        create_function(self._wlst_helper)
+        self.assertEqual(self._wlst.get_created_count(), 1)
+
+        self._wlst_helper.cd('/Server/m1')
+        self._attribute_setter.set_cluster_mbean(self._server_location, 'Cluster', 'cluster-2', None)
+        self.assertEqual(self._wlst.get_set_values()[-1], ('/Server/m1', 'Cluster', 'mbean:/Cluster/cluster-2'))
+
+
+class _StubWlst(object):
+    """
+    The WLST globals of an offline session, with a tree of clusters and servers.
+    The functions that apply templates and server groups create the next MBean.
+    """
+
+    def __init__(self):
+        self._children = {
+            '/': ['Cluster', 'Server'],
+            '/Cluster': ['cluster-1'],
+            '/Server': ['m1']
+        }
+        self._path = '/'
+        self._set_values = []
+        self._created_mbean = None
+        self._created_count = 0
+
+    def get_functions(self):
+        return {
+            'cd': self._cd,
+            'pwd': self._pwd,
+            'ls': self._ls,
+            'set': self._set,
+            'setServerGroups': self._create,
+            'loadTemplates': self._create,
+            'applyJRF': self._create,
+            'WLSTException': _StubWlstException
+        }
+
+    def get_set_values(self):
+        return self._set_values
+
+    def set_created_mbean(self, list_path, name):
+        self._created_mbean = (list_path, name)
+
+    def get_created_count(self):
+        return self._created_count
+
+    def _cd(self, path):
+        if path != '/':
+            parent_path = path[:path.rfind('/')]
+            if parent_path == '':
+                parent_path = '/'
+            name = path[path.rfind('/') + 1:]
+            if parent_path not in self._children or name not in self._children[parent_path]:
+                raise _StubWlstException('No such path ' + path)
+        self._path = path
+        return 'mbean:' + path
+
+    def _pwd(self):
+        if self._path == '/':
+            return '/base_domain'
+        return '/base_domain' + self._path
+
+    def _ls(self, ls_type, returnMap=None, returnType=None):
+        return list(self._children.get(self._path, []))
+
+    def _set(self, attribute, value):
+        self._set_values.append((self._path, attribute, value))
+
+    def _create(self, *args, **kwargs):
+        list_path, name = self._created_mbean
+        self._children[list_path].append(name)
+        self._children[list_path + '/' + name] = []
+        self._created_count += 1
+
+
+class _StubWlstException(Exception):
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
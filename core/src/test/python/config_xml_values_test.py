@@ -0,0 +1,125 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Test that the config.xml reader reads the names, attribute values and subfolders in the config.xml and module
+descriptors of the sample domain, and that it does not answer the queries for files it does not read.
+"""
+import unittest
+
+from wlsdeploy.tool.discover import config_xml_reader
+from wlsdeploy.tool.discover.config_xml_reader import ConfigXmlReader
+
+
+class ConfigXmlValuesTestCase(unittest.TestCase):
+    _domain_home = '../../test-classes/config-xml-domain'
+
+    def setUp(self):
+        self._reader = ConfigXmlReader(self._domain_home)
+
+    def testNormalize(self):
+        self.assertEqual(config_xml_reader.normalize('ListenPort'), 'listenport')
+        self.assertEqual(config_xml_reader.normalize('listen-port'), 'listenport')
+        self.assertEqual(config_xml_reader.normalize('JDBCSystemResource'), 'jdbcsystemresource')
+        self.assertEqual(config_xml_reader.normalize('jdbc-system-resource'), 'jdbcsystemresource')
+
+    def testDomainAttributes(self):
+        values = self._reader.get_attribute_values('/')
+        self.assertEqual(values['name'], 'base_domain')
+        self.assertEqual(values['productionmodeenabled'], 'true')
+        self.assertEqual(values['adminservername'], 'AdminServer')
+        self.assertEqual('server' in values, False)
+
+        subfolders = self._reader.get_subfolder_types('/')
+        subfolders.sort()
+        self.assertEqual(subfolders, ['cluster', 'coherenceclustersystemresource', 'jdbcsystemresource',
+                                      'jmsserver', 'jmssystemresource', 'securityconfiguration', 'server',
+                                      'wldfsystemresource'])
+
+    def testNamedMBeans(self):
+        self.assertEqual(self._reader.get_names('/Server'), ['AdminServer', 'm1'])
+        self.assertEqual(self._reader.get_names('/Cluster'), ['mycluster'])
+        self.assertEqual(self._reader.get_names('/MailSession'), [])
+        self.assertEqual(self._reader.has_names('/Server'), True)
+        self.assertEqual(self._reader.has_names('/MailSession'), False)
+
+        values = self._reader.get_attribute_values('/Server/m1')
+        self.assertEqual(values['listenport'], '8001')
+        self.assertEqual(values['cluster'], 'mycluster')
+        self.assertEqual(values['machine'], None)
+        self.assertEqual(self._reader.get_attribute_values('/Server/AdminServer')['listenaddress'], '')
+        self.assertEqual(self._reader.get_attribute_values('/Server/m2'), None)
+
+    def testAttributesNotInFiles(self):
+        # unlike WLST lsa, only the attributes in the files are reported
+        values = self._reader.get_attribute_values('/Server/AdminServer')
+        keys = values.keys()
+        keys.sort()
+        self.assertEqual(keys, ['listenaddress', 'listenport', 'name'])
+
+    def testUnnamedSingletons(self):
+        # WLST names the unnamed singletons, so the reader does not list their names
+        self.assertEqual(self._reader.get_names('/Server/m1/SSL'), None)
+        self.assertEqual(self._reader.has_names('/Server/m1/SSL'), True)
+        self.assertEqual(self._reader.get_attribute_values('/Server/m1/SSL/m1')['listenport'], '8102')
+        self.assertEqual(self._reader.get_attribute_values('/Server/m1/Log/m1')['filecount'], '10')
+
+        subfolders = self._reader.get_subfolder_types('/Server/m1')
+        subfolders.sort()
+        self.assertEqual(subfolders, ['log', 'ssl'])
+
+    def testSecurityProviders(self):
+        self.assertEqual(self._reader.get_names('/SecurityConfiguration/base_domain/Realm'), ['myrealm'])
+        self.assertEqual(self._reader.get_names('/SecurityConfiguration/base_domain/Realm/myrealm/'
+                                                'AuthenticationProvider'), ['DefaultAuthenticator'])
+        values = self._reader.get_attribute_values('/SecurityConfiguration/base_domain/Realm/myrealm/'
+                                                   'AuthenticationProvider/DefaultAuthenticator')
+        self.assertEqual(values['controlflag'], 'SUFFICIENT')
+
+    def testJdbcDescriptor(self):
+        resource_path = '/JDBCSystemResource/Generic1/JdbcResource/Generic1'
+        self.assertEqual(self._reader.get_names('/JDBCSystemResource/Generic1/JdbcResource'), ['Generic1'])
+        self.assertEqual(self._reader.get_attribute_values(resource_path)['datasourcetype'], 'GENERIC')
+
+        params_path = resource_path + '/JDBCDataSourceParams/NO_NAME_0'
+        values = self._reader.get_attribute_values(params_path)
+        self.assertEqual(values['jndiname'], 'jdbc/generic1,jdbc/generic1a')
+        self.assertEqual(values['globaltransactionsprotocol'], 'TwoPhaseCommit')
+
+        driver_path = resource_path + '/JDBCDriverParams/NO_NAME_0'
+        self.assertEqual(self._reader.get_attribute_values(driver_path)['passwordencrypted'],
+                         '{AES}cHJ0ZW5kLWVuY3J5cHRlZA==')
+        self.assertEqual(self._reader.get_names(driver_path + '/Properties/NO_NAME_0/Property'),
+                         ['user', 'oracle.net.CONNECT_TIMEOUT'])
+        self.assertEqual(self._reader.get_attribute_values(driver_path + '/Properties/NO_NAME_0/Property/user'),
+                         {'name': 'user', 'value': 'scott'})
+
+    def testJmsDescriptor(self):
+        resource_path = '/JMSSystemResource/MyJmsModule/JmsResource/NO_NAME_0'
+        self.assertEqual(self._reader.get_names('/JMSSystemResource/MyJmsModule/JmsResource'), None)
+        self.assertEqual(self._reader.get_names(resource_path + '/UniformDistributedQueue'),
+                         ['MyQueue', 'MyEmptyQueue'])
+        self.assertEqual(self._reader.get_attribute_values(resource_path + '/UniformDistributedQueue/MyEmptyQueue'),
+                         {})
+        values = self._reader.get_attribute_values(resource_path + '/ConnectionFactory/MyConnectionFactory')
+        self.assertEqual(values['jndiname'], 'jms/MyConnectionFactory')
+        self.assertEqual(self._reader.get_names('/JMSSystemResource/MyJmsModule/SubDeployment'),
+                         ['MySubDeployment'])
+
+    def testDescriptorsNotRead(self):
+        # the Coherence descriptor is not read, and the WLDF descriptor is missing, so WLST is used for them
+        self.assertEqual(self._reader.get_names('/CoherenceClusterSystemResource'), ['defaultCoherenceCluster'])
+        self.assertEqual(self._reader.get_attribute_values('/CoherenceClusterSystemResource/'
+                                                           'defaultCoherenceCluster'), None)
+        self.assertEqual(self._reader.get_names('/CoherenceClusterSystemResource/defaultCoherenceCluster/'
+                                                'CoherenceResource'), None)
+        self.assertEqual(self._reader.get_subfolder_types('/WLDFSystemResource/MyWldfModule'), None)
+
+    def testMissingDomain(self):
+        reader = ConfigXmlReader('../../test-classes/no-such-domain')
+        self.assertEqual(reader.get_names('/Server'), None)
+        self.assertEqual(reader.get_attribute_values('/'), None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import unittest
+
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.tool.deploy.deployer import Deployer
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.model_context import ModelContext
+
+
+class DeployerTestCase(unittest.TestCase):
+    wls_version = '12.2.1.3'
+
+    arg_map = {
+        CommandLineArgUtil.ORACLE_HOME_SWITCH: '/oracleHome',
+        CommandLineArgUtil.DOMAIN_HOME_SWITCH: ''
+    }
+
+    model_context = ModelContext('test', arg_map)
+    online_aliases = Aliases(model_context=model_context, wlst_mode=WlstModes.ONLINE, wls_version=wls_version)
+
+    def setUp(self):
+        self.deployer = Deployer({}, self.model_context, self.online_aliases, wlst_mode=WlstModes.ONLINE)
+        self.location = LocationContext().append_location('Server')
+        self.location.add_name_token(self.online_aliases.get_name_token(self.location), 's1')
+
+    def testSkipUnchangedAttribute(self):
+        existing_values = {'ListenPort': '7001', 'Notes': 'note1', 'NativeIOEnabled': 'true'}
+        self.assertEqual(self.deployer._skip_setting_attribute(self.location, 'ListenPort', 7001, existing_values),
+                         True)
+        self.assertEqual(self.deployer._skip_setting_attribute(self.location, 'ListenPort', '7001', existing_values),
+                         True)
+        self.assertEqual(self.deployer._skip_setting_attribute(self.location, 'Notes', 'note1',
+                                                               existing_values), True)
+        self.assertEqual(self.deployer._skip_setting_attribute(self.location, 'NativeIOEnabled', True,
+                                                               existing_values), True)
+
+    def testSetChangedAttribute(self):
+        existing_values = {'ListenPort': '7001', 'Notes': 'note1', 'NativeIOEnabled': 'true'}
+        self.assertEqual(self.deployer._skip_setting_attribute(self.location, 'ListenPort', 7002, existing_values),
+                         False)
+        self.assertEqual(self.deployer._skip_setting_attribute(self.location, 'Notes', 'note2',
+                                                               existing_values), False)
+        self.assertEqual(self.deployer._skip_setting_attribute(self.location, 'NativeIOEnabled', 'false',
+                                                               existing_values), False)
+
+    def testSetAttributeNotRead(self):
+        # the attribute is set if the current value was not read
+        existing_values = {'ListenPort': '7001'}
+        self.assertEqual(self.deployer._skip_setting_attribute(self.location, 'Notes', 'note1',
+                                                               existing_values), False)
+
+    def testOfflineValuesNotRead(self):
+        offline_deployer = Deployer({}, self.model_context, self.online_aliases, wlst_mode=WlstModes.OFFLINE)
+        self.assertEqual(offline_deployer._get_existing_wlst_values(self.location, {'ListenPort': 7001},
+                                                                    ['ListenPort']), None)
+
+
+if __name__ == '__main__':
+    unittest.main()
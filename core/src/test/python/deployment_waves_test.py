@@ -0,0 +1,82 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import unittest
+
+from oracle.weblogic.deploy.deploy import DeployException
+
+from wlsdeploy.aliases.model_constants import DEPLOYMENT_ORDER
+from wlsdeploy.tool.deploy import deployment_waves
+
+
+class _Progress(object):
+    """
+    A WLST progress object that completes after it is polled the specified number of times.
+    """
+
+    def __init__(self, polls, failed=False):
+        self._polls = polls
+        self._failed = failed
+
+    def isRunning(self):
+        self._polls -= 1
+        return self._polls >= 0
+
+    def isFailed(self):
+        return self._failed
+
+    def getMessage(self):
+        return 'failed'
+
+
+class DeploymentWavesTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._started = []
+        self._progress = dict()
+
+    def _start(self, name):
+        self._started.append(name)
+        return self._progress.get(name)
+
+    def testGetWaves(self):
+        apps = {
+            'a1': {DEPLOYMENT_ORDER: 10},
+            'a2': {DEPLOYMENT_ORDER: 10},
+            'a3': {DEPLOYMENT_ORDER: 20},
+            'a4': {},
+            'a5': {}
+        }
+        waves = deployment_waves.get_deployment_waves(['a1', 'a2', 'a3', 'a4', 'a5'], apps)
+        self.assertEqual(waves, [['a1', 'a2'], ['a3'], ['a4', 'a5']])
+        self.assertEqual(deployment_waves.get_deployment_waves([], apps), [])
+
+    def testRunWaves(self):
+        self._progress['a1'] = _Progress(2)
+        self._progress['a2'] = _Progress(1)
+        self._progress['a3'] = _Progress(0)
+        deployment_waves.run_waves([['a1', 'a2'], ['a3']], self._start, 'deploy', 2)
+        self.assertEqual(self._started, ['a1', 'a2', 'a3'])
+
+    def testFirstFailureStopsWaves(self):
+        # the failure of a2 is raised, a4 is not started, and a5 in the next wave is not started
+        self._progress['a1'] = _Progress(1)
+        self._progress['a2'] = _Progress(1, failed=True)
+        self._progress['a3'] = _Progress(3, failed=True)
+        self._progress['a4'] = _Progress(0)
+        self._progress['a5'] = _Progress(0)
+        try:
+            deployment_waves.run_waves([['a1', 'a2', 'a3', 'a4'], ['a5']], self._start, 'deploy', 3)
+            self.fail('expected DeployException')
+        except DeployException, ex:
+            self.assertEqual(ex.getLocalizedMessage().find('a2') >= 0, True)
+        self.assertEqual(self._started, ['a1', 'a2', 'a3'])
+
+    def testTimeout(self):
+        self._progress['a1'] = _Progress(1000000)
+        self.assertRaises(DeployException, deployment_waves.run_waves, [['a1']], self._start, 'deploy', 2, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
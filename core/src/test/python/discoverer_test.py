@@ -0,0 +1,141 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import unittest
+
+from java.util.concurrent.atomic import AtomicInteger
+
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.aliases.model_constants import LOG
+from wlsdeploy.aliases.model_constants import SERVER
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.exception.expection_types import ExceptionType
+from wlsdeploy.tool.discover import discoverer
+from wlsdeploy.tool.discover.discoverer import Discoverer
+from wlsdeploy.tool.util import wlst_helper
+from wlsdeploy.tool.util.wlst_session_pool import WlstSessionPool
+from wlsdeploy.util.cla_utils import CommandLineArgUtil as CLA
+from wlsdeploy.util.model_context import ModelContext
+
+
+class DiscovererTestCase(unittest.TestCase):
+    """
+    Test the concurrent discovery of named MBean instances, using stub WLST sessions.
+    """
+    _wls_version = '12.2.1.3'
+
+    # more log locations than the resolved folder cache holds, so entries are evicted while other threads use it
+    _instance_count = 200
+    _log_count = 10
+
+    def setUp(self):
+        arg_map = dict()
+        arg_map[CLA.ORACLE_HOME_SWITCH] = '/my/path/to/oracle'
+        arg_map[CLA.TARGET_MODE_SWITCH] = 'offline'
+        self._model_context = ModelContext('test', arg_map)
+        self._aliases = Aliases(model_context=self._model_context, wlst_mode=WlstModes.OFFLINE,
+                                wls_version=self._wls_version)
+
+        self._sessions = [_StubSession(), _StubSession(), _StubSession()]
+        self._session_pool = WlstSessionPool(len(self._sessions), ExceptionType.DISCOVER)
+        self._session_pool.open_with_sessions(self._sessions)
+        discoverer.set_session_pool(self._session_pool)
+
+    def tearDown(self):
+        discoverer.set_session_pool(None)
+        self._session_pool.close()
+
+    def testConcurrentNamedInstances(self):
+        names = []
+        for index in range(self._instance_count):
+            names.append('server-%03d' % index)
+        location = LocationContext().append_location(SERVER)
+        name_token = self._aliases.get_name_token(location)
+
+        instance_discoverer = _LogPathDiscoverer(self._model_context, self._aliases)
+        result = instance_discoverer._discover_named_instances(location, name_token, names, 'WLSDPLY-06113')
+
+        # the results are in name order, and each one has the paths resolved for its own name
+        self.assertEqual(result.keys(), names)
+        for name in names:
+            expected_paths = _get_log_paths(self._aliases, location, name_token, name, self._log_count)
+            self.assertEqual(result[name]['Name'], name)
+            self.assertEqual(result[name]['LogPaths'], expected_paths)
+
+        # each instance was discovered with a stub session, not the tool's WLST session
+        cd_count = 0
+        for session in self._sessions:
+            cd_count += session.get_cd_count()
+        self.assertEqual(cd_count, len(names))
+        self.assertEqual(wlst_helper.is_thread_bound(), False)
+
+
+class _LogPathDiscoverer(Discoverer):
+    """
+    Resolve a number of log paths for each instance with the shared aliases, instead of reading its attributes.
+    """
+
+    def __init__(self, model_context, aliases):
+        Discoverer.__init__(self, model_context, LocationContext(), WlstModes.OFFLINE, aliases)
+
+    def _populate_model_parameters(self, dictionary, location):
+        name_token = self._aliases.get_name_token(location)
+        name = location.get_name_tokens()[name_token]
+        dictionary['Name'] = name
+        dictionary['LogPaths'] = _get_log_paths(self._aliases, location, name_token, name,
+                                                DiscovererTestCase._log_count)
+
+    def _discover_subfolders(self, result, location):
+        return result
+
+
+class _StubSession(object):
+    """
+    The WLST globals of a session that only supports cd.
+    """
+
+    def __init__(self):
+        self._cd_count = AtomicInteger()
+        self._functions = {
+            'cd': self._cd,
+            'WLSTException': _StubWlstException
+        }
+
+    def __contains__(self, global_name):
+        return global_name in self._functions
+
+    def __getitem__(self, global_name):
+        return self._functions[global_name]
+
+    def get_cd_count(self):
+        return self._cd_count.get()
+
+    def cleanup(self):
+        pass
+
+    def _cd(self, path):
+        self._cd_count.incrementAndGet()
+        return path
+
+
+class _StubWlstException(Exception):
+    pass
+
+
+def _get_log_paths(aliases, location, name_token, name, count):
+    paths = []
+    for index in range(count):
+        log_location = LocationContext(location)
+        log_location.add_name_token(name_token, name)
+        log_location.append_location(LOG)
+        log_token = aliases.get_name_token(log_location)
+        if log_token is not None:
+            log_location.add_name_token(log_token, '%s-log-%s' % (name, index))
+        paths.append(aliases.get_wlst_attributes_path(log_location))
+    return paths
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,11 @@
 """
-Copyright (c) 2017, 2019, Oracle Corporation and/or its affiliates.  All rights reserved.
+Copyright (c) 2017, 2020, Oracle Corporation and/or its affiliates.  All rights reserved.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import unittest
 
+from java.util.logging import Level
+
 import wlsdeploy.exception.exception_helper as exception_helper
 import wlsdeploy.logging.platform_logger as platform_logger
 from wlsdeploy.util.weblogic_helper import WebLogicHelper
@@ -33,5 +35,49 @@ class LoggerTestCase(unittest.TestCase):
         else:
             self.fail('Test must raise DeployException to test logger handling of python exception')
 
+    def testLazyArgIsOnlyComputedWhenLogged(self):
+        calls = []
+
+        def supplier():
+            calls.append(1)
+            return 'value'
+
+        original_level = self.logger.get_level()
+        self.logger.set_level(Level.INFO)
+        self.logger.finest('lazy {0}', platform_logger.LazyArg(supplier), class_name=self.name,
+                           method_name='testLazyArgIsOnlyComputedWhenLogged')
+        self.logger.entering(platform_logger.LazyArg(supplier), class_name=self.name,
+                             method_name='testLazyArgIsOnlyComputedWhenLogged')
+        self.assertEqual(len(calls), 0)
+
+        self.logger.set_level(Level.FINEST)
+        self.logger.finest('lazy {0}', platform_logger.LazyArg(supplier), class_name=self.name,
+                           method_name='testLazyArgIsOnlyComputedWhenLogged')
+        self.logger.set_level(original_level)
+        self.assertEqual(len(calls), 1)
+
+    def testDisabledLevelDoesNotConvertArgs(self):
+        """
+        A disabled finest() call that is passed a model node must not convert it to a string.
+        """
+        calls = []
+
+        class ModelNode(object):
+            def __str__(self):
+                calls.append(1)
+                return 'model_node'
+
+        original_level = self.logger.get_level()
+        self.logger.set_level(Level.INFO)
+        self.logger.finest('model_node={0}', ModelNode(), class_name=self.name,
+                           method_name='testDisabledLevelDoesNotConvertArgs')
+        self.assertEqual(len(calls), 0)
+
+        self.logger.set_level(Level.FINEST)
+        self.logger.finest('model_node={0}', ModelNode(), class_name=self.name,
+                           method_name='testDisabledLevelDoesNotConvertArgs')
+        self.logger.set_level(original_level)
+        self.assertEqual(len(calls), 1)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import unittest
+
+from wlsdeploy.util.lru_cache import LruCache
+
+
+class LruCacheTestCase(unittest.TestCase):
+
+    def testGetAndPut(self):
+        cache = LruCache(4)
+        cache.put('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('b'), None)
+        self.assertEqual(cache.get('b', 2), 2)
+        self.assertEqual(cache.get_statistics(), (1, 2, 1))
+
+    def testEvictLeastRecentlyUsed(self):
+        cache = LruCache(4)
+        for key in ['a', 'b', 'c', 'd']:
+            cache.put(key, key)
+
+        # use 'a' so that 'b' is the least recently used entry
+        cache.get('a')
+        cache.put('e', 'e')
+        self.assertEqual(len(cache), 4)
+        self.assertEqual('b' in cache, False)
+        self.assertEqual('a' in cache, True)
+        self.assertEqual('e' in cache, True)
+
+    def testReplaceDoesNotEvict(self):
+        cache = LruCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.put('a', 3)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get('a'), 3)
+        self.assertEqual(cache.get('b'), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
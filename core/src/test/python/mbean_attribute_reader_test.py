@@ -0,0 +1,210 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import unittest
+
+from jarray import array
+from java.lang import RuntimeException
+from java.util import HashSet
+from java.util.concurrent.atomic import AtomicInteger
+from javax.management import Attribute
+from javax.management import AttributeList
+from javax.management import MBeanAttributeInfo
+from javax.management import MBeanInfo
+from javax.management import ObjectName
+
+from wlsdeploy.exception.expection_types import ExceptionType
+from wlsdeploy.tool.discover.mbean_attribute_reader import MBeanAttributeReader
+from wlsdeploy.tool.util import wlst_helper
+from wlsdeploy.util import task_runner
+
+
+class MBeanAttributeReaderTestCase(unittest.TestCase):
+    """
+    Test reading the attribute values of online MBeans, using a stub MBean server connection.
+    """
+    _attribute_names = ['ListenPort', 'MaxMessageSize']
+
+    def setUp(self):
+        self._connection = _StubConnection()
+        for index in range(3):
+            self._connection.add_mbean(_get_server_name(index))
+        self._reader = MBeanAttributeReader(ExceptionType.DISCOVER)
+        self._session = _get_session(self._connection)
+        wlst_helper.bind_thread_wlst_functions(self._session)
+
+    def tearDown(self):
+        wlst_helper.unbind_thread_wlst_functions()
+
+    def testBulkLoad(self):
+        # the values of every server are read with the first request
+        result = self._get_values(_get_server_name(0))
+        self.assertEqual(result, _get_expected_values(0))
+        self.assertEqual(self._connection.query_count.get(), 1)
+        self.assertEqual(self._connection.attributes_count.get(), 3)
+
+        result = self._get_values(_get_server_name(2))
+        self.assertEqual(result, _get_expected_values(2))
+        self.assertEqual(self._connection.query_count.get(), 1)
+        self.assertEqual(self._connection.attributes_count.get(), 3)
+
+    def testUnreadableAttribute(self):
+        self._session['cmo'] = _StubMBean(_get_server_name(0))
+        result = self._reader.get_attribute_values(['ListenPort', 'Notes'])
+        self.assertEqual(result, {'ListenPort': 7000})
+
+    def testMBeanCreatedAfterLoad(self):
+        self._get_values(_get_server_name(0))
+        self._connection.add_mbean(_get_server_name(3))
+
+        # the new server is read by itself, without querying the type again
+        result = self._get_values(_get_server_name(3))
+        self.assertEqual(result, _get_expected_values(3))
+        self.assertEqual(self._connection.query_count.get(), 1)
+        self.assertEqual(self._connection.attributes_count.get(), 4)
+
+    def testMBeanFailure(self):
+        failed_name = _get_server_name(1)
+        self._connection.failed_names[failed_name.getCanonicalName()] = True
+
+        # the server that failed in the bulk load is read again, and WLST get is used for it
+        self.assertEqual(self._get_values(_get_server_name(0)), _get_expected_values(0))
+        self.assertEqual(self._get_values(failed_name), None)
+        self.assertEqual(self._connection.attributes_count.get(), 4)
+
+        # the values of the type are still used, and the server is read when it is available again
+        del self._connection.failed_names[failed_name.getCanonicalName()]
+        self.assertEqual(self._get_values(_get_server_name(2)), _get_expected_values(2))
+        self.assertEqual(self._get_values(failed_name), _get_expected_values(1))
+        self.assertEqual(self._connection.query_count.get(), 1)
+        self.assertEqual(self._connection.attributes_count.get(), 5)
+
+    def testTypeFailure(self):
+        self._connection.query_failure = True
+
+        # WLST get is used for every MBean of the type, without querying the type again
+        self.assertEqual(self._get_values(_get_server_name(0)), None)
+        self.assertEqual(self._get_values(_get_server_name(1)), None)
+        self.assertEqual(self._connection.query_count.get(), 1)
+        self.assertEqual(self._connection.attributes_count.get(), 0)
+
+    def testConcurrentRequests(self):
+        count = 40
+        for index in range(3, count):
+            self._connection.add_mbean(_get_server_name(index))
+
+        tasks = []
+        for index in range(count):
+            tasks.append(_ReadTask(self._reader, self._connection, index))
+        results = task_runner.run_tasks(tasks, 4)
+
+        # the type is read by one thread, and the others use its values
+        for index in range(count):
+            self.assertEqual(results[index], _get_expected_values(index))
+        self.assertEqual(self._connection.query_count.get(), 1)
+        self.assertEqual(self._connection.attributes_count.get(), count)
+
+    def _get_values(self, object_name):
+        self._session['cmo'] = _StubMBean(object_name)
+        return self._reader.get_attribute_values(self._attribute_names)
+
+
+class _ReadTask(object):
+    """
+    Read the values of one server, on a worker thread with its own session.
+    """
+
+    def __init__(self, reader, connection, index):
+        self._reader = reader
+        self._session = _get_session(connection)
+        self._session['cmo'] = _StubMBean(_get_server_name(index))
+
+    def __call__(self):
+        wlst_helper.bind_thread_wlst_functions(self._session)
+        try:
+            return self._reader.get_attribute_values(MBeanAttributeReaderTestCase._attribute_names)
+        finally:
+            wlst_helper.unbind_thread_wlst_functions()
+
+
+class _StubConnection(object):
+    """
+    An MBean server connection that holds the attribute values of server MBeans, and counts the requests.
+    """
+
+    def __init__(self):
+        self._values = dict()
+        self.failed_names = dict()
+        self.query_failure = False
+        self.query_count = AtomicInteger()
+        self.attributes_count = AtomicInteger()
+
+    def add_mbean(self, object_name):
+        index = len(self._values)
+        self._values[object_name.getCanonicalName()] = (object_name, _get_expected_values(index))
+
+    def getMBeanInfo(self, object_name):
+        attributes = [
+            MBeanAttributeInfo('ListenPort', 'java.lang.Integer', 'port', True, True, False),
+            MBeanAttributeInfo('MaxMessageSize', 'java.lang.Integer', 'size', True, True, False),
+            MBeanAttributeInfo('Notes', 'java.lang.String', 'notes', False, True, False)
+        ]
+        return MBeanInfo('ServerMBean', 'server', array(attributes, MBeanAttributeInfo), None, None, None)
+
+    def queryNames(self, pattern, query):
+        self.query_count.incrementAndGet()
+        if self.query_failure:
+            raise RuntimeException('query failed')
+        object_names = HashSet()
+        for object_name, values in self._values.values():
+            if pattern.apply(object_name):
+                object_names.add(object_name)
+        return object_names
+
+    def getAttributes(self, object_name, names):
+        self.attributes_count.incrementAndGet()
+        key = object_name.getCanonicalName()
+        if key in self.failed_names:
+            raise RuntimeException('read failed')
+        object_name, values = self._values[key]
+        attribute_list = AttributeList()
+        for name in names:
+            attribute_list.add(Attribute(name, values[name]))
+        return attribute_list
+
+
+class _StubMBean(object):
+    """
+    The current management object, at the location of an MBean.
+    """
+
+    def __init__(self, object_name):
+        self._object_name = object_name
+
+    def getObjectName(self):
+        return self._object_name
+
+
+class _StubWlstException(Exception):
+    pass
+
+
+def _get_session(connection):
+    return {
+        'connected': 'true',
+        'mbs': connection,
+        'WLSTException': _StubWlstException
+    }
+
+
+def _get_server_name(index):
+    return ObjectName('com.bea:Name=server-%s,Type=Server' % index)
+
+
+def _get_expected_values(index):
+    return {'ListenPort': 7000 + index, 'MaxMessageSize': 10000 + index}
+
+
+if __name__ == '__main__':
+    unittest.main()
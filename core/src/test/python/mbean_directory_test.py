@@ -0,0 +1,42 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import unittest
+
+from wlsdeploy.tool.util.mbean_directory import MBeanDirectory
+
+
+class MBeanDirectoryTestCase(unittest.TestCase):
+
+    def testNamesAndMBeans(self):
+        directory = MBeanDirectory()
+        self.assertEqual(directory.get_names('/Servers'), None)
+        directory.put_names('/Servers', 'Server', ['s1', 's2'])
+        self.assertEqual(directory.get_names('/Servers'), ['s1', 's2'])
+
+        self.assertEqual(directory.get_mbean('/Servers/s1'), None)
+        directory.put_mbean('/Servers/s1', 'Server', 'mbean-s1')
+        self.assertEqual(directory.get_mbean('/Servers/s1'), 'mbean-s1')
+        self.assertEqual(directory.get_statistics(), (2, 2))
+
+    def testInvalidateType(self):
+        directory = MBeanDirectory()
+        directory.put_names('/Servers', 'Server', ['s1'])
+        directory.put_names('/Clusters', 'Cluster', ['c1'])
+        directory.put_mbean('/Servers/s1', 'Server', 'mbean-s1')
+        directory.put_mbean('/Clusters/c1', 'Cluster', 'mbean-c1')
+
+        directory.invalidate_type('Server')
+        self.assertEqual(directory.get_names('/Servers'), None)
+        self.assertEqual(directory.get_mbean('/Servers/s1'), None)
+        self.assertEqual(directory.get_names('/Clusters'), ['c1'])
+        self.assertEqual(directory.get_mbean('/Clusters/c1'), 'mbean-c1')
+
+        directory.clear()
+        self.assertEqual(directory.get_names('/Clusters'), None)
+        self.assertEqual(directory.get_mbean('/Clusters/c1'), None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import unittest
+
+from prepare_model import _ModelSession
+from wlsdeploy.util import cla_helper
+from wlsdeploy.util.model_translator import FileToPython
+
+
+class PrepareModelTestCase(unittest.TestCase):
+    """
+    Test that the model files of a prepare session are parsed once, and that the merged model is built
+    from unchanged copies of the parsed files.
+    """
+    _resources_dir = '../../test-classes'
+    _model_file = _resources_dir + '/compare_model_model1.yaml'
+    _other_model_file = _resources_dir + '/compare_model_model2.yaml'
+
+    def testChangedModelNotCopied(self):
+        model_session = _ModelSession()
+        model_dictionary = model_session.parse(self._model_file)
+
+        # change nested values of the parsed model, as the prepare steps do
+        model_dictionary['topology']['Server']['admin-server']['ListenPort'] = 20022
+        model_dictionary['topology']['ServerTemplate']['cluster-1-template']['ServerStart']['Arguments'].append('-Dx')
+        del model_dictionary['topology']['Cluster']['cluster-1']
+        del model_dictionary['domainInfo']
+
+        expected = FileToPython(self._model_file, True).parse()
+        self.assertEqual(model_session.get_model(self._model_file), expected)
+
+        # each copy can also be changed without changing the next one
+        copy = model_session.get_model(self._model_file)
+        copy['topology']['Server']['admin-server']['ListenPort'] = 30033
+        self.assertEqual(model_session.get_model(self._model_file), expected)
+
+    def testModelNotParsed(self):
+        model_session = _ModelSession()
+        expected = FileToPython(self._model_file, True).parse()
+        self.assertEqual(model_session.get_model(self._model_file), expected)
+
+    def testMergeWithLoader(self):
+        model_files = self._model_file + ',' + self._other_model_file
+        model_session = _ModelSession()
+        for model_file in [self._model_file, self._other_model_file]:
+            model_dictionary = model_session.parse(model_file)
+            model_dictionary['topology']['Server']['admin-server']['ListenPort'] = 20022
+
+        expected = cla_helper.merge_model_files(model_files)
+        merged = cla_helper.merge_model_files(model_files, model_files_loader=model_session.get_model)
+        self.assertEqual(merged, expected)
+        self.assertEqual(merged.keys(), expected.keys())
+        self.assertEqual(merged['topology'].keys(), expected['topology'].keys())
+
+        # the merge did not change the kept copies
+        expected_model = FileToPython(self._model_file, True).parse()
+        self.assertEqual(model_session.get_model(self._model_file), expected_model)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import unittest
+
+from java.lang import Thread
+
+from wlsdeploy.util import task_runner
+
+
+class TaskRunnerTestCase(unittest.TestCase):
+
+    def testResultsInTaskOrder(self):
+        tasks = []
+        for index in range(10):
+            # later tasks finish first
+            tasks.append(lambda value=index: _sleep_and_return(10 - value, value))
+        results = task_runner.run_tasks(tasks, 4)
+        self.assertEqual(results, range(10))
+
+    def testSingleTaskRunsOnCurrentThread(self):
+        results = task_runner.run_tasks([lambda: Thread.currentThread()], 4)
+        self.assertEqual(results[0], Thread.currentThread())
+
+    def testNoTasks(self):
+        self.assertEqual(task_runner.run_tasks([]), [])
+
+    def testFirstFailureIsRaised(self):
+        tasks = [lambda: 1, lambda: _fail('first'), lambda: _fail('second')]
+        try:
+            task_runner.run_tasks(tasks, 3)
+            self.fail('expected the task failure to be raised')
+        except ValueError, ve:
+            self.assertEqual(str(ve), 'first')
+
+
+def _sleep_and_return(millis, value):
+    Thread.sleep(millis)
+    return value
+
+
+def _fail(message):
+    raise ValueError(message)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+"""
+Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from wlsdeploy.tool.create import template_cache
+from wlsdeploy.util import task_runner
+
+
+class TemplateCacheTestCase(unittest.TestCase):
+    """
+    Test the snapshot cache of the domains written from the templates.
+    """
+
+    def setUp(self):
+        self._test_dir = os.path.join(tempfile.gettempdir(), 'TemplateCacheTestCase')
+        if os.path.exists(self._test_dir):
+            shutil.rmtree(self._test_dir)
+        self._cache_dir = os.path.join(self._test_dir, 'cache')
+        self._saved_cache_dir = os.environ.get(template_cache.TEMPLATE_CACHE_DIR_VARIABLE, None)
+        os.environ[template_cache.TEMPLATE_CACHE_DIR_VARIABLE] = self._cache_dir
+
+        # a domain home, as written from the templates
+        self._domain_home = os.path.join(self._test_dir, 'domains', 'base_domain')
+        os.makedirs(os.path.join(self._domain_home, 'config'))
+        self._write_file(os.path.join(self._domain_home, 'config', 'config.xml'), '<domain/>')
+        os.makedirs(os.path.join(self._domain_home, 'bin'))
+        self._write_file(os.path.join(self._domain_home, 'bin', 'setDomainEnv.sh'),
+                         'DOMAIN_HOME="%s"\n' % self._domain_home)
+        os.makedirs(os.path.join(self._domain_home, 'nodemanager'))
+        self._write_file(os.path.join(self._domain_home, 'nodemanager', 'nodemanager.domains'),
+                         'base_domain=%s\n' % self._domain_home)
+        self._snapshot_values = [
+            (template_cache.SNAPSHOT_DOMAIN_NAME, 'base_domain'),
+            (template_cache.SNAPSHOT_ADMIN_USER_NAME, 'weblogic')
+        ]
+
+        self._template_file = os.path.join(self._test_dir, 'wls.jar')
+        self._write_file(self._template_file, 'template')
+        self._key_values = [
+            ('template.0', self._template_file),
+            ('template.0.hash', template_cache.get_template_hashes([self._template_file])[0]),
+            ('serverStartMode', None)
+        ]
+
+    def tearDown(self):
+        if self._saved_cache_dir is None:
+            del os.environ[template_cache.TEMPLATE_CACHE_DIR_VARIABLE]
+        else:
+            os.environ[template_cache.TEMPLATE_CACHE_DIR_VARIABLE] = self._saved_cache_dir
+        if os.path.exists(self._test_dir):
+            shutil.rmtree(self._test_dir)
+
+    def testStoreAndClone(self):
+        key = template_cache.get_snapshot_key(self._key_values)
+        self.assertEqual(template_cache.find_snapshot(key, self._key_values), None)
+        self.assertNotEqual(template_cache.store_snapshot(key, self._key_values, self._domain_home,
+                                                          self._snapshot_values), None)
+
+        snapshot_domain_dir = template_cache.find_snapshot(key, self._key_values)
+        self.assertNotEqual(snapshot_domain_dir, None)
+
+        # the snapshot is cloned to a domain with a different home and name
+        new_domain_home = os.path.join(self._test_dir, 'domains', 'new_domain')
+        snapshot_values = template_cache.clone_snapshot(snapshot_domain_dir, new_domain_home, 'new_domain')
+        self.assertEqual(os.path.isfile(os.path.join(new_domain_home, 'config', 'config.xml')), True)
+        self.assertEqual(snapshot_values[template_cache.SNAPSHOT_DOMAIN_HOME], self._domain_home)
+        self.assertEqual(snapshot_values[template_cache.SNAPSHOT_DOMAIN_NAME], 'base_domain')
+        self.assertEqual(snapshot_values[template_cache.SNAPSHOT_ADMIN_USER_NAME], 'weblogic')
+
+        script = self._read_file(os.path.join(new_domain_home, 'bin', 'setDomainEnv.sh'))
+        self.assertEqual(script, 'DOMAIN_HOME="%s"\n' % new_domain_home)
+        domains = self._read_file(os.path.join(new_domain_home, 'nodemanager', 'nodemanager.domains'))
+        self.assertEqual(domains, 'new_domain=%s\n' % new_domain_home)
+
+        snapshots = template_cache.list_snapshots()
+        self.assertEqual(len(snapshots), 1)
+        self.assertEqual(snapshots[0][0], key)
+        self.assertEqual(snapshots[0][1]['template.0'], self._template_file)
+
+        self.assertEqual(template_cache.clear_cache(), 1)
+        self.assertEqual(template_cache.list_snapshots(), [])
+
+    def testKeyChanges(self):
+        key = template_cache.get_snapshot_key(self._key_values)
+        self.assertEqual(key, template_cache.get_snapshot_key(list(self._key_values)))
+        self.assertEqual(key.find('/'), -1)
+
+        # a change to the template contents changes the key
+        self._write_file(self._template_file, 'changed template')
+        changed_values = list(self._key_values)
+        changed_values[1] = ('template.0.hash', template_cache.get_template_hashes([self._template_file])[0])
+        self.assertNotEqual(template_cache.get_snapshot_key(changed_values), key)
+
+    def testMismatchedSnapshotIgnored(self):
+        key = template_cache.get_snapshot_key(self._key_values)
+        template_cache.store_snapshot(key, self._key_values, self._domain_home, self._snapshot_values)
+        self.assertNotEqual(template_cache.find_snapshot(key, self._key_values), None)
+
+        # a snapshot with different recorded values is not used, even with the same key
+        other_values = list(self._key_values)
+        other_values[2] = ('serverStartMode', 'prod')
+        self.assertEqual(template_cache.find_snapshot(key, other_values), None)
+
+    def testOverlappingStores(self):
+        key = template_cache.get_snapshot_key(self._key_values)
+        tasks = []
+        for index in range(4):
+            tasks.append(lambda: template_cache.store_snapshot(key, self._key_values, self._domain_home,
+                                                               self._snapshot_values))
+        results = task_runner.run_tasks(tasks, len(tasks))
+
+        # every store finds the complete snapshot, and no temporary directories are left
+        snapshot_dir = os.path.join(self._cache_dir, key)
+        self.assertEqual(results, [snapshot_dir] * len(tasks))
+        self.assertNotEqual(template_cache.find_snapshot(key, self._key_values), None)
+        temp_names = [name for name in os.listdir(self._cache_dir) if name.endswith('.tmp')]
+        self.assertEqual(temp_names, [])
+
+    def testSharedSecretsAccepted(self):
+        saved_value = os.environ.get(template_cache.SHARED_SECRETS_VARIABLE, None)
+        try:
+            os.environ[template_cache.SHARED_SECRETS_VARIABLE] = 'false'
+            self.assertEqual(template_cache.is_shared_secrets_accepted(), False)
+            os.environ[template_cache.SHARED_SECRETS_VARIABLE] = 'TRUE'
+            self.assertEqual(template_cache.is_shared_secrets_accepted(), True)
+        finally:
+            if saved_value is None:
+                del os.environ[template_cache.SHARED_SECRETS_VARIABLE]
+            else:
+                os.environ[template_cache.SHARED_SECRETS_VARIABLE] = saved_value
+
+    def testDisabled(self):
+        os.environ[template_cache.TEMPLATE_CACHE_DIR_VARIABLE] = ''
+        self.assertEqual(template_cache.is_enabled(), False)
+        self.assertEqual(template_cache.list_snapshots(), [])
+
+    def _read_file(self, file_path):
+        input_file = open(file_path, 'r')
+        try:
+            return input_file.read()
+        finally:
+            input_file.close()
+
+    def _write_file(self, file_path, text):
+        output = open(file_path, 'w')
+        try:
+            output.write(text)
+        finally:
+            output.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
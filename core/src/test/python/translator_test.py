@@ -5,7 +5,9 @@ Licensed under the Universal Permissive License v 1.0 as shown at https://oss.or
 import os
 import unittest
 
+from wlsdeploy.json.json_translator import PythonToJson
 from wlsdeploy.util.model_translator import FileToPython, PythonToFile
+from wlsdeploy.yaml.yaml_translator import PythonToYaml
 
 class TranslatorTestCase(unittest.TestCase):
     _execution_dir = '../../unit-tests/'
@@ -16,6 +18,8 @@ class TranslatorTestCase(unittest.TestCase):
 
     _target_json_file = os.path.join(_execution_dir, 'quote-test.json')
     _target_yaml_file = os.path.join(_execution_dir, 'quote-test.yaml')
+    _sections_json_file = os.path.join(_execution_dir, 'sections-test.json')
+    _sections_yaml_file = os.path.join(_execution_dir, 'sections-test.yaml')
 
     def setUp(self):
         self.name = 'TranslatorTestCase'
@@ -90,3 +94,25 @@ class TranslatorTestCase(unittest.TestCase):
         self.assertEqual(quotedValue, 'test "legal" yaml')
         quotedValue = newPythonDict['baz']
         self.assertEqual(quotedValue, 'test \'legal\' yaml')
+
+    def testSectionsToYaml(self):
+        sections = [('domainInfo', {'AdminUserName': 'weblogic'}),
+                    ('topology', {'Server': {'s1': {'ListenPort': 7001}}})]
+
+        PythonToYaml(None).write_to_yaml_file(self._sections_yaml_file, sections)
+
+        newPythonDict = FileToPython(self._sections_yaml_file, use_ordering=True).parse()
+        self.assertEqual(newPythonDict.keys(), ['domainInfo', 'topology'])
+        self.assertEqual(newPythonDict['domainInfo']['AdminUserName'], 'weblogic')
+        self.assertEqual(newPythonDict['topology']['Server']['s1']['ListenPort'], 7001)
+
+    def testSectionsToJson(self):
+        sections = [('domainInfo', {'AdminUserName': 'weblogic'}),
+                    ('topology', {'Server': {'s1': {'ListenPort': 7001}}})]
+
+        PythonToJson(None).write_to_json_file(self._sections_json_file, sections)
+
+        newPythonDict = FileToPython(self._sections_json_file, use_ordering=True).parse()
+        self.assertEqual(newPythonDict.keys(), ['domainInfo', 'topology'])
+        self.assertEqual(newPythonDict['domainInfo']['AdminUserName'], 'weblogic')
+        self.assertEqual(newPythonDict['topology']['Server']['s1']['ListenPort'], 7001)
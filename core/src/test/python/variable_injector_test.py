@@ -1,11 +1,13 @@
 """
-Copyright (c) 2018, 2019, Oracle Corporation and/or its affiliates.  All rights reserved.
+Copyright (c) 2018, 2020, Oracle Corporation and/or its affiliates.  All rights reserved.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import unittest
 
 import os
 
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
 import wlsdeploy.tool.util.variable_injector as variable_injector
 import wlsdeploy.util.variables as variables
 from wlsdeploy.aliases.alias_constants import PASSWORD_TOKEN
@@ -222,6 +224,22 @@ class VariableFileHelperTest(unittest.TestCase):
         actual = self._helper.inject_variables(replacement_dict)
         self._compare_to_expected_dictionary(expected, actual)
 
+    def testWithOverlappingInjectorPaths(self):
+        short_name = self._helper.get_folder_short_name(LocationContext().append_location('Server'))
+        expected = dict()
+        expected[short_name + '.AdminServer.SSL.Enabled'] = 'True'
+        expected[short_name + '.m1.SSL.Enabled'] = 'True'
+        expected[short_name + '.m2.SSL.Enabled'] = 'True'
+        expected[short_name + '.AdminServer.SSL.ListenPort'] = '9002'
+        expected[short_name + '.m1.SSL.ListenPort'] = '9004'
+        expected[short_name + '.m2.SSL.ListenPort'] = '9006'
+        replacement_dict = OrderedDict()
+        replacement_dict['Server[m1,m2].SSL.Enabled'] = dict()
+        replacement_dict['Server.SSL.ListenPort'] = dict()
+        replacement_dict['Server.SSL.Enabled'] = dict()
+        actual = self._helper.inject_variables(replacement_dict)
+        self._compare_to_expected_dictionary(expected, actual)
+
     def testWithManagedServerKeyword(self):
         short_name = self._helper.get_folder_short_name(LocationContext().append_location('Server'))
         expected = dict()
@@ -347,6 +365,23 @@ class VariableFileHelperTest(unittest.TestCase):
         actual_cache = self._helper.get_variable_cache()
         self._compare_to_expected_dictionary(expected_cache, actual_cache)
 
+    def testThreadVariableCache(self):
+        expected_cache = dict()
+        expected_cache[ADMIN_PASSWORD] = ''
+        actual_model = dict()
+        actual_model[ADMIN_PASSWORD] = PASSWORD_TOKEN
+        variable_injector.begin_thread_variable_cache()
+        try:
+            self._helper.custom_injection(actual_model, ADMIN_PASSWORD, LocationContext(),
+                                          STANDARD_PASSWORD_INJECTOR)
+        finally:
+            thread_cache = variable_injector.end_thread_variable_cache()
+        self._compare_to_expected_dictionary(expected_cache, thread_cache)
+        self._compare_to_expected_dictionary(dict(), self._helper.get_variable_cache())
+
+        self._helper.add_to_cache(dictionary=thread_cache)
+        self._compare_to_expected_dictionary(expected_cache, self._helper.get_variable_cache())
+
     def _compare_to_expected_dictionary(self, expected, actual):
         self.assertEqual(len(expected), len(actual),
                          'Not the same number of entries : expected=' + str(len(expected)) + ', actual=' + str(
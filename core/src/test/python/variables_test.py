@@ -7,6 +7,7 @@ import unittest
 import os
 
 import wlsdeploy.util.variables as variables
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
 from oracle.weblogic.deploy.util import VariableException
 from wlsdeploy.util.model_context import ModelContext
 from wlsdeploy.util.model_translator import FileToPython
@@ -80,6 +81,26 @@ class VariablesTestCase(unittest.TestCase):
         variables.substitute(model, {}, self.model_context)
         self.assertEqual(model['domainInfo']['AdminUserName'], 'file-variable-value')
 
+    def testFileVariableRepeated(self):
+        path = self._resources_dir + '/' + self._file_variable_name
+        model = {'domainInfo': {'AdminUserName': '@@FILE:' + path + '@@',
+                                'AdminPassword': '@@FILE:' + path + '@@-@@FILE:@@ORACLE_HOME@@/' +
+                                                 self._file_variable_name + '@@'}}
+        variables.substitute(model, {}, self.model_context)
+        self.assertEqual(model['domainInfo']['AdminUserName'], 'file-variable-value')
+        self.assertEqual(model['domainInfo']['AdminPassword'], 'file-variable-value-file-variable-value')
+
+    def testSubstituteKeyKeepsOrder(self):
+        servers = OrderedDict()
+        servers['s1'] = {'ListenPort': '@@PROP:my.port@@'}
+        servers['@@PROP:server3.id@@'] = {'ListenPort': 9001}
+        servers['s2'] = {'ListenPort': 8101}
+        model = {'topology': {'Server': servers}}
+        variable_map = variables.load_variables(self._variables_file)
+        variables.substitute(model, variable_map, self.model_context)
+        self.assertEqual(servers.keys(), ['s1', 's3', 's2'])
+        self.assertEqual(servers['s1']['ListenPort'], '1009')
+
     def testFileVariableNotFound(self):
         try:
             path = self._resources_dir + '/no-file.txt'
@@ -135,6 +135,23 @@ class ClaHelperTest(unittest.TestCase):
         server = self._check_single_server(dictionary, 'm1')
         self.assertEquals(2, len(server), "server should have two attributes")
 
+    # merge indexes kept between merges should match names after elements are deleted and added again.
+    def testMergeMultipleModelsWithIndexes(self):
+        dictionary = _build_model_one('@@PROP:server1a@@')
+        variables = _build_variable_map()
+        merge_indexes = {}
+
+        cla_helper._merge_dictionaries(dictionary, _build_model_two('m1'), variables, merge_indexes)
+        self._check_merged_server(dictionary, '@@PROP:server1a@@')
+
+        cla_helper._merge_dictionaries(dictionary, _build_delete_model('@@PROP:server1b@@'), variables, merge_indexes)
+        servers = dictionary['Servers']
+        self.assertEquals(0, len(servers), "there should be no servers after delete")
+
+        cla_helper._merge_dictionaries(dictionary, _build_model_one('m1'), variables, merge_indexes)
+        cla_helper._merge_dictionaries(dictionary, _build_model_two('@@PROP:server1b@@'), variables, merge_indexes)
+        self._check_merged_server(dictionary, 'm1')
+
     # check that a single server exists in the result, and its attributes were merged correctly
     def _check_merged_server(self, dictionary, key):
         server = self._check_single_server(dictionary, key)
@@ -0,0 +1,101 @@
+@ECHO OFF
+@rem **************************************************************************
+@rem cacheAliases.cmd
+@rem
+@rem Copyright (c) 2020, Oracle Corporation and/or its affiliates.  All rights reserved.
+@rem Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+@rem
+@rem     NAME
+@rem       cacheAliases.cmd - WLS Deploy tool to pre-load the alias
+@rem                          knowledge base into the alias cache.
+@rem
+@rem     DESCRIPTION
+@rem       This script resolves the alias knowledge base for the WebLogic Server
+@rem       version and WLST mode, and writes it to the alias cache so that
+@rem       subsequent tool invocations can load the aliases without parsing them.
+@rem
+@rem This script uses the following variables:
+@rem
+@rem JAVA_HOME             - The location of the JDK to use.  The caller must set
+@rem                         this variable to a valid Java 7 (or later) JDK.
+@rem
+@rem WLSDEPLOY_HOME        - The location of the WLS Deploy installation.
+@rem                         If the caller sets this, the callers location will be
+@rem                         honored provided it is an existing directory.
+@rem                         Otherwise, the location will be calculated from the
+@rem                         location of this script.
+@rem
+@rem WDT_ALIAS_CACHE_DIR   - The directory where the alias cache files are written.
+@rem                         If not set, %WLSDEPLOY_HOME%\cache\aliases is used.
+@rem
+@rem WLSDEPLOY_PROPERTIES  - Extra system properties to pass to Java.  The caller
+@rem                         can use this environment variable to add additional
+@rem                         system properties to the Java environment.
+@rem
+
+SETLOCAL
+
+SET WLSDEPLOY_PROGRAM_NAME=cacheAliases
+
+SET SCRIPT_NAME=%~nx0
+SET SCRIPT_ARGS=%*
+SET SCRIPT_PATH=%~dp0
+FOR %%i IN ("%SCRIPT_PATH%") DO SET SCRIPT_PATH=%%~fsi
+IF %SCRIPT_PATH:~-1%==\ SET SCRIPT_PATH=%SCRIPT_PATH:~0,-1%
+
+call "%SCRIPT_PATH%\shared.cmd" :checkJythonArgs %SCRIPT_ARGS%
+SET RETURN_CODE=%ERRORLEVEL%
+if %RETURN_CODE% NEQ 0 (
+  GOTO done
+)
+
+@rem Java 7 is required, no encryption is used
+call "%SCRIPT_PATH%\shared.cmd" :javaSetup 7
+SET RETURN_CODE=%ERRORLEVEL%
+if %RETURN_CODE% NEQ 0 (
+  GOTO done
+)
+
+call "%SCRIPT_PATH%\shared.cmd" :runJython cache_aliases.py
+SET RETURN_CODE=%ERRORLEVEL%
+
+:done
+set SHOW_USAGE=false
+if %RETURN_CODE% == 100 set SHOW_USAGE=true
+if %RETURN_CODE% == 99 set SHOW_USAGE=true
+if "%SHOW_USAGE%" == "false" (
+    GOTO exit_script
+)
+
+:usage
+ECHO.
+ECHO Usage: %SCRIPT_NAME%
+ECHO         [-help]
+ECHO         [-oracle_home ^<oracle_home^>]
+ECHO         [-target_version ^<target_version^>]
+ECHO         [-target_mode ^<target_mode^>]
+ECHO         [-clear]
+ECHO.
+ECHO     where:
+ECHO         oracle_home    - an existing Oracle Home directory.
+ECHO                          This is required unless the ORACLE_HOME environment
+ECHO                          variable is set.
+ECHO.
+ECHO         target_version - the WebLogic Server version to cache the aliases for.
+ECHO                          The default is the version of the Oracle Home.
+ECHO.
+ECHO         target_mode    - the WLST mode (online or offline) to cache the aliases
+ECHO                          for. The default is to cache both modes.
+ECHO.
+ECHO     The -clear switch will remove all existing alias cache files
+ECHO     before the new cache files are written.
+ECHO.
+
+:exit_script
+IF DEFINED USE_CMD_EXIT (
+  EXIT %RETURN_CODE%
+) ELSE (
+  EXIT /B %RETURN_CODE%
+)
+
+ENDLOCAL
@@ -0,0 +1,75 @@
+#!/bin/sh
+# *****************************************************************************
+# cacheAliases.sh
+#
+# Copyright (c) 2020, Oracle Corporation and/or its affiliates.  All rights reserved.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+#
+#     NAME
+#       cacheAliases.sh - WLS Deploy tool to pre-load the alias
+#                         knowledge base into the alias cache.
+#
+#     DESCRIPTION
+#       This script resolves the alias knowledge base for the WebLogic Server
+#       version and WLST mode, and writes it to the alias cache so that
+#       subsequent tool invocations can load the aliases without parsing them.
+#
+# This script uses the following variables:
+#
+# JAVA_HOME             - The location of the JDK to use.  The caller must set
+#                         this variable to a valid Java 7 (or later) JDK.
+#
+# WLSDEPLOY_HOME        - The location of the WLS Deploy installation.
+#                         If the caller sets this, the callers location will be
+#                         honored provided it is an existing directory.
+#                         Otherwise, the location will be calculated from the
+#                         location of this script.
+#
+# WDT_ALIAS_CACHE_DIR   - The directory where the alias cache files are written.
+#                         If not set, $WLSDEPLOY_HOME/cache/aliases is used.
+#
+# WLSDEPLOY_PROPERTIES  - Extra system properties to pass to Java.  The caller
+#                         can use this environment variable to add additional
+#                         system properties to the Java environment.
+#
+
+usage() {
+  echo ""
+  echo "Usage: $1 [-help]"
+  echo "          [-oracle_home <oracle_home>]"
+  echo "          [-target_version <target_version>]"
+  echo "          [-target_mode <target_mode>]"
+  echo "          [-clear]"
+  echo ""
+  echo "    where:"
+  echo "        oracle_home    - an existing Oracle Home directory."
+  echo "                         This is required unless the ORACLE_HOME environment"
+  echo "                         variable is set."
+  echo ""
+  echo "        target_version - the WebLogic Server version to cache the aliases for."
+  echo "                         The default is the version of the Oracle Home."
+  echo ""
+  echo "        target_mode    - the WLST mode (online or offline) to cache the aliases"
+  echo "                         for. The default is to cache both modes."
+  echo ""
+  echo "    The -clear switch will remove all existing alias cache files"
+  echo "    before the new cache files are written."
+  echo ""
+}
+
+WLSDEPLOY_PROGRAM_NAME="cacheAliases"; export WLSDEPLOY_PROGRAM_NAME
+
+scriptName=`basename $0`
+scriptPath=$(dirname "$0")
+scriptArgs=$*
+
+. $scriptPath/shared.sh
+
+umask 27
+
+checkJythonArgs "$@"
+
+# Java 7 is required, no encryption is used
+javaSetup 7
+
+runJython cache_aliases.py
@@ -0,0 +1,65 @@
+#!/bin/sh
+# *****************************************************************************
+# manageTemplateCache.sh
+#
+# Copyright (c) 2020, Oracle Corporation and/or its affiliates.  All rights reserved.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+#
+#     NAME
+#       manageTemplateCache.sh - WLS Deploy tool to list or remove the
+#                                domain template snapshots.
+#
+#     DESCRIPTION
+#       This script lists the domain template snapshots that the Create
+#       Domain Tool has stored in the template cache, or removes them.
+#
+# This script uses the following variables:
+#
+# JAVA_HOME              - The location of the JDK to use.  The caller must set
+#                          this variable to a valid Java 7 (or later) JDK.
+#
+# WLSDEPLOY_HOME         - The location of the WLS Deploy installation.
+#                          If the caller sets this, the callers location will be
+#                          honored provided it is an existing directory.
+#                          Otherwise, the location will be calculated from the
+#                          location of this script.
+#
+# WDT_TEMPLATE_CACHE_DIR - The directory where the template snapshots are stored.
+#
+# WLSDEPLOY_PROPERTIES   - Extra system properties to pass to Java.  The caller
+#                          can use this environment variable to add additional
+#                          system properties to the Java environment.
+#
+
+usage() {
+  echo ""
+  echo "Usage: $1 [-help]"
+  echo "          [-oracle_home <oracle_home>]"
+  echo "          [-clear]"
+  echo ""
+  echo "    where:"
+  echo "        oracle_home    - an existing Oracle Home directory."
+  echo "                         This is required unless the ORACLE_HOME environment"
+  echo "                         variable is set."
+  echo ""
+  echo "    The template snapshots are listed, unless the -clear switch"
+  echo "    is specified to remove all the template snapshots."
+  echo ""
+}
+
+WLSDEPLOY_PROGRAM_NAME="manageTemplateCache"; export WLSDEPLOY_PROGRAM_NAME
+
+scriptName=`basename $0`
+scriptPath=$(dirname "$0")
+scriptArgs=$*
+
+. $scriptPath/shared.sh
+
+umask 27
+
+checkJythonArgs "$@"
+
+# Java 7 is required, no encryption is used
+javaSetup 7
+
+runJython manage_template_cache.py
@@ -173,6 +173,12 @@ variableSetup() {
     if [ -z "${WLSDEPLOY_LOG_HANDLERS}" ]; then
         WLSDEPLOY_LOG_HANDLERS=${WLSDEPLOY_LOG_HANDLER}; export WLSDEPLOY_LOG_HANDLERS
     fi
+
+    # set up the tool daemon file, see toolDaemon.sh
+
+    if [ -z "${WLSDEPLOY_DAEMON_FILE}" ]; then
+        WLSDEPLOY_DAEMON_FILE=${WLSDEPLOY_HOME}/toolDaemon.properties; export WLSDEPLOY_DAEMON_FILE
+    fi
 }
 
 runWlst() {
@@ -280,6 +286,13 @@ runJython() {
 
     PY_SCRIPTS_PATH=${WLSDEPLOY_HOME}/lib/python
 
+    # run the script in the tool daemon if it is running, unless encryption is used,
+    # since the daemon can't read the passphrase from the terminal.
+
+    if [ "${WLSDEPLOY_PROGRAM_NAME}" != "toolDaemon" ] && [ "${USE_ENCRYPTION}" != "true" ]; then
+        runToolDaemonClient "${WLSDEPLOY_PROGRAM_NAME}" ${scriptArgs}
+    fi
+
     echo \
     ${JAVA_HOME}/bin/java -cp ${CLASSPATH} \
         ${JAVA_PROPERTIES} \
@@ -296,6 +309,44 @@ runJython() {
     exit ${RETURN_CODE}
 }
 
+runToolDaemonClient() {
+    # run a tool in the tool daemon, if the daemon file exists.
+    # if the daemon ran the tool, exit with the tool exit code.
+    # if the daemon did not run the tool (exit code 97), return so the tool can be run in a new JVM.
+
+    if [ ! -f "${WLSDEPLOY_DAEMON_FILE}" ]; then
+        return
+    fi
+
+    ${JAVA_HOME}/bin/java -cp ${WLSDEPLOY_HOME}/lib/weblogic-deploy-core.jar \
+        oracle.weblogic.deploy.daemon.ToolDaemonClient \
+        "${WLSDEPLOY_DAEMON_FILE}" "${ORACLE_HOME}" "$@"
+
+    RETURN_CODE=$?
+    if [ ${RETURN_CODE} -ne 97 ]; then
+        checkExitCode ${RETURN_CODE}
+        exit ${RETURN_CODE}
+    fi
+}
+
+stopToolDaemon() {
+    # stop the running tool daemon.
+
+    variableSetup
+
+    ${JAVA_HOME}/bin/java -cp ${WLSDEPLOY_HOME}/lib/weblogic-deploy-core.jar \
+        oracle.weblogic.deploy.daemon.ToolDaemonClient \
+        "${WLSDEPLOY_DAEMON_FILE}" "${ORACLE_HOME}" stop
+
+    RETURN_CODE=$?
+    if [ ${RETURN_CODE} -eq 97 ]; then
+        echo "No tool daemon is running for ${WLSDEPLOY_DAEMON_FILE}"
+        RETURN_CODE=0
+    fi
+    checkExitCode ${RETURN_CODE}
+    exit ${RETURN_CODE}
+}
+
 checkExitCode() {
     # print a message for the exit code passed in.
     # calling script must have assigned the scriptName variable.
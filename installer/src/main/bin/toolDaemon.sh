@@ -0,0 +1,80 @@
+#!/bin/sh
+# *****************************************************************************
+# toolDaemon.sh
+#
+# Copyright (c) 2020, Oracle Corporation and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+#
+#     NAME
+#       toolDaemon.sh - WLS Deploy tool daemon, which runs the tools in a
+#                       long-lived JVM.
+#
+#     DESCRIPTION
+#       This script starts the tool daemon, which runs in the foreground until
+#       it is stopped with the -stop switch.  While the daemon is running, the
+#       compareModel, extractDomainResource, injectVariables, modelHelp,
+#       prepareModel and validateModel scripts run their tools in the daemon,
+#       so that the JVM startup, Jython module imports and alias loading are
+#       not repeated for each run.  The scripts run the tool in a new JVM if
+#       the daemon is not running, -use_encryption is specified, or the script
+#       is run with a different working directory, Oracle home, JAVA_HOME, or
+#       WLSDEPLOY_* environment variables than the daemon.
+#
+# This script uses the following variables:
+#
+# JAVA_HOME             - The location of the JDK to use.  The caller must set
+#                         this variable to a valid Java 7 (or later) JDK.
+#
+# WLSDEPLOY_HOME        - The location of the WLS Deploy installation.
+#                         If the caller sets this, the callers location will be
+#                         honored provided it is an existing directory.
+#                         Otherwise, the location will be calculated from the
+#                         location of this script.
+#
+# WLSDEPLOY_DAEMON_FILE - The file where the daemon writes its port and access
+#                         token.  If not set, $WLSDEPLOY_HOME/toolDaemon.properties
+#                         is used.
+#
+# WLSDEPLOY_PROPERTIES  - Extra system properties to pass to Java.  The caller
+#                         can use this environment variable to add additional
+#                         system properties to the Java environment.
+#
+
+usage() {
+  echo ""
+  echo "Usage: $1 [-help]"
+  echo "          [-oracle_home <oracle_home>]"
+  echo "          [-stop]"
+  echo ""
+  echo "    where:"
+  echo "        oracle_home    - an existing Oracle Home directory."
+  echo "                         This is required unless the ORACLE_HOME environment"
+  echo "                         variable is set."
+  echo ""
+  echo "    The -stop switch will stop the running tool daemon."
+  echo ""
+}
+
+WLSDEPLOY_PROGRAM_NAME="toolDaemon"; export WLSDEPLOY_PROGRAM_NAME
+
+scriptName=`basename $0`
+scriptPath=$(dirname "$0")
+scriptArgs=$*
+
+. $scriptPath/shared.sh
+
+umask 27
+
+checkJythonArgs "$@"
+
+# Java 7 is required, no encryption is used
+javaSetup 7
+
+for arg in "$@"
+do
+    if [ "$arg" = "-stop" ]; then
+        stopToolDaemon
+    fi
+done
+
+runJython tool_daemon.py